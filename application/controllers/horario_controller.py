@@ -5,6 +5,9 @@ from application.config.logger_config import setup_logger
 from infrastructure.databases.models.horario import Horario as HorarioORM
 from infrastructure.repositories.horario_repo import HorarioRepository
 from application.services.horario_service import crear_horarios, actualizar_horarios, generar_excel_horarios
+from application.services.trabajo_generacion_service import obtener_cola_trabajos
+from application.use_cases.generar_horarios import previsualizar_horarios
+from infrastructure.repositories.sucursal_repo import SucursalRepository
 from infrastructure.repositories.puesto_repo import PuestoRepository  # Se asume que este repositorio ya recibe 'db: Session'
 
 logger = setup_logger(__name__, "logs/horario.log")
@@ -115,3 +118,78 @@ def controlador_py_logger_generar_excel_horarios(
     except Exception as error:
         logger.error("Error al generar archivos Excel: %s", error)
         raise HTTPException(status_code=500, detail="Error interno del servidor") from error
+
+
+def controlador_py_logger_encolar_generacion(parametros: dict, usuario_id: int = None):
+    """
+    Controlador para encolar un trabajo de generación de horarios.
+    Se espera un diccionario con 'sucursal_id' o 'empresa_id', 'semana_inicio' (ISO),
+    'tiempo_limite', 'reemplazar' y 'usar_semana_anterior'.
+    """
+    try:
+        tipo = "sucursal" if parametros.get("sucursal_id") is not None else "empresa"
+        trabajo = obtener_cola_trabajos().encolar(tipo, parametros, usuario_id)
+        logger.info("Trabajo de generación %s encolado.", trabajo.id)
+        return trabajo
+    except Exception as error:
+        logger.error("Error al encolar la generación de horarios: %s", error)
+        raise HTTPException(status_code=500, detail="Error interno del servidor") from error
+
+
+def controlador_py_logger_get_trabajo_generacion(trabajo_id: str):
+    """
+    Controlador para obtener el estado y el progreso de un trabajo de generación.
+    """
+    try:
+        trabajo = obtener_cola_trabajos().obtener(trabajo_id)
+    except Exception as error:
+        logger.error("Error al obtener el trabajo de generación %s: %s", trabajo_id, error)
+        raise HTTPException(status_code=500, detail="Error interno del servidor") from error
+    if not trabajo:
+        raise HTTPException(status_code=404, detail="Trabajo de generación no encontrado")
+    return trabajo
+
+
+def controlador_py_logger_eventos_generacion(trabajo_id: str):
+    """
+    Controlador que devuelve un iterador de eventos (tipo, datos) de un trabajo de generación.
+    Si el trabajo ya no está en ejecución en este proceso, entrega un único evento con su estado.
+    """
+    trabajo = controlador_py_logger_get_trabajo_generacion(trabajo_id)
+    canal = obtener_cola_trabajos().canal(trabajo_id)
+    if canal is None:
+        return iter([("estado", {"estado": trabajo.estado, "resultado": trabajo.resultado, "error": trabajo.error})])
+    return canal.escuchar()
+
+
+def controlador_py_logger_detener_generacion(trabajo_id: str) -> bool:
+    """
+    Controlador para detener la búsqueda de un trabajo de generación y quedarse con
+    la mejor solución encontrada.
+    """
+    controlador_py_logger_get_trabajo_generacion(trabajo_id)
+    try:
+        detenido = obtener_cola_trabajos().detener(trabajo_id)
+    except Exception as error:
+        logger.error("Error al detener el trabajo de generación %s: %s", trabajo_id, error)
+        raise HTTPException(status_code=500, detail="Error interno del servidor") from error
+    if not detenido:
+        raise HTTPException(status_code=409, detail="El trabajo de generación ya finalizó")
+    return detenido
+
+
+def controlador_py_logger_previsualizar_generacion(sucursal_id: int, empresa_id: int, semana_inicio: date, db) -> dict:
+    """
+    Controlador para obtener una vista previa de los horarios de una sucursal o de todas
+    las sucursales de una empresa, generada con la heurística y sin persistir.
+    """
+    try:
+        if sucursal_id is not None:
+            sucursal_ids = [sucursal_id]
+        else:
+            sucursal_ids = [sucursal.id for sucursal in SucursalRepository.get_by_empresa(empresa_id, db)]
+        resultado = previsualizar_horarios(sucursal_ids, semana_inicio, db)
+        return resultado.to_dict()
+    except Exception as error:
+        logger.error("Error al previsualizar la generación de horarios: %s", error)
+        raise HTTPException(status_code=500, detail="Error interno del servidor") from error
@@ -1,10 +1,12 @@
 from application.config.logger_config import setup_logger
 from typing import List, Optional
-from datetime import time
+from datetime import date, time
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from infrastructure.databases.models.puestos_cubiertos_por_hora import PuestosCubiertosPorHora
 from infrastructure.repositories.puestos_cubiertos_por_hora_repo import PuestosCubiertosPorHoraRepository
+from infrastructure.repositories.sucursal_repo import SucursalRepository
+from application.services.cobertura_service import CoberturaPeriodo, obtener_cobertura
 
 logger = setup_logger(__name__, "logs/puestos_cubiertos.log")
 
@@ -74,3 +76,26 @@ def controlador_delete_puestos(registro_id: int, db: Session) -> bool:
     
     logger.info("Registro eliminado exitosamente con id %s", registro_id)
     return eliminado
+
+def controlador_calcular_cobertura(
+    sucursal_id: Optional[int],
+    empresa_id: Optional[int],
+    fecha_desde: date,
+    fecha_hasta: date,
+    db: Session
+) -> CoberturaPeriodo:
+    if (sucursal_id is None) == (empresa_id is None):
+        raise HTTPException(status_code=400, detail="Debe indicarse sucursal_id o empresa_id, no ambos")
+    if fecha_hasta < fecha_desde:
+        raise HTTPException(status_code=400, detail="fecha_hasta no puede ser anterior a fecha_desde")
+
+    try:
+        if sucursal_id is not None:
+            sucursal_ids = [sucursal_id]
+        else:
+            sucursal_ids = [sucursal.id for sucursal in SucursalRepository.get_by_empresa(empresa_id, db)]
+        return obtener_cobertura(sucursal_ids, fecha_desde, fecha_hasta, db)
+    except Exception as error:
+        logger.error("Error al calcular la cobertura (sucursal %s, empresa %s) entre %s y %s: %s",
+                     sucursal_id, empresa_id, fecha_desde, fecha_hasta, error)
+        raise HTTPException(status_code=500, detail="Error interno del servidor") from error
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from infrastructure.databases.models.vacacion_colaborador import VacacionColaborador
 from infrastructure.repositories.vacacion_colaborador_repo import VacacionColaboradorRepository
 from application.config.logger_config import setup_logger
+from application.use_cases.generar_horarios import reparar_por_ausencia
 
 logger = setup_logger(__name__, "logs/vacacion_colaborador.log")
 
@@ -42,6 +43,27 @@ def controlador_create_vacacion(vacacion: VacacionColaborador, db: Session) -> V
         logger.error("Error al crear vacación: %s", error)
         raise HTTPException(status_code=500, detail="Error interno del servidor") from error
 
+def controlador_reparar_horarios_vacacion(vacacion: VacacionColaborador, db: Session) -> List[dict]:
+    """
+    Reasigna los puestos que el colaborador tenía en la fecha de la vacación, resolviendo
+    solo el vecindario afectado. Si la reparación falla, la vacación se mantiene y los
+    puestos quedan como estaban; se devuelve una lista vacía.
+    """
+    try:
+        resultados = reparar_por_ausencia(vacacion.colaborador_id, [vacacion.fecha], db)
+        return [
+            {
+                "estado": resultado.estado,
+                "turnos": len(resultado.turnos),
+                "cambios": resultado.cambios,
+                "tiempo_segundos": round(resultado.tiempo_segundos, 3),
+            }
+            for resultado in resultados
+        ]
+    except Exception as error:
+        logger.warning("No se pudo reparar los horarios por la vacación de %s: %s", vacacion.colaborador_id, error)
+        return []
+
 def controlador_delete_vacacion(vacacion_id: int, db: Session) -> bool:
     """
     Elimina un registro de vacación por su ID.
@@ -1,12 +1,17 @@
+import json
 import logging
 from datetime import date
+from typing import Iterator
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from application.services.venta_hora_service import (
     obtener_ventas_por_hora, 
     obtener_facturas, 
-    obtener_personas_por_hora
+    obtener_personas_por_hora,
+    iterar_facturas
 )
+from infrastructure.databases.config.database import DBConfig
 from infrastructure.schemas.venta_hora import VentaHoraResponse
 
 logger = logging.getLogger(__name__)
@@ -23,6 +28,24 @@ def controlador_get_facturas(sucursal: int, fecha_desde: date, fecha_hasta: date
         logger.error("Error en controlador_get_facturas: %s", e)
         raise HTTPException(status_code=500, detail="Error interno del servidor") from e
 
+def controlador_stream_facturas(sucursal: int, fecha_desde: date, fecha_hasta: date) -> Iterator[str]:
+    """
+    Genera las facturas sin procesar como NDJSON: una factura en JSON por línea, a
+    medida que llegan de la base. Abre su propia sesión de plex porque el generador se
+    consume al enviar la respuesta, cuando las dependencias de la ruta ya se cerraron.
+    """
+    db = DBConfig.get_session("plex")
+    try:
+        for venta in iterar_facturas(sucursal, fecha_desde, fecha_hasta, db):
+            yield json.dumps(jsonable_encoder(venta), ensure_ascii=False) + "\n"
+    except Exception as e:
+        # La respuesta ya empezó: solo se puede cortar el stream
+        logger.error("Error en controlador_stream_facturas: %s", e)
+        raise
+    finally:
+        if db is not None:
+            db.close()
+
 def controlador_get_ventas_por_hora(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> dict:
     """
     Llama al service para obtener las ventas agrupadas por hora.
@@ -4,6 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from starlette.responses import StreamingResponse
 from io import BytesIO
 import os
+import json
 import tempfile
 import zipfile
 from datetime import datetime
@@ -14,13 +15,19 @@ from infrastructure.schemas.horario import (
     HorarioUpdate, 
     HorarioDeleteRequest
 )
+from infrastructure.schemas.generacion_horarios import GeneracionHorariosRequest, TrabajoGeneracionResponse
 from application.controllers.horario_controller import (
     controlador_py_logger_crear_horarios,
     controlador_py_logger_actualizar_horarios,
     controlador_py_logger_get_by_puesto,
     controlador_py_logger_delete_horarios,
     controlador_py_logger_get_by_puestos,
-    controlador_py_logger_generar_excel_horarios
+    controlador_py_logger_generar_excel_horarios,
+    controlador_py_logger_encolar_generacion,
+    controlador_py_logger_get_trabajo_generacion,
+    controlador_py_logger_eventos_generacion,
+    controlador_py_logger_detener_generacion,
+    controlador_py_logger_previsualizar_generacion
 )
 from application.helpers.response_handler import success_response, error_response
 from application.config.logger_config import setup_logger
@@ -198,3 +205,120 @@ def descargar_excel_horarios_endpoint(
     except Exception as e:
         logger.error("Error en descargar_excel_horarios_endpoint: %s", e)
         raise HTTPException(status_code=500, detail="Error interno del servidor") from e
+
+
+@router.post("/generar", response_model=TrabajoGeneracionResponse, status_code=202)
+def encolar_generacion_endpoint(
+    request: GeneracionHorariosRequest = Body(...),
+    current_user = Depends(get_current_user_from_cookie),
+    role = Depends(require_roles("superadmin", "admin", "supervisor"))
+):
+    """
+    Endpoint para generar automáticamente los horarios de una sucursal o de todas las
+    sucursales de una empresa para una semana.
+    La generación no se ejecuta dentro del request: se encola y se responde con el ID
+    del trabajo, cuyo estado se consulta en GET /horarios/generar/{job_id}.
+    """
+    try:
+        parametros = jsonable_encoder(request.model_dump())
+        trabajo = controlador_py_logger_encolar_generacion(parametros, current_user.id)
+        data = TrabajoGeneracionResponse.model_validate(trabajo).model_dump()
+        return success_response("Generación de horarios encolada", data=jsonable_encoder(data), status_code=202)
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error("Error en encolar_generacion_endpoint: %s", e)
+        return error_response(str(e), status_code=500)
+
+
+@router.post("/generar/preview", response_model=dict)
+def previsualizar_generacion_endpoint(
+    request: GeneracionHorariosRequest = Body(...),
+    db: Session = Depends(get_db_factory("rrhh")),
+    current_user = Depends(get_current_user_from_cookie),
+    role = Depends(require_roles("superadmin", "admin", "supervisor"))
+):
+    """
+    Endpoint para obtener al instante una propuesta de horarios generada con la
+    heurística constructiva. No persiste nada; para la generación definitiva se usa
+    POST /horarios/generar.
+    """
+    try:
+        data = controlador_py_logger_previsualizar_generacion(
+            request.sucursal_id, request.empresa_id, request.semana_inicio, db
+        )
+        return success_response("Vista previa de horarios generada", data=jsonable_encoder(data))
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error("Error en previsualizar_generacion_endpoint: %s", e)
+        return error_response(str(e), status_code=500)
+
+
+@router.get("/generar/{job_id}", response_model=TrabajoGeneracionResponse)
+def get_trabajo_generacion_endpoint(
+    job_id: str,
+    current_user = Depends(get_current_user_from_cookie),
+    role = Depends(require_roles("superadmin", "admin", "supervisor"))
+):
+    """
+    Endpoint para consultar un trabajo de generación: estado, mejor objetivo encontrado
+    hasta el momento, cota y tiempo transcurrido.
+    """
+    try:
+        trabajo = controlador_py_logger_get_trabajo_generacion(job_id)
+        data = TrabajoGeneracionResponse.model_validate(trabajo).model_dump()
+        return success_response("Trabajo de generación encontrado", data=jsonable_encoder(data))
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error("Error en get_trabajo_generacion_endpoint: %s", e)
+        return error_response(str(e), status_code=500)
+
+
+def _formatear_eventos(eventos):
+    for evento in eventos:
+        if evento is None:
+            # Comentario SSE para que proxies y navegador no corten la conexión
+            yield ": ping\n\n"
+            continue
+        tipo, datos = evento
+        yield f"event: {tipo}\ndata: {json.dumps(jsonable_encoder(datos))}\n\n"
+
+
+@router.get("/generar/{job_id}/eventos", response_class=StreamingResponse)
+def eventos_generacion_endpoint(
+    job_id: str,
+    current_user = Depends(get_current_user_from_cookie),
+    role = Depends(require_roles("superadmin", "admin", "supervisor"))
+):
+    """
+    Endpoint Server-Sent Events con las soluciones que va encontrando un trabajo de generación.
+    Eventos:
+      - solucion: objetivo, cota, turnos que cambiaron respecto de la solución anterior
+        ('cambios' y 'eliminados') y cobertura frente a los mínimos requeridos.
+      - estado: cambios de estado del trabajo; el último incluye el resultado o el error.
+    """
+    eventos = controlador_py_logger_eventos_generacion(job_id)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(_formatear_eventos(eventos), media_type="text/event-stream", headers=headers)
+
+
+@router.post("/generar/{job_id}/detener", response_model=dict)
+def detener_generacion_endpoint(
+    job_id: str,
+    current_user = Depends(get_current_user_from_cookie),
+    role = Depends(require_roles("superadmin", "admin", "supervisor"))
+):
+    """
+    Endpoint para cortar la búsqueda de un trabajo de generación. Se guarda la mejor
+    solución encontrada hasta el momento.
+    """
+    try:
+        controlador_py_logger_detener_generacion(job_id)
+        return success_response("Se solicitó detener la generación", data={"job_id": job_id})
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error("Error en detener_generacion_endpoint: %s", e)
+        return error_response(str(e), status_code=500)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query, Body, Depends
-from typing import List
-from datetime import time
+from typing import List, Optional
+from datetime import date, time
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
@@ -18,7 +18,8 @@ from application.controllers.puestos_cubiertos_por_hora_controller import (
     controlador_get_by_horario_puestos,
     controlador_create_puestos,
     controlador_update_puestos,
-    controlador_delete_puestos
+    controlador_delete_puestos,
+    controlador_calcular_cobertura
 )
 
 # Dependencias para autenticación y roles
@@ -85,6 +86,33 @@ def get_puesto_by_horario(
         logger.error("Error en get_puesto_by_horario: %s", e)
         return error_response(str(e), status_code=500)
 
+@router.get("/cobertura")
+def get_cobertura(
+    fecha_desde: date = Query(...),
+    fecha_hasta: date = Query(...),
+    sucursal_id: Optional[int] = Query(None, description="ID de la sucursal"),
+    empresa_id: Optional[int] = Query(None, description="ID de la empresa (todas sus sucursales)"),
+    solo_resumen: bool = Query(False, description="Omitir el detalle de franjas con desvíos"),
+    db: Session = Depends(get_db_factory("rrhh")),
+    current_user = Depends(get_current_user_from_cookie),
+    role = Depends(require_roles("superadmin", "admin", "supervisor"))
+):
+    """
+    Calcula la cobertura real de los puestos asignados frente a los mínimos requeridos,
+    en franjas de 15 minutos, y devuelve los faltantes y sobrantes.
+    """
+    try:
+        cobertura = controlador_calcular_cobertura(sucursal_id, empresa_id, fecha_desde, fecha_hasta, db)
+        data = {"resumen": cobertura.resumen()}
+        if not solo_resumen:
+            data["desvios"] = cobertura.desvios()
+        return success_response("Cobertura calculada", data=jsonable_encoder(data))
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error("Error en get_cobertura: %s", e)
+        return error_response(str(e), status_code=500)
+
 @router.post("/", response_model=PuestosCubiertosPorHoraResponse)
 def create_puesto(
     puesto_data: PuestosCubiertosPorHoraBase = Body(...),
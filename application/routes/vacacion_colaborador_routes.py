@@ -15,6 +15,7 @@ from application.controllers.vacacion_colaborador_controller import (
     controlador_get_by_colaborador_vacacion,
     controlador_get_by_fecha_vacacion,
     controlador_create_vacacion,
+    controlador_reparar_horarios_vacacion,
     controlador_update_vacacion,
     controlador_delete_vacacion
 )
@@ -79,13 +80,17 @@ def create_vacacion(
 ):
     """
     Endpoint para crear un nuevo registro de vacaciones.
+    Si el colaborador tenía puestos asignados ese día, se reparan los horarios de la
+    semana liberando solo sus puestos y los de un vecindario chico; el detalle se
+    devuelve en 'reparacion'.
     """
     try:
         # Se crea el objeto ORM a partir de los datos del esquema
         nueva_vacacion = VacacionColaborador(**vacacion_data.model_dump())
         creado = controlador_create_vacacion(nueva_vacacion, db)
+        reparacion = controlador_reparar_horarios_vacacion(creado, db)
         vacacion_schema = VacacionColaboradorResponse.model_validate(creado)
-        data = jsonable_encoder(vacacion_schema.model_dump())
+        data = jsonable_encoder({**vacacion_schema.model_dump(), "reparacion": reparacion})
         return success_response("Vacación creada exitosamente", data=data)
     except HTTPException as he:
         raise he
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import StreamingResponse
 from typing import List
 from datetime import date
 from fastapi.encoders import jsonable_encoder
@@ -8,6 +9,7 @@ import logging
 from application.helpers.response_handler import success_response, error_response
 from application.controllers.vta_hora_controller import (
     controlador_get_facturas,
+    controlador_stream_facturas,
     controlador_get_ventas_por_hora,
     controlador_get_personas_por_hora
 )
@@ -26,13 +28,21 @@ def get_vta_hora(
     sucursal: int = Query(..., description="ID de la sucursal"),
     fecha_desde: date = Query(..., description="Fecha de inicio (YYYY-MM-DD)"),
     fecha_hasta: date = Query(..., description="Fecha de fin (YYYY-MM-DD)"),
+    formato: str = Query("json", pattern="^(json|ndjson)$", description="json, o ndjson para recibir una factura por línea en streaming"),
     db: Session = Depends(get_db_factory("plex")),
     current_user = Depends(get_current_user_from_cookie),
     role = Depends(require_roles("superadmin", "admin"))
 ):
     """
     Endpoint para obtener la información de facturas sin procesar.
+    Con formato=ndjson las facturas se envían a medida que se leen de la base, con
+    memoria constante sin importar el rango de fechas.
     """
+    if formato == "ndjson":
+        return StreamingResponse(
+            controlador_stream_facturas(sucursal, fecha_desde, fecha_hasta),
+            media_type="application/x-ndjson"
+        )
     try:
         factura_response = controlador_get_facturas(sucursal, fecha_desde, fecha_hasta, db)
         data_json = jsonable_encoder(factura_response.data)
@@ -48,12 +58,13 @@ def get_ventas_por_hora(
     sucursal: int = Query(..., description="ID de la sucursal"),
     fecha_desde: date = Query(..., description="Fecha de inicio (YYYY-MM-DD)"),
     fecha_hasta: date = Query(..., description="Fecha de fin (YYYY-MM-DD)"),
-    db: Session = Depends(get_db_factory("plex")),
+    db: Session = Depends(get_db_factory("rrhh")),
     current_user = Depends(get_current_user_from_cookie),
     role = Depends(require_roles("superadmin", "admin"))
 ):
     """
-    Endpoint que obtiene las ventas agrupadas por hora.
+    Endpoint que obtiene las ventas agrupadas por hora. Se leen del resumen de la base
+    rrhh, que se completa desde plex solo con los días que faltan.
     """
     try:
         resultado = controlador_get_ventas_por_hora(sucursal, fecha_desde, fecha_hasta, db)
@@ -71,7 +82,7 @@ def get_personas_por_hora(
     fecha_desde: date = Query(..., description="Fecha de inicio (YYYY-MM-DD)"),
     fecha_hasta: date = Query(..., description="Fecha de fin (YYYY-MM-DD)"),
     tiempo_promedio: int = Query(5, description="Tiempo promedio (en minutos) que tarda una factura"),
-    db: Session = Depends(get_db_factory("plex")),
+    db: Session = Depends(get_db_factory("rrhh")),
     current_user = Depends(get_current_user_from_cookie),
     role = Depends(require_roles("superadmin", "admin"))
 ):
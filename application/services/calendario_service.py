@@ -0,0 +1,60 @@
+"""
+Índice anual de vacaciones y días trabajados de los colaboradores de una o varias
+sucursales.
+
+Las vacaciones (VacacionColaborador) y las fechas con puestos asignados (Puesto.fecha)
+del año se leen con una consulta cada una y se guardan como bitmaps de 366 bits por
+colaborador (`IndiceCalendario`). Detectar vacaciones con puestos asignados o contar
+días libres de toda una sucursal es entonces un AND y un popcount por colaborador.
+"""
+
+import logging
+from datetime import date
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from domain.models.calendario import IndiceCalendario
+from infrastructure.repositories.colaborador_sucursal_repo import ColaboradorSucursalRepository
+from infrastructure.repositories.puesto_repo import PuestoRepository
+from infrastructure.repositories.vacacion_colaborador_repo import VacacionColaboradorRepository
+
+logger = logging.getLogger(__name__)
+
+
+def obtener_indice_calendario(sucursal_ids: List[int], anio: int, db: Session) -> IndiceCalendario:
+    """
+    Arma el índice de calendario del año para los colaboradores de las sucursales.
+    Los días trabajados incluyen los puestos del colaborador en cualquier sucursal.
+
+    Args:
+        sucursal_ids (List[int]): Sucursales cuyos colaboradores se incluyen.
+        anio (int): Año calendario.
+        db (Session): Sesión de la base de datos.
+
+    Returns:
+        IndiceCalendario: Bitmaps del año, una fila por colaborador.
+    """
+    colaborador_ids = sorted({
+        relacion.colaborador_id for relacion in ColaboradorSucursalRepository.get_by_sucursales(sucursal_ids, db)
+    }) if sucursal_ids else []
+    vacaciones, trabajados = [], []
+    if colaborador_ids:
+        desde, hasta = date(anio, 1, 1), date(anio, 12, 31)
+        vacaciones = [
+            (vacacion.colaborador_id, vacacion.fecha)
+            for vacacion in VacacionColaboradorRepository.get_by_colaboradores_rango(colaborador_ids, desde, hasta, db)
+        ]
+        trabajados = PuestoRepository.get_fechas_trabajadas(colaborador_ids, desde, hasta, db)
+
+    indice = IndiceCalendario.desde_filas(anio, vacaciones, trabajados, colaborador_ids)
+    logger.info(
+        f"Calendario {anio} de sucursales {sucursal_ids}: {len(indice.colaborador_ids)} colaboradores, "
+        f"{len(vacaciones)} vacaciones, {len(trabajados)} días trabajados"
+    )
+    return indice
+
+
+def colaboradores_con_conflicto(sucursal_ids: List[int], anio: int, db: Session) -> List[int]:
+    """Colaboradores de las sucursales con puestos asignados en días de vacaciones."""
+    return obtener_indice_calendario(sucursal_ids, anio, db).colaboradores_con_conflicto()
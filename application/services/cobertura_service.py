@@ -0,0 +1,307 @@
+"""
+Cobertura real de puestos frente a los mínimos requeridos.
+
+Los bloques horarios de los puestos asignados se rasterizan en un arreglo de NumPy
+de forma (sucursales, días, franjas de 15 minutos, roles): cada bloque aporta un +1
+en la franja donde empieza y un -1 donde termina, y una suma acumulada sobre el eje
+del tiempo da la cantidad de colaboradores presentes en cada franja. Los mínimos
+(por dia_id y hora) se expanden a la misma grilla y la diferencia entre ambas da el
+faltante y el sobrante de cada franja. Todo es vectorizado, por lo que un mes de una
+empresa completa se calcula en milisegundos.
+"""
+
+import logging
+from datetime import date, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from infrastructure.repositories.horario_sucursal_repo import HorarioSucursalRepository
+from infrastructure.repositories.minimo_puestos_requeridos_repo import MinimoPuestosRequeridosRepository
+from infrastructure.repositories.puesto_repo import PuestoRepository
+
+logger = logging.getLogger(__name__)
+
+MINUTOS_FRANJA = 15
+FRANJAS_DIA = 24 * 60 // MINUTOS_FRANJA
+# Cada mínimo se define para la hora que comienza en `hora`
+FRANJAS_MINIMO = 60 // MINUTOS_FRANJA
+
+
+def _a_minutos(hora: time) -> int:
+    return hora.hour * 60 + hora.minute
+
+
+class CoberturaPeriodo:
+    def __init__(
+        self,
+        sucursal_ids: List[int],
+        fechas: List[date],
+        rol_ids: List[int],
+        cubiertos: np.ndarray,
+        requeridos: np.ndarray,
+        con_minimo: np.ndarray
+    ):
+        """
+        Cobertura por franja de un conjunto de sucursales en un rango de fechas.
+        Los arreglos tienen forma (sucursales, días, FRANJAS_DIA, roles).
+
+        Args:
+            sucursal_ids (List[int]): Sucursales, en el orden del primer eje.
+            fechas (List[date]): Fechas, en el orden del segundo eje.
+            rol_ids (List[int]): Roles, en el orden del último eje.
+            cubiertos (np.ndarray): Colaboradores presentes durante toda la franja.
+            requeridos (np.ndarray): Mínimo requerido en la franja (0 si no hay mínimo).
+            con_minimo (np.ndarray): Si la franja tiene un mínimo cargado.
+        """
+        self.sucursal_ids = sucursal_ids
+        self.fechas = fechas
+        self.rol_ids = rol_ids
+        self.cubiertos = cubiertos
+        self.requeridos = requeridos
+        self.con_minimo = con_minimo
+
+    @property
+    def faltantes(self) -> np.ndarray:
+        return np.maximum(self.requeridos - self.cubiertos, 0)
+
+    @property
+    def sobrantes(self) -> np.ndarray:
+        # Solo hay sobrante donde hay un mínimo contra el cual comparar
+        return np.where(self.con_minimo, np.maximum(self.cubiertos - self.requeridos, 0), 0)
+
+    def desvios(self) -> List[dict]:
+        """
+        Franjas con faltante o sobrante, con los colaboradores requeridos y cubiertos.
+        """
+        faltantes, sobrantes = self.faltantes, self.sobrantes
+        indices = np.nonzero((faltantes > 0) | (sobrantes > 0))
+        return [
+            {
+                "sucursal_id": self.sucursal_ids[s],
+                "fecha": self.fechas[d],
+                "hora": f"{f * MINUTOS_FRANJA // 60:02d}:{f * MINUTOS_FRANJA % 60:02d}",
+                "rol_colaborador_id": self.rol_ids[r],
+                "requeridos": int(self.requeridos[s, d, f, r]),
+                "cubiertos": int(self.cubiertos[s, d, f, r]),
+                "faltantes": int(faltantes[s, d, f, r]),
+                "sobrantes": int(sobrantes[s, d, f, r]),
+            }
+            for s, d, f, r in zip(*(eje.tolist() for eje in indices))
+        ]
+
+    def resumen(self) -> List[dict]:
+        """
+        Totales por sucursal en horas-persona: requeridas, faltantes y sobrantes.
+        """
+        a_horas = MINUTOS_FRANJA / 60
+        requeridas = self.requeridos.sum(axis=(1, 2, 3)) * a_horas
+        faltantes = self.faltantes.sum(axis=(1, 2, 3)) * a_horas
+        sobrantes = self.sobrantes.sum(axis=(1, 2, 3)) * a_horas
+        return [
+            {
+                "sucursal_id": sucursal_id,
+                "horas_requeridas": float(requeridas[s]),
+                "horas_faltantes": float(faltantes[s]),
+                "horas_sobrantes": float(sobrantes[s]),
+            }
+            for s, sucursal_id in enumerate(self.sucursal_ids)
+        ]
+
+
+def _indices(valores: np.ndarray, universo: List[int]) -> np.ndarray:
+    """Posición de cada valor dentro de `universo` (ordenado)."""
+    return np.searchsorted(np.asarray(universo), valores)
+
+
+def rasterizar_bloques(
+    sucursal_idx: np.ndarray,
+    dia_idx: np.ndarray,
+    rol_idx: np.ndarray,
+    inicio: np.ndarray,
+    fin: np.ndarray,
+    forma: Tuple[int, int, int]
+) -> np.ndarray:
+    """
+    Cuenta los colaboradores presentes en cada franja a partir de bloques en minutos.
+
+    Un bloque cubre las franjas que ocupa por completo. Un fin anterior o igual al
+    inicio se interpreta como cierre al día siguiente; lo que excede el último día
+    del rango se descarta.
+
+    Args:
+        sucursal_idx, dia_idx, rol_idx (np.ndarray): Posición de cada bloque en los ejes.
+        inicio, fin (np.ndarray): Minutos desde las 00:00 de cada bloque.
+        forma (Tuple[int, int, int]): (sucursales, días, roles).
+
+    Returns:
+        np.ndarray: Arreglo (sucursales, días, FRANJAS_DIA, roles) de enteros.
+    """
+    sucursales, dias, roles = forma
+    # Un día extra para los bloques que terminan después de medianoche, más un lugar para el -1 final
+    largo = (dias + 1) * FRANJAS_DIA + 1
+
+    franja_inicio = -(-inicio // MINUTOS_FRANJA)
+    franja_fin = fin // MINUTOS_FRANJA + np.where(fin <= inicio, FRANJAS_DIA, 0)
+    validos = franja_fin > franja_inicio
+
+    base = (sucursal_idx * roles + rol_idx) * largo + dia_idx * FRANJAS_DIA
+    total = sucursales * roles * largo
+    eventos = (
+        np.bincount((base + franja_inicio)[validos], minlength=total)
+        - np.bincount((base + franja_fin)[validos], minlength=total)
+    )
+    presentes = np.cumsum(eventos.reshape(sucursales, roles, largo), axis=2)
+    presentes = presentes[:, :, :dias * FRANJAS_DIA].reshape(sucursales, roles, dias, FRANJAS_DIA)
+    return presentes.transpose(0, 2, 3, 1)
+
+
+def grilla_minimos(
+    sucursal_idx: np.ndarray,
+    dia_id: np.ndarray,
+    rol_idx: np.ndarray,
+    hora: np.ndarray,
+    cantidad: np.ndarray,
+    dia_ids_fechas: np.ndarray,
+    forma: Tuple[int, int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expande los mínimos por dia_id y hora a la grilla de franjas de cada fecha.
+
+    Args:
+        sucursal_idx, rol_idx (np.ndarray): Posición de cada mínimo en los ejes.
+        dia_id (np.ndarray): dia_id de cada mínimo (1 = Lunes ... 7 = Domingo).
+        hora (np.ndarray): Minutos desde las 00:00 en que comienza la hora del mínimo; un
+            valor de FRANJAS_DIA * MINUTOS_FRANJA o más corresponde al día siguiente.
+        cantidad (np.ndarray): Cantidad mínima de colaboradores.
+        dia_ids_fechas (np.ndarray): dia_id de cada fecha del rango.
+        forma (Tuple[int, int, int]): (sucursales, días, roles).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (requeridos, con_minimo), ambos de forma
+            (sucursales, días, FRANJAS_DIA, roles).
+    """
+    sucursales, dias, roles = forma
+    largo = (dias + 1) * FRANJAS_DIA
+    requeridos = np.zeros(sucursales * roles * largo, dtype=np.int64)
+    con_minimo = np.zeros(sucursales * roles * largo, dtype=bool)
+
+    # Cada mínimo se aplica a todas las fechas de su dia_id y a las franjas de su hora
+    fila, dia = np.nonzero(dia_id[:, None] == dia_ids_fechas[None, :])
+    desplazamiento = np.arange(FRANJAS_MINIMO)
+    posiciones = (
+        ((sucursal_idx[fila] * roles + rol_idx[fila]) * largo + dia * FRANJAS_DIA + hora[fila] // MINUTOS_FRANJA)[:, None]
+        + desplazamiento[None, :]
+    ).ravel()
+    requeridos[posiciones] = np.repeat(cantidad[fila], FRANJAS_MINIMO)
+    con_minimo[posiciones] = True
+
+    def a_grilla(arreglo: np.ndarray) -> np.ndarray:
+        arreglo = arreglo.reshape(sucursales, roles, dias + 1, FRANJAS_DIA)[:, :, :dias]
+        return arreglo.transpose(0, 2, 3, 1)
+
+    return a_grilla(requeridos), a_grilla(con_minimo)
+
+
+def calcular_cobertura(
+    sucursal_ids: List[int],
+    fecha_desde: date,
+    fecha_hasta: date,
+    bloques: Iterable[Tuple[int, int, date, time, time]],
+    minimos: Iterable[Tuple[int, int, int, time, int]],
+    aperturas: Optional[Dict[Tuple[int, int], time]] = None
+) -> CoberturaPeriodo:
+    """
+    Calcula la cobertura por franja de un rango de fechas a partir de datos planos.
+
+    Args:
+        sucursal_ids (List[int]): Sucursales a considerar.
+        fecha_desde (date): Primera fecha del rango.
+        fecha_hasta (date): Última fecha del rango (inclusive).
+        bloques (Iterable[Tuple]): (sucursal_id, rol_colaborador_id, fecha, hora_inicio, hora_fin)
+            de cada bloque asignado.
+        minimos (Iterable[Tuple]): (sucursal_id, rol_colaborador_id, dia_id, hora, cantidad_minima).
+        aperturas (Optional[Dict[Tuple[int, int], time]]): (sucursal_id, dia_id) -> hora de
+            apertura. Un mínimo con hora anterior a la apertura corresponde a la madrugada
+            siguiente, igual que en el motor de generación.
+
+    Returns:
+        CoberturaPeriodo: Cobertura, mínimos y desvíos por franja.
+    """
+    sucursal_ids = sorted(set(sucursal_ids))
+    fechas = [fecha_desde + timedelta(days=i) for i in range((fecha_hasta - fecha_desde).days + 1)]
+    posicion_fecha = {fecha: i for i, fecha in enumerate(fechas)}
+    aperturas = aperturas or {}
+    # Las horas distintas son pocas: se convierten a minutos una sola vez
+    minutos: Dict[time, int] = {}
+
+    def a_minutos(horas) -> np.ndarray:
+        for hora in set(horas).difference(minutos):
+            minutos[hora] = _a_minutos(hora)
+        return np.array([minutos[hora] for hora in horas], dtype=np.int64)
+
+    bloques = list(bloques)
+    if bloques:
+        sucursal, rol, fecha, inicio, fin = zip(*bloques)
+        sucursal, rol = np.array(sucursal), np.array(rol)
+        dia = np.array([posicion_fecha.get(f, -1) for f in fecha])
+        inicio, fin = a_minutos(inicio), a_minutos(fin)
+        validos = np.isin(sucursal, sucursal_ids) & (dia >= 0)
+        sucursal, rol, dia, inicio, fin = (columna[validos] for columna in (sucursal, rol, dia, inicio, fin))
+    else:
+        rol = np.array([], dtype=np.int64)
+
+    incluidas = set(sucursal_ids)
+    minimos = [m for m in minimos if m[0] in incluidas]
+    rol_ids = sorted(set(rol.tolist()) | {m[1] for m in minimos})
+    forma = (len(sucursal_ids), len(fechas), len(rol_ids))
+
+    if len(rol):
+        cubiertos = rasterizar_bloques(
+            _indices(sucursal, sucursal_ids), dia, _indices(rol, rol_ids), inicio, fin, forma
+        )
+    else:
+        cubiertos = np.zeros(forma[:2] + (FRANJAS_DIA, forma[2]), dtype=np.int64)
+
+    if minimos:
+        sucursal_minimo, rol_minimo, dia_id, hora, cantidad = zip(*minimos)
+        # Un mínimo anterior a la apertura del día corresponde a la madrugada siguiente
+        madrugada = np.array([
+            (s, d) in aperturas and h < aperturas[(s, d)] for s, d, h in zip(sucursal_minimo, dia_id, hora)
+        ], dtype=bool)
+        requeridos, con_minimo = grilla_minimos(
+            _indices(np.array(sucursal_minimo), sucursal_ids),
+            np.array(dia_id),
+            _indices(np.array(rol_minimo), rol_ids),
+            a_minutos(hora) + madrugada * 24 * 60,
+            np.array(cantidad),
+            np.array([f.isoweekday() for f in fechas]),
+            forma,
+        )
+    else:
+        requeridos = np.zeros_like(cubiertos)
+        con_minimo = np.zeros(cubiertos.shape, dtype=bool)
+
+    return CoberturaPeriodo(sucursal_ids, fechas, rol_ids, cubiertos, requeridos, con_minimo)
+
+
+def obtener_cobertura(sucursal_ids: List[int], fecha_desde: date, fecha_hasta: date, db: Session) -> CoberturaPeriodo:
+    """
+    Calcula la cobertura real de los puestos asignados de las sucursales en el rango de
+    fechas frente a sus mínimos de puestos requeridos.
+    """
+    try:
+        bloques = PuestoRepository.get_bloques_asignados(sucursal_ids, fecha_desde, fecha_hasta, db)
+        minimos = [
+            (m.sucursal_id, m.rol_colaborador_id, m.dia_id, m.hora, m.cantidad_minima)
+            for m in MinimoPuestosRequeridosRepository.get_by_sucursales(sucursal_ids, db)
+        ]
+        aperturas = {
+            (h.sucursal_id, h.dia_id): h.hora_apertura
+            for h in HorarioSucursalRepository.get_by_sucursales(sucursal_ids, db)
+        }
+        return calcular_cobertura(sucursal_ids, fecha_desde, fecha_hasta, bloques, minimos, aperturas)
+    except Exception as e:
+        logger.error("Error en obtener_cobertura: %s", e)
+        raise e
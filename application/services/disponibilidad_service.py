@@ -0,0 +1,439 @@
+"""
+Matriz de disponibilidad de los colaboradores de una empresa para una semana.
+
+Un colaborador puede trabajar en una sucursal, una fecha y una franja de 15 minutos
+si está asignado a la sucursal (ColaboradorSucursal), la sucursal atiende en esa
+franja (HorarioSucursal) y no está de vacaciones ese día (VacacionColaborador). Si
+además la franja cae dentro de uno de sus horarios preferidos
+(HorarioPreferidoColaborador) se marca como preferida. Las cuatro tablas se leen con
+una consulta cada una para toda la empresa y el resultado se guarda como bits
+empaquetados con NumPy, cacheado por (empresa, semana) e invalidado cuando se
+confirma una transacción que cambia alguna fila que lo afecte. La generación de
+horarios de una empresa toma de la matriz las fechas no disponibles de cada colaborador.
+
+Los horarios siguen la convención del motor: una franja pertenece al día en que abre
+la sucursal, por lo que si cierra después de medianoche la disponibilidad se extiende
+a la madrugada de la fecha siguiente, con las vacaciones del día de apertura.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from application.services.cobertura_service import FRANJAS_DIA, MINUTOS_FRANJA
+from infrastructure.databases.models.colaborador_sucursal import ColaboradorSucursal
+from infrastructure.databases.models.horario_preferido_colaborador import HorarioPreferidoColaborador
+from infrastructure.databases.models.horario_sucursal import HorarioSucursal
+from infrastructure.databases.models.sucursal import Sucursal
+from infrastructure.databases.models.vacacion_colaborador import VacacionColaborador
+from infrastructure.repositories.colaborador_sucursal_repo import ColaboradorSucursalRepository
+from infrastructure.repositories.horario_preferido_colaborador_repo import HorarioPreferidoColaboradorRepository
+from infrastructure.repositories.horario_sucursal_repo import HorarioSucursalRepository
+from infrastructure.repositories.sucursal_repo import SucursalRepository
+from infrastructure.repositories.vacacion_colaborador_repo import VacacionColaboradorRepository
+
+logger = logging.getLogger(__name__)
+
+DIAS_SEMANA = 7
+MINUTOS_DIA = 24 * 60
+# Días de apertura que se rasterizan: el domingo anterior (su madrugada cae en el lunes) y la semana
+DIAS_APERTURA = DIAS_SEMANA + 1
+# Semanas de empresas distintas que se mantienen en memoria
+TAMANO_CACHE = 32
+
+
+def _a_minutos(hora: time) -> int:
+    return hora.hour * 60 + hora.minute
+
+
+def _lunes(fecha: date) -> date:
+    return fecha - timedelta(days=fecha.weekday())
+
+
+class MatrizDisponibilidad:
+    def __init__(
+        self,
+        empresa_id: int,
+        semana_inicio: date,
+        colaborador_ids: List[int],
+        sucursal_ids: List[int],
+        disponible: np.ndarray,
+        preferido: np.ndarray,
+        vacaciones: Optional[np.ndarray] = None
+    ):
+        """
+        Disponibilidad de una semana como bits empaquetados.
+
+        Los arreglos tienen forma (colaboradores, sucursales, DIAS_SEMANA, FRANJAS_DIA / 8)
+        y dtype uint8: el eje de franjas está empaquetado con `np.packbits`, por lo que
+        la semana de un colaborador en una sucursal ocupa 84 bytes.
+
+        Args:
+            empresa_id (int): Empresa de las sucursales.
+            semana_inicio (date): Lunes de la semana.
+            colaborador_ids (List[int]): Colaboradores, en el orden del primer eje.
+            sucursal_ids (List[int]): Sucursales, en el orden del segundo eje.
+            disponible (np.ndarray): Franjas en las que el colaborador puede trabajar.
+            preferido (np.ndarray): Franjas disponibles dentro de un horario preferido.
+            vacaciones (Optional[np.ndarray]): Booleano (colaboradores, DIAS_SEMANA) con los
+                días de vacaciones de cada colaborador.
+        """
+        self.empresa_id = empresa_id
+        self.semana_inicio = semana_inicio
+        self.colaborador_ids = colaborador_ids
+        self.sucursal_ids = sucursal_ids
+        self._disponible = disponible
+        self._preferido = preferido
+        self._vacaciones = (
+            vacaciones if vacaciones is not None else np.zeros((len(colaborador_ids), DIAS_SEMANA), dtype=bool)
+        )
+        self._indice_colaborador = {colaborador_id: i for i, colaborador_id in enumerate(colaborador_ids)}
+        self._indice_sucursal = {sucursal_id: j for j, sucursal_id in enumerate(sucursal_ids)}
+
+    @property
+    def fechas(self) -> List[date]:
+        return [self.semana_inicio + timedelta(days=dia) for dia in range(DIAS_SEMANA)]
+
+    @property
+    def nbytes(self) -> int:
+        return self._disponible.nbytes + self._preferido.nbytes
+
+    def contiene_fecha(self, fecha: date) -> bool:
+        return 0 <= (fecha - self.semana_inicio).days < DIAS_SEMANA
+
+    def contiene_colaborador(self, colaborador_id: int) -> bool:
+        return colaborador_id in self._indice_colaborador
+
+    def contiene_sucursal(self, sucursal_id: int) -> bool:
+        return sucursal_id in self._indice_sucursal
+
+    def franjas(self, colaborador_id: int, sucursal_id: int, fecha: date, preferidas: bool = False) -> np.ndarray:
+        """
+        Franjas de 15 minutos de una fecha en las que el colaborador puede trabajar en
+        la sucursal (o que además son preferidas).
+
+        Returns:
+            np.ndarray: Arreglo booleano de FRANJAS_DIA; todo False si el colaborador,
+                la sucursal o la fecha no están en la matriz.
+        """
+        i = self._indice_colaborador.get(colaborador_id)
+        j = self._indice_sucursal.get(sucursal_id)
+        if i is None or j is None or not self.contiene_fecha(fecha):
+            return np.zeros(FRANJAS_DIA, dtype=bool)
+        bits = (self._preferido if preferidas else self._disponible)[i, j, (fecha - self.semana_inicio).days]
+        return np.unpackbits(bits).astype(bool)
+
+    def fechas_no_disponibles(self, colaborador_id: int) -> Set[date]:
+        """Fechas de la semana en las que el colaborador está de vacaciones."""
+        i = self._indice_colaborador.get(colaborador_id)
+        if i is None:
+            return set()
+        return {self.semana_inicio + timedelta(days=int(dia)) for dia in np.flatnonzero(self._vacaciones[i])}
+
+    def puede_trabajar(self, colaborador_id: int, sucursal_id: int, fecha: date, inicio: time, fin: time) -> bool:
+        """
+        Indica si el colaborador está disponible durante todo el bloque [inicio, fin)
+        de esa fecha. Un fin anterior o igual al inicio continúa en la fecha siguiente.
+        """
+        desde = _a_minutos(inicio) // MINUTOS_FRANJA
+        hasta = -(-_a_minutos(fin) // MINUTOS_FRANJA)
+        if hasta <= desde:
+            return (
+                bool(self.franjas(colaborador_id, sucursal_id, fecha)[desde:].all())
+                and bool(self.franjas(colaborador_id, sucursal_id, fecha + timedelta(days=1))[:hasta].all())
+            )
+        return bool(self.franjas(colaborador_id, sucursal_id, fecha)[desde:hasta].all())
+
+    def tensor(self, preferidas: bool = False) -> np.ndarray:
+        """
+        Matriz desempaquetada con forma (colaboradores, fechas, franjas, sucursales).
+        Ocupa 8 veces más memoria que la empaquetada.
+        """
+        bits = self._preferido if preferidas else self._disponible
+        return np.unpackbits(bits, axis=-1).astype(bool).transpose(0, 2, 3, 1)
+
+
+def _rasterizar(filas: np.ndarray, inicios: np.ndarray, fines: np.ndarray, cantidad_filas: int) -> np.ndarray:
+    """
+    Marca las franjas completamente cubiertas por cada rango de minutos de la semana de
+    apertura (DIAS_APERTURA días) sumando +1/-1 en los extremos y acumulando.
+    """
+    total = DIAS_APERTURA * FRANJAS_DIA
+    desde = np.minimum(-(-inicios // MINUTOS_FRANJA), total)
+    hasta = np.minimum(fines // MINUTOS_FRANJA, total)
+    validos = hasta > desde
+    eventos = np.zeros((cantidad_filas, total + 1), dtype=np.int32)
+    np.add.at(eventos, (filas[validos], desde[validos]), 1)
+    np.add.at(eventos, (filas[validos], hasta[validos]), -1)
+    return np.cumsum(eventos[:, :total], axis=1) > 0
+
+
+def construir_disponibilidad(
+    empresa_id: int,
+    semana_inicio: date,
+    sucursal_ids: List[int],
+    horarios_atencion: Iterable[Tuple[int, int, time, time]],
+    relaciones: Iterable[Tuple[int, int]],
+    vacaciones: Iterable[Tuple[int, date]],
+    preferidos: Iterable[Tuple[int, int, int, time, time]]
+) -> MatrizDisponibilidad:
+    """
+    Arma la matriz a partir de las filas ya leídas de la base.
+
+    Args:
+        empresa_id (int): Empresa de las sucursales.
+        semana_inicio (date): Cualquier fecha de la semana; se toma su lunes.
+        sucursal_ids (List[int]): Sucursales de la empresa.
+        horarios_atencion: Tuplas (sucursal_id, dia_id, apertura, cierre).
+        relaciones: Tuplas (colaborador_id, sucursal_id) de ColaboradorSucursal.
+        vacaciones: Tuplas (colaborador_id, fecha).
+        preferidos: Tuplas (colaborador_id, sucursal_id, dia_id, hora_inicio, hora_fin).
+
+    Returns:
+        MatrizDisponibilidad: Disponibilidad empaquetada de la semana.
+    """
+    lunes = _lunes(semana_inicio)
+    sucursal_ids = sorted(set(sucursal_ids))
+    indice_sucursal = {sucursal_id: j for j, sucursal_id in enumerate(sucursal_ids)}
+    # Día de apertura k corresponde a la fecha lunes + k - 1 (k=0 es el domingo anterior)
+    fechas_apertura = [lunes + timedelta(days=k - 1) for k in range(DIAS_APERTURA)]
+
+    # Ventanas de atención por (sucursal, dia_id) en minutos; el cierre puede pasar de 24 h
+    ventanas: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    for sucursal_id, dia_id, apertura, cierre in horarios_atencion:
+        if sucursal_id not in indice_sucursal:
+            continue
+        inicio, fin = _a_minutos(apertura), _a_minutos(cierre)
+        ventanas[(sucursal_id, dia_id)] = (inicio, fin + MINUTOS_DIA if fin <= inicio else fin)
+
+    # Dueño de cada franja de la semana de apertura por sucursal: día de apertura o -1
+    duenos = np.full((len(sucursal_ids), DIAS_APERTURA * FRANJAS_DIA), -1, dtype=np.int8)
+    for k, fecha in enumerate(fechas_apertura):
+        for j, sucursal_id in enumerate(sucursal_ids):
+            ventana = ventanas.get((sucursal_id, fecha.isoweekday()))
+            if ventana is None:
+                continue
+            desde = -(-(k * MINUTOS_DIA + ventana[0]) // MINUTOS_FRANJA)
+            hasta = min((k * MINUTOS_DIA + ventana[1]) // MINUTOS_FRANJA, duenos.shape[1])
+            duenos[j, desde:hasta] = k
+
+    pares = sorted({
+        (colaborador_id, sucursal_id) for colaborador_id, sucursal_id in relaciones if sucursal_id in indice_sucursal
+    })
+    colaborador_ids = sorted({colaborador_id for colaborador_id, _ in pares})
+    indice_colaborador = {colaborador_id: i for i, colaborador_id in enumerate(colaborador_ids)}
+    indice_par = {par: p for p, par in enumerate(pares)}
+    par_colaborador = np.array([indice_colaborador[c] for c, _ in pares], dtype=np.int64)
+    par_sucursal = np.array([indice_sucursal[s] for _, s in pares], dtype=np.int64)
+
+    # Vacaciones por colaborador y día de apertura; la columna extra es "sin dueño"
+    de_vacaciones = np.zeros((len(colaborador_ids), DIAS_APERTURA + 1), dtype=bool)
+    posicion_fecha = {fecha: k for k, fecha in enumerate(fechas_apertura)}
+    for colaborador_id, fecha in vacaciones:
+        if colaborador_id in indice_colaborador and fecha in posicion_fecha:
+            de_vacaciones[indice_colaborador[colaborador_id], posicion_fecha[fecha]] = True
+
+    # Disponibilidad por par (colaborador, sucursal) sobre la semana de apertura
+    duenos_par = duenos[par_sucursal]
+    disponible = (duenos_par >= 0) & ~de_vacaciones[par_colaborador[:, None], duenos_par]
+
+    filas, inicios, fines = [], [], []
+    for colaborador_id, sucursal_id, dia_id, hora_inicio, hora_fin in preferidos:
+        p = indice_par.get((colaborador_id, sucursal_id))
+        if p is None:
+            continue
+        inicio, fin = _a_minutos(hora_inicio), _a_minutos(hora_fin)
+        ventana = ventanas.get((sucursal_id, dia_id))
+        if ventana is not None and inicio < ventana[0]:
+            inicio += MINUTOS_DIA
+        while fin <= inicio:
+            fin += MINUTOS_DIA
+        for k, fecha in enumerate(fechas_apertura):
+            if fecha.isoweekday() == dia_id:
+                filas.append(p)
+                inicios.append(k * MINUTOS_DIA + inicio)
+                fines.append(k * MINUTOS_DIA + fin)
+    preferido = disponible & _rasterizar(
+        np.array(filas, dtype=np.int64), np.array(inicios, dtype=np.int64), np.array(fines, dtype=np.int64), len(pares)
+    )
+
+    def empaquetar(por_par: np.ndarray) -> np.ndarray:
+        # Se descarta el domingo anterior y se empaqueta cada día de la semana
+        semana = por_par[:, FRANJAS_DIA:].reshape(len(pares), DIAS_SEMANA, FRANJAS_DIA)
+        bits = np.zeros((len(colaborador_ids), len(sucursal_ids), DIAS_SEMANA, FRANJAS_DIA // 8), dtype=np.uint8)
+        bits[par_colaborador, par_sucursal] = np.packbits(semana, axis=-1)
+        return bits
+
+    return MatrizDisponibilidad(
+        empresa_id, lunes, colaborador_ids, sucursal_ids, empaquetar(disponible), empaquetar(preferido),
+        de_vacaciones[:, 1:DIAS_APERTURA].copy(),
+    )
+
+
+# ✅ CACHÉ POR (EMPRESA, SEMANA)
+
+_cache: "OrderedDict[Tuple[int, date], MatrizDisponibilidad]" = OrderedDict()
+_cache_lock = threading.Lock()
+# Se incrementa con cada invalidación: una matriz armada mientras tanto no se cachea
+_generacion = 0
+
+
+def obtener_disponibilidad(empresa_id: int, semana_inicio: date, db: Session) -> MatrizDisponibilidad:
+    """
+    Devuelve la matriz de disponibilidad de la semana, desde la caché si está vigente.
+
+    Args:
+        empresa_id (int): Empresa cuyas sucursales y colaboradores se incluyen.
+        semana_inicio (date): Cualquier fecha de la semana.
+        db (Session): Sesión de la base de datos.
+
+    Returns:
+        MatrizDisponibilidad: Disponibilidad de la semana.
+    """
+    clave = (empresa_id, _lunes(semana_inicio))
+    with _cache_lock:
+        matriz = _cache.get(clave)
+        if matriz is not None:
+            _cache.move_to_end(clave)
+            return matriz
+        generacion = _generacion
+
+    lunes = clave[1]
+    sucursal_ids = [sucursal.id for sucursal in SucursalRepository.get_by_empresa(empresa_id, db)]
+    horarios, relaciones, vacaciones, preferidos = [], [], [], []
+    if sucursal_ids:
+        horarios = [
+            (horario.sucursal_id, horario.dia_id, horario.hora_apertura, horario.hora_cierre)
+            for horario in HorarioSucursalRepository.get_by_sucursales(sucursal_ids, db)
+        ]
+        relaciones = [
+            (relacion.colaborador_id, relacion.sucursal_id)
+            for relacion in ColaboradorSucursalRepository.get_by_sucursales(sucursal_ids, db)
+        ]
+        preferidos = [
+            (preferido.colaborador_id, preferido.sucursal_id, preferido.dia_id, preferido.hora_inicio, preferido.hora_fin)
+            for preferido in HorarioPreferidoColaboradorRepository.get_by_sucursales(sucursal_ids, db)
+        ]
+    colaborador_ids = sorted({colaborador_id for colaborador_id, _ in relaciones})
+    if colaborador_ids:
+        vacaciones = [
+            (vacacion.colaborador_id, vacacion.fecha)
+            for vacacion in VacacionColaboradorRepository.get_by_colaboradores_rango(
+                colaborador_ids, lunes - timedelta(days=1), lunes + timedelta(days=DIAS_SEMANA - 1), db
+            )
+        ]
+
+    matriz = construir_disponibilidad(empresa_id, lunes, sucursal_ids, horarios, relaciones, vacaciones, preferidos)
+    with _cache_lock:
+        # Si se confirmó un cambio durante la lectura, la matriz puede estar desactualizada
+        if generacion == _generacion:
+            _cache[clave] = matriz
+            _cache.move_to_end(clave)
+            while len(_cache) > TAMANO_CACHE:
+                _cache.popitem(last=False)
+    logger.info(
+        f"Disponibilidad empresa {empresa_id} semana {lunes}: {len(matriz.colaborador_ids)} colaboradores, "
+        f"{len(sucursal_ids)} sucursales, {matriz.nbytes} bytes"
+    )
+    return matriz
+
+
+def invalidar_disponibilidad(
+    empresa_id: Optional[int] = None,
+    sucursal_id: Optional[int] = None,
+    colaborador_id: Optional[int] = None,
+    fecha: Optional[date] = None
+) -> int:
+    """
+    Descarta las matrices cacheadas afectadas por un cambio. Sin argumentos vacía la caché.
+
+    Args:
+        empresa_id (Optional[int]): Descarta todas las semanas de la empresa.
+        sucursal_id (Optional[int]): Descarta las matrices que incluyen la sucursal.
+        colaborador_id (Optional[int]): Descarta las matrices que incluyen al colaborador.
+        fecha (Optional[date]): Con colaborador_id, limita a las semanas que contienen
+            la fecha o cuyo lunes es el día siguiente.
+
+    Returns:
+        int: Cantidad de matrices descartadas.
+    """
+    def afectada(clave: Tuple[int, date], matriz: MatrizDisponibilidad) -> bool:
+        if empresa_id is None and sucursal_id is None and colaborador_id is None:
+            return True
+        if empresa_id is not None and clave[0] == empresa_id:
+            return True
+        if sucursal_id is not None and matriz.contiene_sucursal(sucursal_id):
+            return True
+        if colaborador_id is not None and matriz.contiene_colaborador(colaborador_id):
+            # La vacación del domingo anterior afecta la madrugada del lunes
+            return fecha is None or matriz.contiene_fecha(fecha) or matriz.contiene_fecha(fecha + timedelta(days=1))
+        return False
+
+    global _generacion
+    with _cache_lock:
+        _generacion += 1
+        claves = [clave for clave, matriz in _cache.items() if afectada(clave, matriz)]
+        for clave in claves:
+            del _cache[clave]
+    return len(claves)
+
+
+def _valores(target, atributo: str) -> set:
+    # Valor actual y, si se modificó en esta transacción, el anterior
+    historial = inspect(target).attrs[atributo].history
+    return {valor for valor in (getattr(target, atributo, None), *historial.deleted) if valor is not None}
+
+
+def _invalidaciones(target) -> List[Dict]:
+    """
+    Argumentos de `invalidar_disponibilidad` para cada matriz que puede cambiar con la fila.
+    """
+    if isinstance(target, Sucursal):
+        return [{"empresa_id": empresa_id} for empresa_id in _valores(target, "empresa_id")]
+    if isinstance(target, VacacionColaborador):
+        return [
+            {"colaborador_id": colaborador_id, "fecha": fecha}
+            for colaborador_id in _valores(target, "colaborador_id")
+            for fecha in _valores(target, "fecha")
+        ]
+    invalidaciones = [{"sucursal_id": sucursal_id} for sucursal_id in _valores(target, "sucursal_id")]
+    if hasattr(target, "colaborador_id"):
+        invalidaciones += [{"colaborador_id": colaborador_id} for colaborador_id in _valores(target, "colaborador_id")]
+    return invalidaciones
+
+
+MODELOS_DISPONIBILIDAD = (Sucursal, HorarioSucursal, ColaboradorSucursal, VacacionColaborador, HorarioPreferidoColaborador)
+CLAVE_PENDIENTES = "disponibilidad_pendiente"
+
+
+def _al_flush(session: Session, flush_context):
+    # Durante el flush todavía está el historial de cada atributo modificado; las
+    # invalidaciones se aplican recién al confirmar, para que otra sesión no vuelva
+    # a cachear datos sin confirmar y un rollback no descarte matrices vigentes
+    pendientes = session.info.setdefault(CLAVE_PENDIENTES, [])
+    for target in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(target, MODELOS_DISPONIBILIDAD):
+            pendientes.extend(_invalidaciones(target))
+
+
+def _al_confirmar(session: Session):
+    for invalidacion in session.info.pop(CLAVE_PENDIENTES, []):
+        invalidar_disponibilidad(**invalidacion)
+
+
+def _al_terminar_transaccion(session: Session, transaction):
+    # Al terminar la transacción raíz sin confirmar, los cambios pendientes se descartan
+    if transaction.parent is None:
+        session.info.pop(CLAVE_PENDIENTES, None)
+
+
+# Las escrituras pasan por la unidad de trabajo del ORM (add/merge/delete + flush)
+event.listen(Session, "after_flush", _al_flush)
+event.listen(Session, "after_commit", _al_confirmar)
+event.listen(Session, "after_transaction_end", _al_terminar_transaccion)
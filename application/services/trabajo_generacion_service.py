@@ -0,0 +1,509 @@
+"""
+Cola de trabajos de generación de horarios.
+
+Una generación completa puede tardar minutos, por lo que no se ejecuta dentro del
+request: el endpoint registra el trabajo en una base SQLite local y un pool acotado
+de hilos lo ejecuta en segundo plano, cada uno con su propia sesión de rrhh. El
+registro persistido permite retomar los trabajos pendientes tras un reinicio.
+
+Puede haber varios procesos (workers de uvicorn/gunicorn) sobre la misma base: cada
+trabajo se reclama con un UPDATE atómico a nombre del proceso, con una concesión que
+se renueva mientras corre. Al iniciar, un proceso solo reencola los trabajos cuya
+concesión venció, no los que otro proceso sigue ejecutando.
+
+Mientras un trabajo se ejecuta, cada solución mejorada se publica en un canal en
+memoria como diferencia de turnos respecto de la anterior junto con la cobertura de
+los mínimos, para transmitirla por SSE; un supervisor puede detener la búsqueda y
+quedarse con la mejor solución encontrada hasta ese momento. El callback de CP-SAT
+solo copia la solución: calcularla, guardarla y publicarla lo hace otro hilo, a lo
+sumo una vez por INTERVALO_PROGRESO.
+"""
+
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from application.config.logger_config import setup_logger
+from application.use_cases.generar_horarios import generar_horarios_sucursal, generar_horarios_empresa
+from infrastructure.databases.config.database import DBConfig as Database
+from infrastructure.databases.config.trabajos_database import TrabajosDBConfig
+from infrastructure.databases.models.trabajo_generacion import (
+    TrabajoGeneracion,
+    EN_EJECUCION,
+    COMPLETADO,
+    ERROR,
+)
+from infrastructure.repositories.trabajo_generacion_repo import TrabajoGeneracionRepository
+from infrastructure.solvers.solver import ObservadorSoluciones, ResultadoGeneracion, SolucionCapturada, TurnoGenerado
+
+logger = setup_logger(__name__, "logs/trabajos_generacion.log")
+
+# Segundos que vale el reclamo de un trabajo; se renueva cada un tercio de ese tiempo
+DURACION_CONCESION = 60.0
+# Segundos mínimos entre dos soluciones procesadas de un mismo trabajo
+INTERVALO_PROGRESO = 1.0
+
+# Recibe un evento con al menos "objetivo" y "cota" cada vez que el motor mejora la solución
+Progreso = Callable[[Dict[str, Any]], None]
+# Recibe los parámetros del trabajo, la función de progreso y el evento de detención;
+# devuelve el resumen a persistir
+Ejecutor = Callable[[Dict[str, Any], Progreso, threading.Event], Dict[str, Any]]
+
+
+class DiferenciaTurnos:
+    def __init__(self):
+        """
+        Calcula qué turnos cambiaron entre soluciones sucesivas, para no reenviar la
+        semana completa en cada mejora. Un turno se identifica por sucursal,
+        colaborador y día, igual que un Puesto.
+        """
+        self.anteriores: Dict[Tuple[int, int, int], dict] = {}
+
+    def actualizar(self, turnos: List[TurnoGenerado]) -> Dict[str, List[dict]]:
+        actuales = {
+            (turno.sucursal_id, turno.colaborador_id, turno.dia_id): turno.to_dict() for turno in turnos
+        }
+        cambios = [
+            turno for clave, turno in actuales.items() if self.anteriores.get(clave) != turno
+        ]
+        eliminados = [
+            {"sucursal_id": sucursal_id, "colaborador_id": colaborador_id, "dia_id": dia_id}
+            for sucursal_id, colaborador_id, dia_id in self.anteriores.keys() - actuales.keys()
+        ]
+        self.anteriores = actuales
+        return {"cambios": cambios, "eliminados": eliminados}
+
+
+def resumir_cobertura(cobertura: List[dict]) -> Dict[str, Any]:
+    """
+    Reduce la cobertura por mínimo a los totales y a los mínimos no cubiertos.
+    """
+    return {
+        "requeridos": sum(item["requeridos"] for item in cobertura),
+        "cubiertos": sum(item["cubiertos"] for item in cobertura),
+        "faltantes": [item for item in cobertura if item["cubiertos"] < item["requeridos"]],
+    }
+
+
+class CanalSoluciones:
+    def __init__(self):
+        """
+        Eventos publicados por un trabajo en ejecución. Cada suscriptor recibe los
+        eventos ya publicados y luego los nuevos hasta que el canal se cierra.
+        """
+        self.eventos: List[Tuple[str, Dict[str, Any]]] = []
+        self.cerrado = False
+        self._condicion = threading.Condition()
+
+    def publicar(self, tipo: str, datos: Dict[str, Any]):
+        with self._condicion:
+            self.eventos.append((tipo, datos))
+            self._condicion.notify_all()
+
+    def cerrar(self):
+        with self._condicion:
+            self.cerrado = True
+            self._condicion.notify_all()
+
+    def escuchar(self, espera: float = 15.0) -> Iterator[Optional[Tuple[str, Dict[str, Any]]]]:
+        """
+        Itera los eventos del canal. Cada `espera` segundos sin novedades entrega None,
+        para que el endpoint pueda mantener viva la conexión.
+        """
+        indice = 0
+        while True:
+            with self._condicion:
+                if indice >= len(self.eventos) and not self.cerrado:
+                    self._condicion.wait(espera)
+                nuevos = self.eventos[indice:]
+                cerrado = self.cerrado
+            indice += len(nuevos)
+            if not nuevos and not cerrado:
+                yield None
+            yield from nuevos
+            if cerrado and indice >= len(self.eventos):
+                return
+
+
+class ProgresoDiferido:
+    def __init__(self, procesar: Callable[[Any], None], intervalo: float = INTERVALO_PROGRESO):
+        """
+        Procesa en un hilo propio la última solución informada, a lo sumo una vez cada
+        `intervalo` segundos. `informar` solo deja la solución y vuelve, así el callback de
+        CP-SAT no espera a la base ni al cálculo de la cobertura; si llegan varias mientras
+        tanto se procesa solo la más reciente.
+
+        Args:
+            procesar (Callable[[Any], None]): Función a invocar con cada solución a procesar.
+            intervalo (float): Segundos mínimos entre dos llamadas a `procesar`.
+        """
+        self.procesar = procesar
+        self.intervalo = intervalo
+        self._pendiente: Any = None
+        self._hay_pendiente = False
+        self._cerrado = False
+        self._condicion = threading.Condition()
+        self._hilo = threading.Thread(target=self._procesar_pendientes, name="progreso", daemon=True)
+        self._hilo.start()
+
+    def informar(self, solucion: Any):
+        with self._condicion:
+            self._pendiente = solucion
+            self._hay_pendiente = True
+            self._condicion.notify()
+
+    def cerrar(self):
+        """Procesa la solución pendiente, si la hay, sin esperar el intervalo y termina el hilo."""
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify()
+        self._hilo.join()
+
+    def _procesar_pendientes(self):
+        ultima = float("-inf")
+        while True:
+            with self._condicion:
+                while not self._hay_pendiente and not self._cerrado:
+                    self._condicion.wait()
+                if not self._hay_pendiente:
+                    return
+                restante = ultima + self.intervalo - monotonic()
+                if restante > 0 and not self._cerrado:
+                    self._condicion.wait(restante)
+                    continue
+                solucion, self._pendiente, self._hay_pendiente = self._pendiente, None, False
+            try:
+                self.procesar(solucion)
+            except Exception as e:
+                logger.error("Error al procesar una solución: %s", e)
+            ultima = monotonic()
+
+
+def _resumen(resultado: ResultadoGeneracion) -> Dict[str, Any]:
+    return {
+        "estado": resultado.estado,
+        "objetivo": resultado.objetivo,
+        "cota": resultado.cota,
+        "tiempo_segundos": round(resultado.tiempo_segundos, 3),
+        "turnos": len(resultado.turnos),
+        "faltantes": sum(resultado.faltantes.values()),
+        "cambios": resultado.cambios,
+    }
+
+
+def ejecutar_generacion_sucursal(
+    parametros: Dict[str, Any],
+    al_progresar: Progreso,
+    detener: threading.Event
+) -> Dict[str, Any]:
+    """
+    Ejecuta la generación de una sucursal con una sesión de rrhh propia del hilo.
+    Las soluciones mejoradas se informan con los turnos que cambiaron y la cobertura
+    de los mínimos, calculados fuera del callback de CP-SAT; la última se informa
+    antes de terminar.
+    """
+    diferencia = DiferenciaTurnos()
+
+    def informar(solucion: SolucionCapturada):
+        generador = solucion.generador
+        al_progresar({
+            "objetivo": solucion.objetivo,
+            "cota": solucion.cota,
+            "segundos": round(solucion.segundos, 3),
+            **diferencia.actualizar(generador.extraer_turnos(solucion)),
+            "cobertura": resumir_cobertura(generador.cobertura_minimos(solucion)),
+        })
+
+    progreso = ProgresoDiferido(informar)
+
+    def al_mejorar(observador: ObservadorSoluciones):
+        progreso.informar(observador.capturar())
+
+    db = Database.get_session("rrhh")
+    try:
+        resultado = generar_horarios_sucursal(
+            parametros["sucursal_id"],
+            date.fromisoformat(parametros["semana_inicio"]),
+            db,
+            tiempo_limite=parametros["tiempo_limite"],
+            reemplazar=parametros["reemplazar"],
+            usar_semana_anterior=parametros["usar_semana_anterior"],
+            al_mejorar=al_mejorar,
+            detener=detener,
+        )
+        return _resumen(resultado)
+    finally:
+        progreso.cerrar()
+        db.close()
+
+
+def ejecutar_generacion_empresa(
+    parametros: Dict[str, Any],
+    al_progresar: Progreso,
+    detener: threading.Event
+) -> Dict[str, Any]:
+    """
+    Ejecuta la generación de todas las sucursales de una empresa. Los grupos se
+    resuelven en otros procesos, así que el progreso se informa al terminar cada grupo:
+    la suma de los objetivos obtenidos hasta el momento y los turnos del grupo. Si
+    algún grupo viene de la heurística no hay cota conocida y se informa None.
+    """
+    resueltos: List[ResultadoGeneracion] = []
+
+    def al_resolver_grupo(sucursal_ids: List[int], resultado: ResultadoGeneracion):
+        resueltos.append(resultado)
+        factibles = [r for r in resueltos if r.factible]
+        detalle = resultado.to_dict()
+        al_progresar({
+            "objetivo": sum(r.objetivo for r in factibles) if factibles else None,
+            "cota": (
+                sum(r.cota for r in factibles)
+                if factibles and all(r.cota is not None for r in factibles) else None
+            ),
+            "sucursal_ids": sucursal_ids,
+            "cambios": detalle["turnos"],
+            "eliminados": [],
+            "cobertura": {"faltantes": detalle["faltantes"]},
+        })
+
+    db = Database.get_session("rrhh")
+    try:
+        resultados = generar_horarios_empresa(
+            parametros["empresa_id"],
+            date.fromisoformat(parametros["semana_inicio"]),
+            db,
+            tiempo_limite=parametros["tiempo_limite"],
+            reemplazar=parametros["reemplazar"],
+            usar_semana_anterior=parametros["usar_semana_anterior"],
+            al_resolver_grupo=al_resolver_grupo,
+            detener=detener,
+        )
+        return {"grupos": [_resumen(resultado) for resultado in resultados]}
+    finally:
+        db.close()
+
+
+EJECUTORES: Dict[str, Ejecutor] = {
+    "sucursal": ejecutar_generacion_sucursal,
+    "empresa": ejecutar_generacion_empresa,
+}
+
+
+class ColaTrabajos:
+    def __init__(
+        self,
+        max_trabajos: int = 2,
+        get_session: Callable = TrabajosDBConfig.get_session,
+        ejecutores: Optional[Dict[str, Ejecutor]] = None,
+        duracion_concesion: float = DURACION_CONCESION
+    ):
+        """
+        Pool acotado de hilos que ejecuta trabajos de generación persistidos.
+
+        Args:
+            max_trabajos (int): Trabajos que se ejecutan en simultáneo; el resto espera en cola.
+            get_session (Callable): Fábrica de sesiones de la base de trabajos.
+            ejecutores (Optional[Dict[str, Ejecutor]]): Función a ejecutar por tipo de trabajo.
+            duracion_concesion (float): Segundos que vale el reclamo de un trabajo sin renovarse.
+        """
+        self.get_session = get_session
+        self.ejecutores = ejecutores or EJECUTORES
+        self.duracion_concesion = duracion_concesion
+        # Identifica a este proceso como propietario de los trabajos que reclama
+        self.propietario = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.executor = ThreadPoolExecutor(max_workers=max_trabajos, thread_name_prefix="generacion")
+        # Estado en memoria de los trabajos de este proceso que todavía no terminaron
+        self.canales: Dict[str, CanalSoluciones] = {}
+        self.detenciones: Dict[str, threading.Event] = {}
+
+    def encolar(self, tipo: str, parametros: Dict[str, Any], usuario_id: Optional[int] = None) -> TrabajoGeneracion:
+        """
+        Persiste un trabajo nuevo y lo envía al pool.
+
+        Raises:
+            ValueError: Si no hay un ejecutor para el tipo de trabajo.
+        """
+        if tipo not in self.ejecutores:
+            raise ValueError(f"Tipo de trabajo desconocido: {tipo}.")
+
+        db = self.get_session()
+        try:
+            trabajo = TrabajoGeneracionRepository.create(
+                TrabajoGeneracion(id=str(uuid.uuid4()), tipo=tipo, parametros=parametros, usuario_id=usuario_id),
+                db
+            )
+        finally:
+            db.close()
+
+        self._enviar(trabajo.id)
+        logger.info("Trabajo %s encolado (%s): %s", trabajo.id, tipo, parametros)
+        return trabajo
+
+    def obtener(self, trabajo_id: str) -> Optional[TrabajoGeneracion]:
+        db = self.get_session()
+        try:
+            return TrabajoGeneracionRepository.get_by_id(trabajo_id, db)
+        finally:
+            db.close()
+
+    def recuperar(self) -> int:
+        """
+        Reencola los trabajos pendientes y los que quedaron en ejecución en un proceso que
+        se detuvo (concesión vencida). Si varios procesos recuperan a la vez, cada trabajo
+        lo ejecuta solo el que primero lo reclama.
+        Retorna la cantidad de trabajos reencolados.
+        """
+        db = self.get_session()
+        try:
+            TrabajoGeneracionRepository.reencolar_vencidos(db)
+            pendientes = [trabajo.id for trabajo in TrabajoGeneracionRepository.get_pendientes(db)]
+        finally:
+            db.close()
+
+        for trabajo_id in pendientes:
+            self._enviar(trabajo_id)
+        if pendientes:
+            logger.info("Se reencolaron %s trabajos pendientes.", len(pendientes))
+        return len(pendientes)
+
+    def canal(self, trabajo_id: str) -> Optional[CanalSoluciones]:
+        """
+        Devuelve el canal de soluciones de un trabajo pendiente o en ejecución en este
+        proceso, o None si el trabajo ya terminó.
+        """
+        return self.canales.get(trabajo_id)
+
+    def detener(self, trabajo_id: str) -> bool:
+        """
+        Pide cortar la búsqueda de un trabajo; se guarda la mejor solución encontrada.
+        Retorna False si el trabajo no está pendiente ni en ejecución en este proceso.
+        """
+        detener = self.detenciones.get(trabajo_id)
+        if detener is None:
+            return False
+        detener.set()
+        logger.info("Se pidió detener el trabajo %s.", trabajo_id)
+        return True
+
+    def cerrar(self, esperar: bool = False):
+        # Los trabajos que no terminen quedan en la base y se retoman al reiniciar
+        self.executor.shutdown(wait=esperar, cancel_futures=not esperar)
+
+    def _vencimiento(self) -> datetime:
+        return datetime.now() + timedelta(seconds=self.duracion_concesion)
+
+    def _reclamar(self, trabajo_id: str) -> Optional[TrabajoGeneracion]:
+        db = self.get_session()
+        try:
+            return TrabajoGeneracionRepository.reclamar(trabajo_id, self.propietario, self._vencimiento(), db)
+        finally:
+            db.close()
+
+    def _actualizar(self, trabajo_id: str, **campos) -> bool:
+        db = self.get_session()
+        try:
+            actualizado = TrabajoGeneracionRepository.update_propio(trabajo_id, self.propietario, db, **campos)
+        finally:
+            db.close()
+        if not actualizado:
+            logger.warning("El trabajo %s ya no pertenece a este proceso; no se actualizó.", trabajo_id)
+        return actualizado
+
+    def _mantener_concesion(self, trabajo_id: str, terminado: threading.Event, detener: threading.Event):
+        """
+        Renueva la concesión del trabajo hasta que termine. Si otro proceso lo retomó
+        (porque la concesión venció), corta la búsqueda de este.
+        """
+        while not terminado.wait(self.duracion_concesion / 3):
+            db = self.get_session()
+            try:
+                vigente = TrabajoGeneracionRepository.renovar_concesion(
+                    trabajo_id, self.propietario, self._vencimiento(), db
+                )
+            except Exception as e:
+                logger.error("No se pudo renovar la concesión del trabajo %s: %s", trabajo_id, e)
+                continue
+            finally:
+                db.close()
+            if not vigente:
+                logger.warning("El trabajo %s perdió su concesión; se detiene la búsqueda.", trabajo_id)
+                detener.set()
+                return
+
+    def _enviar(self, trabajo_id: str):
+        self.canales[trabajo_id] = CanalSoluciones()
+        self.detenciones[trabajo_id] = threading.Event()
+        self.executor.submit(self._ejecutar, trabajo_id)
+
+    def _ejecutar(self, trabajo_id: str):
+        canal = self.canales[trabajo_id]
+        detener = self.detenciones[trabajo_id]
+        terminado = threading.Event()
+        try:
+            # Si otro proceso ya lo tomó o el trabajo terminó, no se ejecuta
+            trabajo = self._reclamar(trabajo_id)
+            if trabajo is None:
+                return
+            threading.Thread(
+                target=self._mantener_concesion, args=(trabajo_id, terminado, detener),
+                name=f"concesion-{trabajo_id}", daemon=True
+            ).start()
+
+            soluciones = 0
+
+            def al_progresar(evento: Dict[str, Any]):
+                nonlocal soluciones
+                soluciones += 1
+                self._actualizar(trabajo_id, objetivo=evento["objetivo"], cota=evento["cota"], soluciones=soluciones)
+                canal.publicar("solucion", {"solucion": soluciones, **evento})
+
+            canal.publicar("estado", {"estado": EN_EJECUCION})
+            try:
+                resumen = self.ejecutores[trabajo.tipo](trabajo.parametros, al_progresar, detener)
+            except Exception as e:
+                logger.error("Error en el trabajo %s: %s", trabajo_id, e)
+                self._actualizar(trabajo_id, estado=ERROR, error=str(e), finalizado=datetime.now())
+                canal.publicar("estado", {"estado": ERROR, "error": str(e)})
+                return
+
+            resumen["detenido"] = detener.is_set()
+            # Si perdió la concesión, el resultado que vale es el del proceso que lo retomó
+            if self._actualizar(trabajo_id, estado=COMPLETADO, resultado=resumen, finalizado=datetime.now()):
+                canal.publicar("estado", {"estado": COMPLETADO, "resultado": resumen})
+                logger.info("Trabajo %s completado: %s", trabajo_id, resumen)
+        finally:
+            terminado.set()
+            canal.cerrar()
+            self.canales.pop(trabajo_id, None)
+            self.detenciones.pop(trabajo_id, None)
+
+
+_cola: Optional[ColaTrabajos] = None
+
+
+def iniciar_cola_trabajos() -> ColaTrabajos:
+    """
+    Crea la cola de trabajos del proceso y retoma los trabajos pendientes.
+    La cantidad de trabajos simultáneos se toma de GENERACION_MAX_TRABAJOS (2 por defecto).
+    """
+    global _cola
+    if _cola is None:
+        _cola = ColaTrabajos(max_trabajos=int(os.getenv("GENERACION_MAX_TRABAJOS", "2")))
+        _cola.recuperar()
+    return _cola
+
+
+def obtener_cola_trabajos() -> ColaTrabajos:
+    return _cola if _cola is not None else iniciar_cola_trabajos()
+
+
+def detener_cola_trabajos():
+    global _cola
+    if _cola is not None:
+        _cola.cerrar()
+        _cola = None
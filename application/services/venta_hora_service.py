@@ -1,15 +1,24 @@
 import logging
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 
-from infrastructure.schemas.venta_hora import VentaHoraResponse
-from infrastructure.repositories.vta_hora_repo import get_vta_hora
-from domain.models.venta_hora import Factura, VentasPorHora, calcular_personas
+from infrastructure.databases.config.database import DBConfig
+from infrastructure.databases.models.venta_hora_resumen import VentaHoraResumen
+from infrastructure.schemas.venta_hora import VentaHora, VentaHoraResponse
+from infrastructure.repositories.venta_hora_resumen_repo import VentaHoraResumenRepository
+from infrastructure.repositories.vta_hora_repo import TAMANO_LOTE, get_vta_hora, get_vta_hora_agrupado, iterar_vta_hora
+from domain.models.venta_hora import VentasPorHora, calcular_personas
 
 logger = logging.getLogger(__name__)
 
+# Días previos a hoy que se vuelven a leer de plex aunque estén completos: las facturas
+# cargadas o corregidas después de medianoche pueden tener una Emisión anterior
+DIAS_RECHEQUEO = 2
+
 def obtener_facturas(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> List[Any]:
     """
     Obtiene los datos de ventas por hora a través del repository y los valida
@@ -25,6 +34,30 @@ def obtener_facturas(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Se
         logger.error("Error en obtener_facturas: %s", e)
         raise e
 
+def iterar_facturas(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> Iterator[VentaHora]:
+    """
+    Versión en streaming de obtener_facturas: valida y devuelve las facturas de a una
+    a medida que llegan del cursor del servidor, sin armar la lista completa.
+    """
+    for fila in iterar_vta_hora(sucursal, fecha_desde, fecha_hasta, db):
+        yield VentaHora.model_validate(fila)
+
+def agrupar_facturas(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> Dict[Any, Dict[str, int]]:
+    """
+    Agrupa por sucursal, fecha y hora recorriendo las facturas individuales en
+    streaming, de a lotes de TAMANO_LOTE filas que se agrupan en forma columnar, con
+    memoria constante. Sirve para recalcular o auditar el resumen desde el detalle;
+    retorna el mismo diccionario que obtener_agrupamiento.
+    """
+    ventas_por_hora = VentasPorHora()
+    filas = iterar_vta_hora(sucursal, fecha_desde, fecha_hasta, db)
+    while True:
+        lote = list(islice(filas, TAMANO_LOTE))
+        if not lote:
+            break
+        ventas_por_hora.procesar_filas(lote)
+    return ventas_por_hora.obtener_ventas()
+
 def transformar_resultado(resultado: Dict[Any, Any]) -> Dict[str, Any]:
     """
     Transforma las claves del diccionario, que son tuplas, a strings para
@@ -37,27 +70,115 @@ def transformar_resultado(resultado: Dict[Any, Any]) -> Dict[str, Any]:
         resultado_transformado[nueva_clave] = value
     return resultado_transformado
 
+def _hoy() -> date:
+    return date.today()
+
+def _rangos_contiguos(fechas: List[date]) -> List[Tuple[date, date]]:
+    """Agrupa fechas ordenadas en rangos [desde, hasta] de días consecutivos."""
+    rangos = []
+    for fecha in fechas:
+        if rangos and rangos[-1][1] + timedelta(days=1) == fecha:
+            rangos[-1] = (rangos[-1][0], fecha)
+        else:
+            rangos.append((fecha, fecha))
+    return rangos
+
+def actualizar_resumen(
+    sucursal: int,
+    fecha_desde: date,
+    fecha_hasta: date,
+    db: Session,
+    db_plex: Optional[Session] = None,
+    recargar: bool = False,
+) -> List[date]:
+    """
+    Carga en la tabla de resumen (base rrhh) los días del rango que todavía no están
+    completos: los que nunca se cargaron, el día en curso y los DIAS_RECHEQUEO días
+    anteriores, que se recargan en cada consulta. Los días más viejos ya cargados no se
+    vuelven a leer de plex salvo con `recargar`. Cada rango de días consecutivos
+    pendientes se resuelve con una sola consulta agrupada.
+
+    Args:
+        sucursal (int): Número de sucursal en plex.
+        fecha_desde (date): Primer día del rango.
+        fecha_hasta (date): Último día del rango; los días futuros se ignoran.
+        db (Session): Sesión de la base rrhh, donde vive el resumen.
+        db_plex (Optional[Session]): Sesión de plex. Si no se indica se abre una con DBConfig.
+        recargar (bool): Si es True se vuelven a leer de plex todos los días del rango,
+            para corregir facturas cargadas tarde en días ya completos.
+
+    Returns:
+        List[date]: Fechas cargadas en esta llamada; vacía si otra consulta las cargó en paralelo.
+    """
+    hoy = _hoy()
+    fecha_hasta = min(fecha_hasta, hoy)
+    if fecha_hasta < fecha_desde:
+        return []
+    completas = set() if recargar else VentaHoraResumenRepository.get_fechas_completas(
+        sucursal, fecha_desde, fecha_hasta, db
+    )
+    rechequeo = hoy - timedelta(days=DIAS_RECHEQUEO)
+    pendientes = [
+        fecha
+        for fecha in (fecha_desde + timedelta(days=i) for i in range((fecha_hasta - fecha_desde).days + 1))
+        if fecha not in completas or fecha >= rechequeo
+    ]
+    if not pendientes:
+        return []
+
+    sesion_plex = db_plex or DBConfig.get_session("plex")
+    try:
+        for desde, hasta in _rangos_contiguos(pendientes):
+            resumenes = [
+                VentaHoraResumen(
+                    sucursal=sucursal,
+                    fecha=fila["Fecha"],
+                    hora=int(fila["Hora"]),
+                    categoria=fila["Categoria"],
+                    cantidad=int(fila["Cantidad"]),
+                    importe=fila["Importe"] or 0,
+                )
+                for fila in get_vta_hora_agrupado(sucursal, desde, hasta, sesion_plex)
+            ]
+            fechas = [desde + timedelta(days=i) for i in range((hasta - desde).days + 1)]
+            VentaHoraResumenRepository.reemplazar_dias(
+                sucursal, fechas, resumenes, {fecha for fecha in fechas if fecha < hoy}, db
+            )
+        db.commit()
+    except IntegrityError:
+        # Otra consulta cargó los mismos días en paralelo: su resumen es igual de válido
+        db.rollback()
+        logger.warning("Resumen de ventas de la sucursal %s cargado en paralelo; se usa el existente", sucursal)
+        return []
+    finally:
+        if db_plex is None and sesion_plex is not None:
+            sesion_plex.close()
+    logger.info("Resumen de ventas de la sucursal %s: %s días cargados desde plex", sucursal, len(pendientes))
+    return pendientes
+
+def obtener_agrupamiento(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> Dict[Any, Dict[str, int]]:
+    """
+    Obtiene la cantidad de facturas por sucursal, fecha y hora desde la tabla de
+    resumen, cargando antes de plex solo los días que faltan y los más recientes.
+    Retorna el mismo diccionario que VentasPorHora.obtener_ventas, con claves
+    (sucursal, fecha, hora).
+    """
+    actualizar_resumen(sucursal, fecha_desde, fecha_hasta, db)
+    ventas_por_hora = VentasPorHora()
+    for resumen in VentaHoraResumenRepository.get_by_sucursal_fechas(sucursal, fecha_desde, fecha_hasta, db):
+        ventas_por_hora.agregar_conteo(resumen.sucursal, resumen.fecha, resumen.hora, resumen.categoria, resumen.cantidad)
+    return ventas_por_hora.obtener_ventas()
+
 def obtener_ventas_por_hora(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> Dict[str, Any]:
     """
     Orquesta la obtención y procesamiento de los datos:
-      1. Obtiene y valida los datos de ventas.
-      2. Crea instancias de Factura a partir de cada registro.
-      3. Agrupa las facturas por sucursal, fecha y hora mediante el objeto VentasPorHora.
-      4. Transforma las claves del resultado para que sean cadenas.
+      1. Obtiene los conteos de facturas agrupados por sucursal, fecha, hora y categoría.
+      2. Transforma las claves del resultado para que sean cadenas.
     Retorna el diccionario resultante.
     """
     try:
-        # 1. Obtener y validar los datos de ventas.
-        facturas_data = obtener_facturas(sucursal, fecha_desde, fecha_hasta, db)
-        # 2. Crear instancias de Factura a partir de cada registro validado.
-        facturas = [Factura(venta) for venta in facturas_data]
-        # 3. Procesar las facturas agrupándolas por sucursal, fecha y hora.
-        ventas_por_hora = VentasPorHora()
-        ventas_por_hora.procesar_facturas(facturas)
-        resultado = ventas_por_hora.obtener_ventas()
-        # 4. Transformar las claves a strings para la serialización JSON.
-        resultado_transformado = transformar_resultado(resultado)
-        return resultado_transformado
+        resultado = obtener_agrupamiento(sucursal, fecha_desde, fecha_hasta, db)
+        return transformar_resultado(resultado)
     except Exception as e:
         logger.error("Error en obtener_ventas_por_hora: %s", e)
         raise e
@@ -70,12 +191,7 @@ def obtener_personas_por_hora(sucursal: int, fecha_desde: date, fecha_hasta: dat
     Retorna un diccionario con la cantidad de personas, con las claves transformadas a strings.
     """
     try:
-        # Obtener el agrupamiento raw de ventas.
-        facturas_data = obtener_facturas(sucursal, fecha_desde, fecha_hasta, db)
-        facturas = [Factura(venta) for venta in facturas_data]
-        ventas_por_hora_obj = VentasPorHora()
-        ventas_por_hora_obj.procesar_facturas(facturas)
-        agrupamiento = ventas_por_hora_obj.obtener_ventas()
+        agrupamiento = obtener_agrupamiento(sucursal, fecha_desde, fecha_hasta, db)
         # Calcular la cantidad de personas por hora utilizando el tiempo promedio.
         personas = calcular_personas(agrupamiento, tiempo_promedio)
         # Transformar las claves para que sean cadenas, adecuadas para JSON.
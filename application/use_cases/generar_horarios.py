@@ -0,0 +1,582 @@
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import Manager
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+
+from application.config.logger_config import setup_logger
+from application.services.disponibilidad_service import MatrizDisponibilidad, obtener_disponibilidad
+from domain.specs.base import Specification
+from domain.specs.base_conjunctions import AndSpecification
+from domain.specs.horario_specs import (
+    DiaLibreSpecification,
+    HorarioCortadoSpecification,
+    HorarioValidoSpecification,
+)
+from infrastructure.adapters.spec_to_constraint import aplicar_especificacion
+from infrastructure.databases.models.puestos import Puesto
+from infrastructure.databases.models.horario import Horario
+from infrastructure.repositories.colaborador_repo import ColaboradorRepository
+from infrastructure.repositories.colaborador_sucursal_repo import ColaboradorSucursalRepository
+from infrastructure.repositories.espacio_disponible_sucursal_repo import EspacioDisponibleSucursalRepository
+from infrastructure.repositories.horario_preferido_colaborador_repo import HorarioPreferidoColaboradorRepository
+from infrastructure.repositories.horario_sucursal_repo import HorarioSucursalRepository
+from infrastructure.repositories.minimo_puestos_requeridos_repo import MinimoPuestosRequeridosRepository
+from infrastructure.repositories.puesto_repo import PuestoRepository
+from infrastructure.repositories.sucursal_repo import SucursalRepository
+from infrastructure.repositories.vacacion_colaborador_repo import VacacionColaboradorRepository
+from infrastructure.solvers.heuristica import GeneradorHeuristico
+from infrastructure.solvers.reparacion import (
+    TAMANO_VECINDARIO,
+    construir_subproblema,
+    descontar_turnos_externos,
+    elegir_vecindario,
+)
+from infrastructure.solvers.solver import (
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    GeneradorHorarios,
+    ObservadorSoluciones,
+    ResultadoGeneracion,
+    TurnoGenerado,
+    dia_id_de_fecha,
+)
+
+logger = setup_logger(__name__, "logs/generar_horarios.log")
+
+# Brecha relativa y workers de las reparaciones, que deben responder en menos de un segundo.
+# El subproblema es chico: más workers que CPUs solo compiten por el mismo núcleo.
+GAP_REPARACION = 0.01
+WORKERS_REPARACION = 4
+
+# Reglas que se aplican durante la búsqueda si no se indican otras
+REGLAS_POR_DEFECTO = AndSpecification(
+    DiaLibreSpecification(),
+    AndSpecification(HorarioValidoSpecification(), HorarioCortadoSpecification()),
+)
+
+
+def cargar_datos_sucursal(
+    sucursal_id: int,
+    semana_inicio: date,
+    db: Session,
+    disponibilidad: Optional[MatrizDisponibilidad] = None
+) -> DatosSemanaSucursal:
+    """
+    Reúne desde la base de datos todo lo que el motor necesita para una sucursal y una semana:
+    horarios de atención, mínimos por día/hora/rol, espacios por rol, colaboradores
+    habilitados con sus límites de horas, sus horarios preferidos y sus vacaciones
+    dentro de la semana. Si se pasa la matriz de `disponibilidad` de la empresa, las
+    vacaciones se toman de ella en lugar de consultarlas.
+    """
+    lunes = semana_inicio - timedelta(days=semana_inicio.weekday())
+    domingo = lunes + timedelta(days=6)
+
+    horarios_atencion = {
+        horario.dia_id: (horario.hora_apertura, horario.hora_cierre)
+        for horario in HorarioSucursalRepository.get_by_sucursal(sucursal_id, db)
+    }
+    minimos = {
+        (minimo.dia_id, minimo.hora, minimo.rol_colaborador_id): minimo.cantidad_minima
+        for minimo in MinimoPuestosRequeridosRepository.get_by_sucursal(sucursal_id, db)
+    }
+
+    capacidades: Dict[int, int] = {}
+    nombres_roles: Dict[int, str] = {}
+    for espacio in EspacioDisponibleSucursalRepository.get_by_sucursal(sucursal_id, db):
+        rol_id = espacio.rol_colaborador_id
+        capacidades[rol_id] = capacidades.get(rol_id, 0) + espacio.cantidad
+        if espacio.rol_colaborador is not None:
+            nombres_roles[rol_id] = espacio.rol_colaborador.nombre
+
+    roles_por_colaborador: Dict[int, List[int]] = {}
+    for relacion in ColaboradorSucursalRepository.get_by_sucursal(sucursal_id, db):
+        roles = roles_por_colaborador.setdefault(relacion.colaborador_id, [])
+        if relacion.rol_colaborador_id not in roles:
+            roles.append(relacion.rol_colaborador_id)
+
+    colaborador_ids = list(roles_por_colaborador.keys())
+    vacaciones: Dict[int, Set[date]] = {}
+    if disponibilidad is not None:
+        # La matriz de la empresa ya tiene las vacaciones de la semana de todos sus colaboradores
+        vacaciones = {colaborador_id: disponibilidad.fechas_no_disponibles(colaborador_id) for colaborador_id in colaborador_ids}
+    elif colaborador_ids:
+        for vacacion in VacacionColaboradorRepository.get_by_colaboradores_rango(colaborador_ids, lunes, domingo, db):
+            vacaciones.setdefault(vacacion.colaborador_id, set()).add(vacacion.fecha)
+
+    preferidos: Dict[int, Dict[int, List[Tuple]]] = {}
+    if colaborador_ids:
+        for preferido in HorarioPreferidoColaboradorRepository.get_by_sucursal_colaboradores(sucursal_id, colaborador_ids, db):
+            preferidos.setdefault(preferido.colaborador_id, {}).setdefault(preferido.dia_id, []).append(
+                (preferido.hora_inicio, preferido.hora_fin)
+            )
+
+    colaboradores = []
+    for colaborador in ColaboradorRepository.get_by_ids(colaborador_ids, db) if colaborador_ids else []:
+        tipo = colaborador.tipo_empleado
+        colaboradores.append(ColaboradorDisponible(
+            id=colaborador.id,
+            roles=roles_por_colaborador[colaborador.id],
+            horas_por_dia_max=tipo.horas_por_dia_max,
+            horas_semanales=tipo.horas_semanales,
+            horario_corrido=colaborador.horario_corrido,
+            tipo_empleado=tipo.tipo,
+            fechas_no_disponibles=vacaciones.get(colaborador.id, set()),
+            nombre=colaborador.nombre,
+            horarios_preferidos=preferidos.get(colaborador.id),
+        ))
+
+    return DatosSemanaSucursal(
+        sucursal_id=sucursal_id,
+        semana_inicio=lunes,
+        horarios_atencion=horarios_atencion,
+        minimos=minimos,
+        capacidades=capacidades,
+        colaboradores=colaboradores,
+        nombres_roles=nombres_roles,
+    )
+
+
+def cargar_turnos_semana_anterior(sucursal_ids: List[int], semana_inicio: date, db: Session) -> List[TurnoGenerado]:
+    """
+    Carga los puestos asignados de la semana anterior y los traslada a la semana a
+    generar, para usarlos como punto de partida del motor.
+    """
+    lunes = semana_inicio - timedelta(days=semana_inicio.weekday())
+    lunes_anterior = lunes - timedelta(days=7)
+    puestos = PuestoRepository.get_by_sucursales_fechas_con_horarios(
+        sucursal_ids, lunes_anterior, lunes - timedelta(days=1), db
+    )
+    return turnos_de_puestos(puestos, desplazamiento_dias=7)
+
+
+def turnos_de_puestos(puestos: List[Puesto], desplazamiento_dias: int = 0) -> List[TurnoGenerado]:
+    """
+    Convierte puestos asignados (con sus horarios cargados) en turnos del motor,
+    opcionalmente trasladando sus fechas.
+    """
+    turnos = []
+    for puesto in puestos:
+        if puesto.colaborador_id is None or not puesto.horarios:
+            continue
+        fecha = puesto.fecha + timedelta(days=desplazamiento_dias)
+        turnos.append(TurnoGenerado(
+            sucursal_id=puesto.sucursal_id,
+            colaborador_id=puesto.colaborador_id,
+            rol_colaborador_id=puesto.rol_colaborador_id,
+            dia_id=dia_id_de_fecha(fecha),
+            fecha=fecha,
+            bloques=sorted((horario.hora_inicio, horario.hora_fin) for horario in puesto.horarios),
+        ))
+    return turnos
+
+
+def construir_puestos(resultado: ResultadoGeneracion, nombres_roles: Dict[int, str]) -> List[Tuple[Puesto, List[Horario]]]:
+    """
+    Convierte los turnos generados en pares (Puesto, [Horario]) listos para persistir.
+    """
+    puestos_con_horarios = []
+    for turno in resultado.turnos:
+        puesto = Puesto(
+            sucursal_id=turno.sucursal_id,
+            rol_colaborador_id=turno.rol_colaborador_id,
+            dia_id=turno.dia_id,
+            fecha=turno.fecha,
+            nombre=nombres_roles.get(turno.rol_colaborador_id, f"Rol {turno.rol_colaborador_id}"),
+            colaborador_id=turno.colaborador_id,
+        )
+        horarios = [
+            Horario(hora_inicio=inicio, hora_fin=fin, horario_corrido=turno.horario_corrido)
+            for inicio, fin in turno.bloques
+        ]
+        puestos_con_horarios.append((puesto, horarios))
+    return puestos_con_horarios
+
+
+def agrupar_sucursales(datos_sucursales: List[DatosSemanaSucursal]) -> List[List[DatosSemanaSucursal]]:
+    """
+    Separa las sucursales en componentes conexas: dos sucursales quedan en el mismo
+    grupo si comparten (directa o indirectamente) algún colaborador.
+
+    Returns:
+        List[List[DatosSemanaSucursal]]: Grupos ordenados de mayor a menor cantidad de colaboradores.
+    """
+    padres = {datos.sucursal_id: datos.sucursal_id for datos in datos_sucursales}
+
+    def raiz(sucursal_id: int) -> int:
+        while padres[sucursal_id] != sucursal_id:
+            padres[sucursal_id] = padres[padres[sucursal_id]]
+            sucursal_id = padres[sucursal_id]
+        return sucursal_id
+
+    primera_sucursal: Dict[int, int] = {}
+    for datos in datos_sucursales:
+        for colaborador in datos.colaboradores:
+            otra = primera_sucursal.setdefault(colaborador.id, datos.sucursal_id)
+            padres[raiz(datos.sucursal_id)] = raiz(otra)
+
+    grupos: Dict[int, List[DatosSemanaSucursal]] = {}
+    for datos in datos_sucursales:
+        grupos.setdefault(raiz(datos.sucursal_id), []).append(datos)
+
+    return sorted(
+        grupos.values(),
+        key=lambda grupo: len({colaborador.id for datos in grupo for colaborador in datos.colaboradores}),
+        reverse=True,
+    )
+
+
+def resolver_grupo(
+    datos_sucursales: List[DatosSemanaSucursal],
+    tiempo_limite: float,
+    workers: int,
+    especificacion: Optional[Specification],
+    turnos_previos: Optional[List[TurnoGenerado]] = None,
+    al_mejorar: Optional[Callable[[ObservadorSoluciones], None]] = None,
+    detener=None
+) -> ResultadoGeneracion:
+    """
+    Resuelve un grupo de sucursales en su propia instancia de CP-SAT. Si el motor no
+    encuentra solución a tiempo se devuelve la de la heurística, siempre que cumpla
+    todas las restricciones y la especificación; si no, el resultado queda UNKNOWN.
+    Puede ejecutarse en un proceso aparte, por lo que solo recibe datos planos
+    (`al_mejorar` solo se usa cuando se resuelve en el mismo proceso y `detener`
+    debe ser un evento de multiprocessing en ese caso).
+    """
+    heuristica = GeneradorHeuristico(datos_sucursales).resolver()
+    generador = GeneradorHorarios(datos_sucursales, tiempo_limite=tiempo_limite, workers=workers)
+    if especificacion is not None:
+        aplicar_especificacion(especificacion, generador)
+    if turnos_previos:
+        generador.agregar_turnos_previos(turnos_previos)
+    else:
+        # Sin semana anterior, la heurística da un punto de partida casi inmediato
+        generador.agregar_hint(heuristica.turnos)
+
+    resultado = generador.resolver(al_mejorar, detener)
+    if resultado.estado == "UNKNOWN":
+        # CP-SAT no llegó a una solución en el tiempo límite: la heurística solo
+        # reemplaza al motor si cumple el modelo completo, especificación incluida
+        sucursal_ids = [datos.sucursal_id for datos in datos_sucursales]
+        if generador.verificar(heuristica.turnos):
+            logger.warning(
+                "CP-SAT sin solución en %.1fs para las sucursales %s; se usa la heurística.",
+                tiempo_limite, sucursal_ids
+            )
+            return heuristica
+        logger.warning(
+            "CP-SAT sin solución en %.1fs para las sucursales %s y la heurística no cumple las reglas.",
+            tiempo_limite, sucursal_ids
+        )
+    return resultado
+
+
+def previsualizar_horarios(sucursal_ids: List[int], semana_inicio: date, db: Session) -> ResultadoGeneracion:
+    """
+    Genera con la heurística constructiva una propuesta de horarios para una o varias
+    sucursales, sin persistirla. Está pensada para la vista previa de la interfaz:
+    responde en milisegundos, a costa de no garantizar el óptimo ni todas las reglas.
+    """
+    try:
+        datos_sucursales = [cargar_datos_sucursal(sucursal_id, semana_inicio, db) for sucursal_id in sucursal_ids]
+        _descontar_turnos_externos(datos_sucursales, db)
+        resultado = GeneradorHeuristico(datos_sucursales).resolver()
+    except Exception as e:
+        logger.error("Error al previsualizar horarios para las sucursales %s: %s", sucursal_ids, e)
+        raise
+
+    logger.info(
+        "Vista previa para las sucursales %s: %s turnos en %.1f ms",
+        sucursal_ids, len(resultado.turnos), resultado.tiempo_segundos * 1000
+    )
+    return resultado
+
+
+def _puestos_existentes(datos_sucursales: List[DatosSemanaSucursal], reemplazar: bool, db: Session) -> List[Puesto]:
+    existentes = []
+    for datos in datos_sucursales:
+        domingo = datos.semana_inicio + timedelta(days=6)
+        puestos = PuestoRepository.get_by_sucursal_fechas(datos.sucursal_id, datos.semana_inicio, domingo, db)
+        if puestos and not reemplazar:
+            raise ValueError(f"La sucursal {datos.sucursal_id} ya tiene puestos cargados para la semana indicada.")
+        existentes.extend(puestos)
+    return existentes
+
+
+def _descontar_turnos_externos(datos_sucursales: List[DatosSemanaSucursal], db: Session) -> None:
+    """
+    Descuenta de los colaboradores los puestos que ya tienen en la semana en sucursales
+    que no se están generando, para no superponerlos ni exceder sus horas semanales.
+    """
+    if not datos_sucursales:
+        return
+    sucursal_ids = {datos.sucursal_id for datos in datos_sucursales}
+    colaborador_ids = list({colaborador.id for datos in datos_sucursales for colaborador in datos.colaboradores})
+    if not colaborador_ids:
+        return
+    lunes = datos_sucursales[0].semana_inicio
+    externos = turnos_de_puestos([
+        puesto
+        for puesto in PuestoRepository.get_by_colaboradores_fechas_con_horarios(
+            colaborador_ids, lunes, lunes + timedelta(days=6), db
+        )
+        if puesto.sucursal_id not in sucursal_ids
+    ])
+    if not externos:
+        return
+    for datos in datos_sucursales:
+        datos.colaboradores = descontar_turnos_externos(datos.colaboradores, externos)
+
+
+def _guardar_resultados(
+    resultados: List[ResultadoGeneracion],
+    datos_sucursales: List[DatosSemanaSucursal],
+    existentes: List[Puesto],
+    db: Session
+) -> None:
+    """
+    Reemplaza los puestos existentes y guarda todos los turnos en una única transacción.
+    """
+    nombres_roles: Dict[int, str] = {}
+    for datos in datos_sucursales:
+        nombres_roles.update(datos.nombres_roles)
+
+    puestos_con_horarios = []
+    for resultado in resultados:
+        puestos_con_horarios.extend(construir_puestos(resultado, nombres_roles))
+
+    if existentes:
+        PuestoRepository.delete_many_con_horarios([puesto.id for puesto in existentes], db)
+    PuestoRepository.create_many_con_horarios(puestos_con_horarios, db)
+    db.commit()
+
+
+def generar_horarios_sucursal(
+    sucursal_id: int,
+    semana_inicio: date,
+    db: Session,
+    tiempo_limite: float = 10.0,
+    reemplazar: bool = False,
+    especificacion: Optional[Specification] = REGLAS_POR_DEFECTO,
+    usar_semana_anterior: bool = True,
+    al_mejorar: Optional[Callable[[ObservadorSoluciones], None]] = None,
+    detener: Optional[threading.Event] = None
+) -> ResultadoGeneracion:
+    """
+    Genera los puestos y horarios de una sucursal para una semana y los persiste
+    en una única transacción.
+
+    Si la sucursal ya tiene puestos en la semana se rechaza la generación, salvo que
+    `reemplazar` sea True, en cuyo caso los puestos existentes se eliminan en la misma transacción.
+    Los puestos que los colaboradores ya tienen esa semana en otras sucursales quedan fijos:
+    esos días no están disponibles y sus horas se descuentan de las semanales.
+    `especificacion` se compila a restricciones del modelo para cada colaborador.
+    Con `usar_semana_anterior` los puestos de la semana previa se usan como warm start
+    y el motor solo cambia lo necesario respecto de ellos.
+    `al_mejorar` se invoca con cada solución mejorada durante la búsqueda y, si se
+    activa `detener`, la búsqueda termina y se guarda la mejor solución encontrada.
+    """
+    try:
+        datos = cargar_datos_sucursal(sucursal_id, semana_inicio, db)
+        existentes = _puestos_existentes([datos], reemplazar, db)
+        _descontar_turnos_externos([datos], db)
+        turnos_previos = (
+            cargar_turnos_semana_anterior([sucursal_id], semana_inicio, db) if usar_semana_anterior else None
+        )
+
+        resultado = resolver_grupo([datos], tiempo_limite, 8, especificacion, turnos_previos, al_mejorar, detener)
+        if not resultado.factible:
+            raise ValueError(f"No se encontró una solución para la sucursal ({resultado.estado}).")
+
+        _guardar_resultados([resultado], [datos], existentes, db)
+    except Exception as e:
+        db.rollback()
+        logger.error("Error al generar horarios para la sucursal %s: %s", sucursal_id, e)
+        raise
+
+    logger.info(
+        "Horarios generados para la sucursal %s (semana %s): %s turnos, estado %s, %.2fs",
+        sucursal_id, datos.semana_inicio, len(resultado.turnos), resultado.estado, resultado.tiempo_segundos
+    )
+    return resultado
+
+
+def generar_horarios_empresa(
+    empresa_id: int,
+    semana_inicio: date,
+    db: Session,
+    tiempo_limite: float = 30.0,
+    reemplazar: bool = False,
+    especificacion: Optional[Specification] = REGLAS_POR_DEFECTO,
+    max_procesos: Optional[int] = None,
+    usar_semana_anterior: bool = True,
+    al_resolver_grupo: Optional[Callable[[List[int], ResultadoGeneracion], None]] = None,
+    detener: Optional[threading.Event] = None
+) -> List[ResultadoGeneracion]:
+    """
+    Genera los horarios de todas las sucursales de una empresa para una semana.
+
+    Las sucursales se agrupan en componentes independientes según los colaboradores
+    que comparten; cada grupo se resuelve en paralelo en un proceso con su propia
+    instancia de CP-SAT, de modo que el tiempo total queda acotado por el grupo más
+    grande. Todos los resultados se guardan en una única transacción: si algún grupo
+    no tiene solución no se guarda nada. Los puestos de los colaboradores en sucursales
+    de otras empresas quedan fijos. Con `usar_semana_anterior` cada grupo parte
+    de los puestos de la semana previa. `al_resolver_grupo` se invoca con los IDs de
+    las sucursales y el resultado de cada grupo a medida que terminan. Si se activa
+    `detener`, todos los grupos cortan la búsqueda con su mejor solución.
+
+    Returns:
+        List[ResultadoGeneracion]: Un resultado por grupo de sucursales.
+    """
+    try:
+        sucursales = SucursalRepository.get_by_empresa(empresa_id, db)
+        disponibilidad = obtener_disponibilidad(empresa_id, semana_inicio, db)
+        datos_sucursales = [
+            cargar_datos_sucursal(sucursal.id, semana_inicio, db, disponibilidad) for sucursal in sucursales
+        ]
+        existentes = _puestos_existentes(datos_sucursales, reemplazar, db)
+        _descontar_turnos_externos(datos_sucursales, db)
+        grupos = agrupar_sucursales(datos_sucursales)
+        if not grupos:
+            return []
+
+        turnos_previos: Dict[int, List[TurnoGenerado]] = {}
+        if usar_semana_anterior:
+            sucursal_ids = [datos.sucursal_id for datos in datos_sucursales]
+            for turno in cargar_turnos_semana_anterior(sucursal_ids, semana_inicio, db):
+                turnos_previos.setdefault(turno.sucursal_id, []).append(turno)
+
+        cpus = os.cpu_count() or 1
+        procesos = max_procesos or min(len(grupos), cpus)
+        workers = max(1, cpus // procesos)
+        # Los grupos llegan ordenados de mayor a menor, así los más costosos arrancan primero
+        with ProcessPoolExecutor(max_workers=procesos) as executor, Manager() as manager:
+            # Un threading.Event no cruza procesos: la detención se replica en un evento compartido
+            detener_grupos = manager.Event()
+            futuros = {
+                executor.submit(
+                    resolver_grupo, grupo, tiempo_limite, workers, especificacion,
+                    [turno for datos in grupo for turno in turnos_previos.get(datos.sucursal_id, [])],
+                    None, detener_grupos,
+                ): indice
+                for indice, grupo in enumerate(grupos)
+            }
+            resultados: List[Optional[ResultadoGeneracion]] = [None] * len(grupos)
+            pendientes = set(futuros)
+            while pendientes:
+                terminados, pendientes = wait(pendientes, timeout=0.5, return_when=FIRST_COMPLETED)
+                if detener is not None and detener.is_set():
+                    detener_grupos.set()
+                for futuro in terminados:
+                    indice = futuros[futuro]
+                    resultados[indice] = futuro.result()
+                    if al_resolver_grupo:
+                        al_resolver_grupo([datos.sucursal_id for datos in grupos[indice]], resultados[indice])
+
+        sin_solucion = [
+            [datos.sucursal_id for datos in grupo]
+            for grupo, resultado in zip(grupos, resultados)
+            if not resultado.factible
+        ]
+        if sin_solucion:
+            raise ValueError(f"No se encontró una solución para las sucursales {sin_solucion}.")
+
+        _guardar_resultados(resultados, datos_sucursales, existentes, db)
+    except Exception as e:
+        db.rollback()
+        logger.error("Error al generar horarios para la empresa %s: %s", empresa_id, e)
+        raise
+
+    logger.info(
+        "Horarios generados para la empresa %s: %s sucursales en %s grupos, %s turnos",
+        empresa_id, len(datos_sucursales), len(grupos), sum(len(resultado.turnos) for resultado in resultados)
+    )
+    return resultados
+
+
+def reparar_por_ausencia(
+    colaborador_id: int,
+    fechas: List[date],
+    db: Session,
+    tiempo_limite: float = 1.0,
+    tamano_vecindario: int = TAMANO_VECINDARIO,
+    especificacion: Optional[Specification] = REGLAS_POR_DEFECTO
+) -> List[ResultadoGeneracion]:
+    """
+    Repara los horarios ya publicados cuando un colaborador deja de estar disponible
+    en las fechas indicadas (por ejemplo, al registrar una vacación).
+
+    Para cada sucursal y semana afectadas se liberan los puestos del colaborador y
+    los de un vecindario chico de colaboradores con sus mismos roles; el resto de
+    la semana queda fijo y solo se resuelve ese subproblema, con penalización por
+    cada turno que cambia. Los cambios se guardan en un savepoint: si alguna
+    reparación falla no se modifica ningún puesto y el error se propaga. No confirma
+    la transacción; eso queda a cargo de quien llama.
+
+    Returns:
+        List[ResultadoGeneracion]: Un resultado por sucursal y semana reparadas.
+    """
+    fechas = set(fechas)
+    afectados = [
+        puesto for puesto in PuestoRepository.get_by_colaborador_date(colaborador_id, min(fechas), max(fechas), db)
+        if puesto.fecha in fechas
+    ] if fechas else []
+    # (sucursal_id, lunes) -> días afectados
+    reparaciones: Dict[Tuple[int, date], Set[int]] = {}
+    for puesto in afectados:
+        lunes = puesto.fecha - timedelta(days=puesto.fecha.weekday())
+        reparaciones.setdefault((puesto.sucursal_id, lunes), set()).add(dia_id_de_fecha(puesto.fecha))
+
+    resultados = []
+    try:
+        with db.begin_nested():
+            for (sucursal_id, lunes), dias in sorted(reparaciones.items()):
+                domingo = lunes + timedelta(days=6)
+                datos = cargar_datos_sucursal(sucursal_id, lunes, db)
+                puestos = PuestoRepository.get_by_sucursales_fechas_con_horarios([sucursal_id], lunes, domingo, db)
+                turnos = turnos_de_puestos(puestos)
+
+                liberados = elegir_vecindario(datos, turnos, colaborador_id, dias, tamano_vecindario)
+                externos = turnos_de_puestos([
+                    puesto
+                    for puesto in PuestoRepository.get_by_colaboradores_fechas_con_horarios(list(liberados), lunes, domingo, db)
+                    if puesto.sucursal_id != sucursal_id
+                ])
+                subproblema = construir_subproblema(datos, turnos, liberados, externos)
+
+                generador = GeneradorHorarios(
+                    subproblema,
+                    tiempo_limite=tiempo_limite,
+                    workers=min(WORKERS_REPARACION, os.cpu_count() or 1),
+                    gap_relativo=GAP_REPARACION
+                )
+                if especificacion is not None:
+                    aplicar_especificacion(especificacion, generador)
+                # Los turnos actuales ya cumplen el modelo salvo los del ausente en sus
+                # fechas, que no tienen variable: no hace falta reparar el hint
+                generador.agregar_turnos_previos(
+                    [turno for turno in turnos if turno.colaborador_id in liberados], reparar_hint=False
+                )
+                resultado = generador.resolver()
+                if not resultado.factible:
+                    raise ValueError(
+                        f"No se encontró una reparación para la sucursal {sucursal_id} ({resultado.estado})."
+                    )
+
+                PuestoRepository.delete_many_con_horarios(
+                    [puesto.id for puesto in puestos if puesto.colaborador_id in liberados], db
+                )
+                PuestoRepository.create_many_con_horarios(construir_puestos(resultado, datos.nombres_roles), db)
+                resultados.append(resultado)
+                logger.info(
+                    "Reparación de la sucursal %s (semana %s) por ausencia del colaborador %s: "
+                    "%s colaboradores liberados, %s cambios, %.3fs",
+                    sucursal_id, lunes, colaborador_id, len(liberados), resultado.cambios, resultado.tiempo_segundos
+                )
+    except Exception as e:
+        logger.error("Error al reparar horarios por ausencia del colaborador %s: %s", colaborador_id, e)
+        raise
+    return resultados
@@ -0,0 +1,244 @@
+"""
+Índice de calendario en bits: vacaciones y días trabajados de cada colaborador.
+
+Cada año se representa con un bitmap de 366 bits (bit i = día i del año, desde el
+1 de enero). Con un entero de Python por año, detectar vacaciones con horarios
+asignados es un AND y contar días libres en un rango es un AND con una máscara y un
+popcount. Para una sucursal o una empresa completa, `IndiceCalendario` guarda los
+bitmaps como filas de palabras uint64 de NumPy y resuelve las mismas consultas para
+todos los colaboradores a la vez.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+DIAS_ANIO = 366
+PALABRAS_ANIO = (DIAS_ANIO + 63) // 64
+
+
+def bit_de_fecha(fecha: date) -> int:
+    """Posición del día dentro de su año (0 = 1 de enero)."""
+    return fecha.toordinal() - date(fecha.year, 1, 1).toordinal()
+
+
+def _fechas_de_bits(anio: int, bits: int) -> List[date]:
+    inicio = date(anio, 1, 1)
+    fechas = []
+    while bits:
+        menor = bits & -bits
+        fechas.append(inicio + timedelta(days=menor.bit_length() - 1))
+        bits ^= menor
+    return fechas
+
+
+def mascara_rango(desde: date, hasta: date) -> int:
+    """Bits de las fechas de [desde, hasta], que deben ser del mismo año."""
+    if desde.year != hasta.year:
+        raise ValueError("El rango debe estar dentro de un mismo año.")
+    if hasta < desde:
+        return 0
+    return ((1 << (bit_de_fecha(hasta) - bit_de_fecha(desde) + 1)) - 1) << bit_de_fecha(desde)
+
+
+@lru_cache(maxsize=None)
+def mascara_dia_semana(anio: int, weekday: int) -> int:
+    """Bits de todas las fechas del año que caen en `weekday` (0=Lunes, 6=Domingo)."""
+    primero = (weekday - date(anio, 1, 1).weekday()) % 7
+    dias = 366 if date(anio, 12, 31).timetuple().tm_yday == 366 else 365
+    mascara = 0
+    for bit in range(primero, dias, 7):
+        mascara |= 1 << bit
+    return mascara
+
+
+class CalendarioAnual:
+    __slots__ = ("anio", "vacaciones", "trabajados")
+
+    def __init__(self, anio: int, vacaciones: int = 0, trabajados: int = 0):
+        """
+        Bitmaps de un año de un colaborador.
+
+        Args:
+            anio (int): Año calendario.
+            vacaciones (int): Bitmap de días de vacaciones.
+            trabajados (int): Bitmap de días con horarios asignados.
+        """
+        self.anio = anio
+        self.vacaciones = vacaciones
+        self.trabajados = trabajados
+
+    def conflictos(self) -> int:
+        """Bitmap de los días de vacaciones con horarios asignados."""
+        return self.vacaciones & self.trabajados
+
+
+class CalendarioColaborador:
+    def __init__(self):
+        """Calendario de un colaborador, con un CalendarioAnual por año con datos."""
+        self._anios: Dict[int, CalendarioAnual] = {}
+
+    @classmethod
+    def desde_fechas(cls, vacaciones: Iterable[date] = (), trabajados: Iterable[date] = ()) -> "CalendarioColaborador":
+        calendario = cls()
+        for fecha in vacaciones:
+            calendario.marcar_vacacion(fecha)
+        for fecha in trabajados:
+            calendario.marcar_trabajado(fecha)
+        return calendario
+
+    def _anio(self, anio: int) -> CalendarioAnual:
+        calendario = self._anios.get(anio)
+        if calendario is None:
+            calendario = self._anios[anio] = CalendarioAnual(anio)
+        return calendario
+
+    def marcar_vacacion(self, fecha: date):
+        self._anio(fecha.year).vacaciones |= 1 << bit_de_fecha(fecha)
+
+    def quitar_vacacion(self, fecha: date):
+        self._anio(fecha.year).vacaciones &= ~(1 << bit_de_fecha(fecha))
+
+    def limpiar_vacaciones(self):
+        for calendario in self._anios.values():
+            calendario.vacaciones = 0
+
+    def marcar_trabajado(self, fecha: date):
+        self._anio(fecha.year).trabajados |= 1 << bit_de_fecha(fecha)
+
+    def quitar_trabajado(self, fecha: date):
+        self._anio(fecha.year).trabajados &= ~(1 << bit_de_fecha(fecha))
+
+    def hay_conflicto(self) -> bool:
+        """Indica si algún día de vacaciones tiene horarios asignados."""
+        return any(calendario.conflictos() for calendario in self._anios.values())
+
+    def conflictos(self) -> List[date]:
+        """Fechas de vacaciones con horarios asignados, en orden."""
+        fechas: List[date] = []
+        for anio in sorted(self._anios):
+            fechas.extend(_fechas_de_bits(anio, self._anios[anio].conflictos()))
+        return fechas
+
+    def dias_trabajados(self, desde: date, hasta: date) -> int:
+        """Cantidad de días con horarios asignados en [desde, hasta] (mismo año)."""
+        calendario = self._anios.get(desde.year)
+        return (calendario.trabajados & mascara_rango(desde, hasta)).bit_count() if calendario else 0
+
+    def dias_libres(self, desde: date, hasta: date) -> int:
+        """Cantidad de días sin horarios asignados en [desde, hasta] (mismo año)."""
+        return (hasta - desde).days + 1 - self.dias_trabajados(desde, hasta)
+
+    def dias_semana_trabajados(self) -> Set[int]:
+        """Días de la semana (0=Lunes, 6=Domingo) en los que hay algún horario asignado."""
+        dias: Set[int] = set()
+        for anio, calendario in self._anios.items():
+            if calendario.trabajados:
+                dias.update(
+                    weekday for weekday in range(7) if calendario.trabajados & mascara_dia_semana(anio, weekday)
+                )
+        return dias
+
+
+def calendario_de(colaborador) -> CalendarioColaborador:
+    """
+    Calendario de un colaborador: el que mantiene `Colaborador` o, para otros objetos
+    con `vacaciones` y `horario_asignado`, uno armado en una pasada.
+    """
+    if hasattr(colaborador, "calendario"):
+        return colaborador.calendario()
+    trabajados = [
+        (asignacion[1] if isinstance(asignacion, tuple) else asignacion).fecha
+        for asignacion in colaborador.horario_asignado or []
+    ]
+    return CalendarioColaborador.desde_fechas(
+        getattr(colaborador, "vacaciones", None) or [], [fecha for fecha in trabajados if fecha is not None]
+    )
+
+
+# ✅ ÍNDICE DE VARIOS COLABORADORES
+
+def _palabras(filas: np.ndarray, bits: np.ndarray, cantidad_filas: int) -> np.ndarray:
+    palabras = np.zeros((cantidad_filas, PALABRAS_ANIO), dtype=np.uint64)
+    np.bitwise_or.at(
+        palabras, (filas, bits // 64), np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64))
+    )
+    return palabras
+
+
+def _mascara_palabras(mascara: int) -> np.ndarray:
+    return np.array([(mascara >> (64 * i)) & (2 ** 64 - 1) for i in range(PALABRAS_ANIO)], dtype=np.uint64)
+
+
+def _entero(palabras: np.ndarray) -> int:
+    return sum(int(palabra) << (64 * i) for i, palabra in enumerate(palabras))
+
+
+class IndiceCalendario:
+    def __init__(self, anio: int, colaborador_ids: List[int], vacaciones: np.ndarray, trabajados: np.ndarray):
+        """
+        Bitmaps de un año para varios colaboradores.
+
+        Args:
+            anio (int): Año calendario.
+            colaborador_ids (List[int]): Colaboradores, en el orden de las filas.
+            vacaciones (np.ndarray): Palabras uint64 de forma (colaboradores, PALABRAS_ANIO).
+            trabajados (np.ndarray): Igual que `vacaciones`, para los días trabajados.
+        """
+        self.anio = anio
+        self.colaborador_ids = colaborador_ids
+        self.vacaciones = vacaciones
+        self.trabajados = trabajados
+        self._indice = {colaborador_id: i for i, colaborador_id in enumerate(colaborador_ids)}
+
+    @classmethod
+    def desde_filas(
+        cls,
+        anio: int,
+        vacaciones: Iterable[Tuple[int, date]],
+        trabajados: Iterable[Tuple[int, date]],
+        colaborador_ids: Optional[Iterable[int]] = None
+    ) -> "IndiceCalendario":
+        """
+        Arma el índice a partir de filas (colaborador_id, fecha); se ignoran las fechas
+        de otros años.
+        """
+        vacaciones = [(c, f) for c, f in vacaciones if f.year == anio]
+        trabajados = [(c, f) for c, f in trabajados if f.year == anio]
+        ids = set(colaborador_ids or [])
+        ids.update(c for c, _ in vacaciones)
+        ids.update(c for c, _ in trabajados)
+        ids = sorted(ids)
+        indice = {colaborador_id: i for i, colaborador_id in enumerate(ids)}
+        inicio = date(anio, 1, 1).toordinal()
+
+        def a_palabras(filas: List[Tuple[int, date]]) -> np.ndarray:
+            posiciones = np.array([indice[c] for c, _ in filas], dtype=np.int64)
+            bits = np.array([f.toordinal() - inicio for _, f in filas], dtype=np.int64)
+            return _palabras(posiciones, bits, len(ids))
+
+        return cls(anio, ids, a_palabras(vacaciones), a_palabras(trabajados))
+
+    def calendario(self, colaborador_id: int) -> CalendarioAnual:
+        i = self._indice.get(colaborador_id)
+        if i is None:
+            return CalendarioAnual(self.anio)
+        return CalendarioAnual(self.anio, _entero(self.vacaciones[i]), _entero(self.trabajados[i]))
+
+    def conflictos_por_colaborador(self) -> np.ndarray:
+        """Cantidad de días de vacaciones con horarios asignados de cada colaborador."""
+        return np.bitwise_count(self.vacaciones & self.trabajados).sum(axis=1, dtype=np.int64)
+
+    def colaboradores_con_conflicto(self) -> List[int]:
+        return [self.colaborador_ids[i] for i in np.flatnonzero(self.conflictos_por_colaborador())]
+
+    def dias_trabajados(self, desde: date, hasta: date) -> np.ndarray:
+        """Días con horarios asignados en [desde, hasta] de cada colaborador."""
+        mascara = _mascara_palabras(mascara_rango(desde, hasta))
+        return np.bitwise_count(self.trabajados & mascara).sum(axis=1, dtype=np.int64)
+
+    def dias_libres(self, desde: date, hasta: date) -> np.ndarray:
+        """Días sin horarios asignados en [desde, hasta] de cada colaborador."""
+        return (hasta - desde).days + 1 - self.dias_trabajados(desde, hasta)
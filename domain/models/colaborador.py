@@ -1,11 +1,108 @@
 from __future__ import annotations
-from typing import List, Dict, Tuple, Optional
-from datetime import date
-from .horario import Horario
+from collections import Counter
+from typing import FrozenSet, Hashable, List, Dict, Tuple, Optional, Union
+from datetime import date, time
+from .horario import Horario, ultima_mutacion
 from .tipo_colaborador import TipoEmpleado
 from .rol import Rol
 from .sucursal import Sucursal
 from .empresa import Empresa
+from .calendario import CalendarioColaborador
+
+# Tipos de empleado (valor de TipoEmpleado.tipo)
+TIEMPO_COMPLETO = "TIEMPO_COMPLETO"
+TIEMPO_PARCIAL = "TIEMPO_PARCIAL"
+HORARIO_ESPECIAL = "HORARIO_ESPECIAL"
+
+
+def _desempaquetar(asignacion: Union[Horario, Tuple[int, Horario]]) -> Tuple[Optional[int], Horario]:
+    """`horario_asignado` puede tener tuplas (sucursal_id, Horario) o el Horario solo."""
+    if isinstance(asignacion, tuple):
+        return asignacion
+    return getattr(asignacion, "sucursal_id", None), asignacion
+
+
+def _clave_dia(horario: Horario) -> Hashable:
+    # Los horarios sin fecha (plantillas) se acumulan por día de la semana
+    return horario.fecha if horario.fecha is not None else horario.dia_id
+
+
+def _clave_semana(horario: Horario) -> Hashable:
+    # Semana ISO (año, número); los horarios sin fecha cuentan en una única semana
+    return horario.fecha.isocalendar()[:2] if horario.fecha is not None else None
+
+
+def huella_horario(horario) -> Hashable:
+    """Contenido de un horario que determina su evaluación: sucursal, fecha y bloques."""
+    minutos = getattr(horario, "minutos", None)
+    bloques = minutos.tobytes() if minutos is not None else tuple(horario.bloques)
+    return getattr(horario, "sucursal_id", None), horario.fecha, bloques
+
+
+def huella_horarios(asignaciones) -> FrozenSet[Tuple[Hashable, int]]:
+    """
+    Contenido de una lista de horarios asignados, independiente del orden y con
+    repeticiones. Se devuelve el conjunto y no su hash para que dos asignaciones
+    distintas nunca compartan la misma clave.
+    """
+    return frozenset(Counter(
+        (sucursal_id,) + huella_horario(horario)
+        for sucursal_id, horario in map(_desempaquetar, asignaciones or [])
+    ).items())
+
+
+class ListaAsignaciones(list):
+    """
+    Lista de horarios asignados que cuenta sus modificaciones en `version`, para que
+    Colaborador detecte en O(1) los append, remove o reemplazos hechos directamente.
+    El orden no cuenta: sort y reverse no cambian la versión.
+    """
+    __slots__ = ("version",)
+
+    def __init__(self, asignaciones=()):
+        super().__init__(asignaciones)
+        self.version = 0
+
+    def append(self, asignacion):
+        self.version += 1
+        super().append(asignacion)
+
+    def extend(self, asignaciones):
+        self.version += 1
+        super().extend(asignaciones)
+
+    def insert(self, posicion, asignacion):
+        self.version += 1
+        super().insert(posicion, asignacion)
+
+    def remove(self, asignacion):
+        self.version += 1
+        super().remove(asignacion)
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def __setitem__(self, posicion, asignacion):
+        self.version += 1
+        super().__setitem__(posicion, asignacion)
+
+    def __delitem__(self, posicion):
+        self.version += 1
+        super().__delitem__(posicion)
+
+    def __iadd__(self, asignaciones):
+        self.version += 1
+        return super().__iadd__(asignaciones)
+
+    def __imul__(self, veces):
+        self.version += 1
+        return super().__imul__(veces)
+
 
 class Colaborador:
     def __init__(
@@ -59,11 +156,126 @@ class Colaborador:
         self.horario_preferido = horario_preferido
         self.dias_preferidos = dias_preferidos
         self.tipo_empleado = tipo_empleado
-        self.horario_asignado = horario_asignado
+        self.horario_asignado = horario_asignado or []
         self.hs_extra = hs_extra
         self.vacaciones = vacaciones
         self.horario_corrido = horario_corrido
 
+    # ✅ CONTADORES DE MINUTOS ASIGNADOS
+    @property
+    def horario_asignado(self) -> List[Tuple[int, Horario]]:
+        return self._horario_asignado
+
+    @horario_asignado.setter
+    def horario_asignado(self, horarios: List[Tuple[int, Horario]]):
+        self._horario_asignado = ListaAsignaciones(horarios or [])
+        self._recalcular_minutos()
+
+    def _recalcular_minutos(self):
+        """Reconstruye los contadores por día y por semana recorriendo los horarios asignados."""
+        self._minutos_por_dia: Dict[Hashable, int] = {}
+        self._minutos_por_semana: Dict[Hashable, int] = {}
+        self._huella: Optional[FrozenSet[Tuple[Hashable, int]]] = None
+        self._calendario = CalendarioColaborador()
+        self._vacaciones_indexadas: Optional[Tuple[date, ...]] = None
+        self._minutos_totales = 0
+        for asignacion in self._horario_asignado:
+            _, horario = _desempaquetar(asignacion)
+            self._sumar_minutos(horario, horario.duracion())
+        self._version_contada = self._version_asignaciones()
+
+    def _version_asignaciones(self) -> Tuple[int, int]:
+        # Versión de la lista y última mutación de cualquier Horario: si alguna cambió,
+        # los contadores pueden no valer. Editar un horario de otro colaborador también
+        # fuerza un recálculo, que se paga una vez en la siguiente consulta
+        return self._horario_asignado.version, ultima_mutacion()
+
+    def _sumar_minutos(self, horario: Horario, minutos: int):
+        dia, semana = _clave_dia(horario), _clave_semana(horario)
+        self._minutos_por_dia[dia] = self._minutos_por_dia.get(dia, 0) + minutos
+        if horario.fecha is not None:
+            # El bit del día queda encendido mientras el día tenga minutos asignados
+            if self._minutos_por_dia[dia] > 0:
+                self._calendario.marcar_trabajado(horario.fecha)
+            else:
+                self._calendario.quitar_trabajado(horario.fecha)
+        self._minutos_por_semana[semana] = self._minutos_por_semana.get(semana, 0) + minutos
+        self._huella = None
+        self._minutos_totales += minutos
+
+    def _sincronizar_minutos(self):
+        # Si la lista o un horario se modificaron directamente (append, reemplazo,
+        # Horario.agregar_bloque...) los contadores ya no valen
+        if self._version_contada != self._version_asignaciones():
+            self._recalcular_minutos()
+
+    def minutos_dia(self, horario_o_fecha: Union[Horario, date, int]) -> int:
+        """
+        Minutos asignados en un día, en O(1).
+
+        Args:
+            horario_o_fecha (Union[Horario, date, int]): Horario cuyo día se consulta, la
+                fecha, o el dia_id para horarios sin fecha.
+
+        Returns:
+            int: Minutos asignados ese día.
+        """
+        self._sincronizar_minutos()
+        clave = _clave_dia(horario_o_fecha) if isinstance(horario_o_fecha, Horario) else horario_o_fecha
+        return self._minutos_por_dia.get(clave, 0)
+
+    def minutos_semana(self, horario_o_fecha: Optional[Union[Horario, date]] = None) -> int:
+        """
+        Minutos asignados en la semana ISO de un horario o fecha, en O(1).
+        Sin argumento devuelve el total de todos los horarios asignados.
+        """
+        self._sincronizar_minutos()
+        if horario_o_fecha is None:
+            return self._minutos_totales
+        if isinstance(horario_o_fecha, Horario):
+            clave = _clave_semana(horario_o_fecha)
+        else:
+            clave = horario_o_fecha.isocalendar()[:2]
+        return self._minutos_por_semana.get(clave, 0)
+
+    def huella_asignaciones(self) -> FrozenSet[Tuple[Hashable, int]]:
+        """
+        Conjunto de horarios asignados (sucursal, fecha y bloques de cada uno), como lo
+        arma `huella_horarios`. Se calcula una vez y se conserva hasta el próximo cambio,
+        incluidos los bloques editados en un horario ya asignado, para que las
+        especificaciones memoizadas reconozcan en O(1) a un colaborador sin cambios.
+        """
+        self._sincronizar_minutos()
+        if self._huella is None:
+            self._huella = huella_horarios(self._horario_asignado)
+        return self._huella
+
+    def calendario(self) -> CalendarioColaborador:
+        """
+        Bitmaps anuales de días trabajados y de vacaciones. Los días trabajados se
+        mantienen junto con los contadores de minutos; las vacaciones se reindexan solo
+        si la lista cambió.
+        """
+        self._sincronizar_minutos()
+        vacaciones = tuple(self.vacaciones or ())
+        if vacaciones != self._vacaciones_indexadas:
+            self._calendario.limpiar_vacaciones()
+            for fecha in vacaciones:
+                self._calendario.marcar_vacacion(fecha)
+            self._vacaciones_indexadas = vacaciones
+        return self._calendario
+
+    def puede_agregar(self, horario: Horario) -> bool:
+        """
+        Indica en O(1) si asignar el horario mantiene el día y la semana dentro de los
+        límites del tipo de empleado. No verifica superposiciones.
+        """
+        duracion = horario.duracion()
+        return (
+            self.minutos_dia(horario) + duracion <= self.tipo_empleado.horas_por_dia_max * 60
+            and self.minutos_semana(horario) + duracion <= self.tipo_empleado.horas_semanales * 60
+        )
+
     # ✅ MÉTODOS PARA GESTIÓN DE HORARIOS
     def agregar_horario(self, sucursal_id: int, nuevo_horario: Horario):
         """Asigna un horario al colaborador en una sucursal específica."""
@@ -71,33 +283,69 @@ class Colaborador:
             raise ValueError(f"El colaborador no trabaja en la sucursal {sucursal_id}.")
 
         # Verificar superposición de horarios
-        for sucursal, horario_existente in self.horario_asignado:
+        for asignacion in self.horario_asignado:
+            sucursal, horario_existente = _desempaquetar(asignacion)
             if sucursal == sucursal_id and horario_existente.se_superpone(nuevo_horario):
                 raise ValueError("El nuevo horario se superpone con un horario existente.")
 
+        self._sincronizar_minutos()
         self.horario_asignado.append((sucursal_id, nuevo_horario))
+        self._sumar_minutos(nuevo_horario, nuevo_horario.duracion())
+        self._version_contada = self._version_asignaciones()
+
+    def eliminar_horario(self, horario: Horario) -> bool:
+        """
+        Quita un horario asignado y descuenta sus minutos.
+
+        Returns:
+            bool: True si el horario fue eliminado, False si no estaba asignado.
+        """
+        self._sincronizar_minutos()
+        for posicion, asignacion in enumerate(self.horario_asignado):
+            if _desempaquetar(asignacion)[1] is horario:
+                del self.horario_asignado[posicion]
+                self._sumar_minutos(horario, -horario.duracion())
+                self._version_contada = self._version_asignaciones()
+                return True
+        return False
+
+    def eliminar_bloque(self, horario: Horario, inicio: time, fin: time) -> bool:
+        """
+        Elimina un bloque de un horario asignado manteniendo los contadores al día.
+        Editar el horario directamente también se detecta, pero obliga a recalcular
+        todos los contadores en la próxima consulta.
+
+        Args:
+            horario (Horario): Horario asignado al colaborador.
+            inicio (time): Hora de inicio del bloque a eliminar.
+            fin (time): Hora de fin del bloque a eliminar.
+
+        Returns:
+            bool: True si el bloque fue eliminado, False si no se encontró.
+        """
+        self._sincronizar_minutos()
+        duracion_anterior = horario.duracion()
+        if not horario.eliminar_bloque(inicio, fin):
+            return False
+        self._sumar_minutos(horario, horario.duracion() - duracion_anterior)
+        self._version_contada = self._version_asignaciones()
+        return True
 
     def calcular_horas_totales_semanales(self) -> float:
         """Calcula el total de horas trabajadas en la semana."""
-        if not self.horario_asignado:
-            return 0.0
-        minutos_totales = sum(horario.duracion() for _, horario in self.horario_asignado)
-        return minutos_totales / 60  # Convertir a horas
+        return self.minutos_semana() / 60  # Convertir a horas
 
     def verificar_horas_semanales(self) -> bool:
         """Verifica si las horas trabajadas no exceden el límite del contrato."""
-        return self.calcular_horas_totales_semanales() <= self.tipo_empleado.horas_semanales
+        self._sincronizar_minutos()
+        limite = self.tipo_empleado.horas_semanales * 60
+        return all(minutos <= limite for minutos in self._minutos_por_semana.values())
 
     def verificar_horas_diarias(self) -> bool:
         """Verifica si las horas diarias trabajadas no exceden el límite permitido."""
-        horas_por_dia = {}
-        for _, horario in self.horario_asignado:
-            dia = horario.dia  # Suponiendo que Horario tiene un atributo `dia`
-            horas_dia = horas_por_dia.get(dia, 0) + horario.duracion() / 60
-            if horas_dia > self.tipo_empleado.horas_por_dia_max:
-                return False
-            horas_por_dia[dia] = horas_dia
-        return True
+        self._sincronizar_minutos()
+        limite = self.tipo_empleado.horas_por_dia_max * 60
+        return all(minutos <= limite for minutos in self._minutos_por_dia.values())
 
     # ✅ MÉTODOS PARA GESTIÓN DE VACACIONES Y HORAS EXTRA
     def agregar_vacacion(self, fecha: date):
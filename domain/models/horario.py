@@ -1,7 +1,50 @@
+from array import array
 from datetime import date, time, timedelta
+from itertools import count
 from typing import List, Tuple, Optional
 
+MINUTOS_DIA = 24 * 60
+
+# Cada modificación de un Horario ya creado (bloques, fecha, sucursal o día) toma un
+# número nuevo de la secuencia. Quien guarda datos derivados de horarios (los contadores
+# de Colaborador) compara `ultima_mutacion()` para saber en O(1) si siguen valiendo.
+_secuencia_mutaciones = count(1)
+_ultima_mutacion = 0
+
+
+def ultima_mutacion() -> int:
+    """Número de la última modificación de cualquier Horario ya creado."""
+    return _ultima_mutacion
+
+
+def _registrar_mutacion():
+    global _ultima_mutacion
+    _ultima_mutacion = next(_secuencia_mutaciones)
+
+
+def _a_minutos(hora: time) -> int:
+    return hora.hour * 60 + hora.minute
+
+
+def _a_hora(minutos: int) -> time:
+    return time(minutos // 60, minutos % 60)
+
+
 class Horario:
+    """
+    Horario de un colaborador (o de atención de una sucursal) para un día.
+
+    Los bloques se guardan como minutos desde las 00:00 en un `array('H')` plano
+    (inicio1, fin1, inicio2, fin2, ...): `duracion`, `se_superpone` y `esta_dentro`
+    comparan enteros sin crear objetos `time`. `bloques` sigue devolviendo la lista de
+    tuplas (inicio, fin) de `time` para el código que la necesita, y `bloques_en_minutos`
+    da los mismos bloques en minutos. La precisión es de un minuto.
+
+    Modificar los bloques, la fecha, la sucursal o el día de un horario ya creado
+    registra una mutación (ver `ultima_mutacion`).
+    """
+    __slots__ = ("_sucursal_id", "colaborador_id", "rol_colaborador_id", "_dia_id", "_fecha", "horario_corrido", "_minutos")
+
     def __init__(
         self,
         sucursal_id: int,
@@ -23,68 +66,151 @@ class Horario:
             bloques (List[Tuple[time, time]]): Lista de bloques de tiempo (inicio, fin).
             horario_corrido (bool): Define si es horario corrido o no.
         """
-        self.sucursal_id = sucursal_id
+        self._sucursal_id = sucursal_id
         self.colaborador_id = colaborador_id
         self.rol_colaborador_id = rol_colaborador_id
-        self.dia_id = dia_id  # Se alinea con la BD
-        self.fecha = fecha
+        self._dia_id = dia_id  # Se alinea con la BD
+        self._fecha = fecha
         self.horario_corrido = horario_corrido
+        self._cargar_minutos([(_a_minutos(inicio), _a_minutos(fin)) for inicio, fin in bloques or []])
+
+    @classmethod
+    def desde_minutos(
+        cls,
+        sucursal_id: int,
+        colaborador_id: Optional[int],
+        dia_id: int,
+        fecha: Optional[date],
+        bloques: List[Tuple[int, int]],
+        horario_corrido: bool,
+        rol_colaborador_id: Optional[int] = None,
+    ) -> "Horario":
+        """
+        Crea un Horario a partir de bloques en minutos desde las 00:00, sin pasar por `time`.
+
+        Raises:
+            ValueError: Si algún minuto está fuera del día o los bloques no son válidos.
+        """
+        horario = cls.__new__(cls)
+        horario._sucursal_id = sucursal_id
+        horario.colaborador_id = colaborador_id
+        horario.rol_colaborador_id = rol_colaborador_id
+        horario._dia_id = dia_id
+        horario._fecha = fecha
+        horario.horario_corrido = horario_corrido
+        horario._cargar_minutos(bloques)
+        return horario
 
+    @property
+    def sucursal_id(self) -> int:
+        return self._sucursal_id
+
+    @sucursal_id.setter
+    def sucursal_id(self, sucursal_id: int):
+        self._sucursal_id = sucursal_id
+        _registrar_mutacion()
+
+    @property
+    def dia_id(self) -> int:
+        return self._dia_id
+
+    @dia_id.setter
+    def dia_id(self, dia_id: int):
+        self._dia_id = dia_id
+        _registrar_mutacion()
+
+    @property
+    def fecha(self) -> Optional[date]:
+        return self._fecha
+
+    @fecha.setter
+    def fecha(self, fecha: Optional[date]):
+        self._fecha = fecha
+        _registrar_mutacion()
+
+    @property
+    def bloques(self) -> List[Tuple[time, time]]:
+        """Bloques (inicio, fin) como `time`, ordenados por inicio."""
+        minutos = self._minutos
+        return [(_a_hora(minutos[i]), _a_hora(minutos[i + 1])) for i in range(0, len(minutos), 2)]
+
+    @bloques.setter
+    def bloques(self, bloques: List[Tuple[time, time]]):
+        self._cargar_minutos([(_a_minutos(inicio), _a_minutos(fin)) for inicio, fin in bloques or []])
+        _registrar_mutacion()
+
+    @property
+    def minutos(self) -> array:
+        """Bloques en minutos como array plano (inicio1, fin1, inicio2, fin2, ...). No debe modificarse."""
+        return self._minutos
+
+    def bloques_en_minutos(self) -> List[Tuple[int, int]]:
+        """Bloques (inicio, fin) en minutos desde las 00:00, ordenados por inicio."""
+        minutos = self._minutos
+        return [(minutos[i], minutos[i + 1]) for i in range(0, len(minutos), 2)]
+
+    def _cargar_minutos(self, bloques: List[Tuple[int, int]]):
         if not bloques:
             raise ValueError("Debes proporcionar al menos un bloque de tiempo.")
-
+        minutos = array("H")
         # Ordenar y validar los bloques
-        self.bloques = sorted(bloques, key=lambda b: b[0])  
+        for inicio, fin in sorted(bloques, key=lambda b: b[0]):
+            if not (0 <= inicio < MINUTOS_DIA and 0 <= fin < MINUTOS_DIA):
+                raise ValueError("Los bloques deben estar dentro del día (00:00 a 23:59).")
+            minutos.append(inicio)
+            minutos.append(fin)
+        self._minutos = minutos
         self._validar_bloques()
 
     def _validar_bloques(self):
         """Valida que los bloques de horario sean correctos (sin superposiciones y orden lógico)."""
-        for i, (inicio, fin) in enumerate(self.bloques):
-            if fin <= inicio:
-                raise ValueError(f"El bloque {i + 1} tiene una hora de fin anterior o igual a la hora de inicio.")
-            if i > 0:  
-                _, fin_anterior = self.bloques[i - 1]
-                if inicio < fin_anterior:
-                    raise ValueError(f"El bloque {i + 1} se superpone con el bloque anterior.")
+        minutos = self._minutos
+        for i in range(0, len(minutos), 2):
+            if minutos[i + 1] <= minutos[i]:
+                raise ValueError(f"El bloque {i // 2 + 1} tiene una hora de fin anterior o igual a la hora de inicio.")
+            if i > 0 and minutos[i] < minutos[i - 1]:
+                raise ValueError(f"El bloque {i // 2 + 1} se superpone con el bloque anterior.")
 
     def duracion(self) -> int:
         """
         Calcula la duración total del horario en minutos.
         Ahora maneja el caso de horarios que cruzan medianoche.
         """
+        minutos = self._minutos
         duracion_total = 0
-        for inicio, fin in self.bloques:
-            inicio_min = inicio.hour * 60 + inicio.minute
-            fin_min = fin.hour * 60 + fin.minute
-
-            if fin_min < inicio_min:  # Caso en el que el horario cruza medianoche
-                duracion = (24 * 60 - inicio_min) + fin_min
-            else:
-                duracion = fin_min - inicio_min
-
+        for i in range(0, len(minutos), 2):
+            duracion = minutos[i + 1] - minutos[i]
+            if duracion < 0:  # Caso en el que el horario cruza medianoche
+                duracion += MINUTOS_DIA
             duracion_total += duracion
-
         return duracion_total
 
     def se_superpone(self, otro_horario: 'Horario') -> bool:
         """Verifica si este horario se superpone con otro horario en la misma sucursal y fecha."""
         if self.fecha != otro_horario.fecha or self.sucursal_id != otro_horario.sucursal_id:
-            return False  
+            return False
 
-        return any(
-            inicio1 < fin2 and inicio2 < fin1  # Se superponen si hay intersección
-            for inicio1, fin1 in self.bloques
-            for inicio2, fin2 in otro_horario.bloques
-        )
+        # Ambos arrays están ordenados: se recorren en paralelo
+        propios, otros = self._minutos, otro_horario._minutos
+        i = j = 0
+        while i < len(propios) and j < len(otros):
+            if propios[i] < otros[j + 1] and otros[j] < propios[i + 1]:  # Se superponen si hay intersección
+                return True
+            if propios[i + 1] <= otros[j + 1]:
+                i += 2
+            else:
+                j += 2
+        return False
 
     def esta_dentro(self, otro: 'Horario') -> bool:
         """Verifica si todos los bloques de este horario están completamente contenidos dentro del otro horario."""
         if self.fecha != otro.fecha or self.sucursal_id != otro.sucursal_id:
-            return False  
+            return False
 
+        propios, otros = self._minutos, otro._minutos
         return all(
-            any(inicio2 <= inicio1 and fin1 <= fin2 for inicio2, fin2 in otro.bloques)
-            for inicio1, fin1 in self.bloques
+            any(otros[j] <= propios[i] and propios[i + 1] <= otros[j + 1] for j in range(0, len(otros), 2))
+            for i in range(0, len(propios), 2)
         )
 
     def agregar_bloque(self, inicio: time, fin: time):
@@ -95,14 +221,19 @@ class Horario:
         if fin < inicio:  # No permitir bloques que pasen de un día al siguiente
             raise ValueError("El bloque no puede cruzar al siguiente día.")
 
-        nuevo_bloque = (inicio, fin)
-
-        for bloque_existente in self.bloques:
-            if nuevo_bloque[0] < bloque_existente[1] and nuevo_bloque[1] > bloque_existente[0]:
+        nuevo_inicio, nuevo_fin = _a_minutos(inicio), _a_minutos(fin)
+        minutos = self._minutos
+        for i in range(0, len(minutos), 2):
+            if nuevo_inicio < minutos[i + 1] and nuevo_fin > minutos[i]:
                 raise ValueError("El nuevo bloque se superpone con un bloque existente.")
 
-        self.bloques.append(nuevo_bloque)
-        self.bloques.sort(key=lambda b: b[0])  # Ordenar después de agregar el bloque
+        # Insertar manteniendo el orden por inicio
+        posicion = 0
+        while posicion < len(minutos) and minutos[posicion] <= nuevo_inicio:
+            posicion += 2
+        minutos.insert(posicion, nuevo_fin)
+        minutos.insert(posicion, nuevo_inicio)
+        _registrar_mutacion()
 
     def eliminar_bloque(self, inicio: time, fin: time):
         """
@@ -115,11 +246,14 @@ class Horario:
         Returns:
             bool: True si el bloque fue eliminado, False si no se encontró.
         """
-        try:
-            self.bloques.remove((inicio, fin))
-            return True
-        except ValueError:
-            return False
+        buscado_inicio, buscado_fin = _a_minutos(inicio), _a_minutos(fin)
+        minutos = self._minutos
+        for i in range(0, len(minutos), 2):
+            if minutos[i] == buscado_inicio and minutos[i + 1] == buscado_fin:
+                del minutos[i:i + 2]
+                _registrar_mutacion()
+                return True
+        return False
 
     def to_dict(self):
         """Convierte el objeto Horario en un diccionario."""
@@ -129,7 +263,10 @@ class Horario:
             "dia_id": self.dia_id,
             "fecha": self.fecha.isoformat(),
             "horario_corrido": self.horario_corrido,
-            "bloques": [(inicio.strftime("%H:%M"), fin.strftime("%H:%M")) for inicio, fin in self.bloques]
+            "bloques": [
+                (f"{inicio // 60:02d}:{inicio % 60:02d}", f"{fin // 60:02d}:{fin % 60:02d}")
+                for inicio, fin in self.bloques_en_minutos()
+            ]
         }
 
     def __str__(self):
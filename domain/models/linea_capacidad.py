@@ -0,0 +1,94 @@
+from typing import List
+
+
+class LineaCapacidad:
+    """
+    Ocupación de un recurso a lo largo del día, minuto a minuto.
+
+    Árbol de segmentos iterativo con suma por rango y máximo por rango: ocupar un
+    bloque [inicio, fin) y consultar el pico de ocupación dentro de un bloque cuestan
+    O(log n) sin importar cuántos bloques se hayan asignado. Las hojas son minutos
+    desde las 00:00, como en `Horario`.
+    """
+    __slots__ = ("tamano", "_altura", "_maximos", "_pendientes")
+
+    def __init__(self, minutos: int = 24 * 60):
+        """
+        Args:
+            minutos (int): Cantidad de minutos que cubre la línea.
+        """
+        # Se redondea a potencia de dos para que cada nodo cubra un rango contiguo
+        self.tamano = 1 << max(0, minutos - 1).bit_length()
+        self._altura = self.tamano.bit_length()
+        self._maximos: List[int] = [0] * (2 * self.tamano)
+        # Suma pendiente de aplicar a los hijos de cada nodo interno
+        self._pendientes: List[int] = [0] * self.tamano
+
+    def _aplicar(self, nodo: int, valor: int):
+        self._maximos[nodo] += valor
+        if nodo < self.tamano:
+            self._pendientes[nodo] += valor
+
+    def _subir(self, nodo: int):
+        # Recalcula los ancestros de una hoja después de modificarla
+        maximos, pendientes = self._maximos, self._pendientes
+        while nodo > 1:
+            nodo >>= 1
+            maximos[nodo] = max(maximos[2 * nodo], maximos[2 * nodo + 1]) + pendientes[nodo]
+
+    def _bajar(self, nodo: int):
+        # Aplica a los hijos las sumas pendientes de los ancestros de una hoja
+        pendientes = self._pendientes
+        for nivel in range(self._altura - 1, 0, -1):
+            padre = nodo >> nivel
+            if pendientes[padre]:
+                self._aplicar(2 * padre, pendientes[padre])
+                self._aplicar(2 * padre + 1, pendientes[padre])
+                pendientes[padre] = 0
+
+    def sumar(self, inicio: int, fin: int, valor: int = 1):
+        """
+        Suma `valor` a la ocupación de cada minuto del rango [inicio, fin).
+        """
+        if inicio >= fin:
+            return
+        izquierda, derecha = inicio + self.tamano, fin + self.tamano
+        self._bajar(izquierda)
+        self._bajar(derecha - 1)
+        while izquierda < derecha:
+            if izquierda & 1:
+                self._aplicar(izquierda, valor)
+                izquierda += 1
+            if derecha & 1:
+                derecha -= 1
+                self._aplicar(derecha, valor)
+            izquierda >>= 1
+            derecha >>= 1
+        self._subir(inicio + self.tamano)
+        self._subir(fin - 1 + self.tamano)
+
+    def maximo(self, inicio: int, fin: int) -> int:
+        """
+        Ocupación máxima dentro del rango [inicio, fin). Un rango vacío devuelve 0.
+        """
+        if inicio >= fin:
+            return 0
+        izquierda, derecha = inicio + self.tamano, fin + self.tamano
+        self._bajar(izquierda)
+        self._bajar(derecha - 1)
+        maximos = self._maximos
+        resultado = 0
+        while izquierda < derecha:
+            if izquierda & 1:
+                resultado = max(resultado, maximos[izquierda])
+                izquierda += 1
+            if derecha & 1:
+                derecha -= 1
+                resultado = max(resultado, maximos[derecha])
+            izquierda >>= 1
+            derecha >>= 1
+        return resultado
+
+    def maximo_total(self) -> int:
+        """Pico de ocupación de todo el día."""
+        return self._maximos[1]
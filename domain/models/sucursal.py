@@ -1,6 +1,8 @@
-from typing import List, Dict
+from collections import Counter
+from typing import Hashable, List, Dict, Tuple
 from datetime import date
 from domain.models.horario import Horario
+from domain.models.linea_capacidad import LineaCapacidad
 from domain.models.formato import Formato
 from domain.models.rol import Rol
 
@@ -41,7 +43,9 @@ class Sucursal:
         self.disposicion_fisica = self.validar_disposicion(disposicion_fisica)
         self.horario_atencion = horario_atencion  # Lista de Horarios
         self.dias_atencion = dias_atencion  # Lista de `dia_id`
-        self.espacios_ocupados = {rol: 0 for rol in formato.roles}  # Control de espacios ocupados por rol
+        # Ocupación por rol y día (fecha, o dia_id si el horario no tiene fecha), minuto a minuto
+        self._lineas: Dict[Tuple[Rol, Hashable], LineaCapacidad] = {}
+        self._asignaciones: Counter = Counter()
 
     def validar_disposicion(self, disposicion_fisica: Dict[Rol, int]) -> Dict[Rol, int]:
         """
@@ -90,51 +94,101 @@ class Sucursal:
             raise ValueError(f"El rol '{rol.nombre}' no pertenece al formato '{self.formato.nombre}'.")
         return self.disposicion_fisica.get(rol, 0)
 
-    def puede_asignar_rol(self, rol: Rol) -> bool:
+    def _validar_rol(self, rol: Rol):
+        if rol not in self.formato.roles:
+            raise ValueError(f"El rol '{rol.nombre}' no pertenece al formato '{self.formato.nombre}'.")
+
+    @staticmethod
+    def _clave_dia(horario: Horario) -> Hashable:
+        return horario.fecha if horario.fecha is not None else horario.dia_id
+
+    def _linea(self, rol: Rol, horario: Horario) -> LineaCapacidad:
+        clave = (rol, self._clave_dia(horario))
+        linea = self._lineas.get(clave)
+        if linea is None:
+            linea = self._lineas[clave] = LineaCapacidad()
+        return linea
+
+    @property
+    def espacios_ocupados(self) -> Dict[Rol, int]:
+        """Pico de puestos ocupados a la vez por rol, en cualquier día y hora."""
+        ocupados = {rol: 0 for rol in self.formato.roles}
+        for (rol, _), linea in self._lineas.items():
+            ocupados[rol] = max(ocupados[rol], linea.maximo_total())
+        return ocupados
+
+    def ocupacion_rol(self, rol: Rol, horario: Horario) -> int:
         """
-        Verifica si un rol puede asignarse, basándose en la disposición física.
+        Máximo de puestos del rol ocupados a la vez durante los bloques de un horario.
 
         Args:
             rol (Rol): Objeto Rol.
+            horario (Horario): Horario cuyos bloques (y día) se consultan.
+
+        Returns:
+            int: Ocupación máxima dentro de los bloques.
+        """
+        self._validar_rol(rol)
+        linea = self._lineas.get((rol, self._clave_dia(horario)))
+        if linea is None:
+            return 0
+        return max((linea.maximo(inicio, fin) for inicio, fin in horario.bloques_en_minutos()), default=0)
+
+    def puede_asignar_rol(self, rol: Rol, horario: Horario) -> bool:
+        """
+        Verifica si un puesto del rol puede ocuparse durante los bloques del horario sin
+        superar la disposición física en ningún minuto. Cuesta O(log minutos) por bloque.
+
+        Args:
+            rol (Rol): Objeto Rol.
+            horario (Horario): Horario a asignar.
 
         Returns:
             bool: True si el rol puede asignarse, False de lo contrario.
         """
-        if rol not in self.formato.roles:
-            raise ValueError(f"El rol '{rol.nombre}' no pertenece al formato '{self.formato.nombre}'.")
-        return self.espacios_ocupados[rol] < self.disposicion_fisica.get(rol, 0)
+        return self.ocupacion_rol(rol, horario) < self.disposicion_fisica.get(rol, 0)
 
-    def asignar_rol(self, rol: Rol) -> bool:
+    def asignar_rol(self, rol: Rol, horario: Horario) -> bool:
         """
-        Asigna un rol si hay espacio disponible.
+        Ocupa un puesto del rol durante los bloques del horario si hay espacio disponible.
 
         Args:
             rol (Rol): Objeto Rol.
+            horario (Horario): Horario a asignar.
 
         Returns:
             bool: True si se pudo asignar el rol, False si no hay espacio disponible.
         """
-        if self.puede_asignar_rol(rol):
-            self.espacios_ocupados[rol] += 1
-            return True
-        return False
+        if not self.puede_asignar_rol(rol, horario):
+            return False
+        linea = self._linea(rol, horario)
+        for inicio, fin in horario.bloques_en_minutos():
+            linea.sumar(inicio, fin, 1)
+        self._asignaciones[self._clave_asignacion(rol, horario)] += 1
+        return True
 
-    def liberar_rol(self, rol: Rol) -> None:
+    def liberar_rol(self, rol: Rol, horario: Horario) -> None:
         """
-        Libera un puesto ocupado por un rol.
+        Libera el puesto ocupado por un rol durante los bloques de un horario.
 
         Args:
             rol (Rol): Objeto Rol.
+            horario (Horario): Horario con el que se asignó el rol.
 
         Raises:
-            ValueError: Si no hay puestos ocupados para el rol.
-        """
-        if rol not in self.formato.roles:
-            raise ValueError(f"El rol '{rol.nombre}' no pertenece al formato '{self.formato.nombre}'.")
-        if self.espacios_ocupados[rol] > 0:
-            self.espacios_ocupados[rol] -= 1
-        else:
-            raise ValueError(f"No hay puestos ocupados para el rol '{rol.nombre}' para liberar.")
+            ValueError: Si no hay un puesto asignado al rol con ese horario.
+        """
+        self._validar_rol(rol)
+        clave = self._clave_asignacion(rol, horario)
+        if not self._asignaciones[clave]:
+            raise ValueError(f"No hay puestos ocupados para el rol '{rol.nombre}' en ese horario para liberar.")
+        self._asignaciones[clave] -= 1
+        linea = self._linea(rol, horario)
+        for inicio, fin in horario.bloques_en_minutos():
+            linea.sumar(inicio, fin, -1)
+
+    def _clave_asignacion(self, rol: Rol, horario: Horario) -> Tuple:
+        return rol, self._clave_dia(horario), tuple(horario.minutos)
 
     def listar_roles(self) -> List[str]:
         """
@@ -1,6 +1,15 @@
 from infrastructure.schemas.venta_hora import VentaHora, VentaHoraResponse
 import math
 from datetime import date
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Columnas de get_vta_hora que usa el agrupamiento por hora
+COLUMNAS_VENTAS = ("Sucursal", "Fecha", "Hora", "Obra Social Detalle")
+# Orden de las categorías en los códigos del agrupamiento columnar
+CATEGORIAS = ("PAMI", "Obra Social", "Particular")
 
 class Factura:
     def __init__(self, venta: VentaHora):
@@ -70,9 +79,98 @@ class VentasPorHora:
         for factura in facturas:
             self.agregar_factura(factura)
 
+    def agregar_conteo(self, sucursal: int, fecha: date, hora: int, categoria: str, cantidad: int):
+        """
+        Suma una cantidad de facturas ya agrupada (por ejemplo, en la base de datos) a la
+        clave (sucursal, fecha, hora), con el mismo formato que agregar_factura.
+        """
+        key = (sucursal, fecha, hora)
+        if key not in self.ventas:
+            self.ventas[key] = {"PAMI": 0, "Obra Social": 0, "Particular": 0, "Total": 0}
+        self.ventas[key][categoria] += cantidad
+        self.ventas[key]["Total"] += cantidad
+
+    def procesar_tabla(self, tabla: pd.DataFrame):
+        """
+        Versión columnar de procesar_facturas: agrupa una tabla con las columnas de
+        COLUMNAS_VENTAS (las filas de get_vta_hora sin validar) sin crear una Factura por
+        fila. Cada columna se factoriza una vez y las conversiones se hacen sobre los
+        valores distintos: la hora con una división entera de los segundos y la categoría
+        con un str.startswith vectorizado. Los conteos salen de un bincount por grupo y
+        se suman a los que ya hubiera, por lo que puede llamarse por lotes.
+        """
+        if tabla.empty:
+            return
+        # Sobre arrays object, para que pandas no convierta los valores distintos a Timedelta/Timestamp
+        codigos_sucursal, sucursales = pd.factorize(tabla["Sucursal"].to_numpy(object), use_na_sentinel=False)
+        codigos_fecha, fechas = pd.factorize(tabla["Fecha"].to_numpy(object), use_na_sentinel=False)
+        codigos_hora, horas = pd.factorize(tabla["Hora"].to_numpy(object), use_na_sentinel=False)
+        codigos_detalle, detalles = pd.factorize(
+            tabla["Obra Social Detalle"].fillna("").to_numpy(object), use_na_sentinel=False
+        )
+
+        segundos = np.fromiter(map(_segundos, horas), np.int64, len(horas))
+        hora_de_fila = (segundos // 3600)[codigos_hora]
+        # 0 = PAMI, 1 = Obra Social, 2 = Particular, como en determinar_categoria
+        detalles = pd.Index(detalles, dtype=object).astype(str)
+        categoria_detalle = np.where(detalles == "", 2, np.where(detalles.str.startswith("PAMI"), 0, 1))
+        categoria_de_fila = categoria_detalle[codigos_detalle]
+
+        # Un código por (sucursal, fecha, hora) en orden de aparición, como las claves del dict
+        clave = (codigos_sucursal.astype(np.int64) * len(fechas) + codigos_fecha) * 24 + hora_de_fila
+        codigos, claves = pd.factorize(clave)
+        conteos = np.bincount(
+            codigos * len(CATEGORIAS) + categoria_de_fila, minlength=len(claves) * len(CATEGORIAS)
+        ).reshape(-1, len(CATEGORIAS))
+
+        sucursales = [int(sucursal) for sucursal in sucursales]
+        fechas = list(fechas)
+        for clave_grupo, (pami, obra_social, particular) in zip(claves.tolist(), conteos.tolist()):
+            sucursal_fecha, hora = divmod(clave_grupo, 24)
+            indice_sucursal, indice_fecha = divmod(sucursal_fecha, len(fechas))
+            key = (sucursales[indice_sucursal], fechas[indice_fecha], hora)
+            if key not in self.ventas:
+                self.ventas[key] = {"PAMI": 0, "Obra Social": 0, "Particular": 0, "Total": 0}
+            ventas = self.ventas[key]
+            ventas["PAMI"] += pami
+            ventas["Obra Social"] += obra_social
+            ventas["Particular"] += particular
+            ventas["Total"] += pami + obra_social + particular
+
+    def procesar_filas(self, filas: Iterable[dict]):
+        """Carga filas de get_vta_hora en una tabla y las agrupa con procesar_tabla."""
+        self.procesar_tabla(tabla_ventas(filas))
+
     def obtener_ventas(self):
         return self.ventas
 
+def tabla_ventas(filas: Iterable[dict]) -> pd.DataFrame:
+    """
+    Arma la tabla de procesar_tabla con las columnas de COLUMNAS_VENTAS de cada fila.
+    Las columnas quedan como object: procesar_tabla las factoriza sin que pandas tenga
+    que inferir y convertir cada valor.
+    """
+    filas = filas if isinstance(filas, list) else list(filas)
+    return pd.DataFrame(
+        {
+            columna: np.fromiter((fila.get(columna) for fila in filas), object, len(filas))
+            for columna in COLUMNAS_VENTAS
+        },
+        dtype=object
+    )
+
+def _segundos(hora) -> int:
+    """Segundos desde medianoche de la columna Hora, que puede venir como TIME de
+    MySQL (timedelta), segundos, texto "HH:MM:SS" u objetos time ya validados."""
+    if hasattr(hora, "total_seconds"):
+        return int(hora.total_seconds())
+    if hasattr(hora, "hour"):
+        return hora.hour * 3600 + hora.minute * 60 + hora.second
+    if isinstance(hora, str):
+        horas, minutos, segundos = (hora.split(":") + ["0", "0"])[:3]
+        return int(horas) * 3600 + int(minutos) * 60 + int(float(segundos))
+    return int(hora)
+
 def calcular_personas(ventas: dict, tiempo_promedio: int = 5) -> dict:
     """
     Calcula la cantidad de personas que habrían realizado las facturas en cada grupo
@@ -0,0 +1,145 @@
+"""
+Detección de superposiciones entre horarios asignados por barrido (sweep line).
+
+Comparar todos los pares de horarios de un colaborador, y dentro de cada par todos
+los pares de bloques, es cuadrático. Aquí los bloques se agrupan por colaborador y
+fecha (y sucursal, si se pide), se ordenan por inicio y se recorren manteniendo un
+montículo con los bloques activos ordenados por fin: cada bloque nuevo solo se
+compara con los que siguen abiertos, por lo que el costo es O(n log n + k), con k la
+cantidad de conflictos reportados. Sirve igual para un colaborador o para la semana
+(o el mes) completa de una o varias sucursales.
+"""
+
+import heapq
+from collections import defaultdict
+from datetime import date, time
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def _a_minutos(hora: time) -> int:
+    return hora.hour * 60 + hora.minute
+
+
+def bloques_en_minutos(horario) -> List[Tuple[int, int]]:
+    """
+    Bloques (inicio, fin) de un horario en minutos. Horario ya los guarda así; también
+    se aceptan otros objetos con `bloques` de `time`.
+    """
+    if hasattr(horario, "bloques_en_minutos"):
+        return horario.bloques_en_minutos()
+    return [(_a_minutos(inicio), _a_minutos(fin)) for inicio, fin in horario.bloques]
+
+
+class Superposicion:
+    def __init__(
+        self,
+        horario_a: int,
+        bloque_a: int,
+        horario_b: int,
+        bloque_b: int,
+        colaborador_id: Optional[int],
+        fecha: Optional[date],
+        inicio: int,
+        fin: int
+    ):
+        """
+        Conflicto entre dos bloques de horarios distintos.
+
+        Args:
+            horario_a (int): Posición del primer horario en la lista recibida.
+            bloque_a (int): Posición del bloque dentro del primer horario.
+            horario_b (int): Posición del segundo horario en la lista recibida.
+            bloque_b (int): Posición del bloque dentro del segundo horario.
+            colaborador_id (Optional[int]): Colaborador de ambos horarios.
+            fecha (Optional[date]): Fecha de ambos horarios.
+            inicio (int): Inicio del tramo superpuesto, en minutos.
+            fin (int): Fin del tramo superpuesto, en minutos.
+        """
+        self.horario_a = horario_a
+        self.bloque_a = bloque_a
+        self.horario_b = horario_b
+        self.bloque_b = bloque_b
+        self.colaborador_id = colaborador_id
+        self.fecha = fecha
+        self.inicio = inicio
+        self.fin = fin
+
+    def to_dict(self) -> dict:
+        return {
+            "horario_a": self.horario_a,
+            "bloque_a": self.bloque_a,
+            "horario_b": self.horario_b,
+            "bloque_b": self.bloque_b,
+            "colaborador_id": self.colaborador_id,
+            "fecha": self.fecha.isoformat() if self.fecha else None,
+            "inicio": f"{self.inicio // 60:02d}:{self.inicio % 60:02d}",
+            "fin": f"{self.fin // 60:02d}:{self.fin % 60:02d}",
+        }
+
+    def __str__(self):
+        return (
+            f"Superposicion(horario {self.horario_a} bloque {self.bloque_a} con horario {self.horario_b} "
+            f"bloque {self.bloque_b}, colaborador={self.colaborador_id}, fecha={self.fecha})"
+        )
+
+
+def _agrupar_bloques(horarios: List, misma_sucursal: bool) -> Dict[Hashable, List[Tuple[int, int, int, int]]]:
+    grupos: Dict[Hashable, List[Tuple[int, int, int, int]]] = defaultdict(list)
+    for indice, horario in enumerate(horarios):
+        clave = (
+            getattr(horario, "colaborador_id", None),
+            getattr(horario, "sucursal_id", None) if misma_sucursal else None,
+            horario.fecha,
+        )
+        for numero, (inicio, fin) in enumerate(bloques_en_minutos(horario)):
+            grupos[clave].append((inicio, fin, indice, numero))
+    return grupos
+
+
+def detectar_superposiciones(
+    horarios: Iterable,
+    misma_sucursal: bool = True,
+    solo_la_primera: bool = False
+) -> List[Superposicion]:
+    """
+    Encuentra todos los pares de bloques superpuestos entre horarios distintos del
+    mismo colaborador y la misma fecha.
+
+    Args:
+        horarios (Iterable[Horario]): Horarios de uno o varios colaboradores.
+        misma_sucursal (bool): Si es True solo se comparan horarios de la misma sucursal,
+            como `Horario.se_superpone`; si es False también se detecta a un colaborador
+            asignado a dos sucursales a la vez.
+        solo_la_primera (bool): Cortar en el primer conflicto encontrado.
+
+    Returns:
+        List[Superposicion]: Conflictos encontrados, identificados por la posición del
+            horario en `horarios` y la del bloque dentro de cada horario.
+    """
+    horarios = list(horarios)
+    superposiciones: List[Superposicion] = []
+    for (colaborador_id, _, fecha), bloques in _agrupar_bloques(horarios, misma_sucursal).items():
+        if len(bloques) < 2:
+            continue
+        bloques.sort()
+        # Bloques activos: (fin, inicio, índice del horario, número de bloque)
+        activos: List[Tuple[int, int, int, int]] = []
+        for inicio, fin, indice, numero in bloques:
+            while activos and activos[0][0] <= inicio:
+                heapq.heappop(activos)
+            for fin_activo, _, indice_activo, numero_activo in activos:
+                if indice_activo == indice:
+                    continue
+                superposiciones.append(Superposicion(
+                    indice_activo, numero_activo, indice, numero,
+                    colaborador_id, fecha, inicio, min(fin, fin_activo)
+                ))
+                if solo_la_primera:
+                    return superposiciones
+            heapq.heappush(activos, (fin, inicio, indice, numero))
+    return superposiciones
+
+
+def hay_superposiciones(horarios: Iterable, misma_sucursal: bool = True) -> bool:
+    """Indica si algún par de horarios del mismo colaborador y fecha se superpone."""
+    return bool(detectar_superposiciones(horarios, misma_sucursal, solo_la_primera=True))
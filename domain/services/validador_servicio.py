@@ -0,0 +1,418 @@
+"""
+Validación en lote de una semana de horarios asignados.
+
+Las especificaciones de horario y colaborador recorren `colaborador.horario_asignado`
+cada vez que se evalúan: validar una sucursal completa llamando `is_satisfied_by`
+por cada horario y cada regla es cuadrático en la cantidad de horarios. Este servicio
+precalcula una sola vez, por colaborador, los minutos totales, los minutos y bloques
+de cada fecha y las superposiciones, y por sucursal las ventanas de atención de cada
+día; todas las reglas se evalúan sobre esas estructuras compartidas en una única
+pasada y el resultado es un reporte estructurado de violaciones.
+
+Las especificaciones sin evaluador registrado se evalúan con su `is_satisfied_by`,
+por lo que cualquier regla del dominio puede pasarse al validador. Si además declaran
+`depende_de`, el validador las memoiza: revalidar a un colaborador después de editar
+un bloque solo vuelve a evaluarlas sobre los horarios que cambiaron.
+"""
+
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from domain.models.colaborador import TIEMPO_COMPLETO, TIEMPO_PARCIAL
+from domain.specs.base import Specification
+from domain.specs.base_conjunctions import AndSpecification, OrSpecification, NotSpecification
+from domain.specs.colaborador_specs import (
+    ColaboradorSpecification,
+    HorarioAsignadoSpecification,
+    VacacionesSpecification,
+)
+from domain.specs.memoizacion import EspecificacionMemoizada
+from domain.specs.horario_specs import (
+    HorarioSpecification,
+    HorarioValidoSpecification,
+    HorarioRespetaHorasSemanales,
+    DiaLibreSpecification,
+    HorariosPorDefectoSpecification,
+    CONFIGURACIONES_POR_DEFECTO,
+)
+from domain.specs.sucursal_specs import SucursalSpecification
+from domain.services.superposiciones import Superposicion, bloques_en_minutos, detectar_superposiciones
+
+# Alcance de una regla: se evalúa por horario, una vez por colaborador o una vez por sucursal
+ALCANCE_HORARIO = "horario"
+ALCANCE_COLABORADOR = "colaborador"
+ALCANCE_SUCURSAL = "sucursal"
+
+# Regla que el validador agrega cuando recibe las sucursales
+REGLA_HORARIO_ATENCION = "HorarioAtencion"
+
+
+class Violacion:
+    def __init__(
+        self,
+        regla: str,
+        colaborador_id: Optional[int] = None,
+        sucursal_id: Optional[int] = None,
+        fecha: Optional[date] = None,
+        detalle: str = ""
+    ):
+        """
+        Incumplimiento de una regla.
+
+        Args:
+            regla (str): Nombre de la regla incumplida.
+            colaborador_id (Optional[int]): Colaborador afectado, si la regla es de horario o colaborador.
+            sucursal_id (Optional[int]): Sucursal del horario o sucursal evaluada.
+            fecha (Optional[date]): Fecha del horario, si la regla se evalúa por horario.
+            detalle (str): Descripción legible del incumplimiento.
+        """
+        self.regla = regla
+        self.colaborador_id = colaborador_id
+        self.sucursal_id = sucursal_id
+        self.fecha = fecha
+        self.detalle = detalle
+
+    def to_dict(self) -> dict:
+        return {
+            "regla": self.regla,
+            "colaborador_id": self.colaborador_id,
+            "sucursal_id": self.sucursal_id,
+            "fecha": self.fecha.isoformat() if self.fecha else None,
+            "detalle": self.detalle,
+        }
+
+    def __str__(self):
+        return f"Violacion(regla={self.regla}, colaborador={self.colaborador_id}, sucursal={self.sucursal_id}, fecha={self.fecha})"
+
+
+class ReporteValidacion:
+    def __init__(self):
+        """
+        Resultado de validar una semana: violaciones encontradas y volumen evaluado.
+        """
+        self.violaciones: List[Violacion] = []
+        self.colaboradores_evaluados = 0
+        self.horarios_evaluados = 0
+        self.sucursales_evaluadas = 0
+
+    @property
+    def valido(self) -> bool:
+        return not self.violaciones
+
+    def por_regla(self) -> Dict[str, int]:
+        """Cantidad de violaciones de cada regla."""
+        return dict(Counter(violacion.regla for violacion in self.violaciones))
+
+    def por_colaborador(self) -> Dict[int, List[Violacion]]:
+        """Violaciones agrupadas por colaborador (las de sucursal quedan fuera)."""
+        agrupadas: Dict[int, List[Violacion]] = defaultdict(list)
+        for violacion in self.violaciones:
+            if violacion.colaborador_id is not None:
+                agrupadas[violacion.colaborador_id].append(violacion)
+        return dict(agrupadas)
+
+    def to_dict(self) -> dict:
+        return {
+            "valido": self.valido,
+            "colaboradores_evaluados": self.colaboradores_evaluados,
+            "horarios_evaluados": self.horarios_evaluados,
+            "sucursales_evaluadas": self.sucursales_evaluadas,
+            "por_regla": self.por_regla(),
+            "violaciones": [violacion.to_dict() for violacion in self.violaciones],
+        }
+
+
+class ResumenColaborador:
+    def __init__(self, colaborador, memoizadas: Optional[Dict[int, Specification]] = None):
+        """
+        Estructuras de la semana de un colaborador que comparten todas las reglas.
+        Se calculan en una sola pasada sobre sus horarios asignados.
+
+        Args:
+            colaborador (Colaborador): Colaborador con sus horarios asignados.
+            memoizadas (Optional[Dict[int, Specification]]): Versión memoizada de las reglas
+                sin evaluador registrado, por id de la regla original.
+        """
+        self.colaborador = colaborador
+        self.memoizadas = memoizadas or {}
+        # Colaborador.agregar_horario guarda tuplas (sucursal_id, Horario)
+        self.horarios = [
+            horario[1] if isinstance(horario, tuple) else horario
+            for horario in colaborador.horario_asignado or []
+        ]
+        self.duraciones = [horario.duracion() for horario in self.horarios]
+        self.minutos_totales = sum(self.duraciones)
+        self.minutos_por_fecha: Dict[date, int] = Counter()
+        self.duraciones_por_horas = Counter(duracion / 60 for duracion in self.duraciones)
+        self.dias_semana = set()
+        for indice, horario in enumerate(self.horarios):
+            self.minutos_por_fecha[horario.fecha] += self.duraciones[indice]
+            self.dias_semana.add(horario.fecha.weekday())
+
+        self.superposiciones: List[Superposicion] = detectar_superposiciones(self.horarios)
+        self.fechas_vacaciones = set(getattr(colaborador, "vacaciones", None) or [])
+        self.resultados: Dict[int, bool] = {}
+
+
+def _ventanas_sucursal(sucursal) -> Dict[int, List[Tuple[int, int]]]:
+    """Ventanas de atención de la sucursal por dia_id, en minutos."""
+    ventanas: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for horario in sucursal.horario_atencion:
+        ventanas[horario.dia_id].extend(bloques_en_minutos(horario))
+    return dict(ventanas)
+
+
+# ✅ EVALUADORES SOBRE LAS ESTRUCTURAS PRECALCULADAS
+
+Evaluador = Callable[[Specification, ResumenColaborador, Optional[int]], bool]
+
+_EVALUADORES: Dict[Type[Specification], Tuple[str, Evaluador]] = {}
+
+
+def registrar_evaluador(alcance: str, *clases: Type[Specification]):
+    """
+    Registra la función decorada como evaluadora de las clases de especificación indicadas.
+    La función recibe la especificación, el resumen del colaborador y el índice del horario
+    (None si el alcance es por colaborador).
+    """
+    def decorador(funcion: Evaluador) -> Evaluador:
+        for clase in clases:
+            _EVALUADORES[clase] = (alcance, funcion)
+        return funcion
+    return decorador
+
+
+@registrar_evaluador(ALCANCE_HORARIO, HorarioValidoSpecification)
+def _horario_valido(spec, resumen: ResumenColaborador, indice: int) -> bool:
+    return resumen.duraciones[indice] <= resumen.colaborador.horas_diarias_maximas * 60
+
+
+@registrar_evaluador(ALCANCE_COLABORADOR, HorarioRespetaHorasSemanales)
+def _horas_semanales(spec, resumen: ResumenColaborador, indice: Optional[int]) -> bool:
+    return resumen.minutos_totales / 60 == resumen.colaborador.horas_semanales
+
+
+@registrar_evaluador(ALCANCE_COLABORADOR, DiaLibreSpecification)
+def _dia_libre(spec, resumen: ResumenColaborador, indice: Optional[int]) -> bool:
+    if resumen.colaborador.tipo_empleado not in {TIEMPO_COMPLETO, TIEMPO_PARCIAL}:
+        return True
+    return len(resumen.dias_semana) < 7
+
+
+@registrar_evaluador(ALCANCE_COLABORADOR, HorariosPorDefectoSpecification)
+def _horarios_por_defecto(spec, resumen: ResumenColaborador, indice: Optional[int]) -> bool:
+    configuracion = CONFIGURACIONES_POR_DEFECTO.get(resumen.colaborador.tipo_empleado)
+    if configuracion is None:
+        return False
+    return all(resumen.duraciones_por_horas[horas] == dias for horas, dias in configuracion.items())
+
+
+@registrar_evaluador(ALCANCE_COLABORADOR, HorarioAsignadoSpecification)
+def _horario_asignado(spec, resumen: ResumenColaborador, indice: Optional[int]) -> bool:
+    colaborador = resumen.colaborador
+    if resumen.minutos_totales / 60 != colaborador.horas_semanales:
+        return False
+    if resumen.duraciones and max(resumen.duraciones) > colaborador.horas_diarias_maximas * 60:
+        return False
+    return not resumen.superposiciones
+
+
+@registrar_evaluador(ALCANCE_COLABORADOR, VacacionesSpecification)
+def _vacaciones(spec, resumen: ResumenColaborador, indice: Optional[int]) -> bool:
+    return not resumen.fechas_vacaciones.intersection(resumen.minutos_por_fecha)
+
+
+def _hijos(spec: Specification) -> List[Specification]:
+    if isinstance(spec, (AndSpecification, OrSpecification)):
+        return [spec.spec1, spec.spec2]
+    if isinstance(spec, NotSpecification):
+        return [spec.spec]
+    return []
+
+
+def alcance(spec: Specification) -> str:
+    """
+    Determina con qué granularidad se evalúa una especificación. Una conjunción se
+    evalúa por horario si alguna de sus partes lo requiere.
+
+    Raises:
+        TypeError: Si la especificación no es de horario, colaborador ni sucursal, o si
+            combina reglas de sucursal con reglas de colaborador.
+    """
+    hijos = _hijos(spec)
+    if hijos:
+        alcances = {alcance(hijo) for hijo in hijos}
+        if ALCANCE_SUCURSAL in alcances and len(alcances) > 1:
+            raise TypeError("No se pueden combinar reglas de sucursal con reglas de colaborador u horario.")
+        return ALCANCE_HORARIO if ALCANCE_HORARIO in alcances else alcances.pop()
+
+    for clase in type(spec).__mro__:
+        if clase in _EVALUADORES:
+            return _EVALUADORES[clase][0]
+    if isinstance(spec, HorarioSpecification):
+        return ALCANCE_HORARIO
+    if isinstance(spec, ColaboradorSpecification):
+        return ALCANCE_COLABORADOR
+    if isinstance(spec, SucursalSpecification):
+        return ALCANCE_SUCURSAL
+    raise TypeError(f"No se puede validar en lote {type(spec).__name__}.")
+
+
+def evaluar(spec: Specification, resumen: ResumenColaborador, indice: Optional[int] = None) -> bool:
+    """
+    Evalúa una especificación de horario o colaborador sobre el resumen precalculado.
+    Las reglas de alcance colaborador se evalúan una sola vez por resumen aunque
+    formen parte de una conjunción que se evalúa por horario.
+    """
+    if isinstance(spec, AndSpecification):
+        return evaluar(spec.spec1, resumen, indice) and evaluar(spec.spec2, resumen, indice)
+    if isinstance(spec, OrSpecification):
+        return evaluar(spec.spec1, resumen, indice) or evaluar(spec.spec2, resumen, indice)
+    if isinstance(spec, NotSpecification):
+        return not evaluar(spec.spec, resumen, indice)
+
+    regla_alcance = alcance(spec)
+    if regla_alcance == ALCANCE_COLABORADOR and id(spec) in resumen.resultados:
+        return resumen.resultados[id(spec)]
+
+    for clase in type(spec).__mro__:
+        if clase in _EVALUADORES:
+            resultado = _EVALUADORES[clase][1](spec, resumen, indice)
+            break
+    else:
+        regla = resumen.memoizadas.get(id(spec), spec)
+        if isinstance(spec, HorarioSpecification):
+            resultado = regla.is_satisfied_by(resumen.horarios[indice], resumen.colaborador)
+        else:
+            resultado = regla.is_satisfied_by(resumen.colaborador)
+
+    if regla_alcance == ALCANCE_COLABORADOR:
+        resumen.resultados[id(spec)] = resultado
+    return resultado
+
+
+def evaluar_sucursal(spec: Specification, sucursal) -> bool:
+    """Evalúa una especificación de sucursal, incluidas sus conjunciones."""
+    if isinstance(spec, AndSpecification):
+        return evaluar_sucursal(spec.spec1, sucursal) and evaluar_sucursal(spec.spec2, sucursal)
+    if isinstance(spec, OrSpecification):
+        return evaluar_sucursal(spec.spec1, sucursal) or evaluar_sucursal(spec.spec2, sucursal)
+    if isinstance(spec, NotSpecification):
+        return not evaluar_sucursal(spec.spec, sucursal)
+    return spec.is_satisfied_by(sucursal)
+
+
+# ✅ SERVICIO
+
+class ValidadorServicio:
+    def __init__(self, especificaciones: Union[Iterable[Specification], Dict[str, Specification]]):
+        """
+        Inicializa el validador con las reglas a evaluar.
+
+        Args:
+            especificaciones (Union[Iterable[Specification], Dict[str, Specification]]): Reglas
+                de horario, colaborador o sucursal. Si se pasa un diccionario, las claves se
+                usan como nombre de la regla en el reporte; si no, el nombre de la clase.
+
+        Raises:
+            TypeError: Si alguna regla no puede evaluarse en lote.
+        """
+        if isinstance(especificaciones, dict):
+            reglas = list(especificaciones.items())
+        else:
+            reglas = [(type(spec).__name__, spec) for spec in especificaciones]
+        self.reglas: List[Tuple[str, Specification, str]] = [
+            (nombre, spec, alcance(spec)) for nombre, spec in reglas
+        ]
+        # Los resultados memoizados se conservan entre llamadas a validar
+        self.memoizadas: Dict[int, EspecificacionMemoizada] = {}
+        for _, spec, regla_alcance in self.reglas:
+            if regla_alcance != ALCANCE_SUCURSAL:
+                self._memoizar_hojas(spec)
+
+    def _memoizar_hojas(self, spec: Specification):
+        hijos = _hijos(spec)
+        if hijos:
+            for hijo in hijos:
+                self._memoizar_hojas(hijo)
+        elif getattr(spec, "depende_de", None) and not any(clase in _EVALUADORES for clase in type(spec).__mro__):
+            self.memoizadas[id(spec)] = EspecificacionMemoizada(spec)
+
+    def validar(self, colaboradores: Iterable, sucursales: Optional[Iterable] = None) -> ReporteValidacion:
+        """
+        Valida la semana de todos los colaboradores en una sola pasada.
+
+        Args:
+            colaboradores (Iterable[Colaborador]): Colaboradores con sus horarios asignados.
+            sucursales (Optional[Iterable[Sucursal]]): Sucursales involucradas. Si se indican,
+                se evalúan sus reglas y se verifica que cada bloque asignado quede dentro
+                del horario de atención de su sucursal ese día.
+
+        Returns:
+            ReporteValidacion: Violaciones encontradas.
+        """
+        reporte = ReporteValidacion()
+        sucursales = list(sucursales or [])
+        ventanas = {sucursal.id: _ventanas_sucursal(sucursal) for sucursal in sucursales}
+
+        for sucursal in sucursales:
+            reporte.sucursales_evaluadas += 1
+            for nombre, spec, regla_alcance in self.reglas:
+                if regla_alcance == ALCANCE_SUCURSAL and not evaluar_sucursal(spec, sucursal):
+                    reporte.violaciones.append(Violacion(
+                        nombre, sucursal_id=sucursal.id,
+                        detalle=f"La sucursal {sucursal.id} no cumple la regla {nombre}."
+                    ))
+
+        for colaborador in colaboradores:
+            resumen = ResumenColaborador(colaborador, self.memoizadas)
+            colaborador_id = getattr(colaborador, "id", None)
+            reporte.colaboradores_evaluados += 1
+            reporte.horarios_evaluados += len(resumen.horarios)
+
+            for nombre, spec, regla_alcance in self.reglas:
+                if regla_alcance == ALCANCE_COLABORADOR and not evaluar(spec, resumen):
+                    reporte.violaciones.append(Violacion(
+                        nombre, colaborador_id=colaborador_id,
+                        detalle=f"El colaborador {colaborador_id} no cumple la regla {nombre}."
+                    ))
+                elif regla_alcance == ALCANCE_HORARIO:
+                    for indice, horario in enumerate(resumen.horarios):
+                        if not evaluar(spec, resumen, indice):
+                            reporte.violaciones.append(Violacion(
+                                nombre, colaborador_id, getattr(horario, "sucursal_id", None), horario.fecha,
+                                f"El horario del {horario.fecha} no cumple la regla {nombre}."
+                            ))
+
+            if ventanas:
+                reporte.violaciones.extend(self._fuera_de_atencion(resumen, colaborador_id, ventanas))
+
+        return reporte
+
+    def _fuera_de_atencion(
+        self,
+        resumen: ResumenColaborador,
+        colaborador_id: Optional[int],
+        ventanas: Dict[int, Dict[int, List[Tuple[int, int]]]]
+    ) -> List[Violacion]:
+        violaciones = []
+        for indice, horario in enumerate(resumen.horarios):
+            sucursal_id = getattr(horario, "sucursal_id", None)
+            if sucursal_id not in ventanas:
+                continue
+            ventanas_dia = ventanas[sucursal_id].get(horario.dia_id)
+            if not ventanas_dia:
+                violaciones.append(Violacion(
+                    REGLA_HORARIO_ATENCION, colaborador_id, sucursal_id, horario.fecha,
+                    f"La sucursal {sucursal_id} no atiende el día {horario.dia_id}."
+                ))
+                continue
+            for inicio, fin in bloques_en_minutos(horario):
+                if not any(apertura <= inicio and fin <= cierre for apertura, cierre in ventanas_dia):
+                    violaciones.append(Violacion(
+                        REGLA_HORARIO_ATENCION, colaborador_id, sucursal_id, horario.fecha,
+                        f"El bloque {inicio // 60:02d}:{inicio % 60:02d}-{fin // 60:02d}:{fin % 60:02d} "
+                        f"está fuera del horario de atención de la sucursal {sucursal_id}."
+                    ))
+        return violaciones
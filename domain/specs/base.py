@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 
 class Specification(ABC):
     """
     Clase base para representar una regla o criterio.
     Debe implementar el método is_satisfied_by.
+
+    `costo_estimado` es el costo relativo de evaluarla (1 = una comparación o regex
+    sobre un atributo); el compilador de especificaciones lo usa para ordenar las
+    reglas antes de tener mediciones.
+
+    `depende_de` enumera las entradas que determinan el resultado ("horario" para el
+    horario evaluado, "horario_asignado" o el nombre de un atributo del colaborador);
+    solo las especificaciones que lo declaran pueden memoizarse.
     """
+    costo_estimado: float = 1.0
+    depende_de: Optional[Tuple[str, ...]] = None
+
     @abstractmethod
     def is_satisfied_by(self, candidate) -> bool:
         """
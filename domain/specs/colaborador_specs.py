@@ -1,7 +1,10 @@
 from abc import abstractmethod
 import re
 from typing import List
+
+from domain.models.calendario import calendario_de
 from domain.models.colaborador import Colaborador, TIEMPO_COMPLETO, TIEMPO_PARCIAL, HORARIO_ESPECIAL
+from domain.services.superposiciones import hay_superposiciones
 
 from .base import Specification
 
@@ -62,28 +65,33 @@ class RolesSpecification(ColaboradorSpecification):
         )
 
 class HorarioAsignadoSpecification(ColaboradorSpecification):
+    costo_estimado = 50.0  # Recorre la semana completa y busca superposiciones
+    depende_de = ("horario_asignado", "horas_semanales", "horas_diarias_maximas")
+
     def is_satisfied_by(self, colaborador: Colaborador) -> bool:
         # Verificar total de horas semanales
         total_horas = colaborador.calcular_horas_totales_semanales()
         if total_horas != colaborador.horas_semanales:
             return False
 
+        # Colaborador.agregar_horario guarda tuplas (sucursal_id, Horario)
+        horarios = [
+            horario[1] if isinstance(horario, tuple) else horario
+            for horario in colaborador.horario_asignado
+        ]
+
         # Verificar horas diarias máximas
-        for horario in colaborador.horario_asignado:
+        for horario in horarios:
             horas_dia = horario.duracion() / 60
             if horas_dia > colaborador.horas_diarias_maximas:
                 return False
 
-        # Verificar superposición de horarios
-        horarios = colaborador.horario_asignado
-        for i in range(len(horarios)):
-            for j in range(i + 1, len(horarios)):
-                if horarios[i].se_superpone(horarios[j]):
-                    return False
-
-        return True
+        # Verificar superposición de horarios (barrido por fecha en lugar de comparar todos los pares)
+        return not hay_superposiciones(horarios)
 
 class DiasPreferidosSpecification(ColaboradorSpecification):
+    costo_estimado = 2.0
+
     def is_satisfied_by(self, colaborador: Colaborador) -> bool:
         if not isinstance(colaborador.dias_preferidos, list):
             return False
@@ -93,9 +101,8 @@ class DiasPreferidosSpecification(ColaboradorSpecification):
         return len(colaborador.dias_preferidos) < 7
 
 class VacacionesSpecification(ColaboradorSpecification):
+    costo_estimado = 2.0  # AND de los bitmaps anuales de vacaciones y días trabajados
+    depende_de = ("horario_asignado", "vacaciones")
+
     def is_satisfied_by(self, colaborador: Colaborador) -> bool:
-        for vacacion in colaborador.vacaciones:
-            for horario in colaborador.horario_asignado:
-                if vacacion == horario.fecha:
-                    return False
-        return True
\ No newline at end of file
+        return not calendario_de(colaborador).hay_conflicto()
@@ -0,0 +1,211 @@
+"""
+Compilador de árboles de especificaciones.
+
+`AndSpecification`/`OrSpecification` son binarias: `a & b & c & d` es una cadena de
+llamadas anidadas que se evalúan siempre en el orden en que se construyeron, aunque
+la primera regla recorra la semana completa y la última sea un regex. `compilar`
+aplana el árbol en nodos n-arios (AND de AND y OR de OR se fusionan, la doble
+negación desaparece) y evalúa los hijos de cada nodo con un bucle que corta en el
+primer resultado decisivo.
+
+Los hijos se ordenan por costo esperado hasta cortar: en un AND primero la regla con
+menor costo / probabilidad de rechazo, en un OR la de menor costo / probabilidad de
+aceptación. Al principio se usa `Specification.costo_estimado`; cada nodo mide sus
+evaluaciones, aciertos y tiempo, y cada `reordenar_cada` evaluaciones los hijos se
+reordenan con lo medido. Reordenar solo es correcto si las especificaciones no
+tienen efectos secundarios, como todas las del dominio.
+"""
+
+from time import perf_counter
+from typing import List, Optional
+
+from .base import Specification
+from .base_conjunctions import AndSpecification, NotSpecification, OrSpecification
+
+HOJA = "HOJA"
+AND = "AND"
+OR = "OR"
+NOT = "NOT"
+
+# Segundos que representa una unidad de `costo_estimado` (una regex sobre un atributo)
+SEGUNDOS_POR_UNIDAD = 1e-6
+# Evaluaciones mínimas de un nodo antes de confiar en su costo medido
+MUESTRAS_MINIMAS = 16
+REORDENAR_CADA = 256
+
+
+class NodoCompilado:
+    __slots__ = ("tipo", "spec", "hijos", "evaluaciones", "aciertos", "segundos")
+
+    def __init__(self, tipo: str, spec: Optional[Specification] = None, hijos: Optional[List["NodoCompilado"]] = None):
+        """
+        Nodo del árbol compilado con sus contadores.
+
+        Args:
+            tipo (str): HOJA, AND, OR o NOT.
+            spec (Optional[Specification]): Especificación evaluada por una hoja.
+            hijos (Optional[List[NodoCompilado]]): Hijos de un nodo AND, OR o NOT.
+        """
+        self.tipo = tipo
+        self.spec = spec
+        self.hijos = hijos or []
+        self.evaluaciones = 0
+        self.aciertos = 0
+        self.segundos = 0.0
+
+    @property
+    def nombre(self) -> str:
+        return type(self.spec).__name__ if self.tipo == HOJA else self.tipo
+
+    def costo_previo(self) -> float:
+        """Costo estimado en unidades, antes de medir."""
+        if self.tipo == HOJA:
+            return getattr(self.spec, "costo_estimado", 1.0)
+        if self.tipo == NOT:
+            return self.hijos[0].costo_previo()
+        # Cota pesimista: se evalúan todos los hijos
+        return sum(hijo.costo_previo() for hijo in self.hijos)
+
+    def costo_medio(self) -> float:
+        """Segundos por evaluación: medido si hay muestras suficientes, estimado si no."""
+        if self.evaluaciones >= MUESTRAS_MINIMAS:
+            return self.segundos / self.evaluaciones
+        return self.costo_previo() * SEGUNDOS_POR_UNIDAD
+
+    def probabilidad_verdadero(self) -> float:
+        # Suavizado de Laplace: sin datos se asume 1/2
+        return (self.aciertos + 1) / (self.evaluaciones + 2)
+
+    def evaluar(self, args: tuple) -> bool:
+        inicio = perf_counter()
+        tipo = self.tipo
+        if tipo == HOJA:
+            resultado = bool(self.spec.is_satisfied_by(*args))
+        elif tipo == AND:
+            resultado = True
+            for hijo in self.hijos:
+                if not hijo.evaluar(args):
+                    resultado = False
+                    break
+        elif tipo == OR:
+            resultado = False
+            for hijo in self.hijos:
+                if hijo.evaluar(args):
+                    resultado = True
+                    break
+        else:
+            resultado = not self.hijos[0].evaluar(args)
+        self.segundos += perf_counter() - inicio
+        self.evaluaciones += 1
+        if resultado:
+            self.aciertos += 1
+        return resultado
+
+    def reordenar(self):
+        """Ordena los hijos por costo esperado hasta cortar, recursivamente."""
+        for hijo in self.hijos:
+            hijo.reordenar()
+        if self.tipo == AND:
+            # Costo / probabilidad de rechazo: primero lo barato que más rechaza
+            self.hijos.sort(key=lambda hijo: hijo.costo_medio() / (1.0 - hijo.probabilidad_verdadero()))
+        elif self.tipo == OR:
+            self.hijos.sort(key=lambda hijo: hijo.costo_medio() / hijo.probabilidad_verdadero())
+
+    def reiniciar(self):
+        self.evaluaciones = self.aciertos = 0
+        self.segundos = 0.0
+        for hijo in self.hijos:
+            hijo.reiniciar()
+
+
+def _aplanar(spec: Specification) -> NodoCompilado:
+    if isinstance(spec, NotSpecification):
+        hijo = _aplanar(spec.spec)
+        if hijo.tipo == NOT:
+            return hijo.hijos[0]  # not not x == x
+        return NodoCompilado(NOT, hijos=[hijo])
+
+    if isinstance(spec, (AndSpecification, OrSpecification)):
+        tipo = AND if isinstance(spec, AndSpecification) else OR
+        hijos: List[NodoCompilado] = []
+        for parte in (spec.spec1, spec.spec2):
+            nodo = _aplanar(parte)
+            # (a & b) & c se convierte en un único AND de tres hijos
+            hijos.extend(nodo.hijos if nodo.tipo == tipo else [nodo])
+        return NodoCompilado(tipo, hijos=hijos)
+
+    return NodoCompilado(HOJA, spec=spec)
+
+
+class EspecificacionCompilada(Specification):
+    def __init__(self, spec: Specification, reordenar_cada: Optional[int] = REORDENAR_CADA):
+        """
+        Especificación equivalente a `spec`, aplanada y con orden adaptativo.
+
+        Args:
+            spec (Specification): Árbol de especificaciones a compilar.
+            reordenar_cada (Optional[int]): Cada cuántas evaluaciones se reordenan los
+                hijos con los costos medidos. None mantiene el orden inicial por
+                `costo_estimado`.
+        """
+        self.original = spec
+        self.raiz = _aplanar(spec)
+        self.reordenar_cada = reordenar_cada
+        self.raiz.reordenar()
+
+    def is_satisfied_by(self, *args) -> bool:
+        """Evalúa el árbol con los mismos argumentos que la especificación original."""
+        raiz = self.raiz
+        resultado = raiz.evaluar(args)
+        if self.reordenar_cada and raiz.evaluaciones % self.reordenar_cada == 0:
+            raiz.reordenar()
+        return resultado
+
+    def estadisticas(self) -> List[dict]:
+        """
+        Contadores por nodo en el orden de evaluación actual, para ajustar
+        `costo_estimado` o el armado de las reglas.
+
+        Returns:
+            List[dict]: Un diccionario por nodo con su ruta en el árbol compilado
+                ("0.2.1"), nombre, evaluaciones, aciertos, tasa de rechazo y tiempos.
+        """
+        filas: List[dict] = []
+
+        def recorrer(nodo: NodoCompilado, ruta: str):
+            filas.append({
+                "ruta": ruta,
+                "nodo": nodo.nombre,
+                "evaluaciones": nodo.evaluaciones,
+                "aciertos": nodo.aciertos,
+                "tasa_rechazo": round(1 - nodo.aciertos / nodo.evaluaciones, 4) if nodo.evaluaciones else None,
+                "segundos": round(nodo.segundos, 6),
+                "microsegundos_por_evaluacion": (
+                    round(nodo.segundos / nodo.evaluaciones * 1e6, 3) if nodo.evaluaciones else None
+                ),
+            })
+            for posicion, hijo in enumerate(nodo.hijos):
+                recorrer(hijo, f"{ruta}.{posicion}")
+
+        recorrer(self.raiz, "0")
+        return filas
+
+    def reiniciar_estadisticas(self):
+        self.raiz.reiniciar()
+
+
+def compilar(spec: Specification, reordenar_cada: Optional[int] = REORDENAR_CADA) -> EspecificacionCompilada:
+    """
+    Compila un árbol And/Or/Not en un único evaluador con cortocircuito y orden por
+    costo y selectividad.
+
+    Args:
+        spec (Specification): Especificación simple o compuesta.
+        reordenar_cada (Optional[int]): Ver `EspecificacionCompilada`.
+
+    Returns:
+        EspecificacionCompilada: Evaluador equivalente, usable donde se usaba `spec`.
+    """
+    if isinstance(spec, EspecificacionCompilada):
+        return spec
+    return EspecificacionCompilada(spec, reordenar_cada)
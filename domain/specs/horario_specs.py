@@ -1,12 +1,21 @@
 # domain/specifications/horario_specifications.py
 
 from abc import abstractmethod
+from collections import Counter
 from typing import List
+from domain.models.calendario import calendario_de
 from domain.models.horario import Horario
 from domain.models.colaborador import Colaborador, TIEMPO_COMPLETO, TIEMPO_PARCIAL, HORARIO_ESPECIAL
 
 from .base import Specification
 
+# Días de cada duración (en horas) que exige HorariosPorDefectoSpecification
+CONFIGURACIONES_POR_DEFECTO = {
+    TIEMPO_COMPLETO: {7: 3, 8: 3},   # 3 días de 7hs y 3 días de 8hs
+    TIEMPO_PARCIAL: {5: 6},          # 6 días de 5hs
+    HORARIO_ESPECIAL: {11: 2},       # 2 días de 11hs
+}
+
 class HorarioSpecification(Specification):
     @abstractmethod
     def is_satisfied_by(self, horario: Horario, colaborador: Colaborador) -> bool:
@@ -36,6 +45,8 @@ class HorarioSpecification(Specification):
 
 
 class HorarioValidoSpecification(HorarioSpecification):
+    depende_de = ("horario", "horas_diarias_maximas")
+
     def is_satisfied_by(self, horario: Horario, colaborador: Colaborador) -> bool:
         """
         Verifica que la duración del horario no exceda las horas diarias máximas permitidas para el colaborador.
@@ -53,6 +64,8 @@ class HorarioValidoSpecification(HorarioSpecification):
 
 
 class HorarioRespetaHorasSemanales(HorarioSpecification):
+    depende_de = ("horario_asignado", "horas_semanales")
+
     def is_satisfied_by(self, horario: Horario, colaborador: Colaborador) -> bool:
         """
         Verifica que el total de horas semanales del colaborador no exceda las horas semanales permitidas.
@@ -69,6 +82,9 @@ class HorarioRespetaHorasSemanales(HorarioSpecification):
 
 
 class DiaLibreSpecification(HorarioSpecification):
+    costo_estimado = 2.0  # Siete AND contra las máscaras de cada día de la semana
+    depende_de = ("horario_asignado", "tipo_empleado")
+
     def is_satisfied_by(self, horario: Horario, colaborador: Colaborador) -> bool:
         """
         Verifica que los empleados de TIEMPO_COMPLETO y TIEMPO_PARCIAL tengan al menos un día libre por semana.
@@ -85,12 +101,15 @@ class DiaLibreSpecification(HorarioSpecification):
             return True  # No aplica para otros tipos
 
         # Obtener los días trabajados (0=Monday, 6=Sunday)
-        dias_trabajados = set(horario.fecha.weekday() for horario in colaborador.horario_asignado)
+        dias_trabajados = calendario_de(colaborador).dias_semana_trabajados()
         # Verificar que no se trabajen los 7 días
         return len(dias_trabajados) < 7  # Al menos un día libre
 
 
 class HorariosPorDefectoSpecification(HorarioSpecification):
+    costo_estimado = 20.0  # Recorre los horarios de la semana varias veces
+    depende_de = ("horario_asignado", "tipo_empleado")
+
     def is_satisfied_by(self, horario: Horario, colaborador: Colaborador) -> bool:
         """
         Verifica que los horarios asignados coincidan con las configuraciones por defecto del tipo de empleado.
@@ -102,28 +121,17 @@ class HorariosPorDefectoSpecification(HorarioSpecification):
         Returns:
             bool: True si se cumple la especificación, False en caso contrario.
         """
-        tipo = colaborador.tipo_empleado
-
-        if tipo == TIEMPO_COMPLETO:
-            # Espera 3 días de 7hs y 3 días de 8hs
-            conteo_7 = sum(1 for h in colaborador.horario_asignado if h.duracion() / 60 == 7)
-            conteo_8 = sum(1 for h in colaborador.horario_asignado if h.duracion() / 60 == 8)
-            return conteo_7 == 3 and conteo_8 == 3
-
-        elif tipo == TIEMPO_PARCIAL:
-            # Espera 6 días de 5hs
-            conteo_5 = sum(1 for h in colaborador.horario_asignado if h.duracion() / 60 == 5)
-            return conteo_5 == 6
+        configuracion = CONFIGURACIONES_POR_DEFECTO.get(colaborador.tipo_empleado)
+        if configuracion is None:
+            return False
 
-        elif tipo == HORARIO_ESPECIAL:
-            # Espera 2 días de 11hs
-            conteo_11 = sum(1 for h in colaborador.horario_asignado if h.duracion() / 60 == 11)
-            return conteo_11 == 2
-
-        return False
+        conteo = Counter(h.duracion() / 60 for h in colaborador.horario_asignado)
+        return all(conteo[horas] == dias for horas, dias in configuracion.items())
 
 
 class HorarioCortadoSpecification(HorarioSpecification):
+    depende_de = ("horario", "horario_corrido")
+
     def is_satisfied_by(self, horario: Horario, colaborador: Colaborador) -> bool:
         """
         Verifica las reglas específicas para horarios cortados:
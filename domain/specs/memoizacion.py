@@ -0,0 +1,118 @@
+"""
+Memoización de especificaciones por huella de sus entradas.
+
+Al editar horarios desde la interfaz se revalida al colaborador después de cada cambio
+de bloque, y casi todas las reglas vuelven a recorrer la semana completa aunque lo que
+miran no haya cambiado. Cada especificación declara en `depende_de` qué datos del
+colaborador (y si corresponde, del horario evaluado) determinan su resultado;
+`EspecificacionMemoizada` arma con ellos una huella y guarda el resultado en una LRU
+acotada. Los horarios asignados de un `Colaborador` se resumen con
+`Colaborador.huella_asignaciones`, que se conserva hasta el siguiente cambio (incluidos
+los bloques editados en un horario ya asignado), por lo que revalidar a un colaborador
+sin cambios cuesta una búsqueda en un diccionario. La clave guarda el conjunto de
+horarios y no su hash, para que dos asignaciones distintas nunca compartan resultado.
+`ValidadorServicio` memoiza así las reglas que no tienen un evaluador propio.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from domain.models.colaborador import huella_horario, huella_horarios
+
+from .base import Specification
+from .base_conjunctions import AndSpecification, NotSpecification, OrSpecification
+
+TAMANO_CACHE = 4096
+
+# Entradas que pueden declararse en `depende_de`
+HORARIO = "horario"
+HORARIO_ASIGNADO = "horario_asignado"
+TIPO_EMPLEADO = "tipo_empleado"
+
+
+def _huella_valor(valor) -> Hashable:
+    if isinstance(valor, (list, set)):
+        return tuple(valor) if isinstance(valor, list) else frozenset(valor)
+    return valor
+
+
+def huella_entrada(entrada: str, args: tuple) -> Hashable:
+    """
+    Huella de una de las entradas declaradas en `depende_de`.
+
+    Args:
+        entrada (str): HORARIO (el horario evaluado), HORARIO_ASIGNADO o el nombre de un
+            atributo del colaborador.
+        args (tuple): Argumentos de is_satisfied_by; el colaborador es el último.
+    """
+    colaborador = args[-1]
+    if entrada == HORARIO:
+        return huella_horario(args[0])
+    if entrada == HORARIO_ASIGNADO:
+        if hasattr(colaborador, "huella_asignaciones"):
+            return colaborador.huella_asignaciones()
+        return huella_horarios(colaborador.horario_asignado)
+    valor = getattr(colaborador, entrada, None)
+    if entrada == TIPO_EMPLEADO:
+        # Un TipoEmpleado se compara por identidad: el mismo tipo cargado en otra sesión
+        # es otro objeto, así que se usa su id
+        return getattr(valor, "id", valor)
+    return _huella_valor(valor)
+
+
+class EspecificacionMemoizada(Specification):
+    def __init__(self, spec: Specification, tamano: int = TAMANO_CACHE):
+        """
+        Envuelve una especificación y cachea sus resultados por huella de entradas.
+
+        Args:
+            spec (Specification): Especificación con `depende_de` declarado.
+            tamano (int): Cantidad máxima de resultados guardados.
+
+        Raises:
+            TypeError: Si la especificación no declara de qué depende.
+        """
+        depende_de: Optional[Tuple[str, ...]] = getattr(spec, "depende_de", None)
+        if not depende_de:
+            raise TypeError(f"{type(spec).__name__} no declara `depende_de` y no puede memoizarse.")
+        self.spec = spec
+        self.depende_de = depende_de
+        self.tamano = tamano
+        self.costo_estimado = getattr(spec, "costo_estimado", 1.0)
+        self.aciertos = 0
+        self.fallos = 0
+        self._resultados: "OrderedDict[Hashable, bool]" = OrderedDict()
+
+    def is_satisfied_by(self, *args) -> bool:
+        clave = tuple([huella_entrada(entrada, args) for entrada in self.depende_de])
+        resultados = self._resultados
+        resultado = resultados.get(clave)
+        if resultado is not None:
+            self.aciertos += 1
+            resultados.move_to_end(clave)
+            return resultado
+
+        self.fallos += 1
+        resultado = bool(self.spec.is_satisfied_by(*args))
+        resultados[clave] = resultado
+        if len(resultados) > self.tamano:
+            resultados.popitem(last=False)
+        return resultado
+
+    def limpiar(self):
+        self._resultados.clear()
+        self.aciertos = self.fallos = 0
+
+
+def memoizar(spec: Specification, tamano: int = TAMANO_CACHE) -> Specification:
+    """
+    Memoiza las especificaciones que declaran `depende_de`. En un árbol And/Or/Not se
+    memoiza cada hoja por separado; las que no declaran dependencias quedan igual.
+    """
+    if isinstance(spec, (AndSpecification, OrSpecification)):
+        return type(spec)(memoizar(spec.spec1, tamano), memoizar(spec.spec2, tamano))
+    if isinstance(spec, NotSpecification):
+        return NotSpecification(memoizar(spec.spec, tamano))
+    if isinstance(spec, EspecificacionMemoizada) or not getattr(spec, "depende_de", None):
+        return spec
+    return EspecificacionMemoizada(spec, tamano)
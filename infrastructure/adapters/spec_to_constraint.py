@@ -0,0 +1,210 @@
+"""
+Adaptador que compila especificaciones del dominio en restricciones de CP-SAT.
+
+Cada especificación se compila, para un colaborador, en un literal booleano
+equivalente a "la semana del colaborador cumple la especificación". Así las
+conjunciones And/Or/Not se combinan como literales y las reglas se aplican durante
+la búsqueda en lugar de verificarse sobre horarios ya generados.
+
+Las especificaciones que evalúan un único horario (HorarioValido, HorarioCortado) se
+evalúan sobre cada turno candidato: los turnos que no las cumplen quedan prohibidos
+cuando el literal es verdadero, por lo que el presolve los descarta sin enumerarlos.
+Los turnos que cruzan la medianoche no se pueden representar como Horario del dominio
+y esas reglas no los restringen; su duración ya la acota la generación de candidatos.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Type
+
+from ortools.sat.python import cp_model
+
+from domain.models.colaborador import TIEMPO_COMPLETO, TIEMPO_PARCIAL
+from domain.models.horario import Horario
+from domain.specs.base import Specification
+from domain.specs.base_conjunctions import AndSpecification, OrSpecification, NotSpecification
+from domain.specs.horario_specs import (
+    HorarioValidoSpecification,
+    HorarioRespetaHorasSemanales,
+    DiaLibreSpecification,
+    HorariosPorDefectoSpecification,
+    CONFIGURACIONES_POR_DEFECTO,
+    HorarioCortadoSpecification,
+)
+from infrastructure.solvers.solver import (
+    MINUTOS_DIA,
+    ColaboradorDisponible,
+    GeneradorHorarios,
+    TurnoCandidato,
+    fecha_de_dia,
+)
+
+Compilador = Callable[[Specification, GeneradorHorarios, ColaboradorDisponible], cp_model.IntVar]
+
+_COMPILADORES: Dict[Type[Specification], Compilador] = {}
+
+
+def registrar_compilador(*clases: Type[Specification]):
+    """
+    Registra la función decorada como compiladora de las clases de especificación indicadas.
+    """
+    def decorador(funcion: Compilador) -> Compilador:
+        for clase in clases:
+            _COMPILADORES[clase] = funcion
+        return funcion
+    return decorador
+
+
+def compilar(spec: Specification, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    """
+    Compila una especificación para un colaborador y devuelve el literal que la representa.
+
+    Raises:
+        TypeError: Si no hay un compilador registrado para la especificación.
+    """
+    for clase in type(spec).__mro__:
+        if clase in _COMPILADORES:
+            return _COMPILADORES[clase](spec, generador, colaborador)
+    raise TypeError(f"No hay un compilador CP-SAT para {type(spec).__name__}.")
+
+
+def aplicar_especificacion(
+    spec: Specification,
+    generador: GeneradorHorarios,
+    colaboradores: Optional[Iterable[ColaboradorDisponible]] = None
+) -> None:
+    """
+    Obliga a que la semana de cada colaborador cumpla la especificación.
+    """
+    for colaborador in colaboradores if colaboradores is not None else generador.colaboradores.values():
+        generador.modelo.AddBoolOr([compilar(spec, generador, colaborador)])
+
+
+# ✅ LITERALES AUXILIARES
+
+def _constante(generador: GeneradorHorarios, valor: bool):
+    literal = generador.modelo.NewBoolVar("")
+    generador.modelo.Add(literal == int(valor))
+    return literal
+
+
+def _reificar_rango(generador: GeneradorHorarios, expresion, minimo: int, maximo: int):
+    """
+    Devuelve un literal equivalente a minimo <= expresion <= maximo.
+    """
+    modelo = generador.modelo
+    literal = modelo.NewBoolVar("")
+    modelo.AddLinearConstraint(expresion, minimo, maximo).OnlyEnforceIf(literal)
+    modelo.AddLinearExpressionInDomain(
+        expresion, cp_model.Domain(minimo, maximo).complement()
+    ).OnlyEnforceIf(literal.Not())
+    return literal
+
+
+def _conjuncion(generador: GeneradorHorarios, literales: List):
+    modelo = generador.modelo
+    literal = modelo.NewBoolVar("")
+    modelo.AddBoolAnd(literales).OnlyEnforceIf(literal)
+    modelo.AddBoolOr([l.Not() for l in literales]).OnlyEnforceIf(literal.Not())
+    return literal
+
+
+def _disyuncion(generador: GeneradorHorarios, literales: List):
+    modelo = generador.modelo
+    literal = modelo.NewBoolVar("")
+    modelo.AddBoolOr(literales).OnlyEnforceIf(literal)
+    modelo.AddBoolAnd([l.Not() for l in literales]).OnlyEnforceIf(literal.Not())
+    return literal
+
+
+def _horario_de_turno(
+    generador: GeneradorHorarios,
+    colaborador: ColaboradorDisponible,
+    sucursal_id: int,
+    dia_id: int,
+    turno: TurnoCandidato
+) -> Optional[Horario]:
+    try:
+        return Horario.desde_minutos(
+            sucursal_id=sucursal_id,
+            colaborador_id=colaborador.id,
+            dia_id=dia_id,
+            fecha=fecha_de_dia(generador.semana_inicio, dia_id),
+            bloques=[(inicio % MINUTOS_DIA, fin % MINUTOS_DIA) for inicio, fin in turno.bloques],
+            horario_corrido=len(turno.bloques) == 1,
+        )
+    except ValueError:
+        # Turnos que cruzan la medianoche no son representables como Horario del dominio
+        return None
+
+
+# ✅ CONJUNCIONES
+
+@registrar_compilador(AndSpecification)
+def _compilar_and(spec: AndSpecification, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    return _conjuncion(generador, [
+        compilar(spec.spec1, generador, colaborador),
+        compilar(spec.spec2, generador, colaborador),
+    ])
+
+
+@registrar_compilador(OrSpecification)
+def _compilar_or(spec: OrSpecification, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    return _disyuncion(generador, [
+        compilar(spec.spec1, generador, colaborador),
+        compilar(spec.spec2, generador, colaborador),
+    ])
+
+
+@registrar_compilador(NotSpecification)
+def _compilar_not(spec: NotSpecification, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    return compilar(spec.spec, generador, colaborador).Not()
+
+
+# ✅ ESPECIFICACIONES DE HORARIO
+
+@registrar_compilador(HorarioValidoSpecification, HorarioCortadoSpecification)
+def _compilar_por_turno(spec, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    """
+    Especificaciones sobre un único horario: se cumplen si ningún turno asignado las viola.
+    Los turnos que cruzan la medianoche no las violan.
+    """
+    violan = []
+    for dia_id in range(1, 8):
+        for variable, sucursal_id, _, turno in generador.turnos_por_dia.get((colaborador.id, dia_id), []):
+            horario = _horario_de_turno(generador, colaborador, sucursal_id, dia_id, turno)
+            if horario is not None and not spec.is_satisfied_by(horario, colaborador):
+                violan.append(variable)
+    if not violan:
+        return _constante(generador, True)
+    return _reificar_rango(generador, cp_model.LinearExpr.Sum(violan), 0, 0)
+
+
+@registrar_compilador(HorarioRespetaHorasSemanales)
+def _compilar_horas_semanales(spec, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    minutos = colaborador.horas_semanales * 60
+    return _reificar_rango(generador, generador.minutos_semana[colaborador.id], minutos, minutos)
+
+
+@registrar_compilador(DiaLibreSpecification)
+def _compilar_dia_libre(spec, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    if colaborador.tipo_empleado not in {TIEMPO_COMPLETO, TIEMPO_PARCIAL}:
+        return _constante(generador, True)
+    dias = [generador.trabaja[(colaborador.id, dia_id)] for dia_id in range(1, 8)]
+    return _reificar_rango(generador, cp_model.LinearExpr.Sum(dias), 0, 6)
+
+
+@registrar_compilador(HorariosPorDefectoSpecification)
+def _compilar_por_defecto(spec, generador: GeneradorHorarios, colaborador: ColaboradorDisponible):
+    configuracion = CONFIGURACIONES_POR_DEFECTO.get(colaborador.tipo_empleado)
+    if configuracion is None:
+        return _constante(generador, False)
+
+    literales = []
+    for horas, dias_requeridos in configuracion.items():
+        turnos = [
+            variable
+            for dia_id in range(1, 8)
+            for variable, _, _, turno in generador.turnos_por_dia.get((colaborador.id, dia_id), [])
+            if turno.duracion == horas * 60
+        ]
+        literales.append(_reificar_rango(generador, cp_model.LinearExpr.Sum(turnos), dias_requeridos, dias_requeridos))
+    return _conjuncion(generador, literales)
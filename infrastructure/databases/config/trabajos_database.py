@@ -0,0 +1,81 @@
+import os
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker, declarative_base
+from application.config.logger_config import setup_logger
+
+# Crea el logger para este módulo
+logger = setup_logger(__name__, "logs/db_config.log")
+ENV_FILE = ".env"
+load_dotenv(ENV_FILE)
+
+# Base propia: las tablas de trabajos viven en un SQLite local y no en las bases MySQL
+BaseTrabajos = declarative_base()
+
+
+class TrabajosDBConfig:
+    engine = None
+    session_factory = None
+
+    @staticmethod
+    def configurar(url: str = None):
+        """
+        Crea el engine SQLite de la cola de trabajos y sus tablas.
+        Si no se indica `url` se usa TRABAJOS_DB_URL o `sqlite:///data/trabajos.db`.
+
+        Args:
+            url (str): URL de SQLAlchemy de la base de trabajos.
+
+        Returns:
+            sessionmaker: Fábrica de sesiones de la base de trabajos.
+        """
+        url = url or os.getenv("TRABAJOS_DB_URL", "sqlite:///data/trabajos.db")
+        if url.startswith("sqlite:///") and url != "sqlite:///:memory:":
+            directorio = os.path.dirname(url[len("sqlite:///"):])
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+
+        # Los trabajos se actualizan desde los hilos del pool, no solo desde el que creó la conexión
+        engine = create_engine(url, future=True, connect_args={"check_same_thread": False})
+
+        @event.listens_for(engine, "connect")
+        def _configurar_sqlite(conexion, _):
+            cursor = conexion.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA busy_timeout=5000")
+            cursor.close()
+
+        # Importa los modelos para registrarlos en BaseTrabajos antes de crear las tablas
+        from infrastructure.databases.models import trabajo_generacion  # noqa: F401
+        BaseTrabajos.metadata.create_all(engine)
+        TrabajosDBConfig._agregar_columnas_faltantes(engine)
+
+        TrabajosDBConfig.engine = engine
+        TrabajosDBConfig.session_factory = sessionmaker(bind=engine, future=True, expire_on_commit=False)
+        logger.info(f"Base de trabajos configurada en {url}.")
+        return TrabajosDBConfig.session_factory
+
+    @staticmethod
+    def _agregar_columnas_faltantes(engine):
+        """
+        create_all no modifica tablas existentes: agrega a una base creada por una versión
+        anterior las columnas nuevas, que siempre admiten NULL.
+        """
+        inspector = inspect(engine)
+        with engine.begin() as conexion:
+            for tabla in BaseTrabajos.metadata.sorted_tables:
+                existentes = {columna["name"] for columna in inspector.get_columns(tabla.name)}
+                for columna in tabla.columns:
+                    if columna.name not in existentes:
+                        tipo = columna.type.compile(engine.dialect)
+                        conexion.execute(text(f"ALTER TABLE {tabla.name} ADD COLUMN {columna.name} {tipo}"))
+                        logger.info(f"Columna {tabla.name}.{columna.name} agregada a la base de trabajos.")
+
+    @staticmethod
+    def get_session():
+        """
+        Devuelve una sesión nueva de la base de trabajos, configurándola si hace falta.
+        """
+        if TrabajosDBConfig.session_factory is None:
+            TrabajosDBConfig.configurar()
+        return TrabajosDBConfig.session_factory()
@@ -16,4 +16,4 @@ from .rol import Rol
 from .vacacion_colaborador import VacacionColaborador
 from .usuario import Usuario
 from .rol_usuario import RolUsuario
-
+from .venta_hora_resumen import VentaHoraResumen, VentaHoraCarga
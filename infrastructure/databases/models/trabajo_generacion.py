@@ -0,0 +1,42 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, JSON
+from infrastructure.databases.config.trabajos_database import BaseTrabajos
+
+# Estados de un trabajo de generación
+PENDIENTE = "pendiente"
+EN_EJECUCION = "en_ejecucion"
+COMPLETADO = "completado"
+ERROR = "error"
+
+
+class TrabajoGeneracion(BaseTrabajos):
+    __tablename__ = "trabajos_generacion"
+
+    id = Column(String(36), primary_key=True)
+    tipo = Column(String(20), nullable=False)  # "sucursal" o "empresa"
+    parametros = Column(JSON, nullable=False)
+    estado = Column(String(20), nullable=False, default=PENDIENTE, index=True)
+    objetivo = Column(Float, nullable=True)  # Mejor objetivo encontrado hasta el momento
+    cota = Column(Float, nullable=True)
+    soluciones = Column(Integer, nullable=False, default=0)
+    resultado = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    usuario_id = Column(Integer, nullable=True)
+    creado = Column(DateTime, nullable=False, default=datetime.now)
+    iniciado = Column(DateTime, nullable=True)
+    finalizado = Column(DateTime, nullable=True)
+    # Proceso que ejecuta el trabajo y hasta cuándo vale su reclamo; lo renueva mientras corre
+    propietario = Column(String(100), nullable=True)
+    vence_concesion = Column(DateTime, nullable=True)
+
+    @property
+    def segundos_transcurridos(self) -> float:
+        if self.iniciado is None:
+            return 0.0
+        return ((self.finalizado or datetime.now()) - self.iniciado).total_seconds()
+
+    def __repr__(self):
+        return (
+            f"<TrabajoGeneracion(id={self.id}, tipo={self.tipo}, estado={self.estado}, "
+            f"objetivo={self.objetivo})>"
+        )
@@ -0,0 +1,41 @@
+from sqlalchemy import Boolean, Column, Date, DateTime, Index, Integer, Numeric, String, UniqueConstraint
+from infrastructure.databases.config.database import Base
+
+class VentaHoraResumen(Base):
+    __tablename__ = "ventas_hora_resumen"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Número de sucursal en plex, el mismo que recibe /vta_hora
+    sucursal = Column(Integer, nullable=False)
+    fecha = Column(Date, nullable=False)
+    hora = Column(Integer, nullable=False)
+    categoria = Column(String(20), nullable=False)
+    cantidad = Column(Integer, nullable=False)
+    importe = Column(Numeric(14, 2), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("sucursal", "fecha", "hora", "categoria", name="uq_ventas_hora_resumen"),
+        Index("ix_ventas_hora_resumen_sucursal_fecha", "sucursal", "fecha"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<VentaHoraResumen(sucursal={self.sucursal}, fecha={self.fecha}, hora={self.hora}, "
+            f"categoria='{self.categoria}', cantidad={self.cantidad}, importe={self.importe})>"
+        )
+
+class VentaHoraCarga(Base):
+    __tablename__ = "ventas_hora_cargas"
+
+    # Un registro por día cargado; los días sin ventas también se registran
+    sucursal = Column(Integer, primary_key=True)
+    fecha = Column(Date, primary_key=True)
+    # False mientras el día está en curso: se vuelve a cargar en la siguiente consulta
+    completo = Column(Boolean, nullable=False, default=False)
+    actualizado = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<VentaHoraCarga(sucursal={self.sucursal}, fecha={self.fecha}, "
+            f"completo={self.completo}, actualizado={self.actualizado})>"
+        )
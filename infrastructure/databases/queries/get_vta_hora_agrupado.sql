@@ -0,0 +1,41 @@
+-- Cantidad e importe de comprobantes por sucursal, fecha, hora y categoría (PAMI / Obra Social / Particular).
+-- Mismo universo de comprobantes que get_vta_hora.sql; la categoría sale de la primera
+-- obra social del comprobante con el mismo criterio que Factura.determinar_categoria.
+SELECT
+    comprobantes.Sucursal,
+    comprobantes.Fecha,
+    comprobantes.Hora,
+    CASE
+        WHEN COALESCE(comprobantes.ObraSocial, '') = '' THEN 'Particular'
+        WHEN comprobantes.ObraSocial LIKE BINARY 'PAMI%' THEN 'PAMI'
+        ELSE 'Obra Social'
+    END AS Categoria,
+    COUNT(*) AS Cantidad,
+    SUM(comprobantes.Total) AS Importe
+
+FROM (
+    -- Un registro por comprobante, como el GROUP BY de get_vta_hora.sql
+    SELECT
+        fc.Sucursal,
+        fc.Emision AS Fecha,
+        HOUR(fc.Hora) AS Hora,
+        MIN(os.Descripcio) AS ObraSocial,
+        IF(fc.Tipo = 'NC', fc.TotalComprobante * -1, fc.TotalComprobante) AS Total
+    FROM factcabecera fc
+    INNER JOIN Operadores op ON fc.IDUsuario = op.IDOperador
+    LEFT JOIN factcoberturas fco ON fco.IDComprobante = fc.IDComprobante
+    LEFT JOIN obsociales os ON fco.IDObSoc = os.CodObSoc
+    WHERE
+        fc.Sucursal = :sucursal
+        AND fc.Emision BETWEEN :fecha_desde AND :fecha_hasta
+        AND fc.Tipo IN ('FV', 'TK', 'TF', 'NC', 'ND', 'TZ')
+        AND fc.TipoIVA <> 'XX'
+    GROUP BY
+        fc.Tipo, fc.PuntoVta, fc.Numero
+) comprobantes
+
+GROUP BY
+    comprobantes.Sucursal, comprobantes.Fecha, comprobantes.Hora, Categoria
+
+ORDER BY
+    comprobantes.Sucursal, comprobantes.Fecha, comprobantes.Hora;
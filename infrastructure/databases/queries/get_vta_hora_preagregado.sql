@@ -0,0 +1,104 @@
+-- Variante de get_vta_hora.sql sin subconsultas correlacionadas: pagos, líneas y
+-- coberturas se agregan una vez por IDComprobante en tablas derivadas, restringidas a
+-- los comprobantes del rango, y se unen a factcabecera una sola vez. Devuelve las
+-- mismas columnas y filas que get_vta_hora.sql.
+SELECT 
+    fc.Sucursal,
+    fc.Tipo AS Doc,
+    CONCAT(LPAD(CONVERT(fc.PuntoVta, CHAR), 4, '0'), '-', LPAD(CONVERT(fc.Numero, CHAR), 8, '0')) AS Documento,
+    fc.Emision AS Fecha,
+    fc.Hora AS Hora,
+    op.Codigo AS Usuario,
+    
+    -- Efectivo
+    SUM(COALESCE(IF(fc.Tipo = 'NC', pagos.Efectivo * -1, pagos.Efectivo), 0)) AS Efectivo,
+    
+    -- Cuenta Corriente
+    SUM(COALESCE(lineas.CtaCte, 0)) AS CtaCte,
+    
+    -- Obra Social
+    IF(fc.Tipo = 'NC', fc.TotalCobertura * -1, fc.TotalCobertura) AS 'OSocial',
+    coberturas.Descripcio AS 'Obra Social Detalle',
+    
+    -- Tarjetas
+    SUM(COALESCE(IF(fc.Tipo = 'NC', pagos.Tarjeta * -1, pagos.Tarjeta), 0)) AS 'Tarjeta',
+    
+    -- Otros Medios de Pago
+    SUM(COALESCE(IF(fc.Tipo = 'NC', pagos.OtrosMP * -1, pagos.OtrosMP), 0)) AS 'OtrosMP',
+    
+    -- Detalle de Tarjeta
+    pagos.TarjetaDetalle AS 'Tarjeta Detalle',
+    
+    -- Total Comprobante
+    IF(fc.Tipo = 'NC', fc.TotalComprobante * -1, fc.TotalComprobante) AS 'Total',
+    
+    -- Cliente
+    c.Nombre AS 'Apellido y nombre/Razón Social',
+    c.Documento AS 'DNI',
+    c.Cuit AS 'CUIT'
+
+FROM factcabecera fc
+LEFT JOIN clientes c ON fc.IDCliente = c.CodCliente
+INNER JOIN Operadores op ON fc.IDUsuario = op.IDOperador
+
+-- Pagos por comprobante y grupo de medio de pago (1 = efectivo, 3 y 5 = tarjetas)
+LEFT JOIN (
+    SELECT
+        fp.IDComprobante,
+        SUM(IF(fp.idmediodepago IN (1), fp.Importe, NULL)) AS Efectivo,
+        SUM(IF(fp.idmediodepago IN (3, 5), fp.Importe, NULL)) AS Tarjeta,
+        SUM(IF(fp.idmediodepago NOT IN (1, 3, 5), fp.Importe, NULL)) AS OtrosMP,
+        MIN(t.tarjeta) AS TarjetaDetalle
+    FROM factcabecera fcp
+    INNER JOIN factpagos fp ON fp.IDComprobante = fcp.IDComprobante
+    LEFT JOIN tarjetas t ON fp.IDTarjeta = t.IDTarjeta
+    WHERE
+        fcp.Sucursal = :sucursal
+        AND fcp.Emision BETWEEN :fecha_desde AND :fecha_hasta
+        AND fcp.Tipo IN ('FV', 'TK', 'TF', 'NC', 'ND', 'TZ')
+        AND fcp.TipoIVA <> 'XX'
+    GROUP BY fp.IDComprobante
+) pagos ON pagos.IDComprobante = fc.IDComprobante
+
+-- Cuenta corriente por comprobante
+LEFT JOIN (
+    SELECT
+        fl.IDComprobante,
+        SUM(fl.ImporteCtaCte) AS CtaCte
+    FROM factcabecera fcl
+    INNER JOIN factlineas fl ON fl.IDComprobante = fcl.IDComprobante
+    WHERE
+        fcl.Sucursal = :sucursal
+        AND fcl.Emision BETWEEN :fecha_desde AND :fecha_hasta
+        AND fcl.Tipo IN ('FV', 'TK', 'TF', 'NC', 'ND', 'TZ')
+        AND fcl.TipoIVA <> 'XX'
+    GROUP BY fl.IDComprobante
+) lineas ON lineas.IDComprobante = fc.IDComprobante
+
+-- Obra social por comprobante
+LEFT JOIN (
+    SELECT
+        fco.IDComprobante,
+        MIN(os.Descripcio) AS Descripcio
+    FROM factcabecera fcc
+    INNER JOIN factcoberturas fco ON fco.IDComprobante = fcc.IDComprobante
+    INNER JOIN obsociales os ON fco.IDObSoc = os.CodObSoc
+    WHERE
+        fcc.Sucursal = :sucursal
+        AND fcc.Emision BETWEEN :fecha_desde AND :fecha_hasta
+        AND fcc.Tipo IN ('FV', 'TK', 'TF', 'NC', 'ND', 'TZ')
+        AND fcc.TipoIVA <> 'XX'
+    GROUP BY fco.IDComprobante
+) coberturas ON coberturas.IDComprobante = fc.IDComprobante
+
+WHERE
+    fc.Sucursal = :sucursal
+    AND fc.Emision BETWEEN :fecha_desde AND :fecha_hasta
+    AND fc.Tipo IN ('FV', 'TK', 'TF', 'NC', 'ND', 'TZ')
+    AND fc.TipoIVA <> 'XX'
+
+GROUP BY 
+    fc.Tipo, fc.PuntoVta, fc.Numero
+
+ORDER BY 
+    fc.Emision, fc.Tipo, fc.PuntoVta, fc.Numero;
@@ -1,6 +1,6 @@
 from datetime import date
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, cast, String
 from infrastructure.databases.models.colaborador import Colaborador
 from infrastructure.databases.models.horario import Horario
@@ -14,6 +14,15 @@ class ColaboradorRepository:
     def get_by_id(colaborador_id: int, db: Session) -> Optional[Colaborador]:
         return db.query(Colaborador).filter_by(id=colaborador_id).first()
 
+    @staticmethod
+    def get_by_ids(colaborador_ids: List[int], db: Session) -> List[Colaborador]:
+        """
+        Obtiene varios colaboradores junto con su tipo de empleado.
+        """
+        return db.query(Colaborador) \
+            .options(joinedload(Colaborador.tipo_empleado)) \
+            .filter(Colaborador.id.in_(colaborador_ids)).all()
+
     @staticmethod
     def get_by_legajo(legajo: int, db: Session) -> Optional[Colaborador]:
         return db.query(Colaborador).filter_by(legajo=legajo).first()
@@ -26,6 +26,13 @@ class ColaboradorSucursalRepository:
         """
         return db.query(ColaboradorSucursal).filter_by(sucursal_id=sucursal_id).all()
 
+    @staticmethod
+    def get_by_sucursales(sucursal_ids: List[int], db: Session) -> List[ColaboradorSucursal]:
+        """
+        Devuelve las asociaciones 'ColaboradorSucursal' de varias sucursales en una sola consulta.
+        """
+        return db.query(ColaboradorSucursal).filter(ColaboradorSucursal.sucursal_id.in_(sucursal_ids)).all()
+
     @staticmethod
     def create(relacion: ColaboradorSucursal, db: Session) -> ColaboradorSucursal:
         """
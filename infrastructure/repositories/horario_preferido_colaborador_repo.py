@@ -27,6 +27,25 @@ class HorarioPreferidoColaboradorRepository:
         """
         return db.query(HorarioPreferidoColaborador).filter_by(dia_id=dia_id).all()
 
+    @staticmethod
+    def get_by_sucursal_colaboradores(sucursal_id: int, colaborador_ids: List[int], db: Session) -> List[HorarioPreferidoColaborador]:
+        """
+        Retorna los horarios preferidos de varios colaboradores en una sucursal.
+        """
+        return db.query(HorarioPreferidoColaborador).filter(
+            HorarioPreferidoColaborador.sucursal_id == sucursal_id,
+            HorarioPreferidoColaborador.colaborador_id.in_(colaborador_ids)
+        ).all()
+
+    @staticmethod
+    def get_by_sucursales(sucursal_ids: List[int], db: Session) -> List[HorarioPreferidoColaborador]:
+        """
+        Retorna los horarios preferidos de todos los colaboradores en varias sucursales.
+        """
+        return db.query(HorarioPreferidoColaborador).filter(
+            HorarioPreferidoColaborador.sucursal_id.in_(sucursal_ids)
+        ).all()
+
     @staticmethod
     def create(horario: HorarioPreferidoColaborador, db: Session) -> HorarioPreferidoColaborador:
         """
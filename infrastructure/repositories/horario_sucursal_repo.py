@@ -18,6 +18,13 @@ class HorarioSucursalRepository:
         """
         return db.query(HorarioSucursal).filter_by(sucursal_id=sucursal_id).all()
 
+    @staticmethod
+    def get_by_sucursales(sucursal_ids: List[int], db: Session) -> List[HorarioSucursal]:
+        """
+        Obtiene los horarios de atención de varias sucursales.
+        """
+        return db.query(HorarioSucursal).filter(HorarioSucursal.sucursal_id.in_(sucursal_ids)).all()
+
     @staticmethod
     def get_by_dia(dia_id: int, db: Session) -> List[HorarioSucursal]:
         """
@@ -11,6 +11,13 @@ class MinimoPuestosRequeridosRepository:
         """
         return db.query(MinimoPuestosRequeridos).filter_by(sucursal_id=sucursal_id).all()
 
+    @staticmethod
+    def get_by_sucursales(sucursal_ids: List[int], db: Session) -> List[MinimoPuestosRequeridos]:
+        """
+        Obtiene todos los registros de mínimos de puestos requeridos de varias sucursales.
+        """
+        return db.query(MinimoPuestosRequeridos).filter(MinimoPuestosRequeridos.sucursal_id.in_(sucursal_ids)).all()
+
     @staticmethod
     def get_by_rol(sucursal_id: int, rol_colaborador_id: int, db: Session) -> List[MinimoPuestosRequeridos]:
         """
@@ -1,7 +1,8 @@
-from typing import List, Optional
-from datetime import date
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from datetime import date, time
+from sqlalchemy.orm import Session, joinedload
 from infrastructure.databases.models.puestos import Puesto
+from infrastructure.databases.models.horario import Horario
 
 class PuestoRepository:
     @staticmethod
@@ -50,6 +51,79 @@ class PuestoRepository:
             Puesto.fecha <= fecha_hasta
         ).all()
 
+    @staticmethod
+    def get_by_sucursal_fechas(sucursal_id: int, fecha_desde: date, fecha_hasta: date, db: Session) -> List[Puesto]:
+        """
+        Obtiene los puestos de una sucursal dentro del rango de fechas.
+        """
+        return db.query(Puesto).filter(
+            Puesto.sucursal_id == sucursal_id,
+            Puesto.fecha >= fecha_desde,
+            Puesto.fecha <= fecha_hasta
+        ).all()
+
+    @staticmethod
+    def get_by_sucursales_fechas_con_horarios(
+        sucursal_ids: List[int], fecha_desde: date, fecha_hasta: date, db: Session
+    ) -> List[Puesto]:
+        """
+        Obtiene los puestos de varias sucursales dentro del rango de fechas, con sus horarios cargados.
+        """
+        return db.query(Puesto).options(joinedload(Puesto.horarios)).filter(
+            Puesto.sucursal_id.in_(sucursal_ids),
+            Puesto.fecha >= fecha_desde,
+            Puesto.fecha <= fecha_hasta
+        ).all()
+
+    @staticmethod
+    def get_bloques_asignados(
+        sucursal_ids: List[int], fecha_desde: date, fecha_hasta: date, db: Session
+    ) -> List[Tuple[int, int, date, time, time]]:
+        """
+        Obtiene los bloques horarios de los puestos con colaborador asignado de varias
+        sucursales dentro del rango de fechas, como tuplas
+        (sucursal_id, rol_colaborador_id, fecha, hora_inicio, hora_fin) sin instanciar los modelos.
+        """
+        return db.query(
+            Puesto.sucursal_id,
+            Puesto.rol_colaborador_id,
+            Puesto.fecha,
+            Horario.hora_inicio,
+            Horario.hora_fin
+        ).join(Horario, Horario.puesto_id == Puesto.id).filter(
+            Puesto.sucursal_id.in_(sucursal_ids),
+            Puesto.fecha >= fecha_desde,
+            Puesto.fecha <= fecha_hasta,
+            Puesto.colaborador_id.isnot(None)
+        ).all()
+
+    @staticmethod
+    def get_by_colaboradores_fechas_con_horarios(
+        colaborador_ids: List[int], fecha_desde: date, fecha_hasta: date, db: Session
+    ) -> List[Puesto]:
+        """
+        Obtiene los puestos de varios colaboradores dentro del rango de fechas, con sus horarios cargados.
+        """
+        return db.query(Puesto).options(joinedload(Puesto.horarios)).filter(
+            Puesto.colaborador_id.in_(colaborador_ids),
+            Puesto.fecha >= fecha_desde,
+            Puesto.fecha <= fecha_hasta
+        ).all()
+
+    @staticmethod
+    def get_fechas_trabajadas(
+        colaborador_ids: List[int], fecha_desde: date, fecha_hasta: date, db: Session
+    ) -> List[Tuple[int, date]]:
+        """
+        Obtiene las fechas con puestos asignados de varios colaboradores dentro del rango,
+        como tuplas distintas (colaborador_id, fecha) sin instanciar los modelos.
+        """
+        return db.query(Puesto.colaborador_id, Puesto.fecha).filter(
+            Puesto.colaborador_id.in_(colaborador_ids),
+            Puesto.fecha >= fecha_desde,
+            Puesto.fecha <= fecha_hasta
+        ).distinct().all()
+
     @staticmethod
     def create(puesto: Puesto, db: Session) -> Puesto:
         """
@@ -71,6 +145,25 @@ class PuestoRepository:
             db.refresh(puesto)
         return puestos
 
+    @staticmethod
+    def create_many_con_horarios(puestos_con_horarios: List[Tuple[Puesto, List[Horario]]], db: Session) -> List[Puesto]:
+        """
+        Crea varios puestos junto con sus horarios en una sola escritura masiva.
+        Se asume que el manejo del commit se hace externamente.
+        """
+        puestos = [puesto for puesto, _ in puestos_con_horarios]
+        db.add_all(puestos)
+        # flush() asigna los IDs de los puestos para enlazar los horarios
+        db.flush()
+        horarios = []
+        for puesto, horarios_puesto in puestos_con_horarios:
+            for horario in horarios_puesto:
+                horario.puesto_id = puesto.id
+                horarios.append(horario)
+        db.add_all(horarios)
+        db.flush()
+        return puestos
+
     @staticmethod
     def update(puesto: Puesto, db: Session) -> Puesto:
         """
@@ -116,3 +209,15 @@ class PuestoRepository:
         """
         db.query(Puesto).filter(Puesto.id.in_(puesto_ids)).delete(synchronize_session=False)
         db.commit()
+
+    @staticmethod
+    def delete_many_con_horarios(puesto_ids: List[int], db: Session) -> None:
+        """
+        Elimina varios puestos junto con sus horarios.
+        Se asume que el manejo del commit se hace externamente.
+        """
+        if not puesto_ids:
+            return
+        db.query(Horario).filter(Horario.puesto_id.in_(puesto_ids)).delete(synchronize_session=False)
+        db.query(Puesto).filter(Puesto.id.in_(puesto_ids)).delete(synchronize_session=False)
+        db.flush()
@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from infrastructure.databases.models.trabajo_generacion import TrabajoGeneracion, PENDIENTE, EN_EJECUCION
+
+class TrabajoGeneracionRepository:
+    @staticmethod
+    def get_by_id(trabajo_id: str, db: Session) -> Optional[TrabajoGeneracion]:
+        """
+        Obtiene un trabajo de generación por su ID.
+        Retorna None si no existe.
+        """
+        return db.query(TrabajoGeneracion).filter_by(id=trabajo_id).first()
+
+    @staticmethod
+    def get_pendientes(db: Session) -> List[TrabajoGeneracion]:
+        """
+        Devuelve los trabajos pendientes en orden de creación.
+        """
+        return db.query(TrabajoGeneracion).filter_by(estado=PENDIENTE).order_by(TrabajoGeneracion.creado).all()
+
+    @staticmethod
+    def create(trabajo: TrabajoGeneracion, db: Session) -> TrabajoGeneracion:
+        """
+        Registra un nuevo trabajo y confirma la transacción, para que sobreviva a un reinicio
+        aunque todavía no haya empezado a ejecutarse.
+        """
+        db.add(trabajo)
+        db.commit()
+        return trabajo
+
+    @staticmethod
+    def update(trabajo_id: str, db: Session, **campos) -> Optional[TrabajoGeneracion]:
+        """
+        Actualiza los campos indicados de un trabajo y confirma la transacción.
+        Retorna el trabajo actualizado o None si no existe.
+        """
+        trabajo = db.query(TrabajoGeneracion).filter_by(id=trabajo_id).first()
+        if not trabajo:
+            return None
+        for campo, valor in campos.items():
+            setattr(trabajo, campo, valor)
+        db.commit()
+        return trabajo
+
+    @staticmethod
+    def reclamar(trabajo_id: str, propietario: str, vence: datetime, db: Session) -> Optional[TrabajoGeneracion]:
+        """
+        Pasa un trabajo pendiente a en ejecución a nombre de `propietario`, con una concesión
+        hasta `vence`. Es un único UPDATE condicionado al estado, así que si varios procesos
+        intentan tomar el mismo trabajo solo uno lo consigue.
+        Retorna el trabajo reclamado o None si ya lo tomó otro proceso o no está pendiente.
+        """
+        cantidad = db.query(TrabajoGeneracion).filter_by(id=trabajo_id, estado=PENDIENTE).update(
+            {"estado": EN_EJECUCION, "propietario": propietario, "vence_concesion": vence,
+             "iniciado": datetime.now()},
+            synchronize_session=False
+        )
+        db.commit()
+        if cantidad == 0:
+            return None
+        return db.query(TrabajoGeneracion).filter_by(id=trabajo_id).first()
+
+    @staticmethod
+    def renovar_concesion(trabajo_id: str, propietario: str, vence: datetime, db: Session) -> bool:
+        """
+        Extiende la concesión de un trabajo en ejecución.
+        Retorna False si el trabajo ya no está en ejecución a nombre de `propietario`.
+        """
+        cantidad = db.query(TrabajoGeneracion).filter_by(
+            id=trabajo_id, estado=EN_EJECUCION, propietario=propietario
+        ).update({"vence_concesion": vence}, synchronize_session=False)
+        db.commit()
+        return cantidad == 1
+
+    @staticmethod
+    def update_propio(trabajo_id: str, propietario: str, db: Session, **campos) -> bool:
+        """
+        Actualiza los campos indicados solo si el trabajo sigue en ejecución a nombre de
+        `propietario`, para que un proceso que perdió la concesión no pise al que lo retomó.
+        Retorna True si el trabajo fue actualizado.
+        """
+        cantidad = db.query(TrabajoGeneracion).filter_by(
+            id=trabajo_id, estado=EN_EJECUCION, propietario=propietario
+        ).update(campos, synchronize_session=False)
+        db.commit()
+        return cantidad == 1
+
+    @staticmethod
+    def reencolar_vencidos(db: Session) -> int:
+        """
+        Devuelve a pendiente los trabajos en ejecución cuya concesión venció, es decir,
+        los de un proceso que se detuvo sin terminarlos. Los que otro proceso sigue
+        renovando no se tocan.
+        Retorna la cantidad de trabajos afectados.
+        """
+        cantidad = db.query(TrabajoGeneracion).filter(
+            TrabajoGeneracion.estado == EN_EJECUCION,
+            or_(TrabajoGeneracion.vence_concesion.is_(None), TrabajoGeneracion.vence_concesion < datetime.now()),
+        ).update(
+            {"estado": PENDIENTE, "iniciado": None, "objetivo": None, "cota": None, "soluciones": 0,
+             "propietario": None, "vence_concesion": None},
+            synchronize_session=False
+        )
+        db.commit()
+        return cantidad
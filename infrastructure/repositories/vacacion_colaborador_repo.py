@@ -19,6 +19,17 @@ class VacacionColaboradorRepository:
         """
         return db.query(VacacionColaborador).filter_by(fecha=fecha).all()
 
+    @staticmethod
+    def get_by_colaboradores_rango(colaborador_ids: List[int], fecha_desde: date, fecha_hasta: date, db: Session) -> List[VacacionColaborador]:
+        """
+        Devuelve las vacaciones de varios colaboradores dentro de un rango de fechas.
+        """
+        return db.query(VacacionColaborador).filter(
+            VacacionColaborador.colaborador_id.in_(colaborador_ids),
+            VacacionColaborador.fecha >= fecha_desde,
+            VacacionColaborador.fecha <= fecha_hasta
+        ).all()
+
     @staticmethod
     def create(vacacion: VacacionColaborador, db: Session) -> VacacionColaborador:
         """
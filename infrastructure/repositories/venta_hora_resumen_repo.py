@@ -0,0 +1,47 @@
+from datetime import date, datetime
+from typing import List, Set
+from sqlalchemy.orm import Session
+from infrastructure.databases.models.venta_hora_resumen import VentaHoraResumen, VentaHoraCarga
+
+class VentaHoraResumenRepository:
+    @staticmethod
+    def get_by_sucursal_fechas(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> List[VentaHoraResumen]:
+        """
+        Obtiene el resumen de ventas por hora de una sucursal dentro del rango de fechas.
+        """
+        return db.query(VentaHoraResumen).filter(
+            VentaHoraResumen.sucursal == sucursal,
+            VentaHoraResumen.fecha >= fecha_desde,
+            VentaHoraResumen.fecha <= fecha_hasta
+        ).order_by(VentaHoraResumen.fecha, VentaHoraResumen.hora).all()
+
+    @staticmethod
+    def get_fechas_completas(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> Set[date]:
+        """
+        Devuelve las fechas del rango cuyo resumen ya está cargado y no cambiará.
+        """
+        filas = db.query(VentaHoraCarga.fecha).filter(
+            VentaHoraCarga.sucursal == sucursal,
+            VentaHoraCarga.fecha >= fecha_desde,
+            VentaHoraCarga.fecha <= fecha_hasta,
+            VentaHoraCarga.completo.is_(True)
+        ).all()
+        return {fecha for fecha, in filas}
+
+    @staticmethod
+    def reemplazar_dias(
+        sucursal: int, fechas: List[date], resumenes: List[VentaHoraResumen], completas: Set[date], db: Session
+    ) -> None:
+        """
+        Reemplaza el resumen de las fechas indicadas y registra su carga.
+        Se asume que el manejo del commit se hace externamente.
+        """
+        db.query(VentaHoraResumen).filter(
+            VentaHoraResumen.sucursal == sucursal,
+            VentaHoraResumen.fecha.in_(fechas)
+        ).delete(synchronize_session=False)
+        db.add_all(resumenes)
+        ahora = datetime.now()
+        for fecha in fechas:
+            db.merge(VentaHoraCarga(sucursal=sucursal, fecha=fecha, completo=fecha in completas, actualizado=ahora))
+        db.flush()
@@ -1,26 +1,94 @@
-from typing import List
+import os
+from typing import Iterator, List, Optional
 from datetime import date
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-def get_vta_hora(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> List[dict]:
+# Filas que se piden al servidor por vez al leer con cursor del lado del servidor
+TAMANO_LOTE = 1000
+
+def _leer_consulta(archivo: str) -> str:
+    # Ruta relativa del archivo SQL; ajusta según la ubicación real.
+    with open(f"infrastructure/databases/queries/{archivo}", "r", encoding="utf-8") as f:
+        return f.read()
+
+def _ejecutar_consulta(archivo: str, sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> List[dict]:
+    """
+    Ejecuta una consulta de infrastructure/databases/queries con los parámetros de
+    sucursal y rango de fechas, y retorna las filas como diccionarios.
+    """
+    result = db.execute(
+        text(_leer_consulta(archivo)),
+        {"sucursal": sucursal, "fecha_desde": fecha_desde, "fecha_hasta": fecha_hasta}
+    )
+    rows = result.fetchall()
+    # Convertir cada fila en un diccionario usando _mapping
+    return [dict(row._mapping) for row in rows]
+
+def usar_preagregado() -> bool:
+    """
+    Indica si get_vta_hora usa por defecto la variante preagregada de la consulta,
+    según la variable de entorno VTA_HORA_PREAGREGADO ("1", "true" o "si").
+    """
+    return os.getenv("VTA_HORA_PREAGREGADO", "").strip().lower() in {"1", "true", "si", "sí"}
+
+def get_vta_hora(
+    sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session, preagregado: Optional[bool] = None
+) -> List[dict]:
     """
     Ejecuta la consulta definida en el archivo get_vta_hora.sql usando los parámetros:
       - sucursal: int
       - fecha_desde: date
       - fecha_hasta: date
 
+    Con preagregado=True se usa get_vta_hora_preagregado.sql, que devuelve las mismas
+    filas agregando pagos, líneas y coberturas en tablas derivadas en lugar de
+    subconsultas por comprobante. None toma el valor de VTA_HORA_PREAGREGADO.
+
     Retorna una lista de diccionarios con los resultados.
     Se espera que la sesión 'db' sea gestionada externamente.
     """
-    # Ruta relativa del archivo SQL; ajusta según la ubicación real.
-    with open("infrastructure/databases/queries/get_vta_hora.sql", "r", encoding="utf-8") as f:
-        sql_query = f.read()
-    
+    return _ejecutar_consulta(_archivo_vta_hora(preagregado), sucursal, fecha_desde, fecha_hasta, db)
+
+def _archivo_vta_hora(preagregado: Optional[bool]) -> str:
+    if preagregado is None:
+        preagregado = usar_preagregado()
+    return "get_vta_hora_preagregado.sql" if preagregado else "get_vta_hora.sql"
+
+def iterar_vta_hora(
+    sucursal: int,
+    fecha_desde: date,
+    fecha_hasta: date,
+    db: Session,
+    preagregado: Optional[bool] = None,
+    tamano_lote: int = TAMANO_LOTE
+) -> Iterator[dict]:
+    """
+    Igual que get_vta_hora, pero devuelve las filas de a una a medida que llegan.
+    Usa un cursor del lado del servidor (stream_results, SSCursor en pymysql) y pide
+    las filas de a `tamano_lote`, por lo que la memoria no depende del rango de fechas.
+
+    La sesión debe seguir abierta mientras se consume el generador, y no puede
+    ejecutar otras consultas hasta terminarlo.
+    """
     result = db.execute(
-        text(sql_query),
-        {"sucursal": sucursal, "fecha_desde": fecha_desde, "fecha_hasta": fecha_hasta}
+        text(_leer_consulta(_archivo_vta_hora(preagregado))),
+        {"sucursal": sucursal, "fecha_desde": fecha_desde, "fecha_hasta": fecha_hasta},
+        execution_options={"stream_results": True, "yield_per": tamano_lote}
     )
-    rows = result.fetchall()
-    # Convertir cada fila en un diccionario usando _mapping
-    return [dict(row._mapping) for row in rows]
+    try:
+        for row in result.mappings():
+            yield dict(row)
+    finally:
+        # Si el consumidor corta antes, se libera el cursor del servidor
+        result.close()
+
+def get_vta_hora_agrupado(sucursal: int, fecha_desde: date, fecha_hasta: date, db: Session) -> List[dict]:
+    """
+    Ejecuta la consulta get_vta_hora_agrupado.sql, que agrupa los comprobantes en el
+    servidor y retorna solo los conteos.
+
+    Retorna una lista de diccionarios con las claves Sucursal, Fecha, Hora (0-23),
+    Categoria (PAMI, Obra Social o Particular), Cantidad e Importe.
+    """
+    return _ejecutar_consulta("get_vta_hora_agrupado.sql", sucursal, fecha_desde, fecha_hasta, db)
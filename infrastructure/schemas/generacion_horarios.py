@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from typing import Optional, Any
+
+class GeneracionHorariosRequest(BaseModel):
+    # Se indica una sucursal o una empresa (todas sus sucursales), no ambas
+    sucursal_id: Optional[int] = None
+    empresa_id: Optional[int] = None
+    semana_inicio: date
+    tiempo_limite: float = Field(30.0, gt=0, le=600)
+    reemplazar: bool = False
+    usar_semana_anterior: bool = True
+
+    @model_validator(mode="after")
+    def validar_destino(self):
+        if (self.sucursal_id is None) == (self.empresa_id is None):
+            raise ValueError("Se debe indicar sucursal_id o empresa_id, no ambos.")
+        return self
+
+class TrabajoGeneracionResponse(BaseModel):
+    id: str
+    tipo: str
+    estado: str
+    parametros: dict
+    objetivo: Optional[float] = None
+    cota: Optional[float] = None
+    soluciones: int = 0
+    segundos_transcurridos: float
+    creado: datetime
+    iniciado: Optional[datetime] = None
+    finalizado: Optional[datetime] = None
+    resultado: Optional[Any] = None
+    error: Optional[str] = None
+
+    model_config = {
+        "from_attributes": True
+    }
@@ -0,0 +1,280 @@
+"""
+Heurística constructiva para generar horarios en milisegundos.
+
+Trabaja sobre los mismos datos y los mismos turnos candidatos que el motor CP-SAT,
+pero en lugar de buscar el óptimo los asigna de forma voraz: en cada ronda, los
+colaboradores con más horas semanales por asignar eligen primero su mejor turno según
+la demanda todavía descubierta de la grilla día × franja × rol, sus horarios
+preferidos y las horas que cubre. La grilla se mantiene en arreglos NumPy y cada
+evaluación es un producto matriz-vector sobre todos los candidatos del día.
+
+Sirve para previsualizar en la interfaz, como respaldo si CP-SAT no encuentra una
+solución a tiempo y como hint inicial del motor exacto.
+
+Respeta las restricciones duras del modelo (un turno por día, ventana de atención,
+horas diarias y semanales, vacaciones, espacios por rol) y el día libre de los
+colaboradores de tiempo completo y parcial; el resto de las reglas de la
+especificación solo las garantiza CP-SAT.
+"""
+
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from domain.models.colaborador import TIEMPO_COMPLETO, TIEMPO_PARCIAL
+from infrastructure.solvers.solver import (
+    ESTADO_HEURISTICO,
+    MINUTOS_DIA,
+    PESO_FALTANTE,
+    PESO_MINUTO_NO_ASIGNADO,
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    ResultadoGeneracion,
+    TurnoCandidato,
+    TurnoGenerado,
+    a_minutos,
+    fecha_de_dia,
+    generar_candidatos,
+)
+
+# Puntaje por minuto de turno dentro de un horario preferido del colaborador
+PESO_MINUTO_PREFERIDO = 2
+# Días máximos por semana para los tipos de empleado con día libre obligatorio
+DIAS_MAXIMOS_CON_FRANCO = 6
+
+
+class _GrillaDia:
+    def __init__(self, datos: DatosSemanaSucursal, dia_id: int, ventana: Tuple[int, int], paso_minutos: int):
+        """
+        Demanda y espacio libre de una sucursal en un día, por franja y rol.
+        """
+        self.apertura, self.cierre = ventana
+        self.paso_minutos = paso_minutos
+        # Los roles sin espacio quedan en la grilla para contabilizar sus mínimos como faltantes
+        self.roles = sorted(set(datos.capacidades) | {rol_id for dia, _, rol_id in datos.minimos if dia == dia_id})
+        self.indice_rol = {rol_id: indice for indice, rol_id in enumerate(self.roles)}
+        franjas = (self.cierre - self.apertura) // paso_minutos
+
+        # Mínimos por franja; cada mínimo horario cubre las franjas de esa hora
+        self.demanda = np.zeros((franjas, len(self.roles)), dtype=np.int32)
+        self.minimos: List[Tuple[tuple, int, slice]] = []
+        for (dia, hora, rol_id), cantidad in datos.minimos.items():
+            if dia != dia_id or cantidad <= 0:
+                continue
+            inicio = a_minutos(hora)
+            if inicio < self.apertura:
+                inicio += MINUTOS_DIA
+            desde = (inicio - self.apertura) // paso_minutos
+            hasta = min(desde + 60 // paso_minutos, franjas)
+            if desde >= franjas:
+                continue
+            franjas_hora = slice(max(desde, 0), hasta)
+            columna = self.demanda[franjas_hora, self.indice_rol[rol_id]]
+            np.maximum(columna, cantidad, out=columna)
+            self.minimos.append(((datos.sucursal_id, dia_id, hora, rol_id), cantidad, franjas_hora))
+
+        self.libre = np.tile(
+            np.array([datos.capacidades.get(rol_id, 0) for rol_id in self.roles], dtype=np.int32), (franjas, 1)
+        )
+        self.ocupacion = np.zeros_like(self.demanda)
+        for (dia, franja, rol_id), cantidad in datos.ocupacion_fija.items():
+            indice = (franja - self.apertura) // paso_minutos
+            if dia == dia_id and rol_id in self.indice_rol and 0 <= indice < franjas:
+                self.ocupacion[indice, self.indice_rol[rol_id]] += cantidad
+                self.libre[indice, self.indice_rol[rol_id]] -= cantidad
+
+    def matriz(self, turnos: List[TurnoCandidato]) -> np.ndarray:
+        """
+        Matriz candidatos × franjas con 1 en las franjas que cubre cada turno.
+        """
+        matriz = np.zeros((len(turnos), self.demanda.shape[0]), dtype=np.int32)
+        for fila, turno in enumerate(turnos):
+            for franja in turno.franjas:
+                matriz[fila, (franja - self.apertura) // self.paso_minutos] = 1
+        return matriz
+
+    def asignar(self, fila: np.ndarray, rol_id: int):
+        columna = self.indice_rol[rol_id]
+        self.ocupacion[:, columna] += fila
+        self.libre[:, columna] -= fila
+
+    def faltantes(self) -> Dict[tuple, int]:
+        resultado = {}
+        for clave, cantidad, franjas_hora in self.minimos:
+            cubiertos = self.ocupacion[franjas_hora, self.indice_rol[clave[3]]]
+            faltante = cantidad - int(cubiertos.min()) if cubiertos.size else cantidad
+            if faltante > 0:
+                resultado[clave] = faltante
+        return resultado
+
+
+class GeneradorHeuristico:
+    def __init__(
+        self,
+        datos: Union[DatosSemanaSucursal, List[DatosSemanaSucursal]],
+        paso_minutos: int = 60
+    ):
+        """
+        Prepara la heurística para una sucursal o un grupo de sucursales de la misma semana.
+
+        Args:
+            datos (Union[DatosSemanaSucursal, List[DatosSemanaSucursal]]): Datos de la
+                sucursal o de las sucursales que comparten colaboradores.
+            paso_minutos (int): Granularidad de inicios de turno y franjas, igual que en CP-SAT.
+
+        Raises:
+            ValueError: Si las sucursales no corresponden a la misma semana.
+        """
+        lista = datos if isinstance(datos, list) else [datos]
+        if len({datos_sucursal.semana_inicio for datos_sucursal in lista}) > 1:
+            raise ValueError("Todas las sucursales deben corresponder a la misma semana.")
+
+        self.sucursales = lista
+        self.semana_inicio = lista[0].semana_inicio
+        self.paso_minutos = paso_minutos
+
+        self.grillas: Dict[Tuple[int, int], _GrillaDia] = {}
+        for datos_sucursal in lista:
+            for dia_id in range(1, 8):
+                ventana = datos_sucursal.ventana(dia_id)
+                if ventana is not None:
+                    self.grillas[(datos_sucursal.sucursal_id, dia_id)] = _GrillaDia(
+                        datos_sucursal, dia_id, ventana, paso_minutos
+                    )
+
+        # (sucursal_id, dia_id, corrido, horas_max) -> (turnos, matriz, duraciones)
+        self._candidatos: Dict[tuple, Tuple[List[TurnoCandidato], np.ndarray, np.ndarray]] = {}
+
+    def _opciones(self, sucursal_id: int, dia_id: int, colaborador: ColaboradorDisponible):
+        clave = (sucursal_id, dia_id, colaborador.horario_corrido, colaborador.horas_por_dia_max)
+        if clave not in self._candidatos:
+            grilla = self.grillas[(sucursal_id, dia_id)]
+            turnos = generar_candidatos(
+                (grilla.apertura, grilla.cierre), colaborador.horario_corrido, colaborador.horas_por_dia_max, self.paso_minutos
+            )
+            self._candidatos[clave] = (
+                turnos,
+                grilla.matriz(turnos),
+                np.array([turno.duracion for turno in turnos], dtype=np.int32),
+            )
+        return self._candidatos[clave]
+
+    def _preferidas(self, grilla: _GrillaDia, colaborador: ColaboradorDisponible, dia_id: int) -> np.ndarray:
+        preferidas = np.zeros(grilla.demanda.shape[0], dtype=np.int32)
+        for inicio, fin in colaborador.horarios_preferidos.get(dia_id, []):
+            desde, hasta = a_minutos(inicio), a_minutos(fin)
+            # Solo se traslada al día siguiente si la sucursal atiende pasada la medianoche
+            if desde < grilla.apertura and desde + MINUTOS_DIA < grilla.cierre:
+                desde += MINUTOS_DIA
+            while hasta <= desde:
+                hasta += MINUTOS_DIA
+            desde = max((desde - grilla.apertura) // self.paso_minutos, 0)
+            hasta = max((hasta - grilla.apertura) // self.paso_minutos, 0)
+            preferidas[desde:hasta] = 1
+        return preferidas
+
+    def _mejor_turno(
+        self,
+        participaciones: List[Tuple[DatosSemanaSucursal, ColaboradorDisponible]],
+        dias_libres: List[int],
+        minutos_restantes: int
+    ) -> Optional[Tuple[float, int, int, int, TurnoCandidato, np.ndarray]]:
+        mejor = None
+        peso_franja = PESO_FALTANTE * self.paso_minutos / 60
+        for datos, colaborador in participaciones:
+            for dia_id in dias_libres:
+                grilla = self.grillas.get((datos.sucursal_id, dia_id))
+                if grilla is None:
+                    continue
+                turnos, matriz, duraciones = self._opciones(datos.sucursal_id, dia_id, colaborador)
+                if not turnos:
+                    continue
+                preferidas = matriz @ self._preferidas(grilla, colaborador, dia_id)
+                for rol_id in colaborador.roles:
+                    if rol_id not in grilla.indice_rol:
+                        continue
+                    columna = grilla.indice_rol[rol_id]
+                    faltante = np.maximum(grilla.demanda[:, columna] - grilla.ocupacion[:, columna], 0)
+                    sin_lugar = (grilla.libre[:, columna] <= 0).astype(np.int32)
+                    validos = (duraciones <= minutos_restantes) & (matriz @ sin_lugar == 0)
+                    if not validos.any():
+                        continue
+                    puntaje = (
+                        peso_franja * (matriz @ faltante)
+                        + PESO_MINUTO_PREFERIDO * self.paso_minutos * preferidas
+                        + PESO_MINUTO_NO_ASIGNADO * duraciones
+                    )
+                    puntaje = np.where(validos, puntaje, -1)
+                    indice = int(puntaje.argmax())
+                    if mejor is None or puntaje[indice] > mejor[0]:
+                        mejor = (float(puntaje[indice]), datos.sucursal_id, dia_id, rol_id, turnos[indice], matriz[indice])
+        return mejor
+
+    def resolver(self) -> ResultadoGeneracion:
+        """
+        Construye una solución voraz y la devuelve con el mismo formato y la misma
+        función objetivo que el motor CP-SAT.
+        """
+        inicio = perf_counter()
+
+        participaciones: Dict[int, List[Tuple[DatosSemanaSucursal, ColaboradorDisponible]]] = {}
+        colaboradores: Dict[int, ColaboradorDisponible] = {}
+        for datos in self.sucursales:
+            for colaborador in datos.colaboradores:
+                colaboradores.setdefault(colaborador.id, colaborador)
+                participaciones.setdefault(colaborador.id, []).append((datos, colaborador))
+
+        restantes = {colaborador_id: c.horas_semanales * 60 for colaborador_id, c in colaboradores.items()}
+        dias_libres = {
+            colaborador_id: [
+                dia_id for dia_id in range(1, 8)
+                if fecha_de_dia(self.semana_inicio, dia_id) not in colaborador.fechas_no_disponibles
+            ]
+            for colaborador_id, colaborador in colaboradores.items()
+        }
+        dias_trabajados = {colaborador_id: 0 for colaborador_id in colaboradores}
+        turnos: List[TurnoGenerado] = []
+
+        activos = set(colaboradores)
+        while activos:
+            # Primero eligen los colaboradores con más horas por asignar
+            for colaborador_id in sorted(activos, key=lambda c: (-restantes[c], c)):
+                colaborador = colaboradores[colaborador_id]
+                if colaborador.tipo_empleado in {TIEMPO_COMPLETO, TIEMPO_PARCIAL} \
+                        and dias_trabajados[colaborador_id] >= DIAS_MAXIMOS_CON_FRANCO:
+                    activos.discard(colaborador_id)
+                    continue
+                mejor = self._mejor_turno(
+                    participaciones[colaborador_id], dias_libres[colaborador_id], restantes[colaborador_id]
+                )
+                if mejor is None:
+                    activos.discard(colaborador_id)
+                    continue
+
+                _, sucursal_id, dia_id, rol_id, turno, fila = mejor
+                self.grillas[(sucursal_id, dia_id)].asignar(fila, rol_id)
+                restantes[colaborador_id] -= turno.duracion
+                dias_libres[colaborador_id].remove(dia_id)
+                dias_trabajados[colaborador_id] += 1
+                turnos.append(TurnoGenerado(
+                    sucursal_id=sucursal_id,
+                    colaborador_id=colaborador_id,
+                    rol_colaborador_id=rol_id,
+                    dia_id=dia_id,
+                    fecha=fecha_de_dia(self.semana_inicio, dia_id),
+                    bloques=turno.bloques_como_horas(),
+                ))
+
+        faltantes: Dict[tuple, int] = {}
+        for grilla in self.grillas.values():
+            faltantes.update(grilla.faltantes())
+        objetivo = PESO_FALTANTE * sum(faltantes.values()) + PESO_MINUTO_NO_ASIGNADO * sum(restantes.values())
+
+        return ResultadoGeneracion(
+            estado=ESTADO_HEURISTICO,
+            turnos=turnos,
+            objetivo=float(objetivo),
+            tiempo_segundos=perf_counter() - inicio,
+            faltantes=faltantes,
+        )
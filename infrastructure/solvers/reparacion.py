@@ -0,0 +1,166 @@
+"""
+Reparación por vecindario (LNS) de una semana ya generada.
+
+Cuando un colaborador deja de estar disponible (por ejemplo, por una vacación nueva)
+no hace falta regenerar la semana completa: se liberan los turnos del colaborador
+ausente y los de un vecindario chico de colaboradores relacionados (mismos roles en
+la misma sucursal), y se vuelve a resolver solo ese subproblema. Los turnos del resto
+quedan fijos y entran al modelo como ocupación fija de cada franja, por lo que el
+modelo solo contiene las variables de los colaboradores liberados.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+from infrastructure.solvers.solver import (
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    TurnoGenerado,
+    a_minutos,
+    fecha_de_dia,
+)
+
+# Colaboradores que se liberan, además del ausente, si no se indica otro tamaño
+TAMANO_VECINDARIO = 4
+
+
+def _minutos(turno: TurnoGenerado) -> int:
+    minutos = 0
+    for inicio, fin in turno.bloques:
+        duracion = a_minutos(fin) - a_minutos(inicio)
+        minutos += duracion if duracion > 0 else duracion + 24 * 60
+    return minutos
+
+
+def descontar_turnos_externos(
+    colaboradores: Iterable[ColaboradorDisponible],
+    turnos_externos: List[TurnoGenerado]
+) -> List[ColaboradorDisponible]:
+    """
+    Descuenta de cada colaborador los turnos que ya tiene en sucursales que no forman
+    parte del modelo: esos días dejan de estar disponibles (el modelo admite un turno
+    por día) y sus horas se restan de las semanales, redondeando hacia arriba para que
+    la semana completa nunca supere las horas contratadas.
+
+    Returns:
+        List[ColaboradorDisponible]: Copias de los colaboradores con la disponibilidad restante.
+    """
+    fechas_externas: Dict[int, Set] = {}
+    minutos_externos = Counter()
+    for turno in turnos_externos:
+        fechas_externas.setdefault(turno.colaborador_id, set()).add(turno.fecha)
+        minutos_externos[turno.colaborador_id] += _minutos(turno)
+
+    return [
+        ColaboradorDisponible(
+            id=colaborador.id,
+            roles=colaborador.roles,
+            horas_por_dia_max=colaborador.horas_por_dia_max,
+            horas_semanales=max(0, colaborador.horas_semanales + (-minutos_externos[colaborador.id] // 60)),
+            horario_corrido=colaborador.horario_corrido,
+            tipo_empleado=colaborador.tipo_empleado,
+            fechas_no_disponibles=colaborador.fechas_no_disponibles | fechas_externas.get(colaborador.id, set()),
+            nombre=colaborador.nombre,
+            horarios_preferidos=colaborador.horarios_preferidos,
+        )
+        for colaborador in colaboradores
+    ]
+
+
+def elegir_vecindario(
+    datos: DatosSemanaSucursal,
+    turnos: List[TurnoGenerado],
+    colaborador_id: int,
+    dias: Iterable[int],
+    tamano: int = TAMANO_VECINDARIO
+) -> Set[int]:
+    """
+    Elige los colaboradores cuyos turnos se liberan para reparar la ausencia de
+    `colaborador_id` en los días indicados.
+
+    Se consideran los colaboradores de la sucursal que comparten algún rol con el
+    ausente. Primero van los que no trabajan alguno de esos días y pueden cubrirlo;
+    después, los que sí trabajan esos días y pueden correr su turno. Dentro de cada
+    grupo se prefiere a quienes tienen más horas semanales sin asignar.
+
+    Returns:
+        Set[int]: IDs de los colaboradores liberados, incluido el ausente.
+    """
+    dias = set(dias)
+    roles = {turno.rol_colaborador_id for turno in turnos if turno.colaborador_id == colaborador_id}
+    for colaborador in datos.colaboradores:
+        if colaborador.id == colaborador_id:
+            roles.update(colaborador.roles)
+
+    trabajando = {(turno.colaborador_id, turno.dia_id) for turno in turnos}
+    minutos = Counter()
+    for turno in turnos:
+        minutos[turno.colaborador_id] += _minutos(turno)
+
+    def prioridad(colaborador: ColaboradorDisponible):
+        puede_cubrir = any(
+            (colaborador.id, dia_id) not in trabajando
+            and fecha_de_dia(datos.semana_inicio, dia_id) not in colaborador.fechas_no_disponibles
+            for dia_id in dias
+        )
+        holgura = colaborador.horas_semanales * 60 - minutos[colaborador.id]
+        return (not puede_cubrir, -holgura, colaborador.id)
+
+    candidatos = [
+        colaborador for colaborador in datos.colaboradores
+        if colaborador.id != colaborador_id and roles & set(colaborador.roles)
+    ]
+    return {colaborador_id} | {colaborador.id for colaborador in sorted(candidatos, key=prioridad)[:tamano]}
+
+
+def construir_subproblema(
+    datos: DatosSemanaSucursal,
+    turnos: List[TurnoGenerado],
+    liberados: Set[int],
+    turnos_externos: List[TurnoGenerado] = None,
+    paso_minutos: int = 60
+) -> DatosSemanaSucursal:
+    """
+    Arma los datos del subproblema de reparación de una sucursal.
+
+    Args:
+        datos (DatosSemanaSucursal): Datos completos de la sucursal y la semana.
+        turnos (List[TurnoGenerado]): Turnos actuales de la sucursal en la semana.
+        liberados (Set[int]): Colaboradores cuyos turnos se vuelven a resolver.
+        turnos_externos (List[TurnoGenerado]): Turnos de los liberados en otras sucursales;
+            esos días dejan de estar disponibles y sus horas se descuentan de las semanales.
+        paso_minutos (int): Granularidad de las franjas, igual que la del generador.
+
+    Returns:
+        DatosSemanaSucursal: Datos con solo los colaboradores liberados y la ocupación
+            de los turnos fijos.
+    """
+    ocupacion_fija: Dict[Tuple[int, int, int], int] = Counter()
+    for turno in turnos:
+        if turno.colaborador_id in liberados:
+            continue
+        bloques = datos.bloques_en_minutos(turno.dia_id, turno.bloques)
+        if bloques is None:
+            continue
+        # Las franjas se alinean con la apertura, igual que las de los turnos candidatos
+        apertura = datos.ventana(turno.dia_id)[0]
+        for inicio, fin in bloques:
+            primera = apertura + (inicio - apertura) // paso_minutos * paso_minutos
+            for franja in range(primera, fin, paso_minutos):
+                ocupacion_fija[(turno.dia_id, franja, turno.rol_colaborador_id)] += 1
+
+    colaboradores = descontar_turnos_externos(
+        [colaborador for colaborador in datos.colaboradores if colaborador.id in liberados],
+        turnos_externos or [],
+    )
+
+    return DatosSemanaSucursal(
+        sucursal_id=datos.sucursal_id,
+        semana_inicio=datos.semana_inicio,
+        horarios_atencion=datos.horarios_atencion,
+        minimos=datos.minimos,
+        capacidades=datos.capacidades,
+        colaboradores=colaboradores,
+        nombres_roles=datos.nombres_roles,
+        ocupacion_fija=dict(ocupacion_fija),
+    )
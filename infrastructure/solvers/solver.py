@@ -0,0 +1,824 @@
+"""
+Motor de generación de horarios basado en OR-Tools CP-SAT.
+
+El motor recibe los datos de una sucursal para una semana (horarios de atención,
+mínimos de puestos por día/hora/rol, espacios disponibles por rol, colaboradores
+habilitados y sus límites de horas) y devuelve los turnos asignados, listos para
+convertirse en `Puesto` + `Horario`. Varias sucursales que comparten colaboradores
+se resuelven en un mismo modelo.
+
+Convenciones:
+    - `dia_id` sigue la tabla `dias`: 1 = Lunes ... 7 = Domingo.
+    - Los tiempos se manejan internamente en minutos desde las 00:00 del día;
+      un cierre anterior a la apertura se interpreta como cierre al día siguiente.
+"""
+
+import threading
+from datetime import date, time, timedelta
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from ortools.sat.python import cp_model
+
+MINUTOS_DIA = 24 * 60
+
+# Parámetros de generación de turnos candidatos (en horas)
+DURACION_MINIMA_TURNO = 4
+DURACION_MINIMA_BLOQUE_CORTADO = 3
+DESCANSO_MINIMO_CORTADO = 4
+
+# Pesos del objetivo: cubrir mínimos domina sobre no cambiar turnos ya publicados,
+# y ambos sobre completar horas contratadas
+PESO_FALTANTE = 1000
+PESO_CAMBIO = 120
+PESO_MINUTO_NO_ASIGNADO = 1
+
+# Estado de los resultados construidos por la heurística en lugar de CP-SAT
+ESTADO_HEURISTICO = "HEURISTIC"
+
+# Tiempo máximo (en segundos) para comprobar que una solución fija cumple el modelo
+TIEMPO_VERIFICACION = 5.0
+
+# Parte del tiempo límite que puede usarse para completar el hint antes de la búsqueda;
+# si esa parte no llega a TIEMPO_MINIMO_COMPLETAR_HINT segundos no se intenta
+FRACCION_COMPLETAR_HINT = 0.25
+TIEMPO_MINIMO_COMPLETAR_HINT = 0.5
+
+
+def dia_id_de_fecha(fecha: date) -> int:
+    """
+    Devuelve el `dia_id` (1 = Lunes ... 7 = Domingo) de una fecha.
+    """
+    return fecha.weekday() + 1
+
+
+def fecha_de_dia(semana_inicio: date, dia_id: int) -> date:
+    """
+    Devuelve la fecha del `dia_id` indicado dentro de la semana de `semana_inicio`.
+    """
+    lunes = semana_inicio - timedelta(days=semana_inicio.weekday())
+    return lunes + timedelta(days=dia_id - 1)
+
+
+def a_minutos(hora: time) -> int:
+    return hora.hour * 60 + hora.minute
+
+
+def a_hora(minutos: int) -> time:
+    minutos %= MINUTOS_DIA
+    return time(minutos // 60, minutos % 60)
+
+
+class ColaboradorDisponible:
+    def __init__(
+        self,
+        id: int,
+        roles: List[int],
+        horas_por_dia_max: int,
+        horas_semanales: int,
+        horario_corrido: bool = True,
+        tipo_empleado: Optional[str] = None,
+        fechas_no_disponibles: Optional[Set[date]] = None,
+        nombre: Optional[str] = None,
+        horarios_preferidos: Optional[Dict[int, List[Tuple[time, time]]]] = None
+    ):
+        """
+        Colaborador habilitado para trabajar en la sucursal durante la semana.
+
+        Args:
+            id (int): ID del colaborador.
+            roles (List[int]): IDs de los roles que puede cubrir en la sucursal.
+            horas_por_dia_max (int): Máximo de horas por día (TipoEmpleado).
+            horas_semanales (int): Horas semanales contratadas (TipoEmpleado).
+            horario_corrido (bool): Si trabaja en un único bloque diario o en horario cortado.
+            tipo_empleado (Optional[str]): Tipo de empleado, usado por las especificaciones.
+            fechas_no_disponibles (Optional[Set[date]]): Fechas en las que no puede trabajar (vacaciones).
+            nombre (Optional[str]): Nombre del colaborador.
+            horarios_preferidos (Optional[Dict[int, List[Tuple[time, time]]]]): dia_id -> bloques
+                (inicio, fin) en los que prefiere trabajar en la sucursal.
+        """
+        self.id = id
+        self.roles = list(roles)
+        self.horas_por_dia_max = horas_por_dia_max
+        self.horas_semanales = horas_semanales
+        self.horario_corrido = horario_corrido
+        self.tipo_empleado = tipo_empleado
+        self.fechas_no_disponibles = set(fechas_no_disponibles or ())
+        self.nombre = nombre
+        self.horarios_preferidos = horarios_preferidos or {}
+
+    @property
+    def horas_diarias_maximas(self) -> int:
+        # Alias usado por las especificaciones de horario
+        return self.horas_por_dia_max
+
+
+class DatosSemanaSucursal:
+    def __init__(
+        self,
+        sucursal_id: int,
+        semana_inicio: date,
+        horarios_atencion: Dict[int, Tuple[time, time]],
+        minimos: Dict[Tuple[int, time, int], int],
+        capacidades: Dict[int, int],
+        colaboradores: List[ColaboradorDisponible],
+        nombres_roles: Optional[Dict[int, str]] = None,
+        ocupacion_fija: Optional[Dict[Tuple[int, int, int], int]] = None
+    ):
+        """
+        Datos de entrada del motor para una sucursal y una semana.
+
+        Args:
+            sucursal_id (int): ID de la sucursal.
+            semana_inicio (date): Cualquier fecha de la semana a generar (se normaliza al lunes).
+            horarios_atencion (Dict[int, Tuple[time, time]]): dia_id -> (apertura, cierre).
+            minimos (Dict[Tuple[int, time, int], int]): (dia_id, hora, rol_id) -> cantidad mínima
+                de colaboradores durante la hora que comienza en `hora`.
+            capacidades (Dict[int, int]): rol_id -> espacios disponibles. Un rol sin
+                espacio en la sucursal no puede asignarse.
+            colaboradores (List[ColaboradorDisponible]): Colaboradores habilitados.
+            nombres_roles (Optional[Dict[int, str]]): rol_id -> nombre, para nombrar los puestos.
+            ocupacion_fija (Optional[Dict[Tuple[int, int, int], int]]): (dia_id, franja en minutos,
+                rol_id) -> colaboradores ya asignados que no forman parte del modelo. Ocupan
+                espacio y cuentan para los mínimos (ver reparación por vecindario).
+        """
+        self.sucursal_id = sucursal_id
+        self.semana_inicio = semana_inicio - timedelta(days=semana_inicio.weekday())
+        self.horarios_atencion = horarios_atencion
+        self.minimos = minimos
+        self.capacidades = capacidades
+        self.colaboradores = colaboradores
+        self.nombres_roles = nombres_roles or {}
+        self.ocupacion_fija = ocupacion_fija or {}
+
+    def ventana(self, dia_id: int) -> Optional[Tuple[int, int]]:
+        """
+        Devuelve la ventana de atención del día en minutos (apertura, cierre) o None si cierra.
+        """
+        if dia_id not in self.horarios_atencion:
+            return None
+        apertura, cierre = self.horarios_atencion[dia_id]
+        inicio, fin = a_minutos(apertura), a_minutos(cierre)
+        if fin <= inicio:
+            fin += MINUTOS_DIA
+        return inicio, fin
+
+    def bloques_en_minutos(self, dia_id: int, bloques: List[Tuple[time, time]]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Convierte bloques horarios de un día a minutos con la misma convención que los
+        turnos candidatos, o devuelve None si la sucursal no atiende ese día.
+        """
+        ventana = self.ventana(dia_id)
+        if ventana is None:
+            return None
+        resultado = []
+        for inicio, fin in sorted(bloques):
+            inicio_min, fin_min = a_minutos(inicio), a_minutos(fin)
+            if inicio_min < ventana[0]:
+                inicio_min += MINUTOS_DIA
+            while fin_min <= inicio_min:
+                fin_min += MINUTOS_DIA
+            resultado.append((inicio_min, fin_min))
+        return resultado
+
+
+class TurnoCandidato:
+    def __init__(self, bloques: List[Tuple[int, int]], paso_minutos: int):
+        """
+        Turno posible para un día, expresado en minutos.
+
+        Args:
+            bloques (List[Tuple[int, int]]): Bloques (inicio, fin) en minutos.
+            paso_minutos (int): Granularidad de las franjas de cobertura.
+        """
+        self.bloques = bloques
+        self.duracion = sum(fin - inicio for inicio, fin in bloques)
+        self.franjas = [
+            franja
+            for inicio, fin in bloques
+            for franja in range(inicio, fin, paso_minutos)
+        ]
+
+    def bloques_como_horas(self) -> List[Tuple[time, time]]:
+        return [(a_hora(inicio), a_hora(fin)) for inicio, fin in self.bloques]
+
+
+def generar_candidatos(
+    ventana: Tuple[int, int],
+    horario_corrido: bool,
+    horas_max: int,
+    paso_minutos: int
+) -> List[TurnoCandidato]:
+    """
+    Enumera los turnos posibles de un día dentro de la ventana de atención: un bloque
+    de DURACION_MINIMA_TURNO a `horas_max` horas para horario corrido, o dos bloques de
+    al menos DURACION_MINIMA_BLOQUE_CORTADO horas separados por DESCANSO_MINIMO_CORTADO
+    horas para horario cortado. Los turnos cortados se alinean con la apertura (el
+    primer bloque empieza al abrir) o con el cierre (el segundo termina al cerrar): el
+    resto no cubre ningún extremo de la jornada y multiplica las variables del modelo.
+    """
+    apertura, cierre = ventana
+    turnos = []
+    if horario_corrido:
+        for horas in range(DURACION_MINIMA_TURNO, horas_max + 1):
+            duracion = horas * 60
+            for inicio in range(apertura, cierre - duracion + 1, paso_minutos):
+                turnos.append(TurnoCandidato([(inicio, inicio + duracion)], paso_minutos))
+        return turnos
+
+    bloque_min = DURACION_MINIMA_BLOQUE_CORTADO * 60
+    descanso_min = DESCANSO_MINIMO_CORTADO * 60
+    total_max = horas_max * 60
+    for inicio1 in range(apertura, cierre, paso_minutos):
+        for duracion1 in range(bloque_min, total_max - bloque_min + 1, 60):
+            fin1 = inicio1 + duracion1
+            for inicio2 in range(fin1 + descanso_min, cierre, paso_minutos):
+                for duracion2 in range(bloque_min, total_max - duracion1 + 1, 60):
+                    fin2 = inicio2 + duracion2
+                    if fin2 > cierre:
+                        break
+                    if inicio1 != apertura and fin2 != cierre:
+                        continue
+                    turnos.append(TurnoCandidato([(inicio1, fin1), (inicio2, fin2)], paso_minutos))
+    return turnos
+
+
+class TurnoGenerado:
+    def __init__(
+        self,
+        sucursal_id: int,
+        colaborador_id: int,
+        rol_colaborador_id: int,
+        dia_id: int,
+        fecha: date,
+        bloques: List[Tuple[time, time]]
+    ):
+        """
+        Turno asignado por el motor: un puesto con uno o dos bloques horarios.
+        """
+        self.sucursal_id = sucursal_id
+        self.colaborador_id = colaborador_id
+        self.rol_colaborador_id = rol_colaborador_id
+        self.dia_id = dia_id
+        self.fecha = fecha
+        self.bloques = bloques
+
+    @property
+    def horario_corrido(self) -> bool:
+        return len(self.bloques) == 1
+
+    def to_dict(self) -> dict:
+        return {
+            "sucursal_id": self.sucursal_id,
+            "colaborador_id": self.colaborador_id,
+            "rol_colaborador_id": self.rol_colaborador_id,
+            "dia_id": self.dia_id,
+            "fecha": self.fecha.isoformat(),
+            "bloques": [(inicio.strftime("%H:%M"), fin.strftime("%H:%M")) for inicio, fin in self.bloques],
+        }
+
+    def __repr__(self):
+        return (
+            f"<TurnoGenerado(colaborador_id={self.colaborador_id}, rol={self.rol_colaborador_id}, "
+            f"fecha={self.fecha}, bloques={self.bloques})>"
+        )
+
+
+class ResultadoGeneracion:
+    def __init__(
+        self,
+        estado: str,
+        turnos: List[TurnoGenerado],
+        objetivo: Optional[float] = None,
+        cota: Optional[float] = None,
+        tiempo_segundos: float = 0.0,
+        faltantes: Optional[Dict[Tuple[int, int, time, int], int]] = None,
+        cambios: Optional[int] = None
+    ):
+        """
+        Resultado de una ejecución del motor.
+
+        Args:
+            estado (str): Estado de CP-SAT (OPTIMAL, FEASIBLE, INFEASIBLE, UNKNOWN, MODEL_INVALID)
+                o ESTADO_HEURISTICO si la solución proviene de la heurística constructiva.
+            turnos (List[TurnoGenerado]): Turnos asignados.
+            objetivo (Optional[float]): Valor del objetivo de la mejor solución.
+            cota (Optional[float]): Mejor cota inferior conocida.
+            tiempo_segundos (float): Tiempo de resolución.
+            faltantes (Optional[Dict]): (sucursal_id, dia_id, hora, rol_id) -> colaboradores
+                que faltan para cubrir el mínimo.
+            cambios (Optional[int]): Turnos previos que no se mantuvieron (solo con warm start).
+        """
+        self.estado = estado
+        self.turnos = turnos
+        self.objetivo = objetivo
+        self.cota = cota
+        self.tiempo_segundos = tiempo_segundos
+        self.faltantes = faltantes or {}
+        self.cambios = cambios
+
+    @property
+    def factible(self) -> bool:
+        return self.estado in ("OPTIMAL", "FEASIBLE", ESTADO_HEURISTICO)
+
+    def to_dict(self) -> dict:
+        return {
+            "estado": self.estado,
+            "objetivo": self.objetivo,
+            "cota": self.cota,
+            "tiempo_segundos": round(self.tiempo_segundos, 3),
+            "cambios": self.cambios,
+            "turnos": [turno.to_dict() for turno in self.turnos],
+            "faltantes": [
+                {
+                    "sucursal_id": sucursal_id,
+                    "dia_id": dia_id,
+                    "hora": hora.strftime("%H:%M"),
+                    "rol_colaborador_id": rol_id,
+                    "cantidad": cantidad,
+                }
+                for (sucursal_id, dia_id, hora, rol_id), cantidad in self.faltantes.items()
+            ],
+        }
+
+
+class SolucionCapturada:
+    def __init__(self, observador: "ObservadorSoluciones"):
+        """
+        Copia de una solución tomada dentro del callback de CP-SAT. Los valores del
+        observador solo se pueden leer mientras dura el callback; esta copia se puede
+        procesar después en otro hilo mientras la búsqueda sigue. Copiar el vector de la
+        respuesta cuesta bastante menos que leer las variables una por una.
+
+        Args:
+            observador (ObservadorSoluciones): Observador dentro de on_solution_callback.
+        """
+        self.generador = observador.generador
+        self.objetivo = observador.objetivo
+        self.cota = observador.cota
+        self.segundos = observador.segundos
+        self.valores = list(observador.Response().solution)
+
+    def Value(self, expresion) -> int:
+        # Misma interfaz que CpSolver y el callback, para extraer_turnos y cobertura_minimos
+        if isinstance(expresion, int):
+            return expresion
+        return self.valores[expresion.Index()]
+
+
+class ObservadorSoluciones(cp_model.CpSolverSolutionCallback):
+    def __init__(self, generador: "GeneradorHorarios", al_mejorar: Callable[["ObservadorSoluciones"], None]):
+        """
+        Callback de CP-SAT que notifica cada solución mejorada durante la búsqueda.
+
+        `al_mejorar` recibe el propio observador, desde el que se leen el objetivo, la
+        cota, el tiempo transcurrido y, si hace falta, los valores de la solución
+        (`generador.extraer_turnos(observador)`). La búsqueda espera a que `al_mejorar`
+        termine: el trabajo pesado conviene hacerlo sobre `capturar()` en otro hilo.
+
+        Args:
+            generador (GeneradorHorarios): Generador cuyo modelo se está resolviendo.
+            al_mejorar (Callable[[ObservadorSoluciones], None]): Función a invocar por solución.
+        """
+        super().__init__()
+        self.generador = generador
+        self.al_mejorar = al_mejorar
+        self.soluciones = 0
+        self.objetivo: Optional[float] = None
+        self.cota: Optional[float] = None
+        self.segundos = 0.0
+
+    def on_solution_callback(self):
+        self.soluciones += 1
+        self.objetivo = self.ObjectiveValue()
+        self.cota = self.BestObjectiveBound()
+        self.segundos = self.WallTime()
+        self.al_mejorar(self)
+
+    def capturar(self) -> SolucionCapturada:
+        """Copia la solución actual para leerla fuera del callback."""
+        return SolucionCapturada(self)
+
+
+class GeneradorHorarios:
+    def __init__(
+        self,
+        datos: Union[DatosSemanaSucursal, List[DatosSemanaSucursal]],
+        paso_minutos: int = 60,
+        tiempo_limite: float = 10.0,
+        workers: int = 8,
+        gap_relativo: float = 0.0
+    ):
+        """
+        Construye el modelo CP-SAT para una semana de una sucursal o de un grupo de
+        sucursales que comparten colaboradores.
+
+        Variables: una booleana por (colaborador, sucursal, día, rol, turno candidato).
+        Restricciones:
+            - A lo sumo un turno por colaborador y día, en cualquiera de sus sucursales;
+              ninguno en fechas no disponibles.
+            - Turnos dentro del horario de atención y de las horas diarias máximas.
+            - Horas semanales de cada colaborador <= horas contratadas.
+            - Ocupación por rol y franja <= espacios disponibles de cada sucursal.
+            - Mínimos por día/hora/rol, como restricción blanda (la falta se penaliza).
+        Objetivo: minimizar faltantes de cobertura y, en segundo término, las horas
+        contratadas que quedan sin asignar.
+
+        Args:
+            datos (Union[DatosSemanaSucursal, List[DatosSemanaSucursal]]): Datos de la sucursal
+                o de las sucursales a resolver en conjunto, todas de la misma semana.
+            paso_minutos (int): Granularidad de inicios de turno y franjas de cobertura.
+            tiempo_limite (float): Tiempo máximo de búsqueda en segundos.
+            workers (int): Cantidad de workers de búsqueda de CP-SAT.
+            gap_relativo (float): Brecha relativa entre objetivo y cota con la que se
+                da por terminada la búsqueda (0 = probar el óptimo o agotar el tiempo).
+
+        Raises:
+            ValueError: Si las sucursales no corresponden a la misma semana.
+        """
+        lista = datos if isinstance(datos, list) else [datos]
+        if len({datos_sucursal.semana_inicio for datos_sucursal in lista}) > 1:
+            raise ValueError("Todas las sucursales deben corresponder a la misma semana.")
+
+        self.sucursales: Dict[int, DatosSemanaSucursal] = {
+            datos_sucursal.sucursal_id: datos_sucursal for datos_sucursal in lista
+        }
+        self.semana_inicio = lista[0].semana_inicio
+        self.paso_minutos = paso_minutos
+        self.tiempo_limite = tiempo_limite
+        self.workers = workers
+        self.gap_relativo = gap_relativo
+
+        # Un colaborador compartido aparece en varias sucursales con los roles de cada una
+        self.colaboradores: Dict[int, ColaboradorDisponible] = {}
+        self.participaciones: Dict[int, List[Tuple[DatosSemanaSucursal, ColaboradorDisponible]]] = {}
+        for datos_sucursal in lista:
+            for colaborador in datos_sucursal.colaboradores:
+                self.colaboradores.setdefault(colaborador.id, colaborador)
+                self.participaciones.setdefault(colaborador.id, []).append((datos_sucursal, colaborador))
+
+        self.modelo = cp_model.CpModel()
+        # (colaborador_id, sucursal_id, dia_id, rol_id, indice) -> variable
+        self.asignaciones: Dict[Tuple[int, int, int, int, int], cp_model.IntVar] = {}
+        # (sucursal_id, dia_id, corrido, horas_max) -> turnos candidatos
+        self._candidatos: Dict[Tuple[int, int, bool, int], List[TurnoCandidato]] = {}
+        # (colaborador_id, dia_id) -> [(variable, sucursal_id, rol_id, turno)]
+        self.turnos_por_dia: Dict[Tuple[int, int], List[Tuple[cp_model.IntVar, int, int, TurnoCandidato]]] = {}
+        # (sucursal_id, dia_id, franja, rol_id) -> variables que cubren la franja
+        self.cobertura: Dict[Tuple[int, int, int, int], List[cp_model.IntVar]] = {}
+        # (sucursal_id, dia_id, franja, rol_id) -> colaboradores asignados en la franja
+        self.ocupacion: Dict[Tuple[int, int, int, int], cp_model.IntVar] = {}
+        # (sucursal_id, dia_id, hora, rol_id) -> variable de faltante
+        self.faltantes: Dict[Tuple[int, int, time, int], cp_model.IntVar] = {}
+        self.trabaja: Dict[Tuple[int, int], cp_model.IntVar] = {}
+        self.minutos_dia: Dict[Tuple[int, int], cp_model.LinearExpr] = {}
+        self.minutos_semana: Dict[int, cp_model.LinearExpr] = {}
+        self.terminos_objetivo: List[cp_model.LinearExpr] = []
+        # (colaborador_id, sucursal_id, dia_id, rol_id, bloques en minutos) -> variable
+        self._indice_turnos: Dict[tuple, cp_model.IntVar] = {}
+        self.variables_previas: List[cp_model.IntVar] = []
+        self.hint_cargado = False
+        self.hint_completo = False
+        self.reparar_hint = False
+
+        self._construir()
+
+    # ✅ CONSTRUCCIÓN DEL MODELO
+
+    def candidatos(
+        self,
+        datos: DatosSemanaSucursal,
+        dia_id: int,
+        colaborador: ColaboradorDisponible
+    ) -> List[TurnoCandidato]:
+        """
+        Devuelve los turnos candidatos de un día en una sucursal según el tipo de horario del colaborador.
+        """
+        clave = (datos.sucursal_id, dia_id, colaborador.horario_corrido, colaborador.horas_por_dia_max)
+        if clave not in self._candidatos:
+            ventana = datos.ventana(dia_id)
+            if ventana is None:
+                self._candidatos[clave] = []
+            else:
+                self._candidatos[clave] = generar_candidatos(
+                    ventana, colaborador.horario_corrido, colaborador.horas_por_dia_max, self.paso_minutos
+                )
+        return self._candidatos[clave]
+
+    def _construir(self):
+        modelo = self.modelo
+
+        for colaborador_id, colaborador in self.colaboradores.items():
+            minutos_semana = []
+            for dia_id in range(1, 8):
+                variables_dia = []
+                if fecha_de_dia(self.semana_inicio, dia_id) not in colaborador.fechas_no_disponibles:
+                    for datos, participacion in self.participaciones[colaborador_id]:
+                        sucursal_id = datos.sucursal_id
+                        for rol_id in participacion.roles:
+                            if datos.capacidades.get(rol_id, 0) <= 0:
+                                continue
+                            for indice, turno in enumerate(self.candidatos(datos, dia_id, colaborador)):
+                                variable = modelo.NewBoolVar(
+                                    f"x_c{colaborador_id}_s{sucursal_id}_d{dia_id}_r{rol_id}_t{indice}"
+                                )
+                                self.asignaciones[(colaborador_id, sucursal_id, dia_id, rol_id, indice)] = variable
+                                self._indice_turnos[
+                                    (colaborador_id, sucursal_id, dia_id, rol_id, tuple(turno.bloques))
+                                ] = variable
+                                variables_dia.append((variable, sucursal_id, rol_id, turno))
+                                for franja in turno.franjas:
+                                    self.cobertura.setdefault((sucursal_id, dia_id, franja, rol_id), []).append(variable)
+
+                trabaja = modelo.NewBoolVar(f"trabaja_c{colaborador_id}_d{dia_id}")
+                modelo.Add(cp_model.LinearExpr.Sum([opcion[0] for opcion in variables_dia]) == trabaja)
+                minutos = cp_model.LinearExpr.WeightedSum(
+                    [opcion[0] for opcion in variables_dia],
+                    [opcion[3].duracion for opcion in variables_dia],
+                )
+                self.turnos_por_dia[(colaborador_id, dia_id)] = variables_dia
+                self.trabaja[(colaborador_id, dia_id)] = trabaja
+                self.minutos_dia[(colaborador_id, dia_id)] = minutos
+                minutos_semana.append(minutos)
+
+            total = cp_model.LinearExpr.Sum(minutos_semana)
+            contratados = colaborador.horas_semanales * 60
+            no_asignados = modelo.NewIntVar(0, contratados, f"no_asignados_c{colaborador_id}")
+            modelo.Add(total + no_asignados == contratados)
+            self.minutos_semana[colaborador_id] = total
+            self.terminos_objetivo.append(PESO_MINUTO_NO_ASIGNADO * no_asignados)
+
+        self._agregar_capacidades()
+        self._agregar_minimos()
+
+    def _agregar_capacidades(self):
+        # La ocupación de cada franja se modela una sola vez y la usan tanto la
+        # capacidad como los mínimos, evitando repetir las sumas en el modelo.
+        for clave, variables in self.cobertura.items():
+            sucursal_id, dia_id, franja, rol_id = clave
+            datos = self.sucursales[sucursal_id]
+            libre = datos.capacidades.get(rol_id, 0) - datos.ocupacion_fija.get((dia_id, franja, rol_id), 0)
+            capacidad = max(0, min(libre, len(variables)))
+            ocupacion = self.modelo.NewIntVar(0, capacidad, f"ocupacion_s{sucursal_id}_d{dia_id}_f{franja}_r{rol_id}")
+            self.modelo.Add(cp_model.LinearExpr.Sum(variables) == ocupacion)
+            self.ocupacion[clave] = ocupacion
+
+    def _agregar_minimos(self):
+        for sucursal_id, datos in self.sucursales.items():
+            for (dia_id, hora, rol_id), cantidad in datos.minimos.items():
+                ventana = datos.ventana(dia_id)
+                if cantidad <= 0 or ventana is None:
+                    continue
+                inicio = a_minutos(hora)
+                if inicio < ventana[0]:
+                    inicio += MINUTOS_DIA
+                faltante = self.modelo.NewIntVar(0, cantidad, f"faltante_s{sucursal_id}_d{dia_id}_h{inicio}_r{rol_id}")
+                self.faltantes[(sucursal_id, dia_id, hora, rol_id)] = faltante
+                self.terminos_objetivo.append(PESO_FALTANTE * faltante)
+                for franja in range(inicio, inicio + 60, self.paso_minutos):
+                    ocupacion = self.ocupacion.get((sucursal_id, dia_id, franja, rol_id), 0)
+                    fija = datos.ocupacion_fija.get((dia_id, franja, rol_id), 0)
+                    self.modelo.Add(ocupacion + faltante >= cantidad - fija)
+
+    # ✅ WARM START
+
+    def _clave_turno(self, turno: TurnoGenerado) -> Optional[tuple]:
+        datos = self.sucursales.get(turno.sucursal_id)
+        bloques = datos.bloques_en_minutos(turno.dia_id, turno.bloques) if datos else None
+        if bloques is None:
+            return None
+        return (turno.colaborador_id, turno.sucursal_id, turno.dia_id, turno.rol_colaborador_id, tuple(bloques))
+
+    def agregar_turnos_previos(
+        self,
+        turnos: List[TurnoGenerado],
+        peso_cambio: int = PESO_CAMBIO,
+        reparar_hint: bool = False
+    ) -> int:
+        """
+        Usa turnos ya publicados (por ejemplo, los de la semana anterior trasladados a
+        esta semana) como punto de partida de la búsqueda.
+
+        Los turnos que siguen siendo posibles se cargan como hint de la solución y cada
+        uno que no se mantenga se penaliza en el objetivo, de modo que el motor solo
+        cambia lo necesario (nuevas vacaciones, mínimos o colaboradores). Como con
+        `agregar_hint`, al resolver se intenta completar el hint para que la búsqueda
+        parta de él.
+
+        Args:
+            turnos (List[TurnoGenerado]): Turnos previos, con fechas de la semana a generar.
+            peso_cambio (int): Penalización por cada turno previo que no se mantiene.
+            reparar_hint (bool): Si CP-SAT debe reparar el hint en lugar de completarlo. La
+                reparación no respeta el tiempo límite, por eso está desactivada por defecto.
+
+        Returns:
+            int: Cantidad de turnos previos que tienen un candidato equivalente en el modelo.
+        """
+        previas = []
+        for turno in turnos:
+            variable = self._indice_turnos.get(self._clave_turno(turno))
+            if variable is not None:
+                previas.append(variable)
+
+        self._cargar_hint(previas)
+        self.reparar_hint = reparar_hint
+        self.variables_previas = previas
+        if previas:
+            self.terminos_objetivo.append(peso_cambio * (len(previas) - cp_model.LinearExpr.Sum(previas)))
+        return len(previas)
+
+    def agregar_hint(self, turnos: List[TurnoGenerado]) -> int:
+        """
+        Carga turnos (por ejemplo, los de la heurística constructiva) como hint de la
+        solución, sin penalizar que el motor los cambie. Al resolver se intenta completar
+        el hint; si no cumple el modelo no se repara (la reparación de CP-SAT no respeta
+        el tiempo límite) y alcanza con usarlo como guía de la búsqueda.
+
+        Returns:
+            int: Cantidad de turnos que tienen un candidato equivalente en el modelo.
+        """
+        variables = [self._indice_turnos.get(self._clave_turno(turno)) for turno in turnos]
+        variables = [variable for variable in variables if variable is not None]
+        self._cargar_hint(variables)
+        self.reparar_hint = False
+        return len(variables)
+
+    def _completar_hint(self, tiempo_limite: float):
+        # CP-SAT solo arranca desde el hint si es una solución completa: si las
+        # asignaciones del hint cumplen el modelo, se fijan y se completan el resto de
+        # las variables (ocupación, faltantes, literales de la especificación)
+        solucion = self._resolver_con_hint_fijo(tiempo_limite)
+        if solucion is None:
+            return
+        variables = [self.modelo.GetIntVarFromProtoIndex(indice) for indice in range(len(self.modelo.Proto().variables))]
+        self.modelo.ClearHints()
+        for variable in variables:
+            self.modelo.AddHint(variable, solucion.Value(variable))
+        self.hint_completo = True
+
+    def _resolver_con_hint_fijo(self, tiempo_limite: float) -> Optional[cp_model.CpSolver]:
+        # Con todas las asignaciones fijas la resolución es casi pura propagación
+        self.modelo.Minimize(cp_model.LinearExpr.Sum(self.terminos_objetivo))
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = tiempo_limite
+        solver.parameters.num_workers = 1
+        solver.parameters.fix_variables_to_their_hinted_value = True
+        estado = solver.Solve(self.modelo)
+        return solver if estado in (cp_model.OPTIMAL, cp_model.FEASIBLE) else None
+
+    def _cargar_hint(self, variables: List[cp_model.IntVar]):
+        indices = {variable.Index() for variable in variables}
+        self.hint_cargado = True
+        self.hint_completo = False
+        self.modelo.ClearHints()
+        for variable in self.asignaciones.values():
+            self.modelo.AddHint(variable, variable.Index() in indices)
+
+    # ✅ RESOLUCIÓN
+
+    def resolver(
+        self,
+        al_mejorar: Optional[Callable[[ObservadorSoluciones], None]] = None,
+        detener=None
+    ) -> ResultadoGeneracion:
+        """
+        Resuelve el modelo y devuelve los turnos de la mejor solución encontrada. Si hay
+        un hint cargado, primero se intenta completarlo con una parte del tiempo límite
+        (FRACCION_COMPLETAR_HINT); lo que tarda se descuenta de la búsqueda.
+
+        Args:
+            al_mejorar (Optional[Callable[[ObservadorSoluciones], None]]): Función que se
+                invoca con cada solución que mejora el objetivo durante la búsqueda.
+            detener: Evento (threading o multiprocessing) que, al activarse, corta la
+                búsqueda y devuelve la mejor solución encontrada hasta ese momento.
+        """
+        inicio = perf_counter()
+        tiempo_completar = min(TIEMPO_VERIFICACION, self.tiempo_limite * FRACCION_COMPLETAR_HINT)
+        if (
+            self.hint_cargado and not self.hint_completo and not self.reparar_hint
+            and tiempo_completar >= TIEMPO_MINIMO_COMPLETAR_HINT
+        ):
+            self._completar_hint(tiempo_completar)
+        self.modelo.Minimize(cp_model.LinearExpr.Sum(self.terminos_objetivo))
+
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = max(self.tiempo_limite - (perf_counter() - inicio), 0.0)
+        solver.parameters.num_workers = self.workers
+        if self.gap_relativo:
+            solver.parameters.relative_gap_limit = self.gap_relativo
+        if self.hint_completo:
+            # Sin esto el presolve puede descartar el hint y la búsqueda no parte de él
+            solver.parameters.keep_all_feasible_solutions_in_presolve = True
+        elif self.hint_cargado and self.reparar_hint:
+            # Los turnos del hint pueden no ser válidos (vacaciones nuevas, reglas de la especificación, etc.)
+            solver.parameters.repair_hint = True
+
+        observador = ObservadorSoluciones(self, al_mejorar) if al_mejorar else None
+        finalizado = threading.Event()
+        if detener is not None:
+            threading.Thread(target=self._vigilar_detencion, args=(solver, detener, finalizado), daemon=True).start()
+        try:
+            estado = solver.Solve(self.modelo, observador)
+        finally:
+            finalizado.set()
+        tiempo = perf_counter() - inicio
+        nombre_estado = solver.StatusName(estado)
+
+        if estado not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return ResultadoGeneracion(estado=nombre_estado, turnos=[], tiempo_segundos=tiempo)
+
+        return ResultadoGeneracion(
+            estado=nombre_estado,
+            turnos=self.extraer_turnos(solver),
+            objetivo=solver.ObjectiveValue(),
+            cota=solver.BestObjectiveBound(),
+            tiempo_segundos=tiempo,
+            faltantes={
+                clave: solver.Value(variable)
+                for clave, variable in self.faltantes.items()
+                if solver.Value(variable) > 0
+            },
+            cambios=(
+                sum(1 for variable in self.variables_previas if not solver.Value(variable))
+                if self.variables_previas else None
+            ),
+        )
+
+    def verificar(self, turnos: List[TurnoGenerado], tiempo_limite: float = TIEMPO_VERIFICACION) -> bool:
+        """
+        Comprueba si los turnos (por ejemplo, los de la heurística) cumplen todas las
+        restricciones del modelo, incluidas las agregadas por la especificación. Fija
+        cada asignación al valor de los turnos, por lo que alcanza con la propagación.
+
+        Returns:
+            bool: True si los turnos son una solución válida del modelo.
+        """
+        variables = [self._indice_turnos.get(self._clave_turno(turno)) for turno in turnos]
+        if any(variable is None for variable in variables):
+            return False
+        self._cargar_hint(variables)
+        return self._resolver_con_hint_fijo(tiempo_limite) is not None
+
+    @staticmethod
+    def _vigilar_detencion(solver: cp_model.CpSolver, detener, finalizado: threading.Event):
+        # StopSearch no tiene efecto si la búsqueda aún no arrancó, por eso se repite
+        # mientras el evento siga activo y el solver no haya terminado.
+        while not finalizado.is_set():
+            if detener.wait(0.2):
+                solver.StopSearch()
+                finalizado.wait(0.2)
+
+    def cobertura_minimos(self, solucion) -> List[dict]:
+        """
+        Compara la cobertura de una solución (CpSolver o callback) con los mínimos
+        requeridos por día/hora/rol de cada sucursal.
+
+        Returns:
+            List[dict]: Un elemento por mínimo con los colaboradores requeridos y los
+                cubiertos en la franja menos cubierta de esa hora.
+        """
+        cobertura = []
+        for sucursal_id, datos in self.sucursales.items():
+            for (dia_id, hora, rol_id), cantidad in datos.minimos.items():
+                ventana = datos.ventana(dia_id)
+                if cantidad <= 0 or ventana is None:
+                    continue
+                inicio = a_minutos(hora)
+                if inicio < ventana[0]:
+                    inicio += MINUTOS_DIA
+                # El faltante del modelo solo es exacto en la solución óptima; se usa la ocupación
+                cubiertos = min(
+                    (solucion.Value(self.ocupacion[clave]) if clave in self.ocupacion else 0)
+                    + datos.ocupacion_fija.get(clave[1:], 0)
+                    for clave in (
+                        (sucursal_id, dia_id, franja, rol_id)
+                        for franja in range(inicio, inicio + 60, self.paso_minutos)
+                    )
+                )
+                cobertura.append({
+                    "sucursal_id": sucursal_id,
+                    "dia_id": dia_id,
+                    "hora": hora.strftime("%H:%M"),
+                    "rol_colaborador_id": rol_id,
+                    "requeridos": cantidad,
+                    "cubiertos": min(cubiertos, cantidad),
+                })
+        return cobertura
+
+    def extraer_turnos(self, solucion) -> List[TurnoGenerado]:
+        """
+        Convierte los valores de una solución (CpSolver o callback) en turnos.
+        """
+        turnos = []
+        for (colaborador_id, dia_id), opciones in self.turnos_por_dia.items():
+            for variable, sucursal_id, rol_id, turno in opciones:
+                if solucion.Value(variable):
+                    turnos.append(TurnoGenerado(
+                        sucursal_id=sucursal_id,
+                        colaborador_id=colaborador_id,
+                        rol_colaborador_id=rol_id,
+                        dia_id=dia_id,
+                        fecha=fecha_de_dia(self.semana_inicio, dia_id),
+                        bloques=turno.bloques_como_horas(),
+                    ))
+        return turnos
@@ -20,6 +20,8 @@ from application.routes.dia_routes import router as dias_router
 from application.routes.formato_routes import router as formatos_router
 from application.routes.puestos_routes import router as puestos_router
 
+from application.services.trabajo_generacion_service import iniciar_cola_trabajos, detener_cola_trabajos
+
 from fastapi.middleware.cors import CORSMiddleware
 
 from application.config.logger_config import setup_logger
@@ -59,6 +61,16 @@ app.include_router(vta_hora_router)
 app.include_router(auth_router)
 app.include_router(usuario_router)
 
+@app.on_event("startup")
+def iniciar_trabajos():
+    # Retoma los trabajos pendientes y los que quedaron sin terminar en un proceso detenido;
+    # con varios workers cada trabajo lo reclama uno solo
+    iniciar_cola_trabajos()
+
+@app.on_event("shutdown")
+def detener_trabajos():
+    detener_cola_trabajos()
+
 @app.get("/")
 async def read_root():
     return {"mensaje": "¡Hola, FastAPI!"}
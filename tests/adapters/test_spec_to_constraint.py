@@ -0,0 +1,116 @@
+from datetime import date, time
+from domain.models.colaborador import TIEMPO_COMPLETO, TIEMPO_PARCIAL
+from domain.specs.base_conjunctions import AndSpecification, OrSpecification, NotSpecification
+from domain.specs.horario_specs import (
+    DiaLibreSpecification,
+    HorarioCortadoSpecification,
+    HorarioRespetaHorasSemanales,
+    HorarioValidoSpecification,
+    HorariosPorDefectoSpecification,
+)
+from infrastructure.adapters.spec_to_constraint import aplicar_especificacion
+from infrastructure.solvers.solver import ColaboradorDisponible, DatosSemanaSucursal, GeneradorHorarios
+
+
+def resolver(colaborador, spec):
+    datos = DatosSemanaSucursal(
+        sucursal_id=1,
+        semana_inicio=date(2025, 1, 6),
+        horarios_atencion={dia_id: (time(8, 0), time(22, 0)) for dia_id in range(1, 8)},
+        minimos={},
+        capacidades={1: 1},
+        colaboradores=[colaborador],
+    )
+    generador = GeneradorHorarios(datos, tiempo_limite=5)
+    aplicar_especificacion(spec, generador)
+    return generador.resolver()
+
+
+def duraciones(resultado):
+    return sorted(
+        sum((fin.hour - inicio.hour) * 60 for inicio, fin in turno.bloques) // 60
+        for turno in resultado.turnos
+    )
+
+
+def test_dia_libre_tiempo_completo():
+    """
+    Un colaborador de TIEMPO_COMPLETO con 42 horas de 6 por día trabajaría los 7 días;
+    la especificación le deja al menos uno libre.
+    """
+    colaborador = ColaboradorDisponible(1, [1], 6, 42, tipo_empleado=TIEMPO_COMPLETO)
+    resultado = resolver(colaborador, DiaLibreSpecification())
+
+    assert resultado.factible
+    assert len(resultado.turnos) <= 6
+
+
+def test_not_dia_libre_obliga_a_trabajar_toda_la_semana():
+    """
+    La negación de DiaLibre exige que el colaborador trabaje los 7 días.
+    """
+    colaborador = ColaboradorDisponible(1, [1], 6, 42, tipo_empleado=TIEMPO_COMPLETO)
+    resultado = resolver(colaborador, NotSpecification(DiaLibreSpecification()))
+
+    assert resultado.factible
+    assert len(resultado.turnos) == 7
+
+
+def test_horarios_por_defecto_tiempo_completo():
+    """
+    TIEMPO_COMPLETO: 3 días de 7 horas y 3 días de 8 horas.
+    """
+    colaborador = ColaboradorDisponible(1, [1], 8, 45, tipo_empleado=TIEMPO_COMPLETO)
+    spec = AndSpecification(HorariosPorDefectoSpecification(), HorarioRespetaHorasSemanales())
+    resultado = resolver(colaborador, spec)
+
+    assert resultado.factible
+    assert duraciones(resultado) == [7, 7, 7, 8, 8, 8]
+
+
+def test_horario_cortado_poda_turnos_invalidos():
+    """
+    Un colaborador con horario cortado solo recibe turnos de dos bloques que suman 7 u 8 horas.
+    """
+    colaborador = ColaboradorDisponible(1, [1], 8, 45, horario_corrido=False, tipo_empleado=TIEMPO_COMPLETO)
+    resultado = resolver(colaborador, HorarioCortadoSpecification())
+
+    assert resultado.factible
+    assert resultado.turnos
+    for turno in resultado.turnos:
+        assert len(turno.bloques) == 2
+    assert set(duraciones(resultado)) <= {7, 8}
+
+
+def test_or_admite_cualquiera_de_las_alternativas():
+    """
+    Con Or basta con que se cumpla una de las especificaciones: un colaborador de
+    TIEMPO_PARCIAL con 30 horas cumple los horarios por defecto (6 días de 5 horas).
+    """
+    colaborador = ColaboradorDisponible(1, [1], 5, 30, tipo_empleado=TIEMPO_PARCIAL)
+    spec = OrSpecification(HorariosPorDefectoSpecification(), NotSpecification(HorarioRespetaHorasSemanales()))
+    resultado = resolver(colaborador, AndSpecification(spec, HorarioRespetaHorasSemanales()))
+
+    assert resultado.factible
+    assert duraciones(resultado) == [5] * 6
+
+
+def test_turnos_que_cruzan_la_medianoche_no_se_podan():
+    """
+    En una sucursal nocturna los únicos turnos que cubren la madrugada cruzan la
+    medianoche: las reglas por turno no los descartan y la madrugada queda cubierta.
+    """
+    datos = DatosSemanaSucursal(
+        sucursal_id=1,
+        semana_inicio=date(2025, 1, 6),
+        horarios_atencion={dia_id: (time(18, 0), time(2, 0)) for dia_id in range(1, 6)},
+        minimos={(dia_id, time(hora, 0), 1): 1 for dia_id in range(1, 6) for hora in (0, 1)},
+        capacidades={1: 1},
+        colaboradores=[ColaboradorDisponible(1, [1], 8, 40, tipo_empleado=TIEMPO_COMPLETO)],
+    )
+    generador = GeneradorHorarios(datos, tiempo_limite=5)
+    aplicar_especificacion(AndSpecification(HorarioValidoSpecification(), HorarioCortadoSpecification()), generador)
+    resultado = generador.resolver()
+
+    assert resultado.factible and not resultado.faltantes
+    assert all(fin < inicio for turno in resultado.turnos for inicio, fin in turno.bloques)
@@ -0,0 +1,164 @@
+"""
+Benchmark del motor de generación de horarios sobre sucursales sintéticas.
+
+Cada escenario se resuelve en un proceso propio con el mismo camino que la generación
+real (`resolver_grupo`: heurística como hint + CP-SAT con las reglas por defecto) y se
+registran tiempo total, tiempo a la primera solución factible, brecha del objetivo y
+memoria. El resultado se escribe en JSON para comparar cambios del motor entre commits
+sin una base MySQL.
+
+Uso:
+    python -m tests.benchmarks.benchmark_solver --salida bench_output.json
+    python -m tests.benchmarks.benchmark_solver --escenarios chica mediana --tiempo-limite 5
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from ortools import __version__ as version_ortools
+
+from application.use_cases.generar_horarios import REGLAS_POR_DEFECTO, resolver_grupo
+from infrastructure.solvers.heuristica import GeneradorHeuristico
+from infrastructure.solvers.solver import ESTADO_HEURISTICO
+from tests.benchmarks.sinteticos import EscenarioSintetico, generar_sucursal
+
+ESCENARIOS: Dict[str, EscenarioSintetico] = {
+    escenario.nombre: escenario
+    for escenario in [
+        EscenarioSintetico("chica", colaboradores=8, roles=1, semilla=1),
+        EscenarioSintetico("mediana", colaboradores=20, roles=2, semilla=2),
+        EscenarioSintetico("grande", colaboradores=45, roles=3, cierre=time(23, 0), dias=tuple(range(1, 8)), semilla=3),
+        EscenarioSintetico("nocturna", colaboradores=30, roles=2, apertura=time(16, 0), cierre=time(4, 0), semilla=4),
+    ]
+}
+
+
+def _memoria_maxima_mb() -> float:
+    # Pico de memoria residente del proceso (incluye CP-SAT); ru_maxrss está en KB en Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2)
+
+
+def _gap(objetivo: Optional[float], cota: Optional[float]) -> Optional[float]:
+    if objetivo is None or cota is None:
+        return None
+    return round(abs(objetivo - cota) / max(1.0, abs(objetivo)), 6)
+
+
+def ejecutar_escenario(escenario: EscenarioSintetico, tiempo_limite: float, workers: int) -> dict:
+    """
+    Genera la sucursal del escenario, la resuelve y devuelve las métricas.
+    """
+    memoria_inicial = _memoria_maxima_mb()
+    inicio = perf_counter()
+    datos = generar_sucursal(escenario)
+    segundos_datos = perf_counter() - inicio
+
+    heuristica = GeneradorHeuristico(datos).resolver()
+
+    primeras: List[float] = []
+
+    def al_mejorar(observador):
+        primeras.append(observador.segundos)
+
+    inicio = perf_counter()
+    resultado = resolver_grupo([datos], tiempo_limite, workers, REGLAS_POR_DEFECTO, al_mejorar=al_mejorar)
+    segundos_total = perf_counter() - inicio
+    # Si CP-SAT no encontró solución, resolver_grupo devuelve la heurística
+    segundos_solver = None if resultado.estado == ESTADO_HEURISTICO else resultado.tiempo_segundos
+
+    return {
+        "escenario": escenario.to_dict(),
+        "minimos": sum(datos.minimos.values()),
+        "horas_contratadas": sum(colaborador.horas_semanales for colaborador in datos.colaboradores),
+        "estado": resultado.estado,
+        "objetivo": resultado.objetivo,
+        "cota": resultado.cota,
+        "gap": _gap(resultado.objetivo, resultado.cota),
+        "faltantes": sum(resultado.faltantes.values()),
+        "turnos": len(resultado.turnos),
+        "soluciones": len(primeras),
+        "segundos_datos": round(segundos_datos, 4),
+        # Incluye la heurística que se carga como hint y la construcción del modelo
+        "segundos_total": round(segundos_total, 4),
+        "segundos_solver": round(segundos_solver, 4) if segundos_solver is not None else None,
+        "segundos_modelo": round(segundos_total - segundos_solver, 4) if segundos_solver is not None else None,
+        "segundos_primera_solucion": round(primeras[0], 4) if primeras else None,
+        "heuristica": {
+            "objetivo": heuristica.objetivo,
+            "faltantes": sum(heuristica.faltantes.values()),
+            "segundos": round(heuristica.tiempo_segundos, 4),
+        },
+        "memoria": {
+            "inicial_mb": memoria_inicial,
+            "pico_mb": _memoria_maxima_mb(),
+        },
+    }
+
+
+def _commit_actual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def ejecutar_benchmark(nombres: List[str], tiempo_limite: float, workers: int) -> dict:
+    """
+    Ejecuta los escenarios indicados, cada uno en un proceso nuevo para que la memoria
+    de uno no contamine la medición del siguiente.
+    """
+    resultados = []
+    for nombre in nombres:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            resultados.append(executor.submit(ejecutar_escenario, ESCENARIOS[nombre], tiempo_limite, workers).result())
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit_actual(),
+        "python": platform.python_version(),
+        "ortools": version_ortools,
+        "cpus": os.cpu_count(),
+        "tiempo_limite": tiempo_limite,
+        "workers": workers,
+        "resultados": resultados,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del motor de generación de horarios.")
+    parser.add_argument("--escenarios", nargs="+", choices=sorted(ESCENARIOS), default=list(ESCENARIOS))
+    parser.add_argument("--tiempo-limite", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--salida", default="bench_output.json", help="Archivo JSON de resultados ('-' para stdout).")
+    args = parser.parse_args(argv)
+
+    reporte = ejecutar_benchmark(args.escenarios, args.tiempo_limite, args.workers)
+    contenido = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if args.salida == "-":
+        print(contenido)
+    else:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido + "\n")
+        for resultado in reporte["resultados"]:
+            print(
+                f"{resultado['escenario']['nombre']:>10}: {resultado['estado']:<9} "
+                f"objetivo={resultado['objetivo']} gap={resultado['gap']} "
+                f"primera={resultado['segundos_primera_solucion']}s total={resultado['segundos_total']}s "
+                f"memoria={resultado['memoria']['pico_mb']}MB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
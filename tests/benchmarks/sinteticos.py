@@ -0,0 +1,188 @@
+"""
+Generadores de sucursales sintéticas para el benchmark del motor de horarios.
+
+La demanda del rol principal se arma con la misma forma que devuelve `VentasPorHora`
+((sucursal, fecha, hora) -> conteo de facturas por categoría) y se convierte en mínimos
+con `calcular_personas`, igual que la vista de personas por hora. Todo se genera a
+partir de una semilla, por lo que el mismo escenario produce siempre los mismos datos.
+"""
+
+import math
+import random
+from datetime import date, time, timedelta
+from typing import Dict, List, Tuple
+
+from domain.models.colaborador import TIEMPO_COMPLETO, TIEMPO_PARCIAL, HORARIO_ESPECIAL
+from domain.models.venta_hora import calcular_personas
+from infrastructure.solvers.solver import ColaboradorDisponible, DatosSemanaSucursal
+
+LUNES = date(2025, 1, 6)
+
+# Rol que sigue la curva de ventas; el resto de los roles tiene un mínimo fijo
+ROL_PRINCIPAL = 1
+
+# (tipo, horas por día máximas, horas semanales, proporción del plantel)
+TIPOS_EMPLEADO = [
+    (TIEMPO_COMPLETO, 8, 45, 0.6),
+    (TIEMPO_PARCIAL, 5, 30, 0.3),
+    (HORARIO_ESPECIAL, 11, 22, 0.1),
+]
+
+# Picos de facturación (hora del día, ancho en horas, peso relativo)
+PICOS_VENTAS = [(11.5, 1.5, 1.0), (18.5, 2.0, 0.8)]
+
+# Proporción de las horas contratadas que se destina a cubrir mínimos
+OCUPACION_OBJETIVO = 0.7
+
+TIEMPO_PROMEDIO_FACTURA = 5
+
+
+class EscenarioSintetico:
+    def __init__(
+        self,
+        nombre: str,
+        colaboradores: int,
+        roles: int = 2,
+        apertura: time = time(8, 0),
+        cierre: time = time(21, 0),
+        dias: Tuple[int, ...] = (1, 2, 3, 4, 5, 6),
+        cortados: float = 0.2,
+        semilla: int = 0
+    ):
+        """
+        Parámetros de una sucursal sintética.
+
+        Args:
+            nombre (str): Nombre del escenario en el reporte.
+            colaboradores (int): Cantidad de colaboradores de la sucursal.
+            roles (int): Cantidad de roles; el rol 1 sigue la curva de ventas.
+            apertura (time): Hora de apertura de todos los días.
+            cierre (time): Hora de cierre; anterior a la apertura si cierra después de medianoche.
+            dias (Tuple[int, ...]): dia_id en los que la sucursal atiende.
+            cortados (float): Proporción de colaboradores con horario cortado.
+            semilla (int): Semilla de los generadores aleatorios.
+        """
+        self.nombre = nombre
+        self.colaboradores = colaboradores
+        self.roles = roles
+        self.apertura = apertura
+        self.cierre = cierre
+        self.dias = dias
+        self.cortados = cortados
+        self.semilla = semilla
+
+    def to_dict(self) -> dict:
+        return {
+            "nombre": self.nombre,
+            "colaboradores": self.colaboradores,
+            "roles": self.roles,
+            "apertura": self.apertura.strftime("%H:%M"),
+            "cierre": self.cierre.strftime("%H:%M"),
+            "dias": list(self.dias),
+            "cortados": self.cortados,
+            "semilla": self.semilla,
+        }
+
+
+def horas_de_atencion(apertura: time, cierre: time) -> List[int]:
+    """Horas (0-23) en las que comienza cada franja de una hora con la sucursal abierta."""
+    duracion = (cierre.hour - apertura.hour) % 24 or 24
+    return [(apertura.hour + indice) % 24 for indice in range(duracion)]
+
+
+def generar_ventas_por_hora(
+    sucursal_id: int,
+    semana_inicio: date,
+    dias: Tuple[int, ...],
+    horas: List[int],
+    facturas_por_semana: int,
+    rng: random.Random
+) -> Dict[Tuple[int, date, int], Dict[str, int]]:
+    """
+    Genera facturas por hora con dos picos diarios y ruido, con la forma de
+    `VentasPorHora.obtener_ventas()`.
+    """
+    pesos = {}
+    for dia_id in dias:
+        factor_dia = rng.uniform(0.8, 1.2) * (1.15 if dia_id >= 5 else 1.0)
+        for hora in horas:
+            curva = sum(peso * math.exp(-((hora + 0.5 - pico) / ancho) ** 2) for pico, ancho, peso in PICOS_VENTAS)
+            pesos[(dia_id, hora)] = factor_dia * (0.15 + curva) * rng.uniform(0.9, 1.1)
+
+    escala = facturas_por_semana / sum(pesos.values())
+    ventas = {}
+    for (dia_id, hora), peso in pesos.items():
+        total = round(peso * escala)
+        pami = round(total * rng.uniform(0.2, 0.35))
+        obra_social = round((total - pami) * rng.uniform(0.3, 0.5))
+        fecha = semana_inicio + timedelta(days=dia_id - 1)
+        ventas[(sucursal_id, fecha, hora)] = {
+            "PAMI": pami,
+            "Obra Social": obra_social,
+            "Particular": total - pami - obra_social,
+            "Total": total,
+        }
+    return ventas
+
+
+def generar_colaboradores(escenario: EscenarioSintetico, id_inicial: int, rng: random.Random) -> List[ColaboradorDisponible]:
+    colaboradores = []
+    for indice in range(escenario.colaboradores):
+        tipo, horas_dia, horas_semana, _ = rng.choices(TIPOS_EMPLEADO, weights=[t[3] for t in TIPOS_EMPLEADO])[0]
+        # Todos cubren el rol principal salvo una parte que solo cubre los secundarios
+        if escenario.roles > 1 and indice % 4 == 3:
+            roles = [rng.randint(2, escenario.roles)]
+        else:
+            roles = [ROL_PRINCIPAL] + [rol for rol in range(2, escenario.roles + 1) if rng.random() < 0.3]
+        colaboradores.append(ColaboradorDisponible(
+            id=id_inicial + indice,
+            roles=roles,
+            horas_por_dia_max=horas_dia,
+            horas_semanales=horas_semana,
+            horario_corrido=tipo == HORARIO_ESPECIAL or rng.random() >= escenario.cortados,
+            tipo_empleado=tipo,
+            nombre=f"Colaborador {id_inicial + indice}",
+        ))
+    return colaboradores
+
+
+def generar_sucursal(escenario: EscenarioSintetico, sucursal_id: int = 1, semana_inicio: date = LUNES) -> DatosSemanaSucursal:
+    """
+    Arma los datos de una semana de una sucursal sintética.
+
+    Los mínimos del rol principal salen de las ventas por hora; los roles secundarios
+    piden un colaborador por franja. El volumen de ventas se escala para que los mínimos
+    consuman cerca de `OCUPACION_OBJETIVO` de las horas contratadas.
+    """
+    rng = random.Random(escenario.semilla * 1000 + sucursal_id)
+    horas = horas_de_atencion(escenario.apertura, escenario.cierre)
+    colaboradores = generar_colaboradores(escenario, sucursal_id * 10000, rng)
+
+    horas_contratadas = sum(colaborador.horas_semanales for colaborador in colaboradores)
+    franjas = len(escenario.dias) * len(horas)
+    horas_secundarias = franjas * (escenario.roles - 1)
+    horas_principal = max(franjas, OCUPACION_OBJETIVO * horas_contratadas - horas_secundarias)
+    facturas_por_hora = 60 / TIEMPO_PROMEDIO_FACTURA
+    ventas = generar_ventas_por_hora(
+        sucursal_id, semana_inicio, escenario.dias, horas, int(horas_principal * facturas_por_hora), rng
+    )
+    personas = calcular_personas(ventas, TIEMPO_PROMEDIO_FACTURA)
+
+    minimos = {}
+    for (_, fecha, hora), cantidad in personas.items():
+        minimos[(fecha.weekday() + 1, time(hora, 0), ROL_PRINCIPAL)] = max(1, cantidad)
+        for rol in range(2, escenario.roles + 1):
+            minimos[(fecha.weekday() + 1, time(hora, 0), rol)] = 1
+
+    capacidades = {ROL_PRINCIPAL: max(personas.values()) + 1}
+    capacidades.update({rol: 2 for rol in range(2, escenario.roles + 1)})
+
+    return DatosSemanaSucursal(
+        sucursal_id=sucursal_id,
+        semana_inicio=semana_inicio,
+        horarios_atencion={dia_id: (escenario.apertura, escenario.cierre) for dia_id in escenario.dias},
+        minimos=minimos,
+        capacidades=capacidades,
+        colaboradores=colaboradores,
+        nombres_roles={rol: f"Rol {rol}" for rol in range(1, escenario.roles + 1)},
+    )
@@ -0,0 +1,30 @@
+import json
+
+from tests.benchmarks.benchmark_solver import ESCENARIOS, ejecutar_escenario
+from tests.benchmarks.sinteticos import EscenarioSintetico, ROL_PRINCIPAL, generar_sucursal
+
+
+def test_sucursal_sintetica_es_reproducible_y_sigue_la_curva_de_ventas():
+    escenario = EscenarioSintetico("prueba", colaboradores=12, roles=2, semilla=7)
+    datos = generar_sucursal(escenario)
+    otra = generar_sucursal(escenario)
+
+    assert datos.minimos == otra.minimos
+    assert [c.roles for c in datos.colaboradores] == [c.roles for c in otra.colaboradores]
+    assert len(datos.colaboradores) == 12
+    assert set(datos.horarios_atencion) == set(escenario.dias)
+
+    lunes = {hora.hour: cantidad for (dia_id, hora, rol), cantidad in datos.minimos.items() if dia_id == 1 and rol == ROL_PRINCIPAL}
+    # Los picos de ventas son al mediodía y a la tarde, no en la apertura
+    assert max(lunes[11], lunes[18]) > lunes[8]
+    assert datos.capacidades[ROL_PRINCIPAL] > max(lunes.values())
+
+
+def test_ejecutar_escenario_devuelve_metricas_serializables():
+    metricas = ejecutar_escenario(ESCENARIOS["chica"], tiempo_limite=2, workers=1)
+
+    json.dumps(metricas)
+    assert metricas["estado"] in ("OPTIMAL", "FEASIBLE", "HEURISTIC")
+    assert metricas["objetivo"] is not None
+    assert metricas["segundos_total"] >= (metricas["segundos_solver"] or 0)
+    assert metricas["memoria"]["pico_mb"] >= metricas["memoria"]["inicial_mb"] > 0
@@ -0,0 +1,113 @@
+import json
+import re
+from datetime import date
+from types import GeneratorType
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from application.controllers import vta_hora_controller
+from application.services.venta_hora_service import agrupar_facturas, obtener_facturas
+from infrastructure.repositories import vta_hora_repo
+from infrastructure.repositories.vta_hora_repo import get_vta_hora
+
+TABLAS = """
+CREATE TABLE factcabecera (IDComprobante INTEGER, Sucursal INTEGER, Tipo TEXT, PuntoVta INTEGER, Numero INTEGER,
+    Emision DATE, Hora TEXT, IDUsuario INTEGER, IDCliente INTEGER, TotalCobertura REAL, TotalComprobante REAL, TipoIVA TEXT);
+CREATE TABLE factpagos (IDComprobante INTEGER, idmediodepago INTEGER, Importe REAL, IDTarjeta INTEGER);
+CREATE TABLE factlineas (IDComprobante INTEGER, ImporteCtaCte REAL);
+CREATE TABLE factcoberturas (IDComprobante INTEGER, IDObSoc INTEGER);
+CREATE TABLE obsociales (CodObSoc INTEGER, Descripcio TEXT);
+CREATE TABLE tarjetas (IDTarjeta INTEGER, tarjeta TEXT);
+CREATE TABLE clientes (CodCliente INTEGER, Nombre TEXT, Documento TEXT, Cuit TEXT);
+CREATE TABLE Operadores (IDOperador INTEGER, Codigo INTEGER);
+"""
+
+DATOS = """
+INSERT INTO Operadores VALUES (1, 101), (2, 102);
+INSERT INTO clientes VALUES (1, 'Pérez Juan', '20111222', NULL);
+INSERT INTO obsociales VALUES (1, 'PAMI INSSJP'), (2, 'OSDE');
+INSERT INTO tarjetas VALUES (1, 'VISA'), (2, 'MASTERCARD');
+INSERT INTO factcabecera VALUES
+    (1, 3, 'TK', 1, 10, '2025-03-03', '08:15:00', 1, 1, 0, 100, 'CF'),
+    (2, 3, 'FV', 1, 11, '2025-03-03', '09:40:00', 2, NULL, 300, 900, 'RI'),
+    (3, 3, 'NC', 1, 12, '2025-03-04', '10:05:00', 1, NULL, 50, 250, 'CF'),
+    (4, 3, 'TK', 2, 10, '2025-03-04', '18:30:00', 2, NULL, 0, 40, 'CF'),
+    (5, 3, 'TK', 2, 11, '2025-03-05', '19:00:00', 1, 1, 120, 120, 'CF'),
+    (6, 3, 'TK', 2, 12, '2025-03-05', '19:10:00', 1, NULL, 0, 80, 'XX'),
+    (7, 4, 'TK', 1, 10, '2025-03-05', '19:20:00', 1, NULL, 0, 70, 'CF'),
+    (8, 3, 'TK', 2, 13, '2025-03-05', '20:00:00', 9, NULL, 0, 60, 'CF'),
+    (9, 3, 'RE', 2, 14, '2025-03-05', '20:30:00', 1, NULL, 0, 60, 'CF');
+INSERT INTO factpagos VALUES
+    (1, 1, 100, NULL),
+    (2, 1, 200, NULL), (2, 3, 250, 1), (2, 5, 150, 1), (2, 7, 0.5, NULL), (2, NULL, 9, NULL),
+    (3, 1, 120, NULL), (3, 3, 80, 2),
+    (5, 9, 0, NULL),
+    (6, 1, 80, NULL), (7, 1, 70, NULL);
+INSERT INTO factlineas VALUES (1, 0), (2, 100), (2, 200), (3, 50), (4, NULL), (5, 0);
+INSERT INTO factcoberturas VALUES (2, 1), (3, 2), (5, 2);
+"""
+
+
+def _traducir_mysql(sql: str) -> str:
+    # SQLite no tiene CONVERT(x, CHAR); el resto de las funciones se registran al conectar
+    return re.sub(r"CONVERT\(([^,()]+), CHAR\)", r"CAST(\1 AS TEXT)", sql)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def registrar_funciones(conexion, _):
+        conexion.create_function("IF", 3, lambda condicion, si, no: si if condicion else no)
+        conexion.create_function("LPAD", 3, lambda valor, largo, relleno: str(valor).rjust(largo, relleno)[-largo:])
+        conexion.create_function("CONCAT", -1, lambda *partes: "".join(map(str, partes)))
+
+    with engine.begin() as conexion:
+        for sentencia in (TABLAS + DATOS).split(";"):
+            if sentencia.strip():
+                conexion.execute(text(sentencia))
+
+    ejecutar = Session.execute
+    monkeypatch.setattr(
+        Session, "execute", lambda self, consulta, *args, **kwargs: ejecutar(
+            self, text(_traducir_mysql(consulta.text)), *args, **kwargs
+        )
+    )
+    with Session(engine) as session:
+        yield session
+
+
+def test_consulta_preagregada_equivale_a_la_original(db, monkeypatch):
+    original = get_vta_hora(3, date(2025, 3, 1), date(2025, 3, 31), db, preagregado=False)
+    preagregada = get_vta_hora(3, date(2025, 3, 1), date(2025, 3, 31), db, preagregado=True)
+
+    assert [fila["Documento"] for fila in original] == ["0001-00000011", "0001-00000010", "0001-00000012", "0002-00000010", "0002-00000011"]
+    assert preagregada == original
+    nota_credito = original[2]
+    assert (nota_credito["Efectivo"], nota_credito["Tarjeta"], nota_credito["Tarjeta Detalle"]) == (-120, -80, "MASTERCARD")
+
+    # El flag por variable de entorno selecciona la misma variante
+    monkeypatch.setenv("VTA_HORA_PREAGREGADO", "true")
+    assert vta_hora_repo.usar_preagregado()
+    assert get_vta_hora(3, date(2025, 3, 4), date(2025, 3, 4), db) == original[2:4]
+
+
+def test_streaming_entrega_las_mismas_facturas_sin_armar_la_lista(db, monkeypatch):
+    filas = vta_hora_repo.iterar_vta_hora(3, date(2025, 3, 1), date(2025, 3, 31), db, tamano_lote=2)
+    assert isinstance(filas, GeneratorType)
+    assert list(filas) == get_vta_hora(3, date(2025, 3, 1), date(2025, 3, 31), db)
+
+    facturas = obtener_facturas(3, date(2025, 3, 1), date(2025, 3, 31), db)
+    assert sum(grupo["Total"] for grupo in agrupar_facturas(3, date(2025, 3, 1), date(2025, 3, 31), db).values()) == len(facturas)
+
+    # El controlador abre su propia sesión de plex y la cierra al terminar el stream
+    cerradas = []
+    monkeypatch.setattr(db, "close", lambda: cerradas.append(True))
+    monkeypatch.setattr(vta_hora_controller.DBConfig, "get_session", staticmethod(lambda nombre: db))
+    lineas = list(vta_hora_controller.controlador_stream_facturas(3, date(2025, 3, 1), date(2025, 3, 31)))
+    assert [json.loads(linea) for linea in lineas] == jsonable_encoder(facturas)
+    assert all(linea.endswith("\n") for linea in lineas) and cerradas == [True]
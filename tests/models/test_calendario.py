@@ -0,0 +1,67 @@
+from datetime import date, time
+
+import numpy as np
+
+from domain.models.calendario import CalendarioColaborador, IndiceCalendario, mascara_dia_semana
+from domain.models.colaborador import Colaborador, TIEMPO_COMPLETO
+from domain.models.horario import Horario
+from domain.models.tipo_colaborador import TipoEmpleado
+from domain.specs.colaborador_specs import VacacionesSpecification
+
+
+def _horario(fecha, *bloques):
+    return Horario(1, 1, fecha.isoweekday(), fecha, list(bloques), False)
+
+
+def test_colaborador_mantiene_bitmaps_de_vacaciones_y_dias_trabajados():
+    colaborador = Colaborador(
+        id=1, nombre="Ana Gómez", legajo=1, email="ana@example.com", telefono="", dni="12.345.678",
+        empresa=None, sucursales=[1], roles=[], horario_preferido=[], dias_preferidos=[],
+        tipo_empleado=TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45),
+        horario_asignado=None, hs_extra={}, vacaciones=[date(2024, 12, 31)],
+    )
+    horarios = [_horario(date(2025, 1, dia), (time(9), time(13))) for dia in range(6, 12)]
+    for horario in horarios:
+        colaborador.agregar_horario(1, horario)
+
+    calendario = colaborador.calendario()
+    assert calendario.dias_trabajados(date(2025, 1, 6), date(2025, 1, 12)) == 6
+    assert calendario.dias_libres(date(2025, 1, 1), date(2025, 1, 31)) == 25
+    assert calendario.dias_semana_trabajados() == {0, 1, 2, 3, 4, 5}
+    assert VacacionesSpecification().is_satisfied_by(colaborador)
+
+    # Vacaciones agregadas a la lista después de asignar: se reindexan
+    colaborador.agregar_vacacion(date(2025, 1, 8))
+    assert colaborador.calendario().conflictos() == [date(2025, 1, 8)]
+    assert not VacacionesSpecification().is_satisfied_by(colaborador)
+
+    # Al quitar el único bloque del día el bit se apaga
+    colaborador.eliminar_bloque(horarios[2], time(9), time(13))
+    assert not colaborador.calendario().hay_conflicto()
+
+    colaborador.agregar_horario(1, _horario(date(2025, 1, 12), (time(9), time(13))))
+    colaborador.agregar_horario(1, _horario(date(2025, 1, 8), (time(9), time(13))))
+    assert colaborador.calendario().dias_semana_trabajados() == set(range(7))
+
+
+def test_indice_de_sucursal_cuenta_conflictos_y_dias_libres_por_colaborador():
+    trabajados = [(10, date(2024, 12, 30 + i)) for i in range(2)]  # Año bisiesto: el 31/12 es el bit 365
+    trabajados += [(11, date(2024, 3, dia)) for dia in range(1, 8)]
+    vacaciones = [(10, date(2024, 12, 31)), (11, date(2024, 3, 10)), (12, date(2024, 6, 1)), (10, date(2025, 1, 2))]
+    indice = IndiceCalendario.desde_filas(2024, vacaciones, trabajados, colaborador_ids=[13])
+
+    assert indice.colaborador_ids == [10, 11, 12, 13]
+    assert indice.conflictos_por_colaborador().tolist() == [1, 0, 0, 0]
+    assert indice.colaboradores_con_conflicto() == [10]
+    assert indice.dias_libres(date(2024, 3, 1), date(2024, 3, 10)).tolist() == [10, 3, 10, 10]
+
+    # Cada fila coincide con el calendario de un colaborador armado fecha por fecha
+    esperado = CalendarioColaborador.desde_fechas(
+        [f for c, f in vacaciones if c == 10], [f for c, f in trabajados if c == 10]
+    )
+    fila = indice.calendario(10)
+    assert fila.conflictos() == esperado._anios[2024].conflictos() == 1 << 365
+    assert indice.calendario(99).trabajados == 0
+    assert all(
+        bin(mascara_dia_semana(2024, weekday)).count("1") in (52, 53) for weekday in range(7)
+    ) and np.bitwise_count(indice.trabajados).sum() == len(trabajados)
@@ -111,3 +111,74 @@ def test_agregar_horario_excede_horas_semanales(colaborador_tiempo_completo):
         assert str(e) == "Agregar este horario excede las horas semanales asignadas.", \
             "El mensaje de ValueError no coincide con el esperado."
 
+
+
+# Pruebas sobre los contadores de minutos
+def _colaborador_con_contrato(horas_por_dia_max=8, horas_semanales=45):
+    from domain.models.tipo_colaborador import TipoEmpleado
+    return Colaborador(
+        id=1, nombre="Ana Gómez", legajo=1, email="ana@example.com", telefono="", dni="12.345.678",
+        empresa=None, sucursales=[1, 2], roles=[], horario_preferido=[], dias_preferidos=[],
+        tipo_empleado=TipoEmpleado(1, TIEMPO_COMPLETO, horas_por_dia_max, horas_semanales),
+        horario_asignado=None, hs_extra={}, vacaciones=[],
+    )
+
+
+def _horario(sucursal_id, fecha, *bloques):
+    return Horario(sucursal_id, 1, fecha.isoweekday(), fecha, list(bloques), False)
+
+
+def test_contadores_se_actualizan_al_agregar_y_eliminar():
+    colaborador = _colaborador_con_contrato()
+    manana = _horario(1, date(2025, 1, 6), (time(9), time(13)))
+    tarde = _horario(2, date(2025, 1, 6), (time(14), time(16)), (time(17), time(19)))
+    colaborador.agregar_horario(1, manana)
+    colaborador.agregar_horario(2, tarde)
+    colaborador.agregar_horario(1, _horario(1, date(2025, 1, 13), (time(9), time(17))))
+
+    assert colaborador.minutos_dia(date(2025, 1, 6)) == 8 * 60
+    assert colaborador.minutos_semana(date(2025, 1, 8)) == 8 * 60
+    assert colaborador.calcular_horas_totales_semanales() == 16
+    assert colaborador.verificar_horas_diarias()
+    assert not colaborador.puede_agregar(_horario(1, date(2025, 1, 6), (time(20), time(21))))
+
+    assert colaborador.eliminar_bloque(tarde, time(17), time(19))
+    assert colaborador.minutos_dia(tarde) == 6 * 60
+    assert colaborador.puede_agregar(_horario(1, date(2025, 1, 6), (time(20), time(21))))
+    assert colaborador.eliminar_horario(manana)
+    assert not colaborador.eliminar_horario(manana)
+    assert colaborador.calcular_horas_totales_semanales() == 10
+
+
+def test_verificar_horas_diarias_suma_los_horarios_del_mismo_dia():
+    colaborador = _colaborador_con_contrato()
+    colaborador.agregar_horario(1, _horario(1, date(2025, 1, 6), (time(8), time(13))))
+    assert colaborador.verificar_horas_diarias()
+    # Modificar la lista directamente también se refleja en los contadores
+    colaborador.horario_asignado.append((2, _horario(2, date(2025, 1, 6), (time(14), time(19)))))
+    assert not colaborador.verificar_horas_diarias()
+    assert colaborador.verificar_horas_semanales()
+
+
+def test_contadores_detectan_horarios_editados_o_reemplazados():
+    colaborador = _colaborador_con_contrato()
+    manana = _horario(1, date(2025, 1, 6), (time(8), time(13)))
+    colaborador.agregar_horario(1, manana)
+    huella = colaborador.huella_asignaciones()
+
+    # Un bloque agregado al Horario ya asignado cuenta sin pasar por el colaborador
+    manana.agregar_bloque(time(14), time(18))
+    assert colaborador.minutos_dia(manana) == 9 * 60
+    assert not colaborador.verificar_horas_diarias()
+    assert colaborador.huella_asignaciones() != huella
+
+    # Reemplazar el elemento en su posición mantiene la longitud de la lista
+    colaborador.horario_asignado[0] = (1, _horario(1, date(2025, 1, 7), (time(8), time(12))))
+    assert colaborador.minutos_dia(date(2025, 1, 6)) == 0
+    assert colaborador.minutos_dia(date(2025, 1, 7)) == 4 * 60
+    assert colaborador.verificar_horas_diarias()
+
+    # Mover de fecha el horario asignado también invalida los contadores
+    colaborador.horario_asignado[0][1].fecha = date(2025, 1, 8)
+    assert colaborador.minutos_dia(date(2025, 1, 7)) == 0
+    assert colaborador.minutos_dia(date(2025, 1, 8)) == 4 * 60
@@ -0,0 +1,61 @@
+import pickle
+import random
+from datetime import date, time
+
+import pytest
+
+from domain.models.horario import Horario
+
+LUNES = date(2025, 1, 6)
+
+
+def bloques_aleatorios(rng, cantidad):
+    cortes = sorted(rng.sample(range(0, 24 * 60, 15), cantidad * 2))
+    return [(time(cortes[i] // 60, cortes[i] % 60), time(cortes[i + 1] // 60, cortes[i + 1] % 60)) for i in range(0, len(cortes), 2)]
+
+
+def test_mismo_resultado_que_comparar_objetos_time():
+    rng = random.Random(3)
+    for _ in range(300):
+        a = bloques_aleatorios(rng, rng.randint(1, 3))
+        b = bloques_aleatorios(rng, rng.randint(1, 3))
+        h1 = Horario(1, 1, 1, LUNES, a, True)
+        h2 = Horario(1, 2, 1, LUNES, b, True)
+
+        assert h1.bloques == sorted(a)
+        assert h1.duracion() == sum((f.hour * 60 + f.minute) - (i.hour * 60 + i.minute) for i, f in a)
+        assert h1.se_superpone(h2) == any(i1 < f2 and i2 < f1 for i1, f1 in a for i2, f2 in b)
+        assert h2.se_superpone(h1) == h1.se_superpone(h2)
+        assert h1.esta_dentro(h2) == all(any(i2 <= i1 and f1 <= f2 for i2, f2 in b) for i1, f1 in a)
+
+    assert not Horario(1, 1, 1, LUNES, [(time(9), time(12))], True).se_superpone(
+        Horario(2, 1, 1, LUNES, [(time(9), time(12))], True)
+    )
+
+
+def test_validaciones_y_edicion_de_bloques():
+    with pytest.raises(ValueError):
+        Horario(1, 1, 1, LUNES, [], True)
+    with pytest.raises(ValueError):
+        Horario(1, 1, 1, LUNES, [(time(12), time(9))], True)
+    with pytest.raises(ValueError):
+        Horario(1, 1, 1, LUNES, [(time(9), time(13)), (time(12), time(16))], True)
+    with pytest.raises(ValueError):
+        Horario.desde_minutos(1, 1, 1, LUNES, [(1320, 1500)], True)
+
+    horario = Horario.desde_minutos(1, 1, 1, LUNES, [(960, 1200), (540, 720)], False)
+    assert horario.bloques == [(time(9), time(12)), (time(16), time(20))]
+    assert list(horario.minutos) == [540, 720, 960, 1200]
+
+    horario.agregar_bloque(time(13), time(15))
+    assert horario.bloques_en_minutos() == [(540, 720), (780, 900), (960, 1200)]
+    with pytest.raises(ValueError):
+        horario.agregar_bloque(time(14), time(17))
+    assert horario.eliminar_bloque(time(9), time(12)) is True
+    assert horario.eliminar_bloque(time(9), time(12)) is False
+    assert horario.to_dict()["bloques"] == [("13:00", "15:00"), ("16:00", "20:00")]
+
+    with pytest.raises(AttributeError):
+        horario.otro_atributo = 1
+    copia = pickle.loads(pickle.dumps(horario))
+    assert copia.bloques == horario.bloques and copia.fecha == LUNES
@@ -0,0 +1,68 @@
+import random
+from datetime import date, time
+
+import pytest
+
+from domain.models.formato import Formato
+from domain.models.horario import Horario
+from domain.models.linea_capacidad import LineaCapacidad
+from domain.models.rol import Rol
+from domain.models.sucursal import Sucursal
+
+CAJERO = Rol(1, "Cajero")
+REPOSITOR = Rol(2, "Repositor")
+
+
+def _sucursal(cajas=2):
+    return Sucursal(
+        id=1, nombre="Centro", empresa_id=1, direccion="", telefono="",
+        formato=Formato("Super", [CAJERO, REPOSITOR]),
+        disposicion_fisica={CAJERO: cajas, REPOSITOR: 1},
+        horario_atencion=[], dias_atencion=[1, 2, 3, 4, 5, 6],
+    )
+
+
+def _horario(*bloques, fecha=date(2025, 1, 6)):
+    return Horario(1, None, fecha.isoweekday(), fecha, list(bloques), False)
+
+
+def test_capacidad_por_franja_horaria():
+    sucursal = _sucursal(cajas=2)
+    manana = _horario((time(8), time(12)))
+    tarde = _horario((time(14), time(20)))
+
+    assert sucursal.asignar_rol(CAJERO, tarde)
+    assert sucursal.asignar_rol(CAJERO, _horario((time(17), time(21))))
+    # A las 18 las dos cajas están ocupadas, a las 8 no
+    assert not sucursal.puede_asignar_rol(CAJERO, _horario((time(16), time(18, 30))))
+    assert not sucursal.asignar_rol(CAJERO, _horario((time(8), time(10)), (time(18), time(19))))
+    assert sucursal.asignar_rol(CAJERO, manana)
+    assert sucursal.asignar_rol(CAJERO, _horario((time(8), time(14))))
+    assert sucursal.ocupacion_rol(CAJERO, _horario((time(7), time(9)))) == 2
+    # Otro día y otro rol no comparten ocupación
+    assert sucursal.puede_asignar_rol(CAJERO, _horario((time(18), time(19)), fecha=date(2025, 1, 7)))
+    assert sucursal.puede_asignar_rol(REPOSITOR, tarde)
+    assert sucursal.espacios_ocupados == {CAJERO: 2, REPOSITOR: 0}
+
+    sucursal.liberar_rol(CAJERO, tarde)
+    assert sucursal.puede_asignar_rol(CAJERO, _horario((time(16), time(18, 30))))
+    with pytest.raises(ValueError):
+        sucursal.liberar_rol(CAJERO, tarde)
+    with pytest.raises(ValueError):
+        sucursal.puede_asignar_rol(Rol(3, "Carnicero"), tarde)
+
+
+def test_linea_capacidad_coincide_con_conteo_por_minuto():
+    azar = random.Random(5)
+    linea = LineaCapacidad()
+    ocupacion = [0] * (24 * 60)
+    for _ in range(500):
+        inicio = azar.randrange(24 * 60 - 1)
+        fin = azar.randrange(inicio + 1, 24 * 60)
+        if azar.random() < 0.6:
+            linea.sumar(inicio, fin)
+            for minuto in range(inicio, fin):
+                ocupacion[minuto] += 1
+        else:
+            assert linea.maximo(inicio, fin) == max(ocupacion[inicio:fin])
+    assert linea.maximo_total() == max(ocupacion)
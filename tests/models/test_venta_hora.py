@@ -0,0 +1,47 @@
+import random
+from datetime import date, time, timedelta
+
+from domain.models.venta_hora import Factura, VentasPorHora
+from infrastructure.schemas.venta_hora import VentaHora
+
+
+def _filas(cantidad, semilla=7):
+    azar = random.Random(semilla)
+    detalles = ["PAMI INSSJP", "PAMI", "OSDE", "Swiss Medical", "pami minúscula", " PAMI", "", None]
+    return [
+        {
+            "Sucursal": azar.choice([3, 4]), "Doc": "TK", "Documento": f"0001-{i:08d}",
+            "Fecha": date(2025, 1, 1) + timedelta(days=azar.randrange(20)),
+            "Hora": timedelta(seconds=azar.randrange(24 * 3600)), "Usuario": 1, "Efectivo": 0.0,
+            "CtaCte": 0.0, "OSocial": 0.0, "Obra Social Detalle": azar.choice(detalles), "Tarjeta": 0.0,
+            "OtrosMP": 0.0, "Tarjeta Detalle": None, "Total": 10.0, "Apellido y nombre/Razón Social": None,
+            "DNI": None, "CUIT": None,
+        }
+        for i in range(cantidad)
+    ]
+
+
+def test_agrupamiento_columnar_equivale_al_de_facturas():
+    filas = _filas(3000)
+    por_factura = VentasPorHora()
+    por_factura.procesar_facturas([Factura(VentaHora.model_validate(fila)) for fila in filas])
+
+    columnar = VentasPorHora()
+    for inicio in range(0, len(filas), 1000):  # Por lotes, como agrupar_facturas
+        columnar.procesar_filas(filas[inicio:inicio + 1000])
+
+    assert columnar.obtener_ventas() == por_factura.obtener_ventas()
+    assert list(columnar.obtener_ventas()) == list(por_factura.obtener_ventas())
+
+
+def test_acepta_horas_como_time_o_segundos():
+    base = {"Sucursal": 3, "Fecha": date(2025, 1, 6), "Obra Social Detalle": "OSDE"}
+    ventas = VentasPorHora()
+    ventas.procesar_filas([{**base, "Hora": time(8, 59, 59)}, {**base, "Hora": time(9)}])
+    ventas.procesar_filas([{**base, "Hora": 9 * 3600 + 1}])
+    ventas.procesar_filas([])
+
+    assert ventas.obtener_ventas() == {
+        (3, date(2025, 1, 6), 8): {"PAMI": 0, "Obra Social": 1, "Particular": 0, "Total": 1},
+        (3, date(2025, 1, 6), 9): {"PAMI": 0, "Obra Social": 2, "Particular": 0, "Total": 2},
+    }
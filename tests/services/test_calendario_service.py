@@ -0,0 +1,31 @@
+from datetime import date
+from types import SimpleNamespace
+
+from application.services import calendario_service
+from application.services.calendario_service import obtener_indice_calendario
+
+
+def test_indice_de_sucursales_con_una_consulta_por_tabla(monkeypatch):
+    consultas = []
+    repos = {
+        "ColaboradorSucursalRepository": {"get_by_sucursales": lambda ids, db: [
+            SimpleNamespace(colaborador_id=10, sucursal_id=1),
+            SimpleNamespace(colaborador_id=11, sucursal_id=1),
+            SimpleNamespace(colaborador_id=10, sucursal_id=2),
+        ]},
+        "VacacionColaboradorRepository": {"get_by_colaboradores_rango": lambda ids, desde, hasta, db: consultas.append(
+            (ids, desde, hasta)
+        ) or [SimpleNamespace(colaborador_id=11, fecha=date(2025, 2, 3))]},
+        "PuestoRepository": {"get_fechas_trabajadas": lambda ids, desde, hasta, db: [
+            (10, date(2025, 2, 3)), (11, date(2025, 2, 3)), (11, date(2025, 2, 4))
+        ]},
+    }
+    for clase, metodos in repos.items():
+        for nombre, funcion in metodos.items():
+            monkeypatch.setattr(getattr(calendario_service, clase), nombre, staticmethod(funcion))
+
+    indice = obtener_indice_calendario([1, 2], 2025, db=None)
+
+    assert consultas == [([10, 11], date(2025, 1, 1), date(2025, 12, 31))]
+    assert indice.colaboradores_con_conflicto() == [11]
+    assert indice.dias_libres(date(2025, 2, 3), date(2025, 2, 9)).tolist() == [6, 5]
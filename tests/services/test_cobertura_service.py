@@ -0,0 +1,61 @@
+import random
+from datetime import date, time, timedelta
+
+import numpy as np
+
+from application.services.cobertura_service import FRANJAS_DIA, MINUTOS_FRANJA, calcular_cobertura
+
+LUNES = date(2025, 1, 6)
+
+
+def test_coincide_con_contar_franja_por_franja():
+    rng = random.Random(5)
+    fechas = [LUNES + timedelta(days=i) for i in range(10)]
+    bloques = []
+    for _ in range(300):
+        inicio = rng.randrange(6 * 60, 22 * 60, 15) + rng.choice([0, 0, 5])
+        fin = inicio + rng.choice([60, 180, 240, 7])
+        bloques.append((rng.choice([1, 2]), rng.choice([3, 4]), rng.choice(fechas), time(inicio // 60, inicio % 60), time(fin // 60 % 24, fin % 60)))
+    minimos = [(1, 3, dia_id, time(hora), 2) for dia_id in range(1, 8) for hora in range(8, 20)]
+
+    cobertura = calcular_cobertura([1, 2], fechas[0], fechas[-1], bloques, minimos)
+
+    esperado = np.zeros((2, len(fechas), FRANJAS_DIA, 2), dtype=int)
+    for sucursal, rol, fecha, inicio, fin in bloques:
+        d = (fecha - LUNES).days
+        a = inicio.hour * 60 + inicio.minute
+        b = fin.hour * 60 + fin.minute + (24 * 60 if fin <= inicio else 0)
+        for franja in range(FRANJAS_DIA * 2):
+            dia, resto = divmod(franja, FRANJAS_DIA)
+            if d + dia < len(fechas) and a <= franja * MINUTOS_FRANJA and (franja + 1) * MINUTOS_FRANJA <= b:
+                esperado[sucursal - 1, d + dia, resto, rol - 3] += 1
+    assert np.array_equal(cobertura.cubiertos, esperado)
+
+    requeridos = cobertura.requeridos[0, :, :, 0]
+    assert requeridos[0, 8 * 4:20 * 4].tolist() == [2] * 48 and requeridos[0, :8 * 4].sum() == 0
+    assert not cobertura.con_minimo[1].any()
+    assert np.array_equal(cobertura.faltantes[0, :, :, 0], np.maximum(requeridos - esperado[0, :, :, 0], 0))
+
+
+def test_desvios_resumen_y_minimos_de_madrugada():
+    bloques = [
+        (1, 3, LUNES, time(8), time(10)),
+        (1, 3, LUNES, time(8), time(9)),
+        (1, 3, LUNES, time(22), time(2)),
+    ]
+    minimos = [
+        (1, 3, 1, time(8), 1),
+        (1, 3, 1, time(9), 2),
+        (1, 3, 1, time(1), 1),   # Madrugada del martes: la sucursal abre el lunes a las 8
+        (1, 3, 2, time(1), 1),   # El martes no tiene bloques
+    ]
+
+    cobertura = calcular_cobertura([1], LUNES, LUNES + timedelta(days=1), bloques, minimos, {(1, 1): time(8), (1, 2): time(8)})
+
+    desvios = {(d["fecha"], d["hora"]): (d["faltantes"], d["sobrantes"]) for d in cobertura.desvios()}
+    assert desvios[(LUNES, "08:00")] == (0, 1)
+    assert desvios[(LUNES, "09:45")] == (1, 0)
+    assert (LUNES + timedelta(days=1), "01:00") not in desvios
+    assert (LUNES, "01:00") not in desvios
+    [resumen] = cobertura.resumen()
+    assert resumen["horas_requeridas"] == 4 and resumen["horas_faltantes"] == 1 and resumen["horas_sobrantes"] == 1
@@ -0,0 +1,106 @@
+from datetime import date, time
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from application.services import disponibilidad_service
+from application.services.disponibilidad_service import construir_disponibilidad, obtener_disponibilidad
+from infrastructure.databases.config.database import Base
+# Modelos que el paquete no importa y que las relaciones de Colaborador necesitan al configurar los mappers
+from infrastructure.databases.models import horario, horario_preferido_colaborador, puestos  # noqa: F401
+from infrastructure.databases.models.horario_sucursal import HorarioSucursal
+from infrastructure.databases.models.vacacion_colaborador import VacacionColaborador
+
+LUNES = date(2025, 1, 6)
+
+
+def _franja(hora, minuto=0):
+    return (hora * 60 + minuto) // 15
+
+
+def test_construye_disponibilidad_con_vacaciones_preferidos_y_madrugada():
+    horarios = [(1, dia_id, time(8), time(20)) for dia_id in range(1, 7)]
+    horarios += [(2, dia_id, time(18), time(2)) for dia_id in range(1, 8)]  # Sucursal nocturna
+    matriz = construir_disponibilidad(
+        empresa_id=1,
+        semana_inicio=date(2025, 1, 8),  # Se normaliza al lunes
+        sucursal_ids=[1, 2],
+        horarios_atencion=horarios,
+        relaciones=[(10, 1), (11, 1), (11, 2)],
+        vacaciones=[(10, date(2025, 1, 7)), (11, date(2025, 1, 5)), (11, date(2025, 1, 9))],
+        preferidos=[(10, 1, 1, time(9), time(13, 30)), (11, 2, 3, time(1), time(2))],
+    )
+
+    assert matriz.semana_inicio == LUNES and matriz.colaborador_ids == [10, 11]
+    lunes = matriz.franjas(10, 1, LUNES)
+    assert lunes.sum() == 12 * 4 and lunes[_franja(8)] and not lunes[_franja(20)]
+    assert not matriz.franjas(10, 1, date(2025, 1, 7)).any()  # Vacaciones
+    assert matriz.fechas_no_disponibles(10) == {date(2025, 1, 7)}
+    assert matriz.fechas_no_disponibles(11) == {date(2025, 1, 9)}  # El domingo anterior no es de la semana
+    assert not matriz.franjas(10, 2, LUNES).any()  # No asignado a la sucursal 2
+    assert not matriz.franjas(10, 1, date(2025, 1, 12)).any()  # Domingo cerrado
+    assert matriz.franjas(10, 1, LUNES, preferidas=True).nonzero()[0].tolist() == list(range(_franja(9), _franja(13, 30)))
+
+    # Las vacaciones del domingo anterior vacían la madrugada del lunes en la nocturna
+    nocturna_lunes = matriz.franjas(11, 2, LUNES)
+    assert not nocturna_lunes[:_franja(2)].any() and nocturna_lunes[_franja(18):].all()
+    assert matriz.puede_trabajar(11, 2, LUNES, time(22), time(2))
+    # El jueves de vacaciones quita la noche del jueves y su madrugada del viernes
+    assert not matriz.puede_trabajar(11, 2, date(2025, 1, 9), time(22), time(23))
+    assert not matriz.franjas(11, 2, date(2025, 1, 10))[:_franja(2)].any()
+    # Preferido del miércoles a la 01:00: madrugada del jueves
+    assert matriz.franjas(11, 2, date(2025, 1, 9), preferidas=True).nonzero()[0].tolist() == list(range(_franja(1), _franja(2)))
+
+    tensor = matriz.tensor()
+    assert tensor.shape == (2, 7, 96, 2)
+    assert np.array_equal(tensor[1, 0, :, 1], nocturna_lunes)
+    assert matriz.nbytes == 2 * 2 * 2 * 7 * 12
+
+
+def test_cache_por_empresa_y_semana_se_invalida_al_confirmar_cambios(monkeypatch):
+    llamadas = []
+    repos = {
+        "SucursalRepository": {"get_by_empresa": lambda empresa_id, db: llamadas.append(1) or [SimpleNamespace(id=1)]},
+        "HorarioSucursalRepository": {"get_by_sucursales": lambda ids, db: [
+            SimpleNamespace(sucursal_id=1, dia_id=1, hora_apertura=time(8), hora_cierre=time(12))
+        ]},
+        "ColaboradorSucursalRepository": {"get_by_sucursales": lambda ids, db: [
+            SimpleNamespace(colaborador_id=10, sucursal_id=1)
+        ]},
+        "HorarioPreferidoColaboradorRepository": {"get_by_sucursales": lambda ids, db: []},
+        "VacacionColaboradorRepository": {"get_by_colaboradores_rango": lambda ids, desde, hasta, db: []},
+    }
+    for clase, metodos in repos.items():
+        for nombre, funcion in metodos.items():
+            monkeypatch.setattr(getattr(disponibilidad_service, clase), nombre, staticmethod(funcion))
+    monkeypatch.setattr(disponibilidad_service, "_cache", type(disponibilidad_service._cache)())
+
+    matriz = obtener_disponibilidad(1, LUNES, db=None)
+    assert obtener_disponibilidad(1, date(2025, 1, 10), db=None) is matriz and len(llamadas) == 1
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[VacacionColaborador.__table__, HorarioSucursal.__table__])
+    with Session(engine) as db:
+        # Una vacación de otra semana no invalida
+        db.add(VacacionColaborador(colaborador_id=10, fecha=date(2025, 2, 3)))
+        db.commit()
+        assert obtener_disponibilidad(1, LUNES, db=None) is matriz
+
+        # Una de esta semana solo invalida al confirmarse, no en el flush ni tras un rollback
+        db.add(VacacionColaborador(colaborador_id=10, fecha=date(2025, 1, 8)))
+        db.flush()
+        assert obtener_disponibilidad(1, LUNES, db=None) is matriz
+        db.rollback()
+        assert obtener_disponibilidad(1, LUNES, db=None) is matriz
+
+        db.add(VacacionColaborador(colaborador_id=10, fecha=date(2025, 1, 8)))
+        db.commit()
+        matriz = obtener_disponibilidad(1, LUNES, db=None)
+        assert len(llamadas) == 2
+
+        db.add(HorarioSucursal(sucursal_id=1, dia_id=2, hora_apertura=time(8), hora_cierre=time(12)))
+        db.commit()
+        obtener_disponibilidad(1, LUNES, db=None)
+        assert len(llamadas) == 3
@@ -0,0 +1,70 @@
+import random
+from datetime import date, time, timedelta
+
+from domain.models.horario import Horario
+from domain.services.superposiciones import detectar_superposiciones, hay_superposiciones
+
+LUNES = date(2025, 1, 6)
+
+
+def horarios_aleatorios(rng, cantidad):
+    horarios = []
+    for _ in range(cantidad):
+        inicio = rng.randrange(6 * 60, 20 * 60, 30)
+        bloques = [(inicio, inicio + rng.choice([120, 180, 240]))]
+        if rng.random() < 0.3 and bloques[0][1] + 240 < 23 * 60:
+            bloques.append((bloques[0][1] + 180, bloques[0][1] + 300))
+        horarios.append(Horario.desde_minutos(
+            rng.randint(1, 2), rng.randint(1, 8), 1, LUNES + timedelta(days=rng.randint(0, 6)),
+            [(i, min(f, 23 * 60 + 59)) for i, f in bloques], True
+        ))
+    return horarios
+
+
+def pares_por_fuerza_bruta(horarios, misma_sucursal):
+    pares = set()
+    for a in range(len(horarios)):
+        for b in range(a + 1, len(horarios)):
+            h1, h2 = horarios[a], horarios[b]
+            if h1.colaborador_id != h2.colaborador_id or h1.fecha != h2.fecha:
+                continue
+            if misma_sucursal and h1.sucursal_id != h2.sucursal_id:
+                continue
+            for x, (i1, f1) in enumerate(h1.bloques_en_minutos()):
+                for y, (i2, f2) in enumerate(h2.bloques_en_minutos()):
+                    if i1 < f2 and i2 < f1:
+                        pares.add(frozenset({(a, x), (b, y)}))
+    return pares
+
+
+def test_encuentra_los_mismos_pares_que_comparar_todos():
+    rng = random.Random(11)
+    horarios = horarios_aleatorios(rng, 400)
+    for misma_sucursal in (True, False):
+        superposiciones = detectar_superposiciones(horarios, misma_sucursal)
+        obtenidos = {frozenset({(s.horario_a, s.bloque_a), (s.horario_b, s.bloque_b)}) for s in superposiciones}
+        assert len(obtenidos) == len(superposiciones)
+        assert obtenidos == pares_por_fuerza_bruta(horarios, misma_sucursal)
+        assert obtenidos
+
+    mismos = [h for h in horarios if h.sucursal_id == 1]
+    assert hay_superposiciones(mismos) == any(
+        a.se_superpone(b) and a.colaborador_id == b.colaborador_id
+        for i, a in enumerate(mismos) for b in mismos[i + 1:]
+    )
+
+
+def test_reporta_bloques_y_tramo_superpuesto():
+    horarios = [
+        Horario(1, 5, 1, LUNES, [(time(8), time(11)), (time(15), time(19))], False),
+        Horario(1, 5, 1, LUNES, [(time(18), time(21))], True),
+        Horario(2, 5, 1, LUNES, [(time(9), time(10))], True),
+    ]
+
+    [superposicion] = detectar_superposiciones(horarios)
+    assert (superposicion.horario_a, superposicion.bloque_a, superposicion.horario_b, superposicion.bloque_b) == (0, 1, 1, 0)
+    assert superposicion.to_dict()["inicio"] == "18:00" and superposicion.to_dict()["fin"] == "19:00"
+    assert superposicion.colaborador_id == 5
+
+    entre_sucursales = detectar_superposiciones(horarios, misma_sucursal=False)
+    assert {(s.horario_a, s.horario_b) for s in entre_sucursales} == {(0, 1), (0, 2)}
@@ -0,0 +1,234 @@
+from datetime import date, datetime, time, timedelta
+import threading
+from application.services import trabajo_generacion_service
+from application.services.trabajo_generacion_service import (
+    ColaTrabajos,
+    DiferenciaTurnos,
+    ProgresoDiferido,
+    ejecutar_generacion_empresa,
+)
+from infrastructure.databases.config.trabajos_database import TrabajosDBConfig
+from infrastructure.databases.models.trabajo_generacion import TrabajoGeneracion, EN_EJECUCION, COMPLETADO, ERROR
+from infrastructure.repositories.trabajo_generacion_repo import TrabajoGeneracionRepository
+from infrastructure.solvers.solver import ESTADO_HEURISTICO, ResultadoGeneracion, TurnoGenerado
+
+LUNES = date(2025, 1, 6)
+PARAMETROS = {"sucursal_id": 1, "semana_inicio": "2025-01-06", "tiempo_limite": 5.0,
+              "reemplazar": False, "usar_semana_anterior": True}
+
+
+def ejecutor_de_prueba(parametros, al_progresar, detener):
+    al_progresar({"objetivo": 2000.0, "cota": 0.0})
+    al_progresar({"objetivo": 1500.0, "cota": 1000.0})
+    return {"turnos": 3}
+
+
+def ejecutor_con_error(parametros, al_progresar, detener):
+    raise ValueError("sin solución")
+
+
+def test_trabajo_encolado_se_ejecuta_y_guarda_progreso(tmp_path):
+    get_session = TrabajosDBConfig.configurar(f"sqlite:///{tmp_path}/trabajos.db")
+    cola = ColaTrabajos(max_trabajos=1, get_session=get_session,
+                        ejecutores={"sucursal": ejecutor_de_prueba, "empresa": ejecutor_con_error})
+
+    ok = cola.encolar("sucursal", PARAMETROS)
+    fallido = cola.encolar("empresa", {**PARAMETROS, "sucursal_id": None, "empresa_id": 1})
+    cola.cerrar(esperar=True)
+
+    trabajo = cola.obtener(ok.id)
+    assert trabajo.estado == COMPLETADO
+    assert (trabajo.objetivo, trabajo.cota, trabajo.soluciones) == (1500.0, 1000.0, 2)
+    assert trabajo.resultado == {"turnos": 3, "detenido": False}
+    assert trabajo.segundos_transcurridos >= 0
+
+    trabajo = cola.obtener(fallido.id)
+    assert trabajo.estado == ERROR
+    assert trabajo.error == "sin solución"
+
+
+def test_recuperar_reencola_trabajos_interrumpidos(tmp_path):
+    """
+    Un trabajo que quedó en ejecución por un reinicio vuelve a ejecutarse desde cero.
+    """
+    get_session = TrabajosDBConfig.configurar(f"sqlite:///{tmp_path}/trabajos.db")
+    db = get_session()
+    TrabajoGeneracionRepository.create(TrabajoGeneracion(
+        id="interrumpido", tipo="sucursal", parametros=PARAMETROS,
+        estado=EN_EJECUCION, iniciado=datetime.now(), objetivo=9999.0,
+    ), db)
+    db.close()
+
+    cola = ColaTrabajos(max_trabajos=1, get_session=get_session, ejecutores={"sucursal": ejecutor_de_prueba})
+    assert cola.recuperar() == 1
+    cola.cerrar(esperar=True)
+
+    trabajo = cola.obtener("interrumpido")
+    assert trabajo.estado == COMPLETADO
+    assert trabajo.objetivo == 1500.0
+
+
+def test_recuperar_respeta_concesiones_vigentes_de_otro_proceso(tmp_path):
+    """
+    Con varios workers, el que arranca no reencola lo que otro sigue ejecutando, y un
+    trabajo pendiente lo ejecuta uno solo aunque todos lo reencolen.
+    """
+    get_session = TrabajosDBConfig.configurar(f"sqlite:///{tmp_path}/trabajos.db")
+    db = get_session()
+    TrabajoGeneracionRepository.create(TrabajoGeneracion(
+        id="ajeno", tipo="sucursal", parametros=PARAMETROS, estado=EN_EJECUCION, iniciado=datetime.now(),
+        propietario="otro", vence_concesion=datetime.now() + timedelta(minutes=1),
+    ), db)
+    TrabajoGeneracionRepository.create(TrabajoGeneracion(id="pendiente", tipo="sucursal", parametros=PARAMETROS), db)
+    db.close()
+
+    ejecuciones = []
+
+    def ejecutor_contando(parametros, al_progresar, detener):
+        ejecuciones.append(parametros)
+        return {"turnos": 0}
+
+    colas = [
+        ColaTrabajos(max_trabajos=1, get_session=get_session, ejecutores={"sucursal": ejecutor_contando})
+        for _ in range(2)
+    ]
+    # Según cuándo llegue el segundo, el pendiente puede estar ya reclamado por el primero
+    assert colas[0].recuperar() == 1 and colas[1].recuperar() <= 1
+    for cola in colas:
+        cola.cerrar(esperar=True)
+
+    assert len(ejecuciones) == 1
+    assert colas[0].obtener("pendiente").estado == COMPLETADO
+    ajeno = colas[0].obtener("ajeno")
+    assert (ajeno.estado, ajeno.propietario) == (EN_EJECUCION, "otro")
+
+    # El reclamo es atómico: el segundo proceso que lo intenta no obtiene el trabajo
+    db = get_session()
+    TrabajoGeneracionRepository.create(TrabajoGeneracion(id="nuevo", tipo="sucursal", parametros=PARAMETROS), db)
+    vence = datetime.now() + timedelta(minutes=1)
+    assert TrabajoGeneracionRepository.reclamar("nuevo", "uno", vence, db).propietario == "uno"
+    assert TrabajoGeneracionRepository.reclamar("nuevo", "dos", vence, db) is None
+    db.close()
+
+
+def test_trabajo_que_pierde_la_concesion_se_detiene_sin_pisar_el_resultado(tmp_path):
+    """
+    Si otro proceso retomó el trabajo, la renovación falla: la búsqueda se corta y el
+    resultado de este proceso no se guarda.
+    """
+    get_session = TrabajosDBConfig.configurar(f"sqlite:///{tmp_path}/trabajos.db")
+    en_ejecucion = threading.Event()
+
+    def ejecutor_hasta_detener(parametros, al_progresar, detener):
+        en_ejecucion.set()
+        assert detener.wait(5)
+        return {"turnos": 1}
+
+    cola = ColaTrabajos(max_trabajos=1, get_session=get_session,
+                        ejecutores={"sucursal": ejecutor_hasta_detener}, duracion_concesion=0.3)
+    trabajo = cola.encolar("sucursal", PARAMETROS)
+    assert en_ejecucion.wait(5)
+    assert cola.obtener(trabajo.id).propietario == cola.propietario
+
+    db = get_session()
+    TrabajoGeneracionRepository.update(trabajo.id, db, propietario="otro")
+    db.close()
+    cola.cerrar(esperar=True)
+
+    trabajo = cola.obtener(trabajo.id)
+    assert (trabajo.estado, trabajo.propietario, trabajo.resultado) == (EN_EJECUCION, "otro", None)
+
+
+def test_progreso_diferido_procesa_la_ultima_solucion():
+    """
+    Las soluciones que llegan mientras corre el intervalo se reemplazan por la más
+    reciente, que se procesa al cerrar.
+    """
+    procesadas = []
+    primera = threading.Event()
+
+    def procesar(solucion):
+        procesadas.append(solucion)
+        primera.set()
+
+    progreso = ProgresoDiferido(procesar, intervalo=60)
+    progreso.informar(1)
+    assert primera.wait(5)
+    for solucion in (2, 3, 4):
+        progreso.informar(solucion)
+    progreso.cerrar()
+    assert procesadas == [1, 4]
+
+
+def test_canal_transmite_soluciones_y_detencion(tmp_path):
+    """
+    Un suscriptor recibe las soluciones publicadas y el estado final; al detener el
+    trabajo el ejecutor corta su búsqueda y el resultado queda marcado como detenido.
+    """
+    get_session = TrabajosDBConfig.configurar(f"sqlite:///{tmp_path}/trabajos.db")
+    primera_solucion = threading.Event()
+
+    def ejecutor_hasta_detener(parametros, al_progresar, detener):
+        al_progresar({"objetivo": 100.0, "cota": 0.0})
+        primera_solucion.set()
+        assert detener.wait(5)
+        return {"turnos": 1}
+
+    cola = ColaTrabajos(max_trabajos=1, get_session=get_session, ejecutores={"sucursal": ejecutor_hasta_detener})
+    trabajo = cola.encolar("sucursal", PARAMETROS)
+    canal = cola.canal(trabajo.id)
+    assert primera_solucion.wait(5)
+    assert cola.detener(trabajo.id)
+    cola.cerrar(esperar=True)
+
+    eventos = [evento for evento in canal.escuchar(espera=1) if evento is not None]
+    assert [tipo for tipo, _ in eventos] == ["estado", "solucion", "estado"]
+    assert eventos[1][1]["solucion"] == 1 and eventos[1][1]["objetivo"] == 100.0
+    assert eventos[-1][1]["resultado"]["detenido"] is True
+    assert cola.canal(trabajo.id) is None and not cola.detener(trabajo.id)
+
+
+def test_empresa_con_grupo_heuristico_completa_sin_cota(tmp_path, monkeypatch):
+    """
+    Un grupo resuelto por la heurística no tiene cota: el trabajo de empresa termina
+    igual y el progreso informa la cota como desconocida.
+    """
+    get_session = TrabajosDBConfig.configurar(f"sqlite:///{tmp_path}/trabajos.db")
+    grupos = [
+        ([1], ResultadoGeneracion("FEASIBLE", [], objetivo=10.0, cota=5.0)),
+        ([2], ResultadoGeneracion(ESTADO_HEURISTICO, [], objetivo=20.0)),
+    ]
+
+    def generar_de_prueba(empresa_id, semana_inicio, db, al_resolver_grupo=None, **kwargs):
+        for sucursal_ids, resultado in grupos:
+            al_resolver_grupo(sucursal_ids, resultado)
+        return [resultado for _, resultado in grupos]
+
+    monkeypatch.setattr(trabajo_generacion_service, "generar_horarios_empresa", generar_de_prueba)
+    monkeypatch.setattr(trabajo_generacion_service.Database, "get_session", lambda nombre: get_session())
+
+    cola = ColaTrabajos(max_trabajos=1, get_session=get_session, ejecutores={"empresa": ejecutar_generacion_empresa})
+    trabajo = cola.encolar("empresa", {**PARAMETROS, "sucursal_id": None, "empresa_id": 1})
+    cola.cerrar(esperar=True)
+
+    trabajo = cola.obtener(trabajo.id)
+    assert trabajo.estado == COMPLETADO
+    assert (trabajo.objetivo, trabajo.cota, trabajo.soluciones) == (30.0, None, 2)
+    assert [grupo["estado"] for grupo in trabajo.resultado["grupos"]] == ["FEASIBLE", ESTADO_HEURISTICO]
+
+
+def test_diferencia_turnos_solo_informa_cambios():
+    def turno(colaborador_id, dia_id, inicio):
+        return TurnoGenerado(1, colaborador_id, 1, dia_id, LUNES, [(time(inicio, 0), time(inicio + 8, 0))])
+
+    diferencia = DiferenciaTurnos()
+    assert len(diferencia.actualizar([turno(1, 1, 9), turno(2, 1, 9)])["cambios"]) == 2
+
+    # El colaborador 2 cambia de horario y el 3 se agrega; el 1 no se reenvía
+    cambios = diferencia.actualizar([turno(1, 1, 9), turno(2, 1, 10), turno(3, 2, 9)])
+    assert {turno["colaborador_id"] for turno in cambios["cambios"]} == {2, 3}
+    assert cambios["eliminados"] == []
+
+    cambios = diferencia.actualizar([turno(3, 2, 9)])
+    assert cambios["cambios"] == []
+    assert sorted(e["colaborador_id"] for e in cambios["eliminados"]) == [1, 2]
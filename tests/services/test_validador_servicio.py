@@ -0,0 +1,153 @@
+from datetime import date, time
+
+from domain.models.colaborador import Colaborador, TIEMPO_COMPLETO
+from domain.models.formato import Formato
+from domain.models.horario import Horario
+from domain.models.rol import Rol
+from domain.models.sucursal import Sucursal
+from domain.models.tipo_colaborador import TipoEmpleado
+from domain.services.validador_servicio import REGLA_HORARIO_ATENCION, ValidadorServicio
+from domain.specs.base_conjunctions import AndSpecification
+from domain.specs.colaborador_specs import (
+    ColaboradorSpecification,
+    HorarioAsignadoSpecification,
+    VacacionesSpecification,
+)
+from domain.specs.horario_specs import (
+    DiaLibreSpecification,
+    HorarioCortadoSpecification,
+    HorarioRespetaHorasSemanales,
+    HorarioValidoSpecification,
+)
+from tests.mocks.mock_colaborador import MockColaborador
+from tests.mocks.mock_horarios import MockHorario
+
+
+def crear_colaborador(horarios, horas_semanales=45, horas_diarias_maximas=8, horario_corrido=True, id=1):
+    colaborador = MockColaborador(
+        tipo_empleado=TIEMPO_COMPLETO,
+        horas_diarias_maximas=horas_diarias_maximas,
+        horas_semanales=horas_semanales,
+        horario_asignado=horarios,
+        horario_corrido=horario_corrido,
+    )
+    colaborador.id = id
+    colaborador.vacaciones = []
+    return colaborador
+
+
+def semana_valida():
+    # Lunes a sábado: 3 días de 7hs y 3 de 8hs = 45hs
+    return [
+        MockHorario(fecha=date(2025, 1, dia), bloques=[(time(9, 0), time(16 if dia < 9 else 17, 0))])
+        for dia in range(6, 12)
+    ]
+
+
+def test_reporte_coincide_con_is_satisfied_by():
+    reglas = [
+        HorarioValidoSpecification(),
+        HorarioRespetaHorasSemanales(),
+        DiaLibreSpecification(),
+        HorarioAsignadoSpecification(),
+        HorarioCortadoSpecification(),
+    ]
+    colaboradores = [
+        crear_colaborador(semana_valida(), id=1),
+        crear_colaborador(semana_valida(), horas_semanales=30, id=2),
+        crear_colaborador(semana_valida() + [MockHorario(date(2025, 1, 12), [(time(9, 0), time(18, 0))])], id=3),
+    ]
+
+    reporte = ValidadorServicio(reglas).validar(colaboradores)
+
+    esperado = set()
+    for posicion, colaborador in enumerate(colaboradores):
+        for spec in reglas:
+            if isinstance(spec, HorarioAsignadoSpecification):
+                continue
+            for horario in colaborador.horario_asignado:
+                if not spec.is_satisfied_by(horario, colaborador):
+                    esperado.add((posicion, type(spec).__name__, horario.fecha))
+    obtenido = set()
+    for violacion in reporte.violaciones:
+        obtenido.add((violacion.colaborador_id - 1, violacion.regla, violacion.fecha))
+
+    # Las reglas semanales se reportan una vez por colaborador, sin fecha
+    assert {(p, r) for p, r, f in obtenido if r != "HorarioAsignadoSpecification"} == {(p, r) for p, r, _ in esperado}
+    assert reporte.colaboradores_evaluados == 3
+    assert reporte.horarios_evaluados == 19
+    assert reporte.por_regla()["HorarioRespetaHorasSemanales"] == 2
+    assert reporte.por_regla()["DiaLibreSpecification"] == 1
+    assert reporte.por_regla()["HorarioAsignadoSpecification"] == 2
+
+
+def test_superposiciones_vacaciones_y_conjunciones():
+    horarios = semana_valida()
+    horarios[0] = MockHorario(fecha=date(2025, 1, 6), bloques=[(time(9, 0), time(12, 0))])
+    horarios.append(MockHorario(fecha=date(2025, 1, 6), bloques=[(time(11, 0), time(16, 0))]))
+    colaborador = crear_colaborador(horarios)
+    colaborador.vacaciones = [date(2025, 1, 8)]
+
+    reporte = ValidadorServicio({
+        "asignado": HorarioAsignadoSpecification(),
+        "vacaciones": VacacionesSpecification(),
+        "valido_y_semanal": AndSpecification(HorarioValidoSpecification(), HorarioRespetaHorasSemanales()),
+    }).validar([colaborador])
+
+    assert not reporte.valido
+    assert reporte.por_regla() == {"asignado": 1, "vacaciones": 1, "valido_y_semanal": 7}
+    assert HorarioAsignadoSpecification().is_satisfied_by(colaborador) is False
+
+
+def test_bloques_fuera_del_horario_de_atencion():
+    rol = Rol(1, "Cajero")
+    sucursal = Sucursal(
+        id=10, nombre="Centro", empresa_id=1, direccion="", telefono="",
+        formato=Formato("Farmacia", [rol]), disposicion_fisica={rol: 2},
+        horario_atencion=[Horario(10, None, 1, None, [(time(8, 0), time(20, 0))], True)],
+        dias_atencion=[1],
+    )
+    horarios = [
+        Horario(10, 1, 1, date(2025, 1, 6), [(time(9, 0), time(17, 0))], True),
+        Horario(10, 1, 1, date(2025, 1, 13), [(time(14, 0), time(21, 0))], True),
+        Horario(10, 1, 2, date(2025, 1, 7), [(time(9, 0), time(17, 0))], True),
+    ]
+
+    reporte = ValidadorServicio([]).validar([crear_colaborador(horarios)], [sucursal])
+
+    assert reporte.por_regla() == {REGLA_HORARIO_ATENCION: 2}
+    assert {v.fecha for v in reporte.violaciones} == {date(2025, 1, 13), date(2025, 1, 7)}
+    assert reporte.to_dict()["violaciones"][0]["sucursal_id"] == 10
+
+
+class HastaOchoHoras(ColaboradorSpecification):
+    """Regla sin evaluador registrado que cuenta cuántas veces recorre la semana."""
+    depende_de = ("horario_asignado",)
+
+    def __init__(self):
+        self.recorridos = 0
+
+    def is_satisfied_by(self, colaborador) -> bool:
+        self.recorridos += 1
+        return colaborador.calcular_horas_totales_semanales() <= 8
+
+
+def test_revalidar_memoiza_las_reglas_sin_evaluador():
+    colaborador = Colaborador(
+        id=1, nombre="Ana", legajo=1, email="", telefono="", dni="", empresa=None, sucursales=[1], roles=[],
+        horario_preferido=[], dias_preferidos=[], tipo_empleado=TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45),
+        horario_asignado=None, hs_extra={}, vacaciones=[],
+    )
+    lunes = Horario(1, 1, 1, date(2025, 1, 6), [(time(8, 0), time(12, 0))], False)
+    colaborador.agregar_horario(1, lunes)
+    regla = HastaOchoHoras()
+    validador = ValidadorServicio({"ocho_horas": AndSpecification(regla, VacacionesSpecification())})
+
+    assert validador.validar([colaborador]).valido
+    assert validador.validar([colaborador]).valido
+    assert regla.recorridos == 1
+
+    # Editar el bloque directamente en el Horario asignado invalida el resultado guardado
+    lunes.agregar_bloque(time(14, 0), time(19, 0))
+    assert validador.validar([colaborador]).por_regla() == {"ocho_horas": 1}
+    assert regla.recorridos == 2
@@ -0,0 +1,137 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from application.services import venta_hora_service
+from application.services.venta_hora_service import actualizar_resumen, obtener_personas_por_hora, obtener_ventas_por_hora
+from domain.models.venta_hora import Factura, VentasPorHora, calcular_personas
+from infrastructure.databases.config.database import Base
+# Modelos que el paquete no importa y que las relaciones de Colaborador necesitan al configurar los mappers
+from infrastructure.databases.models import horario, horario_preferido_colaborador, puestos  # noqa: F401
+from infrastructure.databases.models.venta_hora_resumen import VentaHoraCarga, VentaHoraResumen
+from infrastructure.repositories.venta_hora_resumen_repo import VentaHoraResumenRepository
+from infrastructure.schemas.venta_hora import VentaHora
+
+HOY = date(2025, 3, 6)
+
+
+def _factura(numero, fecha, segundos, obra_social):
+    return {
+        "Sucursal": 3, "Doc": "TK", "Documento": f"0001-{numero:08d}", "Fecha": fecha,
+        "Hora": timedelta(seconds=segundos), "Usuario": 1, "Efectivo": 100.0, "CtaCte": 0.0,
+        "OSocial": 0.0, "Obra Social Detalle": obra_social, "Tarjeta": 0.0, "OtrosMP": 0.0,
+        "Tarjeta Detalle": None, "Total": 100.0, "Apellido y nombre/Razón Social": None, "DNI": None, "CUIT": None,
+    }
+
+
+def _agrupar(filas, desde, hasta):
+    # Lo que devuelve get_vta_hora_agrupado.sql para las mismas facturas
+    agrupado = {}
+    for fila in filas:
+        if not desde <= fila["Fecha"] <= hasta:
+            continue
+        detalle = fila["Obra Social Detalle"]
+        categoria = "Particular" if not detalle else "PAMI" if detalle.startswith("PAMI") else "Obra Social"
+        clave = (fila["Sucursal"], fila["Fecha"], int(fila["Hora"].total_seconds()) // 3600, categoria)
+        cantidad, importe = agrupado.get(clave, (0, Decimal(0)))
+        agrupado[clave] = (cantidad + 1, importe + Decimal(str(fila["Total"])))
+    return [
+        {"Sucursal": s, "Fecha": f, "Hora": h, "Categoria": c, "Cantidad": cantidad, "Importe": importe}
+        for (s, f, h, c), (cantidad, importe) in agrupado.items()
+    ]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[VentaHoraResumen.__table__, VentaHoraCarga.__table__])
+    monkeypatch.setattr(venta_hora_service, "_hoy", lambda: HOY)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def plex(monkeypatch):
+    obras_sociales = ["PAMI INSSJP", "OSDE", None, "", "pami minúscula"]
+    filas = [
+        _factura(i, date(2025, 3, 3 + i % 4), 8 * 3600 + i * 500, obras_sociales[i % len(obras_sociales)])
+        for i in range(80)
+    ]
+    consultas = []
+    monkeypatch.setattr(venta_hora_service.DBConfig, "get_session", staticmethod(lambda db_name: Session()))
+    monkeypatch.setattr(venta_hora_service, "get_vta_hora_agrupado", lambda sucursal, desde, hasta, db: (
+        consultas.append((desde, hasta)) or _agrupar(filas, desde, hasta)
+    ))
+    return filas, consultas
+
+
+def test_resumen_equivale_al_agrupamiento_de_las_facturas(db, plex):
+    filas, _ = plex
+    ventas = VentasPorHora()
+    ventas.procesar_facturas([Factura(VentaHora.model_validate(fila)) for fila in filas])
+    esperado = ventas.obtener_ventas()
+
+    resultado = obtener_ventas_por_hora(3, date(2025, 3, 1), date(2025, 3, 31), db)
+    assert resultado == venta_hora_service.transformar_resultado(esperado)
+    assert obtener_personas_por_hora(3, date(2025, 3, 1), date(2025, 3, 31), db, tiempo_promedio=10) == (
+        venta_hora_service.transformar_resultado(calcular_personas(esperado, 10))
+    )
+    assert sum(r.importe for r in db.query(VentaHoraResumen)) == 100 * len(filas)
+
+
+def test_carga_incremental_solo_pide_dias_faltantes_y_el_dia_en_curso(db, plex, monkeypatch):
+    _, consultas = plex
+    monkeypatch.setattr(venta_hora_service, "DIAS_RECHEQUEO", 0)
+    assert actualizar_resumen(3, date(2025, 3, 4), date(2025, 3, 5), db, db_plex=object()) == [
+        date(2025, 3, 4), date(2025, 3, 5)
+    ]
+    consultas.clear()
+
+    # Solo los días que faltan, agrupados en rangos contiguos, y hoy; nada del futuro
+    cargadas = actualizar_resumen(3, date(2025, 3, 1), date(2025, 3, 10), db, db_plex=object())
+    assert consultas == [(date(2025, 3, 1), date(2025, 3, 3)), (date(2025, 3, 6), date(2025, 3, 6))]
+    assert cargadas == [date(2025, 3, 1), date(2025, 3, 2), date(2025, 3, 3), HOY]
+
+    # Los días pasados quedan completos (también los que no tuvieron ventas); hoy se recarga
+    consultas.clear()
+    actualizar_resumen(3, date(2025, 3, 1), date(2025, 3, 6), db, db_plex=object())
+    assert consultas == [(HOY, HOY)]
+    assert db.query(VentaHoraCarga).filter_by(completo=True).count() == 5
+    assert db.query(VentaHoraResumen).filter_by(fecha=HOY).count() > 0
+
+
+def test_dias_recientes_se_rechequean_y_recargar_relee_el_rango(db, plex, monkeypatch):
+    filas, consultas = plex
+    actualizar_resumen(3, date(2025, 3, 1), date(2025, 3, 6), db, db_plex=object())
+
+    def cantidad(fecha):
+        return sum(r.cantidad for r in db.query(VentaHoraResumen).filter_by(fecha=fecha))
+
+    # Facturas cargadas después de medianoche con Emisión de días ya completos
+    antes = {fecha: cantidad(fecha) for fecha in (date(2025, 3, 3), date(2025, 3, 5))}
+    filas.append(_factura(900, date(2025, 3, 5), 10 * 3600, None))
+    filas.append(_factura(901, date(2025, 3, 3), 10 * 3600, None))
+    consultas.clear()
+
+    assert actualizar_resumen(3, date(2025, 3, 1), date(2025, 3, 6), db, db_plex=object()) == [
+        date(2025, 3, 4), date(2025, 3, 5), HOY
+    ]
+    assert consultas == [(date(2025, 3, 4), HOY)]
+    assert cantidad(date(2025, 3, 5)) == antes[date(2025, 3, 5)] + 1
+    assert cantidad(date(2025, 3, 3)) == antes[date(2025, 3, 3)]
+
+    consultas.clear()
+    actualizar_resumen(3, date(2025, 3, 1), date(2025, 3, 6), db, db_plex=object(), recargar=True)
+    assert consultas == [(date(2025, 3, 1), HOY)]
+    assert cantidad(date(2025, 3, 3)) == antes[date(2025, 3, 3)] + 1
+
+    # Si otra consulta cargó los mismos días en paralelo no se informan como cargados
+    def cargados_en_paralelo(*args):
+        raise IntegrityError("INSERT", {}, Exception("duplicado"))
+
+    monkeypatch.setattr(VentaHoraResumenRepository, "reemplazar_dias", staticmethod(cargados_en_paralelo))
+    assert actualizar_resumen(3, date(2025, 3, 1), date(2025, 3, 6), db, db_plex=object()) == []
@@ -0,0 +1,260 @@
+import threading
+from datetime import date, time
+from time import sleep
+
+from ortools.sat.python import cp_model
+
+from infrastructure.solvers.solver import (
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    GeneradorHorarios,
+    a_minutos,
+    generar_candidatos,
+)
+
+LUNES = date(2025, 1, 6)
+
+
+def crear_datos(colaboradores, capacidades=None, minimos=None):
+    horarios = {dia_id: (time(9, 0), time(17, 0)) for dia_id in range(1, 6)}
+    if minimos is None:
+        minimos = {(dia_id, time(hora, 0), 1): 1 for dia_id in range(1, 6) for hora in range(9, 17)}
+    return DatosSemanaSucursal(
+        sucursal_id=1,
+        semana_inicio=LUNES,
+        horarios_atencion=horarios,
+        minimos=minimos,
+        capacidades=capacidades or {1: 2},
+        colaboradores=colaboradores,
+    )
+
+
+def test_cubre_minimos_dentro_del_horario_de_atencion():
+    """
+    Con dos colaboradores de 8 horas diarias se cubre todo el mínimo de la semana
+    sin salir del horario de atención de la sucursal.
+    """
+    datos = crear_datos([
+        ColaboradorDisponible(1, [1], 8, 40),
+        ColaboradorDisponible(2, [1], 8, 40),
+    ])
+    resultado = GeneradorHorarios(datos, tiempo_limite=5).resolver()
+
+    assert resultado.factible
+    assert resultado.faltantes == {}
+    for turno in resultado.turnos:
+        assert turno.dia_id in datos.horarios_atencion
+        for inicio, fin in turno.bloques:
+            assert a_minutos(inicio) >= 9 * 60 and a_minutos(fin) <= 17 * 60
+
+
+def test_notifica_soluciones_mejoradas():
+    """
+    El callback recibe cada solución mejorada con objetivos que no empeoran y el
+    último coincide con el del resultado.
+    """
+    datos = crear_datos([ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)])
+    objetivos = []
+    resultado = GeneradorHorarios(datos, tiempo_limite=5).resolver(
+        lambda observador: objetivos.append(observador.objetivo)
+    )
+
+    assert resultado.factible
+    assert objetivos and objetivos == sorted(objetivos, reverse=True)
+    assert objetivos[-1] == resultado.objetivo
+
+
+def test_solucion_capturada_se_lee_fuera_del_callback():
+    """
+    La copia tomada en el callback conserva los valores de esa solución después de
+    que la búsqueda sigue: la última coincide con los turnos del resultado.
+    """
+    datos = crear_datos([ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)])
+    generador = GeneradorHorarios(datos, tiempo_limite=5)
+    capturas = []
+    resultado = generador.resolver(lambda observador: capturas.append(observador.capturar()))
+
+    ultima = capturas[-1]
+    assert ultima.objetivo == resultado.objetivo
+    assert [turno.to_dict() for turno in generador.extraer_turnos(ultima)] == [
+        turno.to_dict() for turno in resultado.turnos
+    ]
+    assert all(item["cubiertos"] == item["requeridos"] for item in generador.cobertura_minimos(ultima))
+
+
+def test_detener_corta_la_busqueda_con_la_mejor_solucion():
+    """
+    Al activar el evento de detención en la primera solución, la búsqueda termina
+    mucho antes del tiempo límite y devuelve esa solución con su cobertura.
+    """
+    datos = crear_datos([ColaboradorDisponible(colaborador_id, [1], 8, 40) for colaborador_id in range(1, 5)])
+    generador = GeneradorHorarios(datos, tiempo_limite=120)
+    detener = threading.Event()
+    coberturas = []
+
+    def al_mejorar(observador):
+        coberturas.append(generador.cobertura_minimos(observador))
+        detener.set()
+
+    resultado = generador.resolver(al_mejorar, detener)
+
+    assert resultado.factible
+    assert resultado.tiempo_segundos < 60
+    assert len(coberturas[0]) == len(datos.minimos)
+    assert all(0 <= item["cubiertos"] <= item["requeridos"] for item in coberturas[0])
+
+
+def test_respeta_limites_de_horas_y_vacaciones():
+    """
+    Verifica las horas diarias y semanales del tipo de empleado y que no se asignen
+    turnos en fechas de vacaciones.
+    """
+    vacaciones = {date(2025, 1, 7)}
+    datos = crear_datos([
+        ColaboradorDisponible(1, [1], 6, 20, fechas_no_disponibles=vacaciones),
+        ColaboradorDisponible(2, [1], 8, 40),
+    ])
+    resultado = GeneradorHorarios(datos, tiempo_limite=5).resolver()
+
+    assert resultado.factible
+    minutos_por_colaborador = {}
+    for turno in resultado.turnos:
+        duracion = sum(a_minutos(fin) - a_minutos(inicio) for inicio, fin in turno.bloques)
+        minutos_por_colaborador[turno.colaborador_id] = minutos_por_colaborador.get(turno.colaborador_id, 0) + duracion
+        if turno.colaborador_id == 1:
+            assert duracion <= 6 * 60
+            assert turno.fecha not in vacaciones
+    assert minutos_por_colaborador.get(1, 0) <= 20 * 60
+    assert minutos_por_colaborador.get(2, 0) <= 40 * 60
+
+
+def test_respeta_capacidad_y_reporta_faltantes():
+    """
+    Con un solo espacio para el rol no puede haber dos colaboradores en la misma franja,
+    y el mínimo imposible de cubrir se informa como faltante.
+    """
+    minimos = {(1, time(10, 0), 1): 2}
+    datos = crear_datos(
+        [ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)],
+        capacidades={1: 1},
+        minimos=minimos,
+    )
+    resultado = GeneradorHorarios(datos, tiempo_limite=5).resolver()
+
+    assert resultado.factible
+    assert resultado.faltantes == {(1, 1, time(10, 0), 1): 1}
+    for dia_id in range(1, 6):
+        for hora in range(9, 17):
+            presentes = [
+                turno for turno in resultado.turnos
+                if turno.dia_id == dia_id
+                and any(inicio.hour <= hora < fin.hour for inicio, fin in turno.bloques)
+            ]
+            assert len(presentes) <= 1
+
+
+def test_rol_sin_espacio_no_se_asigna():
+    """
+    Un colaborador cuyo único rol no tiene espacio en la sucursal no recibe turnos.
+    """
+    datos = crear_datos([ColaboradorDisponible(1, [2], 8, 40)])
+    resultado = GeneradorHorarios(datos, tiempo_limite=5).resolver()
+
+    assert resultado.turnos == []
+
+
+def claves(turnos):
+    return {(turno.colaborador_id, turno.fecha, turno.rol_colaborador_id, tuple(turno.bloques)) for turno in turnos}
+
+
+def test_warm_start_mantiene_turnos_previos():
+    """
+    Re-resolver con los turnos previos como punto de partida y sin cambios en los
+    datos no modifica ningún turno.
+    """
+    colaboradores = [ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)]
+    previo = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5).resolver()
+
+    generador = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5)
+    assert generador.agregar_turnos_previos(previo.turnos) == len(previo.turnos)
+    resultado = generador.resolver()
+
+    assert resultado.cambios == 0
+    assert claves(resultado.turnos) == claves(previo.turnos)
+
+
+def test_warm_start_solo_cambia_lo_afectado_por_vacaciones():
+    """
+    Una vacación nueva solo cambia los turnos del día afectado.
+    """
+    colaboradores = [ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)]
+    previo = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5).resolver()
+
+    martes = date(2025, 1, 7)
+    colaboradores[0] = ColaboradorDisponible(1, [1], 8, 40, fechas_no_disponibles={martes})
+    generador = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5)
+    generador.agregar_turnos_previos(previo.turnos)
+    resultado = generador.resolver()
+
+    assert resultado.factible
+    sin_martes = {clave for clave in claves(previo.turnos) if clave[1] != martes}
+    assert sin_martes <= claves(resultado.turnos)
+    assert all(turno.fecha != martes for turno in resultado.turnos if turno.colaborador_id == 1)
+
+
+def test_turnos_cortados_alineados_con_apertura_o_cierre():
+    apertura, cierre = 8 * 60, 21 * 60
+    candidatos = generar_candidatos((apertura, cierre), False, 8, 60)
+
+    assert candidatos
+    assert all(turno.bloques[0][0] == apertura or turno.bloques[1][1] == cierre for turno in candidatos)
+    assert [(8 * 60, 12 * 60), (17 * 60, 21 * 60)] in [turno.bloques for turno in candidatos]
+
+
+def test_hint_valido_es_la_primera_solucion():
+    """
+    Un hint que cumple el modelo se completa y CP-SAT parte de él: la primera
+    solución es al menos tan buena como el hint.
+    """
+    colaboradores = [ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)]
+    previo = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5).resolver()
+
+    generador = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5)
+    generador.agregar_hint(previo.turnos)
+    objetivos = []
+    resultado = generador.resolver(lambda observador: objetivos.append(observador.objetivo))
+
+    assert generador.hint_completo
+    assert objetivos[0] <= previo.objetivo and resultado.objetivo == previo.objetivo
+
+
+def test_completar_el_hint_se_descuenta_del_tiempo_limite(monkeypatch):
+    """
+    Completar el hint usa una parte del tiempo límite y lo que tarda se descuenta de
+    la búsqueda; con un tiempo límite corto no se intenta.
+    """
+    colaboradores = [ColaboradorDisponible(1, [1], 8, 40), ColaboradorDisponible(2, [1], 8, 40)]
+    previo = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=5).resolver()
+
+    limites = []
+    solve = cp_model.CpSolver.Solve
+
+    def solve_lento(solver, modelo, *args):
+        limites.append(solver.parameters.max_time_in_seconds)
+        if solver.parameters.fix_variables_to_their_hinted_value:
+            sleep(0.5)
+        return solve(solver, modelo, *args)
+
+    monkeypatch.setattr(cp_model.CpSolver, "Solve", solve_lento)
+    generador = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=4)
+    generador.agregar_hint(previo.turnos)
+    resultado = generador.resolver()
+
+    assert generador.hint_completo and limites[0] == 1.0
+    assert limites[1] <= 3.5 and resultado.tiempo_segundos >= 0.5
+
+    limites.clear()
+    corto = GeneradorHorarios(crear_datos(colaboradores), tiempo_limite=1)
+    corto.agregar_hint(previo.turnos)
+    assert corto.resolver().factible
+    assert not corto.hint_completo and len(limites) == 1 and limites[0] <= 1.0
@@ -0,0 +1,90 @@
+from collections import Counter
+from datetime import date, time
+from infrastructure.solvers.heuristica import GeneradorHeuristico
+from infrastructure.solvers.solver import (
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    GeneradorHorarios,
+    ESTADO_HEURISTICO,
+    a_minutos,
+)
+
+LUNES = date(2025, 1, 6)
+
+
+def crear_datos(colaboradores, capacidades=None):
+    return DatosSemanaSucursal(
+        sucursal_id=1,
+        semana_inicio=LUNES,
+        horarios_atencion={dia_id: (time(8, 0), time(20, 0)) for dia_id in range(1, 8)},
+        minimos={(dia_id, time(hora, 0), 1): 2 for dia_id in range(1, 8) for hora in range(8, 20)},
+        capacidades=capacidades or {1: 3},
+        colaboradores=colaboradores,
+    )
+
+
+def test_respeta_horas_capacidad_vacaciones_y_dia_libre():
+    datos = crear_datos([
+        ColaboradorDisponible(1, [1], 8, 40, tipo_empleado="TIEMPO_COMPLETO", fechas_no_disponibles={LUNES}),
+        ColaboradorDisponible(2, [1], 8, 48, tipo_empleado="TIEMPO_COMPLETO"),
+        ColaboradorDisponible(3, [1], 6, 30, tipo_empleado="TIEMPO_PARCIAL"),
+        ColaboradorDisponible(4, [1], 8, 40, horario_corrido=False),
+    ], capacidades={1: 2})
+    resultado = GeneradorHeuristico(datos).resolver()
+
+    assert resultado.estado == ESTADO_HEURISTICO and resultado.factible
+    colaboradores = {colaborador.id: colaborador for colaborador in datos.colaboradores}
+    minutos = Counter()
+    for turno in resultado.turnos:
+        duracion = sum(a_minutos(fin) - a_minutos(inicio) for inicio, fin in turno.bloques)
+        assert duracion <= colaboradores[turno.colaborador_id].horas_por_dia_max * 60
+        minutos[turno.colaborador_id] += duracion
+    for colaborador_id, total in minutos.items():
+        assert total <= colaboradores[colaborador_id].horas_semanales * 60
+
+    dias = Counter((turno.colaborador_id, turno.dia_id) for turno in resultado.turnos)
+    assert max(dias.values()) == 1
+    assert (1, 1) not in dias
+    assert sum(1 for colaborador_id, _ in dias if colaborador_id == 2) <= 6
+    assert all(len(turno.bloques) == 2 for turno in resultado.turnos if turno.colaborador_id == 4)
+
+    for dia_id in range(1, 8):
+        for hora in range(8, 20):
+            presentes = sum(
+                1 for turno in resultado.turnos
+                if turno.dia_id == dia_id and any(
+                    a_minutos(inicio) <= hora * 60 < a_minutos(fin) for inicio, fin in turno.bloques
+                )
+            )
+            assert presentes <= 2
+
+
+def test_prioriza_horarios_preferidos():
+    """
+    Sin demanda que lo impida, el colaborador trabaja dentro de su horario preferido.
+    """
+    preferidos = {dia_id: [(time(12, 0), time(20, 0))] for dia_id in range(1, 8)}
+    datos = crear_datos([
+        ColaboradorDisponible(1, [1], 8, 40, horarios_preferidos=preferidos),
+    ])
+    resultado = GeneradorHeuristico(datos).resolver()
+
+    assert resultado.turnos
+    for turno in resultado.turnos:
+        assert turno.bloques == [(time(12, 0), time(20, 0))]
+
+
+def test_sirve_como_hint_del_motor_exacto():
+    """
+    Todos los turnos de la heurística tienen un candidato equivalente en el modelo
+    CP-SAT y el motor no empeora el objetivo de la heurística.
+    """
+    datos = crear_datos([ColaboradorDisponible(colaborador_id, [1], 8, 40) for colaborador_id in range(1, 5)])
+    heuristica = GeneradorHeuristico(datos).resolver()
+
+    generador = GeneradorHorarios(datos, tiempo_limite=5)
+    assert generador.agregar_hint(heuristica.turnos) == len(heuristica.turnos)
+    resultado = generador.resolver()
+
+    assert resultado.factible
+    assert resultado.objetivo <= heuristica.objetivo
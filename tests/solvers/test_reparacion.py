@@ -0,0 +1,91 @@
+from collections import Counter
+from datetime import date, time
+from infrastructure.solvers.reparacion import construir_subproblema, descontar_turnos_externos, elegir_vecindario
+from infrastructure.solvers.solver import (
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    GeneradorHorarios,
+    TurnoGenerado,
+    a_minutos,
+)
+
+LUNES = date(2025, 1, 6)
+
+
+def crear_datos(vacaciones=None):
+    vacaciones = vacaciones or {}
+    return DatosSemanaSucursal(
+        sucursal_id=1,
+        semana_inicio=LUNES,
+        horarios_atencion={dia_id: (time(8, 0), time(20, 0)) for dia_id in range(1, 7)},
+        minimos={(dia_id, time(hora, 0), 1): 2 for dia_id in range(1, 7) for hora in range(8, 20)},
+        capacidades={1: 3},
+        colaboradores=[
+            ColaboradorDisponible(colaborador_id, [1], 8, 36, fechas_no_disponibles=vacaciones.get(colaborador_id))
+            for colaborador_id in range(1, 9)
+        ],
+    )
+
+
+def test_repara_solo_el_vecindario_del_ausente():
+    """
+    Con una vacación nueva el lunes, solo cambian los turnos de los colaboradores
+    liberados, el ausente deja de trabajar ese día y la cobertura se mantiene.
+    """
+    semana = GeneradorHorarios(crear_datos(), tiempo_limite=5).resolver()
+    assert semana.factible and not semana.faltantes
+
+    ausente = next(turno.colaborador_id for turno in semana.turnos if turno.dia_id == 1)
+    datos = crear_datos({ausente: {LUNES}})
+    liberados = elegir_vecindario(datos, semana.turnos, ausente, {1}, tamano=3)
+    assert ausente in liberados and len(liberados) == 4
+
+    subproblema = construir_subproblema(datos, semana.turnos, liberados)
+    assert {colaborador.id for colaborador in subproblema.colaboradores} == liberados
+
+    generador = GeneradorHorarios(subproblema, tiempo_limite=5)
+    generador.agregar_turnos_previos([turno for turno in semana.turnos if turno.colaborador_id in liberados])
+    reparacion = generador.resolver()
+
+    assert reparacion.factible and not reparacion.faltantes
+    assert {turno.colaborador_id for turno in reparacion.turnos} <= liberados
+    assert not any(turno.colaborador_id == ausente and turno.dia_id == 1 for turno in reparacion.turnos)
+
+    fijos = [turno for turno in semana.turnos if turno.colaborador_id not in liberados]
+    ocupacion = Counter()
+    for turno in fijos + reparacion.turnos:
+        for inicio, fin in turno.bloques:
+            for minuto in range(a_minutos(inicio), a_minutos(fin), 60):
+                ocupacion[(turno.dia_id, minuto)] += 1
+    assert max(ocupacion.values()) <= 3
+    assert all(ocupacion[(dia_id, hora * 60)] >= 2 for dia_id in range(1, 7) for hora in range(8, 20))
+
+
+def test_turnos_externos_bloquean_el_dia_y_descuentan_horas():
+    """
+    Un colaborador con un turno de 8 horas el lunes en otra sucursal no trabaja ese
+    día y su semana en la sucursal no supera las horas contratadas restantes.
+    """
+    datos = crear_datos()
+    externo = TurnoGenerado(2, 1, 1, 1, LUNES, [(time(8, 0), time(16, 0))])
+    datos.colaboradores = descontar_turnos_externos(datos.colaboradores, [externo])
+
+    colaborador = next(colaborador for colaborador in datos.colaboradores if colaborador.id == 1)
+    assert colaborador.horas_semanales == 28 and LUNES in colaborador.fechas_no_disponibles
+
+    resultado = GeneradorHorarios(datos, tiempo_limite=5).resolver()
+    turnos = [turno for turno in resultado.turnos if turno.colaborador_id == 1]
+    assert resultado.factible and all(turno.dia_id != 1 for turno in turnos)
+    assert sum(a_minutos(fin) - a_minutos(inicio) for turno in turnos for inicio, fin in turno.bloques) <= 28 * 60
+
+
+def test_turnos_externos_de_horas_no_enteras_descuentan_la_hora_completa():
+    """
+    Siete horas y media en otra sucursal descuentan 8 de las semanales: la semana
+    completa no supera las horas contratadas.
+    """
+    externo = TurnoGenerado(2, 1, 1, 1, LUNES, [(time(8, 0), time(15, 30))])
+    colaboradores = descontar_turnos_externos(crear_datos().colaboradores, [externo])
+
+    assert next(colaborador for colaborador in colaboradores if colaborador.id == 1).horas_semanales == 28
+    assert next(colaborador for colaborador in colaboradores if colaborador.id == 2).horas_semanales == 36
@@ -0,0 +1,36 @@
+from datetime import date, time
+
+from domain.models.colaborador import Colaborador, TIEMPO_COMPLETO
+from domain.models.horario import Horario
+from domain.models.tipo_colaborador import TipoEmpleado
+from domain.specs.colaborador_specs import HorarioAsignadoSpecification
+
+
+def _colaborador() -> Colaborador:
+    colaborador = Colaborador(
+        id=1, nombre="Ana", legajo=1, email="", telefono="", dni="", empresa=None, sucursales=[1, 2], roles=[],
+        horario_preferido=[], dias_preferidos=[], tipo_empleado=TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45),
+        horario_asignado=None, hs_extra={}, vacaciones=[],
+    )
+    colaborador.horas_semanales = 12
+    colaborador.horas_diarias_maximas = 8
+    return colaborador
+
+
+def test_evalua_las_asignaciones_guardadas_como_tuplas():
+    """
+    agregar_horario guarda (sucursal_id, Horario): la regla desempaqueta las tuplas
+    antes de sumar horas y buscar superposiciones.
+    """
+    lunes = date(2025, 1, 6)
+    colaborador = _colaborador()
+    colaborador.agregar_horario(1, Horario(1, 1, 1, lunes, [(time(8), time(14))], False))
+    colaborador.agregar_horario(1, Horario(1, 1, 2, date(2025, 1, 7), [(time(8), time(14))], False))
+    assert all(isinstance(asignacion, tuple) for asignacion in colaborador.horario_asignado)
+    assert HorarioAsignadoSpecification().is_satisfied_by(colaborador) is True
+
+    # Dos turnos superpuestos el mismo día en la misma sucursal
+    colaborador = _colaborador()
+    colaborador.agregar_horario(1, Horario(1, 1, 1, lunes, [(time(8), time(14))], False))
+    colaborador.horario_asignado.append((1, Horario(1, 1, 1, lunes, [(time(13), time(19))], False)))
+    assert HorarioAsignadoSpecification().is_satisfied_by(colaborador) is False
@@ -0,0 +1,56 @@
+import itertools
+
+from domain.specs.base import Specification
+from domain.specs.base_conjunctions import AndSpecification, NotSpecification, OrSpecification
+from domain.specs.colaborador_specs import DNISpecification, HorarioAsignadoSpecification
+from domain.specs.compilador import AND, compilar
+
+
+class Contadora(Specification):
+    """Especificación de prueba que cuenta cuántas veces se evaluó."""
+    def __init__(self, resultado, costo_estimado=1.0):
+        self.resultado = resultado
+        self.costo_estimado = costo_estimado
+        self.llamadas = 0
+
+    def is_satisfied_by(self, candidato) -> bool:
+        self.llamadas += 1
+        return self.resultado(candidato) if callable(self.resultado) else self.resultado
+
+
+def test_aplana_ordena_por_costo_y_es_equivalente():
+    cara = Contadora(lambda x: x % 2 == 0, costo_estimado=50)
+    barata = Contadora(lambda x: x % 3 == 0)
+    otra = Contadora(lambda x: x > 4, costo_estimado=5)
+    original = OrSpecification(
+        AndSpecification(AndSpecification(cara, barata), otra),
+        NotSpecification(NotSpecification(Contadora(lambda x: x == 1))),
+    )
+    compilada = compilar(original, reordenar_cada=None)
+
+    assert compilada.raiz.tipo == "OR"
+    and_plano = compilada.raiz.hijos[1]  # El AND de tres hijos es más caro que la hoja
+    assert and_plano.tipo == AND and [hijo.spec for hijo in and_plano.hijos] == [barata, otra, cara]
+    for candidato in range(12):
+        assert compilada.is_satisfied_by(candidato) == original.is_satisfied_by(candidato)
+
+    # Orden real de las reglas del dominio: la regex antes del recorrido de la semana
+    reglas = compilar(AndSpecification(HorarioAsignadoSpecification(), DNISpecification()))
+    assert [type(hijo.spec) for hijo in reglas.raiz.hijos] == [DNISpecification, HorarioAsignadoSpecification]
+
+
+def test_reordena_por_rechazo_medido_y_cuenta_por_nodo():
+    acepta = Contadora(True)
+    rechaza = Contadora(lambda x: x % 10 != 0)  # Rechaza 1 de cada 10
+    siempre_rechaza = Contadora(False)
+    compilada = compilar(AndSpecification(AndSpecification(acepta, rechaza), siempre_rechaza), reordenar_cada=32)
+
+    for candidato in itertools.islice(itertools.count(1), 100):
+        assert compilada.is_satisfied_by(candidato) is False
+
+    assert compilada.raiz.hijos[0].spec is siempre_rechaza
+    # Después del primer reordenamiento solo se evalúa la regla que corta
+    assert acepta.llamadas == 32 and rechaza.llamadas == 32
+    estadisticas = {fila["ruta"]: fila for fila in compilada.estadisticas()}
+    assert estadisticas["0"]["evaluaciones"] == 100 and estadisticas["0"]["aciertos"] == 0
+    assert estadisticas["0.0"]["nodo"] == "Contadora" and estadisticas["0.0"]["tasa_rechazo"] == 1.0
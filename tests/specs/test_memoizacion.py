@@ -0,0 +1,125 @@
+from datetime import date, time
+
+import pytest
+
+from domain.models import colaborador as modulo_colaborador
+
+from domain.models.colaborador import Colaborador, TIEMPO_COMPLETO
+from domain.models.horario import Horario
+from domain.models.tipo_colaborador import TipoEmpleado
+from domain.specs.base import Specification
+from domain.specs.base_conjunctions import AndSpecification
+from domain.specs.colaborador_specs import EmailSpecification
+from domain.specs.horario_specs import DiaLibreSpecification
+from domain.specs.memoizacion import EspecificacionMemoizada, memoizar
+from tests.mocks.mock_colaborador import MockColaborador
+from tests.mocks.mock_horarios import MockHorario
+
+
+class HorasAsignadas(Specification):
+    """Regla de prueba que cuenta cuántas veces recorre la semana."""
+    depende_de = ("horario_asignado", "vacaciones")
+
+    def __init__(self):
+        self.recorridos = 0
+
+    def is_satisfied_by(self, colaborador) -> bool:
+        self.recorridos += 1
+        return colaborador.calcular_horas_totales_semanales() <= 8 and not colaborador.vacaciones
+
+
+def _horario(fecha, *bloques):
+    return Horario(1, 1, fecha.isoweekday(), fecha, list(bloques), False)
+
+
+def test_reutiliza_el_resultado_hasta_que_cambia_la_asignacion():
+    colaborador = Colaborador(
+        id=1, nombre="Ana", legajo=1, email="", telefono="", dni="", empresa=None, sucursales=[1], roles=[],
+        horario_preferido=[], dias_preferidos=[], tipo_empleado=TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45),
+        horario_asignado=None, hs_extra={}, vacaciones=[],
+    )
+    lunes = _horario(date(2025, 1, 6), (time(8), time(12)), (time(14), time(19)))
+    colaborador.agregar_horario(1, lunes)
+    regla = HorasAsignadas()
+    memoizada = EspecificacionMemoizada(regla)
+
+    assert memoizada.is_satisfied_by(colaborador) is False
+    assert memoizada.is_satisfied_by(colaborador) is False
+    assert regla.recorridos == 1 and memoizada.aciertos == 1
+
+    colaborador.eliminar_bloque(lunes, time(14), time(19))
+    assert memoizada.is_satisfied_by(colaborador) is True
+    colaborador.agregar_vacacion(date(2025, 1, 7))
+    assert memoizada.is_satisfied_by(colaborador) is False
+    assert regla.recorridos == 3
+
+    # Volver a una asignación ya vista no recorre la semana otra vez
+    colaborador.vacaciones.clear()
+    colaborador.agregar_horario(1, _horario(date(2025, 1, 8), (time(9), time(10))))
+    assert memoizada.is_satisfied_by(colaborador) is True
+    colaborador.horario_asignado.pop()
+    assert memoizada.is_satisfied_by(colaborador) is True
+    assert regla.recorridos == 4
+
+
+def test_memoizar_arbol_y_lru_acotada():
+    semana = [MockHorario(date(2025, 1, 6 + dia), [(time(9), time(17))]) for dia in range(7)]
+    colaboradores = [
+        MockColaborador(TIEMPO_COMPLETO, 8, 45, semana[:dias]) for dias in range(4, 8)
+    ]
+    regla = memoizar(AndSpecification(DiaLibreSpecification(), EmailSpecification()), tamano=2)
+    dia_libre = regla.spec1
+    assert isinstance(dia_libre, EspecificacionMemoizada) and regla.spec2.__class__ is EmailSpecification
+
+    resultados = [dia_libre.is_satisfied_by(None, colaborador) for colaborador in colaboradores]
+    assert resultados == [True, True, True, False]
+    assert dia_libre.is_satisfied_by(None, colaboradores[-1]) is False and dia_libre.aciertos == 1
+    # Solo quedan los dos últimos: el primero se recalcula
+    dia_libre.is_satisfied_by(None, colaboradores[0])
+    assert dia_libre.fallos == 5 and len(dia_libre._resultados) == 2
+
+    with pytest.raises(TypeError):
+        EspecificacionMemoizada(EmailSpecification())
+
+
+def test_la_clave_es_el_conjunto_de_horarios_y_no_se_recalcula_sin_cambios(monkeypatch):
+    def crear():
+        colaborador = Colaborador(
+            id=1, nombre="Ana", legajo=1, email="", telefono="", dni="", empresa=None, sucursales=[1], roles=[],
+            horario_preferido=[], dias_preferidos=[], tipo_empleado=TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45),
+            horario_asignado=None, hs_extra={}, vacaciones=[],
+        )
+        colaborador.agregar_horario(1, _horario(date(2025, 1, 6), (time(8), time(12))))
+        return colaborador
+
+    primero, segundo = crear(), crear()
+    assert isinstance(primero.huella_asignaciones(), frozenset)
+    assert primero.huella_asignaciones() == segundo.huella_asignaciones()
+
+    memoizada = EspecificacionMemoizada(HorasAsignadas())
+    assert memoizada.is_satisfied_by(primero) is True
+
+    # Un colaborador sin cambios se reconoce sin volver a recorrer sus horarios
+    monkeypatch.setattr(modulo_colaborador, "huella_horarios", lambda asignaciones: pytest.fail("recalculó la huella"))
+    assert memoizada.is_satisfied_by(primero) is True and memoizada.aciertos == 1
+
+
+def test_tipo_empleado_se_identifica_por_su_id():
+    """
+    El mismo tipo de empleado cargado dos veces son objetos distintos; la regla se
+    memoiza por su id y no por identidad.
+    """
+    def crear(tipo_empleado):
+        return Colaborador(
+            id=1, nombre="Ana", legajo=1, email="", telefono="", dni="", empresa=None, sucursales=[1], roles=[],
+            horario_preferido=[], dias_preferidos=[], tipo_empleado=tipo_empleado,
+            horario_asignado=None, hs_extra={}, vacaciones=[],
+        )
+
+    memoizada = EspecificacionMemoizada(DiaLibreSpecification())
+    memoizada.is_satisfied_by(None, crear(TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45)))
+    memoizada.is_satisfied_by(None, crear(TipoEmpleado(1, TIEMPO_COMPLETO, 8, 45)))
+    assert memoizada.aciertos == 1
+
+    memoizada.is_satisfied_by(None, crear(TipoEmpleado(2, TIEMPO_COMPLETO, 8, 45)))
+    assert memoizada.fallos == 2
@@ -0,0 +1,103 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, time
+from application.use_cases.generar_horarios import agrupar_sucursales, resolver_grupo
+from domain.specs.base_conjunctions import NotSpecification
+from domain.specs.horario_specs import HorarioRespetaHorasSemanales
+from infrastructure.solvers.solver import (
+    ESTADO_HEURISTICO,
+    ColaboradorDisponible,
+    DatosSemanaSucursal,
+    GeneradorHorarios,
+    ResultadoGeneracion,
+)
+
+LUNES = date(2025, 1, 6)
+
+
+def crear_sucursal(sucursal_id, colaborador_ids):
+    return DatosSemanaSucursal(
+        sucursal_id=sucursal_id,
+        semana_inicio=LUNES,
+        horarios_atencion={dia_id: (time(9, 0), time(17, 0)) for dia_id in range(1, 7)},
+        minimos={(dia_id, time(hora, 0), 1): 1 for dia_id in range(1, 7) for hora in range(9, 17)},
+        capacidades={1: 2},
+        colaboradores=[ColaboradorDisponible(colaborador_id, [1], 8, 40) for colaborador_id in colaborador_ids],
+    )
+
+
+def test_agrupar_sucursales_por_colaboradores_compartidos():
+    """
+    Las sucursales 1 y 2 comparten al colaborador 10 y la 2 y 3 al 20, por lo que
+    forman un único grupo; la sucursal 4 queda sola.
+    """
+    sucursales = [
+        crear_sucursal(1, [10, 11]),
+        crear_sucursal(2, [10, 20]),
+        crear_sucursal(3, [20, 30]),
+        crear_sucursal(4, [40]),
+    ]
+    grupos = agrupar_sucursales(sucursales)
+
+    assert [sorted(datos.sucursal_id for datos in grupo) for grupo in grupos] == [[1, 2, 3], [4]]
+
+
+def test_resolver_grupo_en_proceso_aparte():
+    """
+    Un grupo se resuelve en un worker del pool y el resultado vuelve al proceso
+    principal; el colaborador compartido no trabaja dos veces el mismo día.
+    """
+    grupo = [crear_sucursal(1, [10, 11]), crear_sucursal(2, [10, 12])]
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        resultado = executor.submit(resolver_grupo, grupo, 5, 1, None).result()
+
+    assert resultado.factible
+    assert {turno.sucursal_id for turno in resultado.turnos} == {1, 2}
+    dias_compartido = [turno.fecha for turno in resultado.turnos if turno.colaborador_id == 10]
+    assert len(dias_compartido) == len(set(dias_compartido))
+    minutos_compartido = sum(
+        (fin.hour - inicio.hour) * 60
+        for turno in resultado.turnos if turno.colaborador_id == 10
+        for inicio, fin in turno.bloques
+    )
+    assert minutos_compartido <= 40 * 60
+
+
+def test_resolver_grupo_solo_usa_la_heuristica_si_cumple_la_especificacion(monkeypatch):
+    """
+    Si CP-SAT no llega a una solución, la heurística reemplaza al motor solo cuando
+    cumple la especificación; si no, el grupo queda sin solución y no se persiste.
+    """
+    monkeypatch.setattr(
+        GeneradorHorarios, "resolver", lambda self, al_mejorar=None, detener=None: ResultadoGeneracion("UNKNOWN", [])
+    )
+    grupo = [crear_sucursal(1, [10, 11])]
+
+    resultado = resolver_grupo(grupo, 5, 1, HorarioRespetaHorasSemanales())
+    assert resultado.estado == ESTADO_HEURISTICO and resultado.factible
+
+    # La heurística completa las horas contratadas, así que no puede cumplir la negación
+    resultado = resolver_grupo(grupo, 5, 1, NotSpecification(HorarioRespetaHorasSemanales()))
+    assert resultado.estado == "UNKNOWN" and not resultado.factible
+
+
+def test_resolver_grupo_parte_de_la_semana_anterior_completa(monkeypatch):
+    """
+    Con turnos de la semana anterior el motor completa el hint en lugar de repararlo
+    y la primera solución ya es la semana anterior sin cambios.
+    """
+    grupo = [crear_sucursal(1, [10, 11])]
+    previo = resolver_grupo(grupo, 5, 1, None)
+
+    generadores = []
+    resolver = GeneradorHorarios.resolver
+
+    def resolver_registrando(self, al_mejorar=None, detener=None):
+        generadores.append(self)
+        return resolver(self, al_mejorar, detener)
+
+    monkeypatch.setattr(GeneradorHorarios, "resolver", resolver_registrando)
+    objetivos = []
+    resultado = resolver_grupo(grupo, 5, 1, None, previo.turnos, lambda observador: objetivos.append(observador.objetivo))
+
+    assert generadores[0].hint_completo and not generadores[0].reparar_hint
+    assert objetivos[0] <= previo.objetivo and resultado.cambios == 0